@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for cub's hot paths.
+
+The suite generates a deterministic, synthetic large project (tasks with
+deep dependency chains, a big ledger, specs, plans and a source tree) and
+times the code that has to stay fast as projects grow.
+
+See benchmarks/README.md, or run:
+    python benchmarks/run.py --help
+"""
@@ -0,0 +1,258 @@
+"""
+Benchmark cases for cub's hot paths.
+
+Each case prepares whatever state it needs from a Fixture (untimed) and
+returns a zero-argument callable; the runner times repeated calls of that
+callable. Cases that construct their objects inside the callable measure
+cold behaviour (file reads, parsing); cases that construct them during
+preparation measure warm, cached behaviour.
+
+A case raises SkipCaseError from its preparation when an optional dependency it
+needs (e.g. tree-sitter for code intelligence) is not installed.
+"""
+
+import functools
+import os
+import subprocess
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.fixtures import Fixture, ledger_id, task_id
+from cub.core.dashboard.sync.orchestrator import SyncOrchestrator
+from cub.core.ledger.reader import LedgerReader
+from cub.core.ledger.writer import LedgerWriter
+from cub.core.map import code_intel
+from cub.core.tasks.graph import DependencyGraph
+from cub.core.tasks.jsonl import JsonlBackend
+
+Thunk = Callable[[], object]
+
+
+class SkipCaseError(Exception):
+    """Raised by a case's preparation when the case cannot run here."""
+
+
+@dataclass(frozen=True)
+class Case:
+    """A named, timed operation."""
+
+    name: str
+    prepare: Callable[[Fixture], Thunk]
+    description: str
+
+
+@contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _sample_ids(make_id: Callable[[int], str], count: int, limit: int = 100) -> list[str]:
+    step = max(count // limit, 1)
+    return [make_id(i) for i in range(0, count, step)][:limit]
+
+
+# ---------------------------------------------------------------------------
+# Tasks
+# ---------------------------------------------------------------------------
+
+
+def tasks_load(fixture: Fixture) -> Thunk:
+    return lambda: JsonlBackend(fixture.root).list_tasks()
+
+
+def tasks_ready(fixture: Fixture) -> Thunk:
+    backend = JsonlBackend(fixture.root)
+    return backend.get_ready_tasks
+
+
+def tasks_get(fixture: Fixture) -> Thunk:
+    backend = JsonlBackend(fixture.root)
+    ids = _sample_ids(task_id, fixture.scale.tasks)
+    return lambda: [backend.get_task(i) for i in ids]
+
+
+def tasks_search(fixture: Fixture) -> Thunk:
+    backend = JsonlBackend(fixture.root)
+    return lambda: backend.search_tasks("ledger cache")
+
+
+def tasks_counts(fixture: Fixture) -> Thunk:
+    backend = JsonlBackend(fixture.root)
+    return backend.get_task_counts
+
+
+def graph_build(fixture: Fixture) -> Thunk:
+    tasks = JsonlBackend(fixture.root).list_tasks()
+    return lambda: DependencyGraph(tasks)
+
+
+def graph_analyze(fixture: Fixture) -> Thunk:
+    graph = DependencyGraph(JsonlBackend(fixture.root).list_tasks())
+
+    def run() -> object:
+        return (
+            graph.stats,
+            graph.root_blockers(),
+            graph.chains(),
+            graph.has_cycle(),
+            graph.transitive_unblocks(task_id(0)),
+        )
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Ledger
+# ---------------------------------------------------------------------------
+
+
+def ledger_list(fixture: Fixture) -> Thunk:
+    return lambda: LedgerReader(fixture.ledger_dir).list_tasks()
+
+
+def ledger_get(fixture: Fixture) -> Thunk:
+    reader = LedgerReader(fixture.ledger_dir)
+    ids = _sample_ids(ledger_id, fixture.scale.ledger_entries)
+    return lambda: [reader.get_task(i) for i in ids]
+
+
+def ledger_search(fixture: Fixture) -> Thunk:
+    reader = LedgerReader(fixture.ledger_dir)
+    return lambda: reader.search_tasks("sync")
+
+
+def ledger_stats(fixture: Fixture) -> Thunk:
+    reader = LedgerReader(fixture.ledger_dir)
+    return reader.get_stats
+
+
+def ledger_write(fixture: Fixture) -> Thunk:
+    # Rewrite existing entries unchanged so repeated runs leave the fixture as generated
+    reader = LedgerReader(fixture.ledger_dir)
+    entries = [reader.get_task(i) for i in _sample_ids(ledger_id, fixture.scale.ledger_entries, 5)]
+    writer = LedgerWriter(fixture.ledger_dir)
+
+    def run() -> object:
+        for entry in entries:
+            if entry is not None:
+                writer.create_entry(entry)
+        return None
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Dashboard sync
+# ---------------------------------------------------------------------------
+
+
+def sync_full(fixture: Fixture) -> Thunk:
+    db_path = fixture.root / ".cub" / "dashboard-bench.db"
+
+    def run() -> object:
+        # A fresh database each time, so every run is a full sync
+        db_path.unlink(missing_ok=True)
+        previous_backend = os.environ.get("CUB_BACKEND")
+        os.environ["CUB_BACKEND"] = "jsonl"
+        try:
+            with _chdir(fixture.root):
+                result = SyncOrchestrator(
+                    db_path=db_path,
+                    specs_root=fixture.specs_dir,
+                    plans_root=fixture.plans_dir,
+                    tasks_backend="jsonl",
+                    ledger_path=fixture.ledger_dir,
+                ).sync()
+        finally:
+            if previous_backend is None:
+                os.environ.pop("CUB_BACKEND", None)
+            else:
+                os.environ["CUB_BACKEND"] = previous_backend
+            db_path.unlink(missing_ok=True)
+        return result
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Code intelligence
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def _parser_available(source_dir: Path) -> bool:
+    # The language pack fetches parsers on first use, which fails offline
+    probe = next(source_dir.rglob("mod*.py"))
+    return bool(code_intel.extract_tags(source_dir, [probe], use_cache=False))
+
+
+def _require_tree_sitter(fixture: Fixture) -> None:
+    if not code_intel._HAS_TREE_SITTER:
+        raise SkipCaseError("tree-sitter dependencies not installed")
+    if not _parser_available(fixture.source_dir):
+        raise SkipCaseError("no tree-sitter parser available for Python")
+
+
+def map_extract_cold(fixture: Fixture) -> Thunk:
+    _require_tree_sitter(fixture)
+    return lambda: code_intel.extract_tags(fixture.source_dir, use_cache=False)
+
+
+def map_extract_warm(fixture: Fixture) -> Thunk:
+    _require_tree_sitter(fixture)
+    code_intel.extract_tags(fixture.source_dir)
+    return lambda: code_intel.extract_tags(fixture.source_dir)
+
+
+def map_rank(fixture: Fixture) -> Thunk:
+    _require_tree_sitter(fixture)
+    tags = code_intel.extract_tags(fixture.source_dir)
+    return lambda: code_intel.rank_symbols(tags)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def cli_startup(fixture: Fixture) -> Thunk:
+    src_dir = Path(__file__).resolve().parent.parent / "src"
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(src_dir), os.environ.get("PYTHONPATH", "")]),
+    }
+    command = [sys.executable, "-m", "cub", "--help"]
+
+    def run() -> object:
+        return subprocess.run(command, cwd=fixture.root, env=env, capture_output=True, check=True)
+
+    return run
+
+
+CASES: list[Case] = [
+    Case("tasks.load", tasks_load, "JsonlBackend: parse tasks.jsonl and list every task"),
+    Case("tasks.ready", tasks_ready, "JsonlBackend.get_ready_tasks (cached file)"),
+    Case("tasks.get", tasks_get, "JsonlBackend.get_task for 100 IDs"),
+    Case("tasks.search", tasks_search, "JsonlBackend.search_tasks"),
+    Case("tasks.counts", tasks_counts, "JsonlBackend.get_task_counts"),
+    Case("graph.build", graph_build, "DependencyGraph construction"),
+    Case("graph.analyze", graph_analyze, "DependencyGraph stats, blockers, chains, cycles"),
+    Case("ledger.list", ledger_list, "LedgerReader.list_tasks over the full index"),
+    Case("ledger.get", ledger_get, "LedgerReader.get_task for 100 IDs"),
+    Case("ledger.search", ledger_search, "LedgerReader.search_tasks"),
+    Case("ledger.stats", ledger_stats, "LedgerReader.get_stats"),
+    Case("ledger.write", ledger_write, "LedgerWriter.create_entry for 5 entries"),
+    Case("sync.full", sync_full, "SyncOrchestrator.sync into a fresh database"),
+    Case("map.extract.cold", map_extract_cold, "extract_tags without the tag cache"),
+    Case("map.extract.warm", map_extract_warm, "extract_tags with a warm tag cache"),
+    Case("map.rank", map_rank, "rank_symbols over the extracted tags"),
+    Case("cli.startup", cli_startup, "python -m cub --help in a subprocess"),
+]
@@ -0,0 +1,434 @@
+"""
+Deterministic generator for large synthetic cub projects.
+
+A fixture project contains everything cub's hot paths read:
+
+- .cub/tasks.jsonl: tasks grouped into epics, each epic a deep dependency
+  chain with occasional cross-chain dependencies
+- .cub/ledger/: index.jsonl plus one by-task/ file per completed task
+- specs/{stage}/*.md: specs with frontmatter, spread across stages
+- plans/*/: session.json and plan.jsonl for each plan
+- src/: a Python source tree whose modules reference each other
+
+Generation is seeded, so the same scale and seed always produce the same
+project. Fixtures are expensive to build at full scale and are reused
+when a matching one already exists (see ensure_fixture()).
+"""
+
+import json
+import random
+import shutil
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from cub.core.ledger.models import (
+    CommitRef,
+    LedgerEntry,
+    LedgerIndex,
+    Lineage,
+    Outcome,
+    TokenUsage,
+)
+from cub.core.specs import Stage
+from cub.core.tasks.models import Task, TaskPriority, TaskStatus, TaskType
+
+# Bump when the generated layout changes so cached fixtures are rebuilt
+GENERATOR_VERSION = 1
+
+MANIFEST_NAME = "fixture.json"
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+LABELS = ["backend", "frontend", "cli", "docs", "perf", "bug", "refactor", "model:sonnet"]
+WORDS = (
+    "ledger task spec plan sync graph cache index parse render queue retry "
+    "budget harness session branch review release config symbol token"
+).split()
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Sizes of a generated fixture project."""
+
+    tasks: int
+    chain_length: int
+    ledger_entries: int
+    specs: int
+    plans: int
+    source_files: int
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(
+        tasks=200, chain_length=20, ledger_entries=500, specs=20, plans=10, source_files=40
+    ),
+    "medium": Scale(
+        tasks=2_000, chain_length=50, ledger_entries=10_000, specs=100, plans=50, source_files=300
+    ),
+    "full": Scale(
+        tasks=10_000,
+        chain_length=100,
+        ledger_entries=50_000,
+        specs=300,
+        plans=200,
+        source_files=1_500,
+    ),
+}
+
+
+def task_id(index: int) -> str:
+    """Return the ID of the index-th generated task."""
+    return f"bench-{index:05d}"
+
+
+def epic_id(chain: int) -> str:
+    """Return the ID of the epic owning the given dependency chain."""
+    return f"bench-e{chain:04d}"
+
+
+def ledger_id(index: int) -> str:
+    """Return the ID of the index-th generated ledger entry."""
+    return f"done-{index:05d}"
+
+
+@dataclass(frozen=True)
+class Fixture:
+    """A generated project on disk."""
+
+    root: Path
+    scale: Scale
+    seed: int
+
+    @property
+    def tasks_file(self) -> Path:
+        return self.root / ".cub" / "tasks.jsonl"
+
+    @property
+    def ledger_dir(self) -> Path:
+        return self.root / ".cub" / "ledger"
+
+    @property
+    def specs_dir(self) -> Path:
+        return self.root / "specs"
+
+    @property
+    def plans_dir(self) -> Path:
+        return self.root / "plans"
+
+    @property
+    def source_dir(self) -> Path:
+        return self.root / "src"
+
+    def manifest(self) -> dict[str, object]:
+        return {"generator": GENERATOR_VERSION, "seed": self.seed, "scale": asdict(self.scale)}
+
+
+def _sentence(rng: random.Random, words: int = 8) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _source_path(rng: random.Random, scale: Scale) -> str:
+    module = rng.randrange(scale.source_files)
+    return f"src/benchpkg{module // 25:03d}/mod{module % 25:02d}.py"
+
+
+def generate_tasks(fixture: Fixture, rng: random.Random) -> None:
+    """Write .cub/tasks.jsonl: epics whose tasks form deep dependency chains."""
+    scale = fixture.scale
+    chains = -(-scale.tasks // scale.chain_length)
+    tasks: list[Task] = []
+
+    for chain in range(chains):
+        first = chain * scale.chain_length
+        size = min(scale.chain_length, scale.tasks - first)
+        # Earlier chains are further along: everything before `done` is closed
+        done = size if rng.random() < 0.3 else rng.randrange(size)
+        tasks.append(
+            Task(
+                id=epic_id(chain),
+                title=f"Epic {chain}: {_sentence(rng, 4)}",
+                status=TaskStatus.CLOSED if done == size else TaskStatus.OPEN,
+                type=TaskType.EPIC,
+                description=_sentence(rng, 20),
+                created_at=BASE_TIME + timedelta(hours=chain),
+            )
+        )
+
+        for position in range(size):
+            index = first + position
+            depends_on = [task_id(index - 1)] if position else []
+            if chain and rng.random() < 0.1:
+                # Cross-chain dependency on an earlier chain keeps the graph acyclic
+                depends_on.append(task_id(rng.randrange(first)))
+            if position < done:
+                status = TaskStatus.CLOSED
+            elif position == done and rng.random() < 0.5:
+                status = TaskStatus.IN_PROGRESS
+            else:
+                status = TaskStatus.OPEN
+
+            created_at = BASE_TIME + timedelta(hours=chain, minutes=position)
+            tasks.append(
+                Task(
+                    id=task_id(index),
+                    title=f"Task {index}: {_sentence(rng, 5)}",
+                    status=status,
+                    priority=rng.choice(list(TaskPriority)),
+                    type=rng.choice([TaskType.TASK, TaskType.TASK, TaskType.BUG]),
+                    description=" ".join(_sentence(rng) for _ in range(4)),
+                    labels=rng.sample(LABELS, 2),
+                    depends_on=depends_on,
+                    parent=epic_id(chain),
+                    created_at=created_at,
+                    updated_at=created_at,
+                    closed_at=created_at + timedelta(hours=1)
+                    if status == TaskStatus.CLOSED
+                    else None,
+                    acceptance_criteria=[_sentence(rng, 6) for _ in range(3)],
+                )
+            )
+
+    fixture.tasks_file.parent.mkdir(parents=True, exist_ok=True)
+    with fixture.tasks_file.open("w", encoding="utf-8") as f:
+        for task in tasks:
+            json.dump(task.model_dump(by_alias=True, mode="json"), f)
+            f.write("\n")
+
+
+def generate_ledger(fixture: Fixture, rng: random.Random) -> None:
+    """Write the ledger index and by-task entries directly.
+
+    LedgerWriter rewrites the whole index on every entry, which would make
+    building a 50k-entry ledger quadratic; the files written here are the
+    same ones it produces.
+    """
+    scale = fixture.scale
+    chains = -(-scale.tasks // scale.chain_length)
+    by_task = fixture.ledger_dir / "by-task"
+    by_task.mkdir(parents=True, exist_ok=True)
+
+    with (fixture.ledger_dir / "index.jsonl").open("w", encoding="utf-8") as index:
+        for i in range(scale.ledger_entries):
+            completed_at = BASE_TIME + timedelta(minutes=7 * i)
+            files = sorted({_source_path(rng, scale) for _ in range(3)})
+            commit = CommitRef(
+                hash=f"{rng.getrandbits(160):040x}",
+                message=_sentence(rng, 6),
+                timestamp=completed_at,
+            )
+            cost = round(rng.uniform(0.01, 2.0), 4)
+            entry = LedgerEntry(
+                id=ledger_id(i),
+                title=f"Completed {i}: {_sentence(rng, 5)}",
+                lineage=Lineage(
+                    spec_file=f"specs/released/bench-spec-{i % max(scale.specs, 1):04d}.md",
+                    epic_id=epic_id(i % chains),
+                ),
+                started_at=completed_at - timedelta(minutes=30),
+                completed_at=completed_at,
+                tokens=TokenUsage(
+                    input_tokens=rng.randrange(1_000, 100_000),
+                    output_tokens=rng.randrange(100, 20_000),
+                ),
+                cost_usd=cost,
+                duration_seconds=1_800,
+                approach=_sentence(rng, 20),
+                decisions=[_sentence(rng) for _ in range(2)],
+                files_changed=files,
+                commits=[commit],
+                outcome=Outcome(
+                    success=rng.random() < 0.9,
+                    completed_at=completed_at,
+                    total_cost_usd=cost,
+                    total_attempts=rng.randrange(1, 4),
+                    total_duration_seconds=1_800,
+                    files_changed=files,
+                    commits=[commit],
+                ),
+            )
+            (by_task / f"{entry.id}.json").write_text(
+                json.dumps(entry.model_dump(mode="json"), default=str), encoding="utf-8"
+            )
+            json.dump(LedgerIndex.from_ledger_entry(entry).model_dump(mode="json"), index)
+            index.write("\n")
+
+
+def generate_specs(fixture: Fixture, rng: random.Random) -> None:
+    """Write specs with frontmatter, spread across the stage directories."""
+    stages = list(Stage)
+    for i in range(fixture.scale.specs):
+        stage = stages[i % len(stages)]
+        spec_dir = fixture.specs_dir / stage.value
+        spec_dir.mkdir(parents=True, exist_ok=True)
+        sections = "\n\n".join(
+            f"## {heading}\n\n" + "\n".join(f"- {_sentence(rng)}" for _ in range(8))
+            for heading in ("Goals", "Non-Goals", "Design", "Open Questions")
+        )
+        (spec_dir / f"bench-spec-{i:04d}.md").write_text(
+            f"---\n"
+            f"status: {stage.value}\n"
+            f"priority: {rng.choice(['low', 'medium', 'high'])}\n"
+            f"complexity: {rng.choice(['low', 'medium', 'high'])}\n"
+            f"dependencies: []\n"
+            f"created: 2026-01-{i % 28 + 1:02d}\n"
+            f"updated: 2026-02-{i % 28 + 1:02d}\n"
+            f"readiness:\n"
+            f"  score: {rng.randrange(1, 11)}\n"
+            f"  blockers: []\n"
+            f"  questions:\n"
+            f"  - {_sentence(rng)}\n"
+            f"spec_id: bench-spec-{i:04d}\n"
+            f"---\n"
+            f"# Spec {i}: {_sentence(rng, 4)}\n\n"
+            f"{_sentence(rng, 30)}\n\n{sections}\n",
+            encoding="utf-8",
+        )
+
+
+def generate_plans(fixture: Fixture, rng: random.Random) -> None:
+    """Write plan sessions, each an epic plus its tasks in plan.jsonl."""
+    for i in range(fixture.scale.plans):
+        plan_dir = fixture.plans_dir / f"bench-plan-{i:04d}"
+        plan_dir.mkdir(parents=True, exist_ok=True)
+        session = {
+            "id": f"bench-plan-{i:04d}",
+            "created": (BASE_TIME + timedelta(days=i)).isoformat(),
+            "updated": (BASE_TIME + timedelta(days=i, hours=2)).isoformat(),
+            "epic_id": f"plan-e{i:04d}",
+            "status": "complete",
+        }
+        (plan_dir / "session.json").write_text(json.dumps(session, indent=2), encoding="utf-8")
+
+        lines = [
+            {
+                "id": f"plan-e{i:04d}",
+                "title": f"Plan {i}: {_sentence(rng, 4)}",
+                "issue_type": "epic",
+                "priority": rng.randrange(5),
+                "description": _sentence(rng, 25),
+                "labels": rng.sample(LABELS, 2),
+                "spec_id": f"bench-spec-{i % max(fixture.scale.specs, 1):04d}",
+            }
+        ]
+        lines.extend(
+            {
+                "id": f"plan-e{i:04d}.{j}",
+                "title": _sentence(rng, 5),
+                "issue_type": "task",
+                "priority": rng.randrange(5),
+                "description": _sentence(rng, 25),
+                "depends_on": [f"plan-e{i:04d}.{j - 1}"] if j else [],
+            }
+            for j in range(1, 11)
+        )
+        (plan_dir / "plan.jsonl").write_text(
+            "".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8"
+        )
+
+
+def generate_source(fixture: Fixture, rng: random.Random) -> None:
+    """Write a Python package tree whose modules import and call each other."""
+    for i in range(fixture.scale.source_files):
+        package, module = divmod(i, 25)
+        package_dir = fixture.source_dir / f"benchpkg{package:03d}"
+        package_dir.mkdir(parents=True, exist_ok=True)
+
+        lines = [f'"""Generated module {i}."""', ""]
+        callees: list[tuple[int, int]] = []
+        if i:
+            for other in sorted({rng.randrange(i) for _ in range(3)}):
+                other_package, other_module = divmod(other, 25)
+                lines.append(
+                    f"from benchpkg{other_package:03d}.mod{other_module:02d} import "
+                    f"helper_{other}_0, Service{other}_0"
+                )
+                callees.append((other, rng.randrange(6)))
+        lines.append("")
+
+        for c in range(4):
+            lines += [
+                "",
+                f"class Service{i}_{c}:",
+                f'    """Service {c} of module {i}."""',
+                "",
+                "    def __init__(self, name: str) -> None:",
+                "        self.name = name",
+                "        self.count = 0",
+            ]
+            for m in range(3):
+                lines += [
+                    "",
+                    f"    def {rng.choice(WORDS)}_{m}(self, value: int) -> int:",
+                    "        self.count += value",
+                    f"        return helper_{i}_{m}(self.count)",
+                ]
+            lines.append("")
+
+        for f_index in range(6):
+            body = [f"    total = value + {f_index}"]
+            for other, _ in callees:
+                body.append(f"    total += helper_{other}_0(total) % 7")
+                body.append(f"    Service{other}_0(str(total))")
+            lines += [
+                "",
+                f"def helper_{i}_{f_index}(value: int) -> int:",
+                *body,
+                "    return total",
+                "",
+            ]
+
+        (package_dir / f"mod{module:02d}.py").write_text("\n".join(lines), encoding="utf-8")
+        init_file = package_dir / "__init__.py"
+        if not init_file.exists():
+            init_file.write_text("", encoding="utf-8")
+
+
+def generate(root: Path, scale: Scale, seed: int = 0) -> Fixture:
+    """
+    Generate a fixture project, replacing anything already at root.
+
+    Args:
+        root: Directory to generate the project in
+        scale: Sizes of the generated data
+        seed: Random seed; equal seeds produce identical projects
+
+    Returns:
+        The generated Fixture
+    """
+    if root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+    fixture = Fixture(root=root, scale=scale, seed=seed)
+
+    # Each part gets its own stream so changing one doesn't reshuffle the rest
+    generate_tasks(fixture, random.Random(f"{seed}-tasks"))
+    generate_ledger(fixture, random.Random(f"{seed}-ledger"))
+    generate_specs(fixture, random.Random(f"{seed}-specs"))
+    generate_plans(fixture, random.Random(f"{seed}-plans"))
+    generate_source(fixture, random.Random(f"{seed}-source"))
+
+    (root / MANIFEST_NAME).write_text(json.dumps(fixture.manifest(), indent=2), encoding="utf-8")
+    return fixture
+
+
+def ensure_fixture(root: Path, scale: Scale, seed: int = 0) -> Fixture:
+    """
+    Reuse the fixture at root if it matches scale and seed, else generate it.
+
+    Args:
+        root: Directory holding the fixture project
+        scale: Sizes of the generated data
+        seed: Random seed
+
+    Returns:
+        A Fixture matching scale and seed
+    """
+    fixture = Fixture(root=root, scale=scale, seed=seed)
+    try:
+        manifest = json.loads((root / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = None
+    if manifest == fixture.manifest():
+        return fixture
+    return generate(root, scale, seed)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Run cub's performance benchmarks against a synthetic large project.
+
+Generates (or reuses) a deterministic fixture project, times each hot path
+and writes the results as JSON. With --compare, the results are checked
+against an earlier run and regressions beyond the threshold are reported.
+
+Usage:
+    python benchmarks/run.py                          # full scale, all cases
+    python benchmarks/run.py --scale small            # quick run
+    python benchmarks/run.py --only ledger --only tasks.load
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --compare before.json --threshold 0.15
+
+Exit codes:
+    0 - Benchmarks ran (and no regressions with --compare)
+    1 - Regressions found by --compare
+    2 - Invalid arguments or unreadable baseline
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root))
+
+from benchmarks.cases import CASES, Case, SkipCaseError  # noqa: E402
+from benchmarks.fixtures import SCALES, Fixture, ensure_fixture  # noqa: E402
+
+RESULTS_VERSION = 1
+
+# Differences smaller than this are timer noise, whatever the ratio
+DEFAULT_MIN_DELTA_SECONDS = 0.005
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One case's timing against the baseline."""
+
+    name: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+def select_cases(only: list[str] | None) -> list[Case]:
+    """Select cases whose name equals or starts with one of the given prefixes."""
+    if not only:
+        return list(CASES)
+    return [
+        case
+        for case in CASES
+        if any(case.name == prefix or case.name.startswith(prefix + ".") for prefix in only)
+    ]
+
+
+def time_case(case: Case, fixture: Fixture, repeat: int, warmup: int) -> dict[str, Any]:
+    """Prepare a case and time repeated calls of it."""
+    try:
+        thunk = case.prepare(fixture)
+    except SkipCaseError as e:
+        return {"skipped": str(e)}
+
+    for _ in range(warmup):
+        thunk()
+
+    runs: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        thunk()
+        runs.append(time.perf_counter() - start)
+
+    return {
+        "median_s": statistics.median(runs),
+        "min_s": min(runs),
+        "mean_s": statistics.fmean(runs),
+        "runs": runs,
+    }
+
+
+def git_commit() -> str | None:
+    """Return the checked-out commit, if the project is a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmarks(
+    fixture: Fixture,
+    cases: list[Case],
+    *,
+    scale_name: str,
+    repeat: int,
+    warmup: int,
+    verbose: bool = True,
+) -> dict[str, Any]:
+    """Time every case and return the results document."""
+    results: dict[str, Any] = {}
+    for case in cases:
+        result = time_case(case, fixture, repeat, warmup)
+        results[case.name] = result
+        if verbose:
+            if "skipped" in result:
+                print(f"  {case.name:<20} skipped: {result['skipped']}")
+            else:
+                print(
+                    f"  {case.name:<20} median {result['median_s'] * 1000:10.2f} ms"
+                    f"   min {result['min_s'] * 1000:10.2f} ms"
+                )
+
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale_name,
+        "seed": fixture.seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float,
+    min_delta: float = DEFAULT_MIN_DELTA_SECONDS,
+) -> list[Comparison]:
+    """
+    Compare median timings of the cases present in both result documents.
+
+    A case regresses when its median grew by more than threshold (a
+    fraction, 0.2 = 20%) and by more than min_delta seconds.
+    """
+    comparisons: list[Comparison] = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or "median_s" not in before or "median_s" not in result:
+            continue
+        old, new = before["median_s"], result["median_s"]
+        regressed = new > old * (1 + threshold) and new - old > min_delta
+        comparisons.append(Comparison(name=name, baseline=old, current=new, regressed=regressed))
+    return comparisons
+
+
+def print_comparison(comparisons: list[Comparison], baseline: dict[str, Any]) -> None:
+    commit = (baseline.get("commit") or "unknown")[:12]
+    print(f"\nCompared with {commit} ({baseline.get('created_at', 'unknown date')}):")
+    for c in comparisons:
+        marker = "  REGRESSION" if c.regressed else ""
+        print(
+            f"  {c.name:<20} {c.baseline * 1000:10.2f} ms -> {c.current * 1000:10.2f} ms"
+            f"  {c.change:+7.1%}{marker}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark cub's hot paths on a synthetic large project."
+    )
+    parser.add_argument(
+        "--scale",
+        choices=sorted(SCALES),
+        default="full",
+        help="Fixture size (default: full)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Fixture random seed (default: 0)")
+    parser.add_argument(
+        "--fixture-dir",
+        type=Path,
+        help="Where to generate or reuse the fixture project "
+        "(default: <tmp>/cub-benchmarks/<scale>-<seed>)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="PREFIX",
+        help="Run only cases named PREFIX or PREFIX.* (repeatable)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (default: 5)")
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed runs before timing (default: 1)"
+    )
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE", help="Results JSON to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Slowdown fraction counted as a regression (default: 0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA_SECONDS,
+        help="Ignore slowdowns smaller than this many seconds "
+        f"(default: {DEFAULT_MIN_DELTA_SECONDS})",
+    )
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    args = parser.parse_args(argv)
+
+    cases = select_cases(args.only)
+    if args.list:
+        for case in cases:
+            print(f"{case.name:<20} {case.description}")
+        return 0
+    if not cases:
+        print(f"No cases match {args.only}", file=sys.stderr)
+        return 2
+    if args.repeat < 1 or args.warmup < 0:
+        print("--repeat must be at least 1 and --warmup at least 0", file=sys.stderr)
+        return 2
+
+    baseline: dict[str, Any] | None = None
+    if args.compare:
+        try:
+            baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Cannot read baseline {args.compare}: {e}", file=sys.stderr)
+            return 2
+
+    fixture_dir = args.fixture_dir or (
+        Path(tempfile.gettempdir()) / "cub-benchmarks" / f"{args.scale}-{args.seed}"
+    )
+    print(f"Preparing {args.scale} fixture in {fixture_dir} ...")
+    start = time.perf_counter()
+    fixture = ensure_fixture(fixture_dir, SCALES[args.scale], args.seed)
+    print(f"Fixture ready in {time.perf_counter() - start:.1f}s\n")
+
+    # Library warnings (e.g. sync's per-relationship errors) would drown the report
+    logging.disable(logging.CRITICAL)
+    try:
+        document = run_benchmarks(
+            fixture, cases, scale_name=args.scale, repeat=args.repeat, warmup=args.warmup
+        )
+    finally:
+        logging.disable(logging.NOTSET)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if baseline is None:
+        return 0
+
+    if (baseline.get("scale"), baseline.get("seed")) != (args.scale, args.seed):
+        print(
+            f"\nWarning: baseline used scale={baseline.get('scale')} seed={baseline.get('seed')}; "
+            "timings are not comparable",
+            file=sys.stderr,
+        )
+    comparisons = compare(baseline, document, threshold=args.threshold, min_delta=args.min_delta)
+    print_comparison(comparisons, baseline)
+    regressions = [c.name for c in comparisons if c.regressed]
+    if regressions:
+        print(
+            f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: "
+            + ", ".join(regressions)
+        )
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,7 @@ from .coverage import (
     run_coverage,
 )
 from .dead_code import (
+    analyze_python_file,
     detect_unused,
     detect_unused_bash,
     find_bash_calls,
@@ -19,6 +20,7 @@ from .dead_code import (
     find_python_definitions,
     find_python_references,
     run_shellcheck,
+    run_shellcheck_batch,
 )
 from .docs import (
     check_links,
@@ -27,6 +29,7 @@ from .docs import (
     validate_code,
     validate_docs,
 )
+from .links import ExternalLinkChecker, LinkCheckResult, LinkResultCache
 from .models import (
     AuditReport,
     CategoryScore,
@@ -47,8 +50,12 @@ __all__ = [
     "DeadCodeFinding",
     "DeadCodeReport",
     "DocsReport",
+    "ExternalLinkChecker",
     "Grade",
+    "LinkCheckResult",
     "LinkFinding",
+    "LinkResultCache",
+    "analyze_python_file",
     "check_links",
     "detect_unused",
     "detect_unused_bash",
@@ -64,6 +71,7 @@ __all__ = [
     "parse_coverage_report",
     "run_coverage",
     "run_shellcheck",
+    "run_shellcheck_batch",
     "validate_code",
     "validate_docs",
 ]
@@ -3,17 +3,39 @@ Dead code detection for Python using AST analysis.
 
 Detects unused imports, functions, classes, methods, and variables by comparing
 definitions against references.
+
+Each Python file is parsed once to collect its definitions, references and
+``__all__`` exports together. Files are analysed across a process pool, and
+per-file results can be cached by content hash so repeated audits only
+re-analyse files that changed.
 """
 
 import ast
+import hashlib
 import json
+import logging
+import os
 import re
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Literal, NamedTuple
+from typing import Any, Literal, NamedTuple
 
 from .models import DeadCodeFinding, DeadCodeReport
 
+logger = logging.getLogger(__name__)
+
+# Bump when analysis output changes so stale cache entries are discarded
+ANALYSIS_CACHE_VERSION = 1
+
+# Below this many uncached files, process pool start-up costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+# Maximum number of files passed to a single shellcheck invocation
+SHELLCHECK_BATCH_SIZE = 200
+
 
 class Definition(NamedTuple):
     """A definition found in the AST."""
@@ -161,6 +183,95 @@ class ASTReferenceVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+class ASTFileVisitor(ASTDefinitionVisitor, ASTReferenceVisitor):
+    """
+    AST visitor that collects definitions, references and exports in one pass.
+
+    Combines ASTDefinitionVisitor and ASTReferenceVisitor, and also records
+    the ``__all__`` list. When several ``__all__`` assignments exist, the
+    shallowest one wins, matching a breadth-first search of the tree.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        ASTDefinitionVisitor.__init__(self, file_path)
+        ASTReferenceVisitor.__init__(self)
+        self.exports: set[str] = set()
+        self._exports_depth: int | None = None
+        self._depth = 0
+
+    def visit(self, node: ast.AST) -> Any:
+        """Visit a node, tracking nesting depth for __all__ resolution."""
+        self._depth += 1
+        try:
+            return super().visit(node)
+        finally:
+            self._depth -= 1
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Collect __all__ exports, then record the assignment as a definition."""
+        if self._exports_depth is None or self._depth < self._exports_depth:
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == "__all__":
+                    if isinstance(node.value, (ast.List, ast.Tuple)):
+                        self.exports = {
+                            elt.value
+                            for elt in node.value.elts
+                            if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                        }
+                        self._exports_depth = self._depth
+        super().visit_Assign(node)
+
+
+class PythonFileAnalysis(NamedTuple):
+    """Definitions, references and exports collected from one Python file."""
+
+    definitions: list[Definition]
+    references: set[str]
+    exports: set[str]
+
+
+def analyze_python_source(source: str, file_path: str) -> PythonFileAnalysis:
+    """
+    Parse Python source once and collect definitions, references and exports.
+
+    Args:
+        source: Python source code
+        file_path: Path recorded on each Definition
+
+    Returns:
+        PythonFileAnalysis for the source
+
+    Raises:
+        SyntaxError: If the source contains invalid Python syntax
+    """
+    tree = ast.parse(source, filename=file_path)
+
+    visitor = ASTFileVisitor(file_path)
+    visitor.visit(tree)
+
+    return PythonFileAnalysis(
+        definitions=visitor.definitions,
+        references=visitor.references,
+        exports=visitor.exports,
+    )
+
+
+def analyze_python_file(file_path: Path) -> PythonFileAnalysis:
+    """
+    Parse a Python file once and collect definitions, references and exports.
+
+    Args:
+        file_path: Path to the Python file to analyze
+
+    Returns:
+        PythonFileAnalysis for the file
+
+    Raises:
+        SyntaxError: If the file contains invalid Python syntax
+    """
+    return analyze_python_source(file_path.read_text(encoding="utf-8"), str(file_path))
+
+
 def find_python_definitions(file_path: Path) -> list[Definition]:
     """
     Parse a Python file and extract all definitions.
@@ -174,13 +285,7 @@ def find_python_definitions(file_path: Path) -> list[Definition]:
     Raises:
         SyntaxError: If the file contains invalid Python syntax
     """
-    source = file_path.read_text(encoding="utf-8")
-    tree = ast.parse(source, filename=str(file_path))
-
-    visitor = ASTDefinitionVisitor(str(file_path))
-    visitor.visit(tree)
-
-    return visitor.definitions
+    return analyze_python_file(file_path).definitions
 
 
 def find_python_references(file_path: Path) -> set[str]:
@@ -196,13 +301,7 @@ def find_python_references(file_path: Path) -> set[str]:
     Raises:
         SyntaxError: If the file contains invalid Python syntax
     """
-    source = file_path.read_text(encoding="utf-8")
-    tree = ast.parse(source, filename=str(file_path))
-
-    visitor = ASTReferenceVisitor()
-    visitor.visit(tree)
-
-    return visitor.references
+    return analyze_python_file(file_path).references
 
 
 def get_module_exports(file_path: Path) -> set[str]:
@@ -215,22 +314,7 @@ def get_module_exports(file_path: Path) -> set[str]:
     Returns:
         Set of exported names (empty if no __all__ is defined)
     """
-    source = file_path.read_text(encoding="utf-8")
-    tree = ast.parse(source, filename=str(file_path))
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "__all__":
-                    # Extract list values
-                    if isinstance(node.value, (ast.List, ast.Tuple)):
-                        exports = set()
-                        for elt in node.value.elts:
-                            if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                                exports.add(elt.value)
-                        return exports
-
-    return set()
+    return analyze_python_file(file_path).exports
 
 
 def should_exclude_definition(definition: Definition, exports: set[str]) -> bool:
@@ -261,9 +345,129 @@ def should_exclude_definition(definition: Definition, exports: set[str]) -> bool
     return False
 
 
+class PythonAnalysisCache:
+    """
+    Per-file Python analysis results keyed by file content hash.
+
+    Stored as a single JSON file so a warm audit costs one read plus a hash
+    of each source file. Definitions are stored without their file path, so
+    files with identical content share an entry.
+    """
+
+    def __init__(self, cache_file: Path) -> None:
+        self.cache_file = cache_file
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == ANALYSIS_CACHE_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self._entries
+
+    def get(self, content_hash: str, file_path: str) -> PythonFileAnalysis | None:
+        """
+        Look up the analysis for a file's content.
+
+        Returns:
+            PythonFileAnalysis, or None on a miss or if the content is cached
+            as unparseable
+        """
+        entry = self._entries.get(content_hash)
+        if entry is None or entry.get("error"):
+            return None
+        return PythonFileAnalysis(
+            definitions=[
+                Definition(name=name, kind=kind, line_number=line, file_path=file_path)
+                for name, kind, line in entry["definitions"]
+            ],
+            references=set(entry["references"]),
+            exports=set(entry["exports"]),
+        )
+
+    def put(self, content_hash: str, analysis: PythonFileAnalysis | None) -> None:
+        """Store the analysis for a file's content (None for unparseable files)."""
+        if analysis is None:
+            self._entries[content_hash] = {"error": True}
+        else:
+            self._entries[content_hash] = {
+                "definitions": [[d.name, d.kind, d.line_number] for d in analysis.definitions],
+                "references": sorted(analysis.references),
+                "exports": sorted(analysis.exports),
+            }
+        self._dirty = True
+
+    def save(self, keep: set[str]) -> None:
+        """Write the cache, dropping entries for content no longer present."""
+        stale = set(self._entries) - keep
+        if not self._dirty and not stale:
+            return
+        for content_hash in stale:
+            del self._entries[content_hash]
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": ANALYSIS_CACHE_VERSION, "entries": self._entries}, f)
+                os.replace(tmp_path, self.cache_file)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("Failed to write dead code analysis cache", exc_info=True)
+        self._dirty = False
+
+
+def _analyze_or_none(source: str, file_path: str) -> PythonFileAnalysis | None:
+    """Analyze source, returning None for files that can't be parsed.
+
+    Module-level so it can be pickled into a process pool.
+    """
+    try:
+        return analyze_python_source(source, file_path)
+    except (SyntaxError, ValueError):
+        return None
+
+
+def _analyze_sources(
+    sources: list[tuple[str, str]],
+    max_workers: int | None,
+) -> list[PythonFileAnalysis | None]:
+    """Analyze (source, file_path) pairs, in parallel when worthwhile."""
+    if len(sources) >= PARALLEL_THRESHOLD and max_workers != 1:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                workers = max_workers or os.cpu_count() or 1
+                chunksize = max(1, len(sources) // (workers * 4))
+                return list(
+                    executor.map(
+                        _analyze_or_none,
+                        [src for src, _ in sources],
+                        [path for _, path in sources],
+                        chunksize=chunksize,
+                    )
+                )
+        except (OSError, RuntimeError):
+            # Process pools are unavailable in some sandboxes; fall back to serial
+            logger.debug("Process pool unavailable; analyzing serially", exc_info=True)
+    return [_analyze_or_none(src, path) for src, path in sources]
+
+
 def detect_unused(
     project_root: Path,
     exclude_patterns: list[str] | None = None,
+    *,
+    cache_dir: Path | None = None,
+    max_workers: int | None = None,
 ) -> DeadCodeReport:
     """
     Detect unused code in a Python project.
@@ -271,6 +475,8 @@ def detect_unused(
     Args:
         project_root: Root directory of the project to analyze
         exclude_patterns: List of glob patterns to exclude (e.g., ["**/test_*.py"])
+        cache_dir: Directory for the per-file analysis cache (no caching if None)
+        max_workers: Maximum analysis processes (None for CPU count, 1 for serial)
 
     Returns:
         DeadCodeReport containing all findings
@@ -288,28 +494,57 @@ def detect_unused(
 
     python_files = [f for f in python_files if f not in excluded_paths]
 
-    # Collect all definitions across all files
-    all_definitions: list[Definition] = []
-    all_references: set[str] = set()
-    files_scanned = 0
+    cache = PythonAnalysisCache(cache_dir / "python.json") if cache_dir else None
+
+    # Read each file once; serve unchanged content from the cache
+    analyses: dict[int, PythonFileAnalysis | None] = {}
+    content_hashes: dict[int, str] = {}
+    pending: list[tuple[int, str]] = []
 
-    for py_file in python_files:
+    for i, py_file in enumerate(python_files):
         try:
-            definitions = find_python_definitions(py_file)
-            references = find_python_references(py_file)
-            exports = get_module_exports(py_file)
+            raw = py_file.read_bytes()
+            source = raw.decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            # Skip unreadable files or files with encoding issues
+            continue
 
-            # Filter out excluded definitions
-            definitions = [d for d in definitions if not should_exclude_definition(d, exports)]
+        content_hash = hashlib.sha256(raw).hexdigest()
+        content_hashes[i] = content_hash
+        if cache is not None and content_hash in cache:
+            analyses[i] = cache.get(content_hash, str(py_file))
+        else:
+            pending.append((i, source))
 
-            all_definitions.extend(definitions)
-            all_references.update(references)
-            files_scanned += 1
+    results = _analyze_sources(
+        [(source, str(python_files[i])) for i, source in pending], max_workers
+    )
+    for (i, _), analysis in zip(pending, results):
+        analyses[i] = analysis
+        if cache:
+            cache.put(content_hashes[i], analysis)
+
+    if cache:
+        cache.save(set(content_hashes.values()))
+
+    # Collect all definitions across all files
+    all_definitions: list[Definition] = []
+    all_references: set[str] = set()
+    files_scanned = 0
 
-        except (SyntaxError, UnicodeDecodeError):
-            # Skip files with syntax errors or encoding issues
+    for i in sorted(analyses):
+        analysis = analyses[i]
+        if analysis is None:
+            # Skip files with syntax errors
             continue
 
+        # Filter out excluded definitions
+        all_definitions.extend(
+            d for d in analysis.definitions if not should_exclude_definition(d, analysis.exports)
+        )
+        all_references.update(analysis.references)
+        files_scanned += 1
+
     # Find unused definitions
     findings: list[DeadCodeFinding] = []
     for definition in all_definitions:
@@ -563,6 +798,45 @@ def run_shellcheck(file_path: Path) -> list[dict[str, object]]:
     return []
 
 
+def run_shellcheck_batch(file_paths: list[Path]) -> dict[str, list[dict[str, object]]]:
+    """
+    Run shellcheck over many Bash scripts with as few invocations as possible.
+
+    Files are checked in batches of SHELLCHECK_BATCH_SIZE per process.
+
+    Args:
+        file_paths: Paths to the Bash scripts to check
+
+    Returns:
+        Mapping of file path (as passed) to its shellcheck warnings. Empty if
+        shellcheck is not available.
+    """
+    warnings_by_file: dict[str, list[dict[str, object]]] = {}
+    if not file_paths or shutil.which("shellcheck") is None:
+        return warnings_by_file
+
+    for start in range(0, len(file_paths), SHELLCHECK_BATCH_SIZE):
+        batch = [str(p) for p in file_paths[start : start + SHELLCHECK_BATCH_SIZE]]
+        try:
+            result = subprocess.run(
+                ["shellcheck", "--format=json", *batch],
+                capture_output=True,
+                text=True,
+                timeout=10 * len(batch),
+            )
+            if result.returncode not in (0, 1):  # 0 = no issues, 1 = issues found
+                continue
+            warnings = json.loads(result.stdout) if result.stdout else []
+        except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
+            continue
+
+        for warning in warnings:
+            if isinstance(warning, dict) and isinstance(warning.get("file"), str):
+                warnings_by_file.setdefault(warning["file"], []).append(warning)
+
+    return warnings_by_file
+
+
 def detect_unused_bash(
     project_root: Path,
     exclude_patterns: list[str] | None = None,
@@ -609,14 +883,13 @@ def detect_unused_bash(
 
     # Integrate shellcheck warnings (optional)
     shellcheck_unused: set[tuple[str, int]] = set()
-    for bash_file in bash_files:
-        warnings = run_shellcheck(bash_file)
+    for file_path, warnings in run_shellcheck_batch(bash_files).items():
         for warning in warnings:
             # SC2317: Command appears to be unreachable (shellcheck unused function detection)
             if isinstance(warning, dict) and warning.get("code") == 2317:
                 line = warning.get("line")
                 if isinstance(line, int):
-                    shellcheck_unused.add((str(bash_file), line))
+                    shellcheck_unused.add((file_path, line))
 
     # Find unused definitions
     findings: list[DeadCodeFinding] = []
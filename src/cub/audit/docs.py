@@ -15,8 +15,7 @@ from pathlib import Path
 from typing import NamedTuple
 from urllib.parse import urlparse
 
-import requests
-
+from .links import ExternalLinkChecker, LinkCheckResult, LinkResultCache
 from .models import CodeBlockFinding, DocsReport, LinkFinding
 
 
@@ -136,25 +135,32 @@ def extract_code_blocks(file_path: Path, content: str) -> list[CodeBlock]:
     return code_blocks
 
 
-def check_links(links: list[Link], project_root: Path, timeout: int = 5) -> list[LinkFinding]:
+def check_links(
+    links: list[Link],
+    project_root: Path,
+    timeout: float = 5,
+    *,
+    cache: LinkResultCache | None = None,
+    max_per_host: int = 4,
+) -> list[LinkFinding]:
     """
     Validate a list of links, checking HTTP URLs and internal file references.
 
+    Internal file references are checked on disk. HTTP/HTTPS URLs are
+    deduplicated and checked concurrently by ExternalLinkChecker.
+
     Args:
         links: List of Link objects to check
         project_root: Root directory of the project for resolving relative paths
         timeout: Timeout in seconds for HTTP requests
+        cache: Optional persistent cache of HTTP results
+        max_per_host: Maximum concurrent HTTP requests to a single host
 
     Returns:
         List of LinkFinding objects for broken or invalid links
     """
-    findings: list[LinkFinding] = []
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "cub-docs-validator/1.0",
-        }
-    )
+    # Findings in link order, with HTTP links held in place until checked
+    ordered: list[LinkFinding | Link] = []
 
     for link in links:
         url = link.url
@@ -182,7 +188,7 @@ def check_links(links: list[Link], project_root: Path, timeout: int = 5) -> list
             ref_path = Path(ref_path_str)
 
             if not ref_path.exists():
-                findings.append(
+                ordered.append(
                     LinkFinding(
                         file_path=link.file_path,
                         line_number=link.line_number,
@@ -197,18 +203,11 @@ def check_links(links: list[Link], project_root: Path, timeout: int = 5) -> list
             # Validate URL format
             try:
                 parsed = urlparse(url)
-                if not parsed.scheme or not parsed.netloc:
-                    findings.append(
-                        LinkFinding(
-                            file_path=link.file_path,
-                            line_number=link.line_number,
-                            url=url,
-                            issue="invalid_url",
-                        )
-                    )
-                    continue
+                valid = bool(parsed.scheme and parsed.netloc)
             except Exception:
-                findings.append(
+                valid = False
+            if not valid:
+                ordered.append(
                     LinkFinding(
                         file_path=link.file_path,
                         line_number=link.line_number,
@@ -219,7 +218,7 @@ def check_links(links: list[Link], project_root: Path, timeout: int = 5) -> list
                 continue
         else:
             # Not clearly a URL or file path - treat as invalid
-            findings.append(
+            ordered.append(
                 LinkFinding(
                     file_path=link.file_path,
                     line_number=link.line_number,
@@ -229,54 +228,32 @@ def check_links(links: list[Link], project_root: Path, timeout: int = 5) -> list
             )
             continue
 
-        # Check HTTP/HTTPS links
-        try:
-            response = session.head(url, timeout=timeout, allow_redirects=True)
-            if response.status_code >= 400:
-                findings.append(
-                    LinkFinding(
-                        file_path=link.file_path,
-                        line_number=link.line_number,
-                        url=url,
-                        issue="broken_link",
-                        status_code=response.status_code,
-                    )
-                )
-        except requests.Timeout:
+        # Only HTTP/HTTPS links are checked over the network
+        if parsed.scheme in ("http", "https"):
+            ordered.append(link)
+
+    http_urls = [item.url for item in ordered if isinstance(item, Link)]
+    results: dict[str, LinkCheckResult] = {}
+    if http_urls:
+        checker = ExternalLinkChecker(timeout=timeout, max_per_host=max_per_host, cache=cache)
+        results = checker.check(http_urls)
+
+    findings: list[LinkFinding] = []
+    for item in ordered:
+        if isinstance(item, LinkFinding):
+            findings.append(item)
+            continue
+        result = results.get(item.url)
+        if result is not None and result.issue is not None:
             findings.append(
                 LinkFinding(
-                    file_path=link.file_path,
-                    line_number=link.line_number,
-                    url=url,
-                    issue="timeout",
+                    file_path=item.file_path,
+                    line_number=item.line_number,
+                    url=item.url,
+                    issue=result.issue,
+                    status_code=result.status_code,
                 )
             )
-        except requests.RequestException:
-            # Try GET if HEAD fails (some servers block HEAD)
-            try:
-                response = session.get(url, timeout=timeout, allow_redirects=True)
-                if response.status_code >= 400:
-                    findings.append(
-                        LinkFinding(
-                            file_path=link.file_path,
-                            line_number=link.line_number,
-                            url=url,
-                            issue="broken_link",
-                            status_code=response.status_code,
-                        )
-                    )
-            except requests.Timeout:
-                findings.append(
-                    LinkFinding(
-                        file_path=link.file_path,
-                        line_number=link.line_number,
-                        url=url,
-                        issue="timeout",
-                    )
-                )
-            except requests.RequestException:
-                # If both HEAD and GET fail, skip (may be network issue, not broken link)
-                pass
 
     return findings
 
@@ -368,7 +345,11 @@ def validate_code(code_blocks: list[CodeBlock]) -> list[CodeBlockFinding]:
 
 
 def validate_docs(
-    docs_paths: list[Path], project_root: Path, check_external_links: bool = True
+    docs_paths: list[Path],
+    project_root: Path,
+    check_external_links: bool = True,
+    *,
+    cache_dir: Path | None = None,
 ) -> DocsReport:
     """
     Validate documentation files for broken links and invalid code blocks.
@@ -377,6 +358,7 @@ def validate_docs(
         docs_paths: List of markdown file paths to validate
         project_root: Root directory of the project
         check_external_links: Whether to check HTTP/HTTPS links (can be slow)
+        cache_dir: Directory for the external link result cache (no caching if None)
 
     Returns:
         DocsReport containing all findings
@@ -404,7 +386,8 @@ def validate_docs(
     # Validate links
     link_findings: list[LinkFinding] = []
     if check_external_links:
-        link_findings = check_links(all_links, project_root)
+        cache = LinkResultCache(cache_dir / "links.json") if cache_dir else None
+        link_findings = check_links(all_links, project_root, cache=cache)
     else:
         # Only check internal file references
         internal_links = [
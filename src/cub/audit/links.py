@@ -0,0 +1,247 @@
+"""
+Concurrent external link checking with a persistent result cache.
+
+Checks HTTP/HTTPS URLs with an async httpx client:
+- Identical URLs are checked once, however many files reference them
+- Concurrency is bounded overall and per host, so one slow or rate-limiting
+  server can't monopolise the checker
+- HEAD is tried first, falling back to GET when HEAD errors or the server
+  rejects the method
+- Definitive results (an HTTP status) are cached on disk with a TTL;
+  timeouts and network errors are never cached
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Literal, NamedTuple
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime of cached link results (one day)
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+# Status codes that mean "HEAD not supported here", so GET should be tried
+HEAD_UNSUPPORTED_STATUSES = frozenset({403, 405, 501})
+
+
+class LinkCheckResult(NamedTuple):
+    """Outcome of checking one external URL.
+
+    ``issue`` is None when the link is fine or could not be reached for
+    reasons that don't indicate a broken link (e.g. a network error).
+    """
+
+    url: str
+    issue: Literal["broken_link", "timeout"] | None = None
+    status_code: int | None = None
+
+
+class LinkResultCache:
+    """
+    On-disk cache of link check results with a time-to-live.
+
+    Stored as a single JSON file mapping URL to its last definitive result.
+
+    Example:
+        >>> cache = LinkResultCache(Path(".cub/cache/audit/links.json"))
+        >>> cache.get("https://example.com")
+    """
+
+    def __init__(self, cache_file: Path, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_file: JSON file to persist results in
+            ttl: Seconds a cached result stays valid
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._entries: dict[str, dict[str, object]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = data
+        except (OSError, ValueError):
+            pass
+
+    def _is_fresh(self, entry: dict[str, object], now: float) -> bool:
+        checked_at = entry.get("checked_at")
+        return isinstance(checked_at, (int, float)) and now - checked_at <= self.ttl
+
+    def get(self, url: str) -> LinkCheckResult | None:
+        """Return the cached result for a URL, or None if missing or expired."""
+        entry = self._entries.get(url)
+        if not entry or not self._is_fresh(entry, time.time()):
+            return None
+        status_code = entry.get("status_code")
+        return LinkCheckResult(
+            url=url,
+            issue="broken_link" if entry.get("broken") else None,
+            status_code=status_code if isinstance(status_code, int) else None,
+        )
+
+    def set(self, result: LinkCheckResult) -> None:
+        """Record a result. Only results with an HTTP status are cached."""
+        if result.status_code is None:
+            return
+        self._entries[result.url] = {
+            "checked_at": time.time(),
+            "status_code": result.status_code,
+            "broken": result.issue == "broken_link",
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache, dropping expired entries. Errors are logged."""
+        now = time.time()
+        expired = [url for url, entry in self._entries.items() if not self._is_fresh(entry, now)]
+        if not self._dirty and not expired:
+            return
+        for url in expired:
+            del self._entries[url]
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.cache_file)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("Failed to write link cache", exc_info=True)
+        self._dirty = False
+
+
+class ExternalLinkChecker:
+    """
+    Check many external URLs concurrently.
+
+    Example:
+        >>> checker = ExternalLinkChecker(timeout=5, max_per_host=4)
+        >>> results = checker.check(["https://python.org", "https://example.com/404"])
+        >>> results["https://example.com/404"].issue
+        'broken_link'
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 5,
+        max_concurrency: int = 32,
+        max_per_host: int = 4,
+        cache: LinkResultCache | None = None,
+        user_agent: str = "cub-docs-validator/1.0",
+    ) -> None:
+        """
+        Initialize the checker.
+
+        Args:
+            timeout: Timeout in seconds for each HTTP request
+            max_concurrency: Maximum requests in flight overall
+            max_per_host: Maximum requests in flight to a single host
+            cache: Optional persistent result cache
+            user_agent: User-Agent header sent with each request
+        """
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self.cache = cache
+        self.user_agent = user_agent
+
+    def check(self, urls: Iterable[str]) -> dict[str, LinkCheckResult]:
+        """
+        Check URLs from synchronous code.
+
+        Args:
+            urls: URLs to check (duplicates are checked once)
+
+        Returns:
+            Mapping of each distinct URL to its result
+        """
+        return asyncio.run(self.check_async(urls))
+
+    async def check_async(self, urls: Iterable[str]) -> dict[str, LinkCheckResult]:
+        """
+        Check URLs concurrently.
+
+        Args:
+            urls: URLs to check (duplicates are checked once)
+
+        Returns:
+            Mapping of each distinct URL to its result
+        """
+        results: dict[str, LinkCheckResult] = {}
+        pending: list[str] = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url) if self.cache else None
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+
+        if pending:
+            overall = asyncio.Semaphore(self.max_concurrency)
+            per_host: dict[str, asyncio.Semaphore] = {}
+            async with httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+            ) as client:
+
+                async def bounded(url: str) -> LinkCheckResult:
+                    host = urlparse(url).netloc.lower()
+                    host_limit = per_host.setdefault(host, asyncio.Semaphore(self.max_per_host))
+                    async with host_limit, overall:
+                        return await self._check_url(client, url)
+
+                for result in await asyncio.gather(*(bounded(url) for url in pending)):
+                    results[result.url] = result
+                    if self.cache:
+                        self.cache.set(result)
+
+        if self.cache:
+            self.cache.save()
+        return results
+
+    async def _check_url(self, client: httpx.AsyncClient, url: str) -> LinkCheckResult:
+        """Check one URL with HEAD, falling back to GET."""
+        try:
+            response = await client.head(url)
+            if response.status_code not in HEAD_UNSUPPORTED_STATUSES:
+                return self._result(url, response.status_code)
+        except httpx.TimeoutException:
+            return LinkCheckResult(url=url, issue="timeout")
+        except httpx.HTTPError:
+            # Some servers reset or reject HEAD; retry with GET
+            pass
+
+        try:
+            # Stream so only the status line and headers are read
+            async with client.stream("GET", url) as response:
+                return self._result(url, response.status_code)
+        except httpx.TimeoutException:
+            return LinkCheckResult(url=url, issue="timeout")
+        except httpx.HTTPError:
+            # If both HEAD and GET fail, skip (may be network issue, not broken link)
+            return LinkCheckResult(url=url)
+
+    @staticmethod
+    def _result(url: str, status_code: int) -> LinkCheckResult:
+        return LinkCheckResult(
+            url=url,
+            issue="broken_link" if status_code >= 400 else None,
+            status_code=status_code,
+        )
@@ -385,6 +385,7 @@ def run(
             python_report = detect_unused(
                 project_root / "src",
                 exclude_patterns=["**/test_*.py", "**/tests/**"],
+                cache_dir=project_root / ".cub" / "cache" / "audit",
             )
             # Bash dead code
             bash_report = detect_unused_bash(
@@ -411,7 +412,12 @@ def run(
         try:
             # Find all markdown files
             md_files = list(project_root.rglob("*.md"))
-            docs_report = validate_docs(md_files, project_root, check_external_links=True)
+            docs_report = validate_docs(
+                md_files,
+                project_root,
+                check_external_links=True,
+                cache_dir=project_root / ".cub" / "cache" / "audit",
+            )
             audit_report.documentation = docs_report
             audit_report.docs_score = grade_documentation(docs_report)
         except Exception as e:
@@ -52,6 +52,7 @@ GITIGNORE_PATTERNS = [
     "# cub",
     ".cub/ledger/forensics/",
     ".cub/ledger/by-run/",
+    ".cub/ledger/epic-index/",
     ".cub/dashboard.db",
     ".cub/map.md",
     ".cub/cache/",
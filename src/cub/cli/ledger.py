@@ -13,6 +13,8 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from cub.core.ledger.artifact_store import ArtifactStore
+from cub.core.ledger.artifacts import ArtifactManager
 from cub.core.ledger.extractor import extract_insights
 from cub.core.ledger.models import VerificationStatus
 from cub.core.ledger.reader import LedgerReader
@@ -154,6 +156,19 @@ def _show_attempt_detail(entry: "LedgerEntry", attempt_num: int) -> None:
             console.print(f"  Cache creation: {attempt_obj.tokens.cache_creation_tokens:,}")
     console.print()
 
+    # Resource telemetry
+    if attempt_obj.resources:
+        from cub.core.telemetry import format_bytes
+
+        resources = attempt_obj.resources
+        console.print(f"Peak RSS: {format_bytes(resources.peak_rss_bytes)}")
+        console.print(f"CPU: {resources.cpu_seconds:.1f}s ({resources.average_cpus:.2f} cores avg)")
+        console.print(
+            f"I/O: {format_bytes(resources.read_bytes)} read, "
+            f"{format_bytes(resources.write_bytes)} written"
+        )
+        console.print()
+
     # Status
     if attempt_obj.success:
         console.print("Status: [green]Success ✓[/green]")
@@ -164,6 +179,44 @@ def _show_attempt_detail(entry: "LedgerEntry", attempt_num: int) -> None:
         if attempt_obj.error_summary:
             console.print(f"Error Summary: {attempt_obj.error_summary}")
 
+    # Artifacts (plain or in the artifact store)
+    manager = ArtifactManager(_get_ledger_reader().ledger_dir)
+    artifacts = manager.get_task_artifacts(entry.id, attempt_num)
+    if artifacts:
+        from cub.core.telemetry import format_bytes
+
+        console.print()
+        console.print("Artifacts:")
+        for artifact_type, path in artifacts.items():
+            console.print(
+                f"  {artifact_type}: {path.name} ({format_bytes(manager.store.size(path))})"
+            )
+        console.print(f"[dim]View with: cub ledger show {entry.id} -a {attempt_num} -A TYPE[/dim]")
+
+
+def _print_artifact(entry: "LedgerEntry", attempt_num: int | None, artifact_type: str) -> None:
+    """Print an attempt artifact, reading through the artifact store."""
+    if attempt_num is None:
+        if not entry.attempts:
+            console.print(f"[red]Error:[/red] {entry.id} has no recorded attempts.")
+            raise typer.Exit(1)
+        attempt_num = entry.attempts[-1].attempt_number
+
+    manager = ArtifactManager(_get_ledger_reader().ledger_dir)
+    try:
+        content = manager.read_artifact(entry.id, attempt_num, artifact_type)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    if content is None:
+        console.print(
+            f"[red]Error:[/red] No {artifact_type} artifact for {entry.id} attempt {attempt_num}."
+        )
+        raise typer.Exit(1)
+    sys.stdout.write(content)
+    if not content.endswith("\n"):
+        sys.stdout.write("\n")
+
 
 @app.command()
 def show(
@@ -186,6 +239,12 @@ def show(
         "-h",
         help="Show workflow stage transition history",
     ),
+    artifact: str | None = typer.Option(
+        None,
+        "--artifact",
+        "-A",
+        help="Print an attempt artifact: prompt, harness, or patch (latest attempt by default)",
+    ),
     json_output: bool = typer.Option(
         False,
         "--json",
@@ -210,6 +269,7 @@ def show(
         cub ledger show beads-abc --changes
         cub ledger show beads-abc --history
         cub ledger show beads-abc --json
+        cub ledger show beads-abc --attempt 2 --artifact prompt
     """
     service = _get_ledger_service()
 
@@ -226,6 +286,14 @@ def show(
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
+    if artifact is not None:
+        if artifact not in ArtifactManager.ARTIFACT_EXTENSIONS:
+            valid_types = ", ".join(ArtifactManager.ARTIFACT_EXTENSIONS)
+            console.print(f"[red]Error:[/red] Unknown artifact '{artifact}'. Use: {valid_types}")
+            raise typer.Exit(1)
+        _print_artifact(entry, attempt, artifact)
+        return
+
     # --agent wins over --json
     if agent:
         # Agent-friendly markdown output for a single ledger entry
@@ -708,6 +776,91 @@ def stats(
         console.print(f"Last task: {stats.last_task_date.strftime('%Y-%m-%d')}")
 
 
+@app.command()
+def cache(
+    since: str | None = typer.Option(
+        None,
+        "--since",
+        help="Only include tasks completed since date (YYYY-MM-DD)",
+    ),
+    epic: str | None = typer.Option(
+        None,
+        "--epic",
+        help="Only include tasks in this epic",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output as JSON",
+    ),
+) -> None:
+    """
+    Show prompt cache hit ratio per run.
+
+    The hit ratio is the share of prompt tokens read from the provider's
+    cache. A run with more than one prompt prefix changed its system
+    prompt mid-run, which invalidates the cache.
+
+    Examples:
+        cub ledger cache
+        cub ledger cache --epic cub-vd6
+        cub ledger cache --json
+    """
+    service = _get_ledger_service()
+
+    if not service:
+        console.print(
+            "[yellow]Warning:[/yellow] No ledger found. "
+            "Tasks have not been completed yet."
+        )
+        raise typer.Exit(0)
+
+    runs = service.cache_stats(StatsQuery(since=since, epic=epic))
+
+    if json_output:
+        data = [
+            {
+                **run.model_dump(mode="json"),
+                "prompt_tokens": run.prompt_tokens,
+                "cache_hit_ratio": run.cache_hit_ratio,
+            }
+            for run in runs
+        ]
+        console.print(json.dumps(data, indent=2))
+        return
+
+    if not runs:
+        console.print("[yellow]No attempts recorded.[/yellow]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Run", style="cyan")
+    table.add_column("Started")
+    table.add_column("Attempts", justify="right")
+    table.add_column("Prompt", justify="right")
+    table.add_column("Read", justify="right")
+    table.add_column("Write", justify="right")
+    table.add_column("Hit Ratio", justify="right")
+    table.add_column("Prefixes", justify="right")
+
+    for run in runs:
+        ratio = run.cache_hit_ratio
+        ratio_color = "green" if ratio >= 0.7 else "yellow" if ratio >= 0.3 else "red"
+        prefixes = len(run.prompt_prefixes)
+        table.add_row(
+            run.run_id,
+            run.started_at.strftime("%Y-%m-%d") if run.started_at else "—",
+            str(run.attempts),
+            f"{run.prompt_tokens:,}",
+            f"{run.cache_read_tokens:,}",
+            f"{run.cache_creation_tokens:,}",
+            f"[{ratio_color}]{ratio * 100:.1f}%[/{ratio_color}]",
+            f"[yellow]{prefixes}[/yellow]" if prefixes > 1 else str(prefixes or "—"),
+        )
+
+    console.print(table)
+
+
 @app.command()
 def search(
     query: str = typer.Argument(..., help="Search query"),
@@ -1167,6 +1320,54 @@ def gc(
     console.print("[dim]Future versions will support actual deletion with --dry-run=false.[/dim]")
 
 
+@app.command()
+def compact(
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show what would be compacted without changing anything",
+    ),
+) -> None:
+    """
+    Move plain prompt files and harness logs into the artifact store.
+
+    Attempt prompts and harness logs written before artifact compression
+    was enabled (ledger.compress_artifacts) are stored once per distinct
+    content, gzip-compressed, under .cub/ledger/objects/. Each plain file
+    is replaced by a small .ref manifest. `cub ledger show --artifact`
+    reads either form. Safe to run more than once.
+
+    Examples:
+        cub ledger compact --dry-run
+        cub ledger compact
+    """
+    from cub.core.telemetry import format_bytes
+
+    reader = _get_ledger_reader()
+
+    if not reader.exists():
+        console.print("[yellow]Warning:[/yellow] No ledger found. Nothing to compact.")
+        raise typer.Exit(0)
+
+    result = ArtifactStore(reader.ledger_dir).compact(dry_run=dry_run)
+
+    if result.files == 0:
+        console.print("[dim]No plain artifact files to compact.[/dim]")
+        raise typer.Exit(0)
+
+    if dry_run:
+        console.print(
+            f"Would compact [yellow]{result.files}[/yellow] file(s) "
+            f"({format_bytes(result.bytes_before)})"
+        )
+        return
+
+    console.print(
+        f"[green]Compacted {result.files} file(s):[/green] "
+        f"{format_bytes(result.bytes_before)} -> {format_bytes(result.bytes_after)}"
+    )
+
+
 @app.command()
 def extract(
     task_id: str | None = typer.Argument(None, help="Task ID to extract insights for (or --all)"),
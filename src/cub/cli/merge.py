@@ -14,6 +14,7 @@ from rich.console import Console
 
 from cub.core.github.client import GitHubClientError
 from cub.core.pr import PRService, PRServiceError
+from cub.core.services.pr_checks import get_shared_poller
 
 app = typer.Typer(
     name="merge",
@@ -223,7 +224,10 @@ def wait(
         console.print("[dim]Press Ctrl+C to cancel[/dim]")
 
         try:
-            success = service.github_client.wait_for_checks(pr_number, timeout=timeout)
+            client = service.github_client
+            success = client.wait_for_checks(
+                pr_number, timeout=timeout, poller=get_shared_poller(client.repo)
+            )
             if success:
                 console.print("[green]All checks passed![/green]")
             else:
@@ -13,6 +13,7 @@ from rich.console import Console
 from cub.cli.review.display import ReviewDisplay
 from cub.core.ledger.reader import LedgerReader
 from cub.core.review.assessor import EpicAssessor, PlanAssessor, TaskAssessor
+from cub.core.review.cache import AssessmentCache
 from cub.core.review.formatter import to_json
 from cub.utils.project import get_project_root
 
@@ -32,6 +33,13 @@ def _get_ledger_reader() -> LedgerReader:
     return LedgerReader(ledger_dir)
 
 
+def _get_cache(no_cache: bool) -> AssessmentCache | None:
+    """Get the assessment cache for current project, unless disabled."""
+    if no_cache:
+        return None
+    return AssessmentCache.for_project(get_project_root())
+
+
 def _get_plans_root() -> Path:
     """Get plans directory for current project."""
     project_root = get_project_root()
@@ -57,6 +65,11 @@ def task(
         "--deep",
         help="Run LLM-based deep analysis of implementation vs spec",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-assess tasks even if their ledger entries are unchanged",
+    ),
 ) -> None:
     """
     Review a single task implementation.
@@ -71,6 +84,7 @@ def task(
         cub review task beads-abc --json
         cub review task beads-abc --verbose
         cub review task beads-abc --deep
+        cub review task beads-abc --no-cache
     """
     reader = _get_ledger_reader()
 
@@ -81,7 +95,7 @@ def task(
         )
         raise typer.Exit(0)
 
-    assessor = TaskAssessor(reader)
+    assessor = TaskAssessor(reader, cache=_get_cache(no_cache))
     assessment = assessor.assess_task(task_id, deep=deep)
 
     if json_output:
@@ -112,6 +126,11 @@ def epic(
         "--deep",
         help="Run LLM-based deep analysis of implementation vs spec",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-assess tasks even if their ledger entries are unchanged",
+    ),
 ) -> None:
     """
     Review all tasks in an epic.
@@ -126,6 +145,7 @@ def epic(
         cub review epic cub-abc --json
         cub review epic cub-abc --verbose
         cub review epic cub-abc --deep
+        cub review epic cub-abc --no-cache
     """
     reader = _get_ledger_reader()
 
@@ -136,7 +156,7 @@ def epic(
         )
         raise typer.Exit(0)
 
-    assessor = EpicAssessor(reader)
+    assessor = EpicAssessor(reader, cache=_get_cache(no_cache))
     assessment = assessor.assess_epic(epic_id, deep=deep)
 
     if json_output:
@@ -167,6 +187,11 @@ def plan(
         "--deep",
         help="Run LLM-based deep analysis of implementation vs spec",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-assess tasks even if their ledger entries are unchanged",
+    ),
 ) -> None:
     """
     Review all work from a plan.
@@ -181,6 +206,7 @@ def plan(
         cub review plan unified-tracking-model --json
         cub review plan unified-tracking-model --verbose
         cub review plan unified-tracking-model --deep
+        cub review plan unified-tracking-model --no-cache
     """
     reader = _get_ledger_reader()
     plans_root = _get_plans_root()
@@ -192,7 +218,7 @@ def plan(
         )
         raise typer.Exit(0)
 
-    assessor = PlanAssessor(reader, plans_root)
+    assessor = PlanAssessor(reader, plans_root, cache=_get_cache(no_cache))
     assessment = assessor.assess_plan(plan_slug, deep=deep)
 
     if json_output:
@@ -35,8 +35,11 @@ from cub.core.config.loader import load_config
 from cub.core.config.models import CubConfig
 from cub.core.harness.async_backend import detect_async_harness, get_async_backend
 from cub.core.harness.models import HarnessResult, TaskInput, TokenUsage
+from cub.core.ledger.artifact_store import ArtifactStore
 from cub.core.ledger.integration import LedgerIntegration
+from cub.core.ledger.models import ResourceTelemetry
 from cub.core.ledger.writer import LedgerWriter
+from cub.core.profiling import TRACE_FILE, format_summary, load_summary, run_profile_dir
 from cub.core.run.git_ops import create_run_branch, get_epic_context, get_issue_context, slugify
 from cub.core.run.interrupt import InterruptHandler
 from cub.core.run.models import RunEvent, RunEventType
@@ -44,11 +47,13 @@ from cub.core.run.models import RunEvent, RunEventType
 # TODO: Restore when plan module is implemented
 # from cub.core.plan.context import PlanContext
 # from cub.core.plan.models import PlanStatus
+from cub.core.sandbox.docker import DockerProvider
 from cub.core.sandbox.models import SandboxConfig, SandboxState
+from cub.core.sandbox.pool import SandboxPool
 from cub.core.sandbox.provider import get_provider, is_provider_available
 from cub.core.sandbox.state import clear_sandbox_state, save_sandbox_state
 from cub.core.services.run import RunService
-from cub.core.session import RunSessionManager, SessionBudget
+from cub.core.session import RunSessionError, RunSessionManager, SessionBudget
 
 # TODO: Restore when specs module is implemented
 # from cub.core.specs.lifecycle import SpecLifecycleError, move_spec_to_implementing
@@ -66,6 +71,7 @@ from cub.core.sync.service import SyncService
 from cub.core.tasks.backend import TaskBackend
 from cub.core.tasks.backend import get_backend as get_task_backend
 from cub.core.tasks.models import Task
+from cub.core.telemetry import format_bytes, format_telemetry
 from cub.core.worktree.manager import WorktreeError, WorktreeManager
 from cub.core.worktree.parallel import ParallelRunner
 from cub.dashboard.tmux import get_dashboard_pane_size, launch_with_dashboard
@@ -667,6 +673,12 @@ def run(
         "--no-circuit-breaker",
         help="Disable circuit breaker timeout protection (overrides config)",
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-span timings and a Chrome trace in the run's ledger directory "
+        "(also enabled by CUB_PROFILE=1)",
+    ),
 ) -> None:
     """
     Execute autonomous task loop with AI harness.
@@ -1003,6 +1015,16 @@ def run(
         for orphan in orphaned_sessions:
             console.print(f"[dim]  - {orphan.run_id}: {orphan.orphaned_reason}[/dim]")
 
+    # Roll old finished sessions into the compressed archive
+    try:
+        archived = session_manager.archive_sessions()
+    except RunSessionError as e:
+        archived = 0
+        if debug:
+            console.print(f"[dim]Failed to archive old sessions: {e}[/dim]")
+    if archived and debug:
+        console.print(f"[dim]Archived {archived} old session(s)[/dim]")
+
     # Handle --worktree flag: create and enter worktree
     worktree_path: Path | None = None
     original_cwd: Path | None = None
@@ -1091,6 +1113,8 @@ def run(
             run_args.append("--no-sync")
         if no_circuit_breaker:
             run_args.append("--no-circuit-breaker")
+        if profile:
+            run_args.append("--profile")
         if debug:
             run_args.append("--debug")
 
@@ -1263,16 +1287,19 @@ def run(
         ),
     )
 
+    # Prompts and harness logs go to the deduplicating artifact store
+    ledger_dir = project_dir / ".cub" / "ledger"
+    artifact_store = ArtifactStore(ledger_dir) if config.ledger.compress_artifacts else None
+
     # Initialize status writer
-    status_writer = StatusWriter(project_dir, run_id)
+    status_writer = StatusWriter(project_dir, run_id, artifact_store=artifact_store)
     status_writer.write(status)
 
     if debug:
         console.print(f"[dim]Status file: {status_writer.status_path}[/dim]")
 
     # Initialize ledger writer
-    ledger_dir = project_dir / ".cub" / "ledger"
-    ledger_writer = LedgerWriter(ledger_dir)
+    ledger_writer = LedgerWriter(ledger_dir, artifact_store)
 
     # Initialize ledger integration
     ledger_integration = LedgerIntegration(ledger_writer, task_backend)
@@ -1352,6 +1379,7 @@ def run(
         budget_cost=budget,
         no_circuit_breaker=no_circuit_breaker,
         no_sync=no_sync,
+        profile=profile,
     )
 
     try:
@@ -1422,6 +1450,13 @@ def run(
         console.print()
         display_summary(status)
 
+        if run_config.profile:
+            profile_dir = run_profile_dir(project_dir, run_id)
+            profile_summary = load_summary(profile_dir)
+            if profile_summary is not None:
+                console.print(f"[cyan]Profile: {format_summary(profile_summary)}[/cyan]")
+                console.print(f"[dim]Trace: {profile_dir / TRACE_FILE}[/dim]")
+
         if debug:
             console.print(f"[dim]Final status: {status_writer.status_path}[/dim]")
             console.print(f"[dim]Run artifact: {status_writer.run_artifact_path}[/dim]")
@@ -1942,7 +1977,8 @@ def _run_plan(
 
     # Initialize ledger
     ledger_dir = project_dir / ".cub" / "ledger"
-    ledger_writer = LedgerWriter(ledger_dir)
+    artifact_store = ArtifactStore(ledger_dir) if config.ledger.compress_artifacts else None
+    ledger_writer = LedgerWriter(ledger_dir, artifact_store)
     ledger_integration = LedgerIntegration(ledger_writer, task_backend)
 
     # Generate session/plan ID
@@ -2028,7 +2064,9 @@ def _run_plan(
 
             # Initialize status writer
             epic_run_id = f"{plan_session_id}-{epic_id}"
-            status_writer = StatusWriter(project_dir, epic_run_id)
+            status_writer = StatusWriter(
+                project_dir, epic_run_id, artifact_store=artifact_store
+            )
 
             # Initialize interrupt handler
             interrupt_handler = InterruptHandler()
@@ -2841,6 +2879,9 @@ def _display_parallel_summary(result: object) -> None:
     table.add_row("Total Tokens", f"{result.total_tokens:,}")
     if result.total_cost > 0:
         table.add_row("Total Cost", f"${result.total_cost:.4f}")
+    if result.peak_worker_rss_bytes:
+        table.add_row("Peak Worker RSS", format_bytes(result.peak_worker_rss_bytes))
+        table.add_row("Total CPU", f"{result.total_cpu_seconds:.1f}s")
 
     console.print(table)
 
@@ -2852,6 +2893,8 @@ def _display_parallel_summary(result: object) -> None:
         worker_table.add_column("Status")
         worker_table.add_column("Duration")
         worker_table.add_column("Tokens")
+        worker_table.add_column("Peak RSS")
+        worker_table.add_column("CPU")
 
         for worker in result.workers:
             status = "[green]✓[/green]" if worker.success else "[red]✗[/red]"
@@ -2863,6 +2906,8 @@ def _display_parallel_summary(result: object) -> None:
                 status,
                 f"{worker.duration_seconds:.1f}s",
                 f"{worker.tokens_used:,}" if worker.tokens_used else "-",
+                format_bytes(worker.resources.peak_rss_bytes) if worker.resources else "-",
+                f"{worker.resources.cpu_seconds:.1f}s" if worker.resources else "-",
             )
 
         console.print(worker_table)
@@ -2955,13 +3000,29 @@ def _run_in_sandbox(
         console.print(f"[dim]Provider: {provider.name} (v{provider.get_version()})[/dim]")
         console.print(f"[dim]Network: {'enabled' if not no_network else 'disabled'}[/dim]")
 
+    # Warm container pool (kept sandboxes are never pooled)
+    pool: SandboxPool | None = None
+    pool_config = load_config(project_dir).sandbox_pool
+    if pool_config.enabled and not sandbox_keep and isinstance(provider, DockerProvider):
+        pool = SandboxPool(provider, max_size=pool_config.max_size, idle_ttl=pool_config.idle_ttl)
+
     # Start sandbox
     sandbox_id = None
+    resources: ResourceTelemetry | None = None
     exit_code = 1  # Track exit code for artifact creation
     try:
-        console.print("[cyan]Creating sandbox...[/cyan]")
-        sandbox_id = provider.start(project_dir, sandbox_config)
-        console.print(f"[cyan]Sandbox started: {sandbox_id}[/cyan]")
+        if pool is not None:
+            sandbox_id = pool.acquire(project_dir, sandbox_config)
+            if sandbox_id is None:
+                pool = None
+                if debug:
+                    console.print("[dim]No pooled sandbox available[/dim]")
+            else:
+                console.print(f"[cyan]Sandbox taken from pool: {sandbox_id}[/cyan]")
+        if sandbox_id is None:
+            console.print("[cyan]Creating sandbox...[/cyan]")
+            sandbox_id = provider.start(project_dir, sandbox_config)
+            console.print(f"[cyan]Sandbox started: {sandbox_id}[/cyan]")
 
         # Save sandbox state if keeping
         if sandbox_keep:
@@ -2972,6 +3033,10 @@ def _run_in_sandbox(
         if debug:
             console.print(f"[dim]Container ID: {sandbox_id}[/dim]")
 
+        # Stream resource telemetry while the sandbox runs
+        if isinstance(provider, DockerProvider):
+            provider.start_telemetry(sandbox_id)
+
         # Stream logs to terminal
         console.print()
         console.print("[bold]Sandbox Output:[/bold]")
@@ -2981,14 +3046,21 @@ def _run_in_sandbox(
             """Print log line to console."""
             print(line, end="")
 
-        # Follow logs until container stops
-        provider.logs(sandbox_id, follow=True, callback=log_callback)
+        if pool is not None:
+            # Run cub in the pooled container until it exits
+            status = pool.run(sandbox_id, sandbox_config, callback=log_callback)
+        else:
+            # Follow logs until container stops
+            provider.logs(sandbox_id, follow=True, callback=log_callback)
+            status = provider.status(sandbox_id)
 
         console.print("─" * 80)
         console.print()
 
-        # Get final status
-        status = provider.status(sandbox_id)
+        if isinstance(provider, DockerProvider):
+            resources = provider.stop_telemetry(sandbox_id)
+            if resources is not None:
+                console.print(f"[dim]Resources: {format_telemetry(resources)}[/dim]")
 
         if debug:
             console.print(f"[dim]Final state: {status.state.value}[/dim]")
@@ -3051,6 +3123,10 @@ def _run_in_sandbox(
         exit_code = 1
 
     finally:
+        # Close the telemetry stream if the run ended early
+        if sandbox_id and isinstance(provider, DockerProvider):
+            resources = provider.stop_telemetry(sandbox_id) or resources
+
         # Always create host-side run artifact (E4 requirement)
         # Sandbox creates its own artifacts inside container, but host needs record too
         try:
@@ -3078,6 +3154,7 @@ def _run_in_sandbox(
                     tokens_limit=budget_tokens,
                     cost_limit=budget,
                 ),
+                resources=resources,
             )
 
             status_writer.write_run_artifact(run_artifact)
@@ -3089,8 +3166,14 @@ def _run_in_sandbox(
             # Don't let artifact write failure crash cleanup
             console.print(f"[yellow]Warning: Failed to write host artifact: {e}[/yellow]")
 
-        # Cleanup sandbox unless --sandbox-keep
-        if sandbox_id and not sandbox_keep:
+        # Return pooled sandboxes; clean up others unless --sandbox-keep
+        if sandbox_id and pool is not None:
+            console.print("[cyan]Returning sandbox to pool...[/cyan]")
+            if pool.release(sandbox_id):
+                console.print("[cyan]Sandbox returned to pool[/cyan]")
+            else:
+                console.print("[cyan]Sandbox removed[/cyan]")
+        elif sandbox_id and not sandbox_keep:
             try:
                 console.print("[cyan]Cleaning up sandbox...[/cyan]")
                 provider.cleanup(sandbox_id)
@@ -11,6 +11,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from cub.core.profiling import HARNESS_CATEGORY, load_summary
 from cub.core.services.status import StatusService
 from cub.core.status.writer import StatusWriter, get_latest_status
 from cub.core.tasks.backend import get_backend
@@ -139,6 +140,9 @@ def status(
                     }
                     task_costs.append(task_cost)
 
+        # Span timings, if the run was profiled (cub run --profile)
+        profile_summary = load_summary(writer.run_dir) if writer else None
+
         # Use in-memory data if available (for active runs)
         if run_status:
             # Override with in-memory data if it's more recent
@@ -187,6 +191,25 @@ def status(
             raise typer.Exit(0)
 
         if json_output:
+            profile_json = None
+            if profile_summary:
+                profile_json = {
+                    "wall_seconds": profile_summary.wall_seconds,
+                    "harness_seconds": profile_summary.harness_seconds,
+                    "overhead_seconds": profile_summary.overhead_seconds,
+                    "overhead_percentage": profile_summary.overhead_percentage,
+                    "spans": [
+                        {
+                            "name": span_total.name,
+                            "category": span_total.category,
+                            "count": span_total.count,
+                            "total_seconds": span_total.total_seconds,
+                            "self_seconds": span_total.self_seconds,
+                        }
+                        for span_total in profile_summary.spans
+                    ],
+                }
+
             # Output machine-readable JSON
             json_output_dict = {
                 "task_counts": {
@@ -214,6 +237,7 @@ def status(
                     "commits_since_main": project_stats.commits_since_main,
                 },
                 "task_costs": task_costs if verbose else None,
+                "profile": profile_json,
             }
             console.print(json_module.dumps(json_output_dict, indent=2))
             raise typer.Exit(0)
@@ -257,6 +281,30 @@ def status(
 
         console.print(budget_table)
 
+        if profile_summary:
+            console.print()
+            profile_table = Table(title="Profile", show_header=False)
+            profile_table.add_column("Metric", style="cyan")
+            profile_table.add_column("Value", style="green", justify="right")
+
+            profile_table.add_row("Profiled Time", f"{profile_summary.wall_seconds:.1f}s")
+            profile_table.add_row("Harness", f"{profile_summary.harness_seconds:.1f}s")
+            overhead = (
+                f"{profile_summary.overhead_seconds:.2f}s "
+                f"({profile_summary.overhead_percentage:.1f}%)"
+            )
+            profile_table.add_row("Cub Overhead", overhead)
+
+            # Where the overhead goes: top spans by self time, harness excluded
+            top_spans = [t for t in profile_summary.spans if t.category != HARNESS_CATEGORY][:5]
+            for span_total in top_spans:
+                profile_table.add_row(
+                    f"  {span_total.name} (x{span_total.count})",
+                    f"{span_total.self_seconds:.2f}s",
+                )
+
+            console.print(profile_table)
+
         if verbose and task_costs:
             console.print()
             console.print("[bold cyan]Per-Task Cost Breakdown:[/bold cyan]")
@@ -448,6 +448,13 @@ def artifacts(
             help="Limit number of results",
         ),
     ] = 10,
+    prune: Annotated[
+        bool,
+        typer.Option(
+            "--prune",
+            help="Evict artifacts beyond the retention limits before listing",
+        ),
+    ] = False,
     debug: Annotated[
         bool,
         typer.Option(
@@ -462,23 +469,35 @@ def artifacts(
     Shows recent tool execution artifacts stored in .cub/toolsmith/runs/.
     Results are sorted by modification time (most recent first).
 
+    Artifacts are listed from the directory's index, and old ones are
+    evicted in the background (by age, count per tool and total size).
+    Use --prune to evict immediately.
+
     Examples:
         cub tools artifacts
         cub tools artifacts --tool-id brave-search
         cub tools artifacts --action search --limit 20
+        cub tools artifacts --prune
     """
     setup_logging(debug)
 
     try:
         service = ExecutionService()
 
-        # List artifacts
-        artifact_paths = service.list_artifacts(
+        if prune:
+            evicted = service.artifact_index.evict()
+            if evicted is None:
+                console.print("[yellow]Another process is already pruning artifacts[/yellow]")
+            else:
+                console.print(f"[dim]Evicted {len(evicted)} artifact(s)[/dim]")
+
+        # List artifacts from the index
+        records = service.artifact_index.query(
             tool_id=tool_id,
             action=action,
         )
 
-        if not artifact_paths:
+        if not records:
             console.print()
             no_results = Text("No artifacts found", style="yellow")
             if tool_id or action:
@@ -500,7 +519,7 @@ def artifacts(
             return
 
         # Apply limit
-        limited_paths = artifact_paths[:limit]
+        limited = records[:limit]
 
         # Create table
         title = "Execution Artifacts"
@@ -519,23 +538,23 @@ def artifacts(
         table.add_column("Success", style="green", width=10)
         table.add_column("Path", style="blue")
 
-        for artifact_path in limited_paths:
-            # Read artifact to get details
-            result = service.read_artifact(artifact_path)
-            if result:
-                timestamp = result.started_at.strftime("%Y-%m-%d %H:%M:%S")
-                success_icon = "✓" if result.success else "✗"
-                success_style = "green" if result.success else "red"
-
-                table.add_row(
-                    timestamp,
-                    result.tool_id,
-                    result.action,
-                    Text(success_icon, style=success_style),
-                    str(artifact_path.relative_to(Path.cwd()))
-                    if artifact_path.is_relative_to(Path.cwd())
-                    else str(artifact_path),
-                )
+        for record in limited:
+            artifact_path = service.artifact_dir / record.name
+            if not artifact_path.is_absolute():
+                artifact_path = Path.cwd() / artifact_path
+            timestamp = record.started_at.strftime("%Y-%m-%d %H:%M:%S")
+            success_icon = "✓" if record.success else "✗"
+            success_style = "green" if record.success else "red"
+
+            table.add_row(
+                timestamp,
+                record.tool_id,
+                record.action,
+                Text(success_icon, style=success_style),
+                str(artifact_path.relative_to(Path.cwd()))
+                if artifact_path.is_relative_to(Path.cwd())
+                else str(artifact_path),
+            )
 
         console.print()
         console.print(table)
@@ -544,12 +563,12 @@ def artifacts(
         # Summary
         summary = Text()
         summary.append("Showing ", style="dim")
-        summary.append(str(len(limited_paths)), style="bold green")
+        summary.append(str(len(limited)), style="bold green")
         summary.append(" of ", style="dim")
-        summary.append(str(len(artifact_paths)), style="bold cyan")
+        summary.append(str(len(records)), style="bold cyan")
         summary.append(" total artifacts", style="dim")
 
-        if len(artifact_paths) > limit:
+        if len(records) > limit:
             summary.append("\n", style="dim")
             summary.append(
                 f"Use --limit to see more (currently limited to {limit})",
@@ -578,7 +597,7 @@ def stats(
     View tool effectiveness metrics.
 
     Shows execution statistics for all tools, including invocation counts,
-    success rates, timing information, and error tracking. Metrics are
+    success rates, timing (average and p50/p95 latency), and error tracking. Metrics are
     color-coded based on success rate for quick assessment.
 
     Success rate color coding:
@@ -622,6 +641,8 @@ def stats(
         table.add_column("Invocations", style="white", justify="right")
         table.add_column("Success Rate", style="white", justify="right")
         table.add_column("Avg Duration", style="white", justify="right")
+        table.add_column("p50", style="white", justify="right")
+        table.add_column("p95", style="white", justify="right")
         table.add_column("Errors", style="white", justify="right")
         table.add_column("Last Used", style="dim")
 
@@ -647,6 +668,11 @@ def stats(
                 else "N/A"
             )
 
+            # Format latency percentiles from the histogram
+            p50, p95 = metrics.percentile(50), metrics.percentile(95)
+            p50_text = f"{p50:.0f}ms" if p50 is not None else "N/A"
+            p95_text = f"{p95:.0f}ms" if p95 is not None else "N/A"
+
             # Count total errors
             total_errors = sum(metrics.error_types.values())
             errors_text = str(total_errors) if total_errors > 0 else "-"
@@ -682,6 +708,8 @@ def stats(
                 str(metrics.invocations),
                 success_text,
                 avg_duration,
+                p50_text,
+                p95_text,
                 errors_text,
                 last_used,
             )
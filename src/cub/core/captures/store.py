@@ -10,6 +10,8 @@ Two-tier storage model:
    - For captures ready to be permanent project records
 
 Uses python-frontmatter for parsing Markdown files with YAML frontmatter.
+Reads go through the shared document cache, so listing unchanged captures
+doesn't re-parse them.
 """
 
 import os
@@ -21,6 +23,7 @@ import frontmatter
 
 from cub.core.captures.models import Capture, CaptureStatus
 from cub.core.captures.project_id import get_project_id
+from cub.core.documents import get_document_cache
 
 # Characters for random ID generation (lowercase alphanumeric)
 ID_CHARS = string.ascii_lowercase + string.digits
@@ -78,14 +81,15 @@ class CaptureStore:
             raise FileNotFoundError(f"Captures directory not found: {self.captures_dir}")
 
         captures: list[Capture] = []
-        for capture_file in self.captures_dir.glob("*.md"):
-            try:
-                capture = self._read_capture_file(capture_file)
-                captures.append(capture)
-            except Exception as e:
-                # Skip malformed files but continue processing
-                print(f"Warning: Failed to parse {capture_file}: {e}")
-                continue
+        with get_document_cache().batch():
+            for capture_file in self.captures_dir.glob("*.md"):
+                try:
+                    capture = self._read_capture_file(capture_file)
+                    captures.append(capture)
+                except Exception as e:
+                    # Skip malformed files but continue processing
+                    print(f"Warning: Failed to parse {capture_file}: {e}")
+                    continue
 
         # Sort by creation date, newest first
         captures.sort(key=lambda c: c.created, reverse=True)
@@ -117,13 +121,14 @@ class CaptureStore:
             return self._read_capture_file(direct_file)
 
         # Search all .md files for matching ID in frontmatter
-        for capture_file in self.captures_dir.glob("*.md"):
-            try:
-                capture = self._read_capture_file(capture_file)
-                if capture.id == capture_id:
-                    return capture
-            except Exception:
-                continue
+        with get_document_cache().batch():
+            for capture_file in self.captures_dir.glob("*.md"):
+                try:
+                    capture = self._read_capture_file(capture_file)
+                    if capture.id == capture_id:
+                        return capture
+                except Exception:
+                    continue
 
         raise FileNotFoundError(f"Capture not found: {capture_id}")
 
@@ -252,15 +257,16 @@ class CaptureStore:
 
         # Collect existing IDs for collision detection
         existing_ids: set[str] = set()
-        for capture_file in self.captures_dir.glob("*.md"):
-            try:
-                capture = self._read_capture_file(capture_file)
-                existing_ids.add(capture.id)
-            except Exception:
-                # Also check filename-based IDs
-                stem = capture_file.stem
-                if stem.startswith("cap-"):
-                    existing_ids.add(stem)
+        with get_document_cache().batch():
+            for capture_file in self.captures_dir.glob("*.md"):
+                try:
+                    capture = self._read_capture_file(capture_file)
+                    existing_ids.add(capture.id)
+                except Exception:
+                    # Also check filename-based IDs
+                    stem = capture_file.stem
+                    if stem.startswith("cap-"):
+                        existing_ids.add(stem)
 
         # Generate random ID with collision detection
         for _ in range(max_attempts):
@@ -295,13 +301,14 @@ class CaptureStore:
             return direct_file
 
         # Search all .md files for matching ID in frontmatter
-        for capture_file in self.captures_dir.glob("*.md"):
-            try:
-                capture = self._read_capture_file(capture_file)
-                if capture.id == capture_id:
-                    return capture_file
-            except Exception:
-                continue
+        with get_document_cache().batch():
+            for capture_file in self.captures_dir.glob("*.md"):
+                try:
+                    capture = self._read_capture_file(capture_file)
+                    if capture.id == capture_id:
+                        return capture_file
+                except Exception:
+                    continue
 
         raise FileNotFoundError(f"Capture not found: {capture_id}")
 
@@ -318,11 +325,13 @@ class CaptureStore:
         Raises:
             ValueError: If file is malformed or missing required fields
         """
-        # Parse frontmatter
-        post = frontmatter.load(capture_file)
+        # Parse frontmatter (cached while the file is unchanged)
+        doc = get_document_cache().load(capture_file)
+        if doc.error:
+            raise ValueError(doc.error)
 
         # Convert to Capture model
-        return Capture.from_frontmatter_dict(post.metadata)
+        return Capture.from_frontmatter_dict(dict(doc.metadata))
 
     @classmethod
     def project(cls, project_dir: Path | None = None) -> "CaptureStore":
@@ -26,6 +26,7 @@ from .models import (
     LoopConfig,
     PRRetryConfig,
     ReviewConfig,
+    SandboxPoolConfig,
     StateConfig,
 )
 
@@ -42,6 +43,7 @@ __all__ = [
     "LoopConfig",
     "PRRetryConfig",
     "ReviewConfig",
+    "SandboxPoolConfig",
     "StateConfig",
     # Loader functions
     "clear_cache",
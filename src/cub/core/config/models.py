@@ -245,6 +245,13 @@ class LedgerConfig(BaseModel):
         default=True,
         description="Enable automatic ledger entry creation on task completion",
     )
+    compress_artifacts: bool = Field(
+        default=True,
+        description=(
+            "Store attempt prompts and harness logs deduplicated and gzip-compressed "
+            "under .cub/ledger/objects/ instead of as plain files"
+        ),
+    )
 
 
 class SyncConfig(BaseModel):
@@ -268,6 +275,30 @@ class SyncConfig(BaseModel):
     )
 
 
+class SandboxPoolConfig(BaseModel):
+    """
+    Warm sandbox container pool configuration.
+
+    Keeps started Docker sandbox containers idle between runs so that
+    repeated `cub run --sandbox` invocations skip container start-up.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Hand out warm pooled containers to `cub run --sandbox`",
+    )
+    max_size: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of pooled containers (idle and in use)",
+    )
+    idle_ttl: int = Field(
+        default=900,
+        ge=0,
+        description="Remove pooled containers left idle for this many seconds",
+    )
+
+
 class CircuitBreakerConfig(BaseModel):
     """
     Circuit breaker configuration for stagnation detection.
@@ -395,6 +426,19 @@ class BackendConfig(BaseModel):
             "(dual-backend with divergence detection)"
         ),
     )
+    shadow: bool = Field(
+        default=False,
+        description=(
+            "In 'both' mode, run the secondary backend and comparisons in the "
+            "background so only the primary adds latency"
+        ),
+    )
+    compare_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="In 'both' mode, fraction of operations compared against the secondary",
+    )
 
 
 class TaskConfig(BaseModel):
@@ -435,6 +479,13 @@ class HarnessConfig(BaseModel):
     model: str | None = Field(
         default=None, description="Specific model to use (e.g., 'sonnet', 'haiku')"
     )
+    retain_session: bool = Field(
+        default=False,
+        description=(
+            "Keep one harness session alive across the tasks of an epic "
+            "(claude-sdk only), clearing the conversation between tasks"
+        ),
+    )
 
 
 class CubConfig(BaseModel):
@@ -517,6 +568,10 @@ class CubConfig(BaseModel):
         default_factory=PRRetryConfig,
         description="PR check retry configuration for transient CI failures",
     )
+    sandbox_pool: SandboxPoolConfig = Field(
+        default_factory=SandboxPoolConfig,
+        description="Warm sandbox container pool settings",
+    )
 
     model_config = ConfigDict(
         extra="allow",  # Allow extra fields for forward compatibility
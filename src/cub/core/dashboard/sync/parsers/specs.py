@@ -19,14 +19,11 @@ Stage mapping:
 
 import hashlib
 import logging
-import re
 from datetime import datetime
 from pathlib import Path
 
-import frontmatter
-import yaml
-
 from cub.core.dashboard.db.models import DashboardEntity, EntityType, Stage
+from cub.core.documents import ParsedDocument, get_document_cache
 from cub.core.specs import Spec
 from cub.core.specs import Stage as SpecStage
 
@@ -192,13 +189,16 @@ class SpecParser:
             return excerpt
         return None
 
-    def _spec_to_entity(self, spec: Spec, checksum: str) -> DashboardEntity:
+    def _spec_to_entity(
+        self, spec: Spec, checksum: str, content: str | None = None
+    ) -> DashboardEntity:
         """
         Convert a Spec object to a DashboardEntity.
 
         Args:
             spec: Parsed Spec object
             checksum: File content checksum
+            content: Full file text, if already loaded
 
         Returns:
             DashboardEntity suitable for board display
@@ -214,7 +214,8 @@ class SpecParser:
         updated_at = datetime.combine(spec.updated, datetime.min.time()) if spec.updated else None
 
         # Read full content for detail view
-        content = spec.path.read_text() if spec.path.exists() else None
+        if content is None and spec.path.exists():
+            content = spec.path.read_text()
 
         # Extract card metadata
         readiness_score = self._extract_readiness_score(spec)
@@ -282,70 +283,34 @@ class SpecParser:
                 logger.warning(f"Empty spec file: {file_path}")
                 return None
 
-            # Read file content for parsing
+            # Read and parse through the shared document cache, which
+            # skips both when the file is unchanged
+            doc: ParsedDocument
             try:
-                raw_content = file_path.read_text(encoding='utf-8')
+                doc = get_document_cache().load(file_path)
             except UnicodeDecodeError as e:
                 logger.warning(f"Unable to read {file_path} as UTF-8: {e}. Skipping.")
                 return None
+            except (FileNotFoundError, PermissionError):
+                raise
             except Exception as e:
                 logger.error(f"Error reading file {file_path}: {e}")
                 return None
 
-            # Compute checksum for incremental sync
-            checksum = self._compute_checksum(file_path)
-
-            # Parse frontmatter with comprehensive error handling
-            post = None
-            try:
-                post = frontmatter.load(file_path)
-            except yaml.YAMLError as e:
-                logger.warning(
-                    f"Invalid YAML frontmatter in {file_path}: {e}. "
-                    f"Using defaults and treating entire file as content."
-                )
-                # Create minimal post with empty metadata
-                post = frontmatter.Post(content=raw_content, metadata={})
-            except Exception as e:
-                logger.warning(
-                    f"Error parsing frontmatter in {file_path}: {e}. "
-                    f"Treating file as plain markdown."
-                )
-                # Treat entire file as content
-                post = frontmatter.Post(content=raw_content, metadata={})
-
-            # Ensure metadata is a dict (handle null frontmatter)
-            if post.metadata is None:
-                logger.debug(f"Null frontmatter in {file_path}, using empty dict")
-                post.metadata = {}
-            elif not isinstance(post.metadata, dict):
-                logger.warning(
-                    f"Frontmatter in {file_path} is not a dict "
-                    f"(got {type(post.metadata).__name__}). Using empty dict."
-                )
-                post.metadata = {}
-
-            # Get spec name from filename
-            name = file_path.stem
-
-            # Extract title from first markdown heading if present
-            title: str | None = None
-            content = post.content
-            if content:
-                # Match first # heading
-                match = re.match(r"^#\s+(.+)$", content, re.MULTILINE)
-                if match:
-                    title = match.group(1).strip()
+            # Invalid or non-dict frontmatter leaves empty metadata and the
+            # entire file as content
+            if doc.error:
+                logger.warning(f"{doc.error} in {file_path}. Using defaults.")
 
             # Parse spec using existing Spec.from_frontmatter_dict
             # This handles all the complex parsing and validation
             try:
                 spec = Spec.from_frontmatter_dict(
-                    data=post.metadata,
-                    name=name,
+                    data=dict(doc.metadata),
+                    name=file_path.stem,
                     path=file_path,
                     stage=stage,
-                    title=title,
+                    title=doc.title,  # First markdown heading, if present
                 )
             except Exception as e:
                 logger.error(
@@ -354,8 +319,16 @@ class SpecParser:
                 )
                 return None
 
+            # A cached document reads its text from the file, which may
+            # have changed since it was loaded
+            try:
+                text = doc.text
+            except OSError as e:
+                logger.warning(f"Spec file changed during parsing: {file_path}: {e}")
+                return None
+
             # Convert to DashboardEntity
-            return self._spec_to_entity(spec, checksum)
+            return self._spec_to_entity(spec, doc.checksum, text)
 
         except FileNotFoundError:
             logger.warning(f"Spec file disappeared during parsing: {file_path}")
@@ -387,17 +360,18 @@ class SpecParser:
             return entities
 
         # Scan each stage directory
-        for stage in SpecStage:
-            stage_dir = self.specs_root / stage.value
-            if not stage_dir.exists():
-                logger.debug(f"Stage directory not found: {stage_dir}")
-                continue
-
-            # Parse all .md files in this stage
-            for spec_file in stage_dir.glob("*.md"):
-                entity = self.parse_file(spec_file, stage)
-                if entity:
-                    entities.append(entity)
+        with get_document_cache().batch():
+            for stage in SpecStage:
+                stage_dir = self.specs_root / stage.value
+                if not stage_dir.exists():
+                    logger.debug(f"Stage directory not found: {stage_dir}")
+                    continue
+
+                # Parse all .md files in this stage
+                for spec_file in stage_dir.glob("*.md"):
+                    entity = self.parse_file(spec_file, stage)
+                    if entity:
+                        entities.append(entity)
 
         # Sort by name for consistent ordering
         entities.sort(key=lambda e: e.id)
@@ -0,0 +1,418 @@
+"""
+Shared cache of parsed markdown documents.
+
+Specs, captures and plans are markdown files with optional YAML
+frontmatter. Listing them used to mean reading and YAML-parsing every
+file on every call. DocumentCache keeps the parsed form of each file
+(frontmatter, heading structure, checksum) in one JSON index per
+directory, so when nothing has changed a listing costs one stat per file.
+File bodies are never cached: a document from the index reads its source
+file when a caller first asks for the text, and checks it against the
+stored checksum.
+
+An entry is reused while the file's size and mtime match. If they don't,
+the file is read and hashed; when the content hash is unchanged (e.g.
+after a touch or checkout) the parsed data is kept and only the stat is
+refreshed. Otherwise the file is parsed again.
+
+Indexes live under $XDG_CACHE_HOME/cub/documents/, named after the
+directory they describe. The same cache serves project files and global
+captures alike. A missing or unwritable cache only costs speed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import frontmatter
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Bump when parsing changes in a way that invalidates stored documents
+CACHE_VERSION = 3
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+class Section(NamedTuple):
+    """A markdown heading within a document body."""
+
+    level: int
+    title: str
+    line: int
+
+
+@dataclass
+class ParsedDocument:
+    """
+    A parsed markdown file.
+
+    The metadata dict is shared with the cache; treat it as read-only.
+    The file's text is loaded on first access when the document came from
+    an on-disk index; ``content`` is the span of it after the frontmatter.
+    Both then raise OSError if the file was deleted or changed since it
+    was loaded, so callers that need the body should be ready for that.
+    """
+
+    path: Path
+    size: int
+    mtime_ns: int
+    checksum: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    content_start: int = 0
+    content_end: int = 0
+    sections: list[Section] = field(default_factory=list)
+    error: str | None = None
+    _text: str | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        """
+        The whole file.
+
+        Raises:
+            OSError: If the text isn't loaded yet and the file has changed
+                or can't be read since the document was loaded
+        """
+        if self._text is None:
+            self._text = self._read_text()
+        return self._text
+
+    @property
+    def content(self) -> str:
+        """
+        The body after the frontmatter (the whole file if it had none).
+
+        Raises:
+            OSError: As for ``text``
+        """
+        return self.text[self.content_start : self.content_end]
+
+    def _read_text(self) -> str:
+        raw = self.path.read_bytes()
+        if hashlib.md5(raw).hexdigest() != self.checksum:
+            raise OSError(f"{self.path} changed since it was loaded")
+        return raw.decode("utf-8")
+
+    @property
+    def title(self) -> str | None:
+        """The body's leading level-1 heading, if it starts with one."""
+        if self.sections and self.sections[0].level == 1 and self.sections[0].line == 0:
+            return self.sections[0].title
+        return None
+
+
+def parse_sections(content: str) -> list[Section]:
+    """
+    Find the ATX headings in a markdown body, skipping fenced code.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        Headings in document order, with 0-based line numbers
+    """
+    sections: list[Section] = []
+    in_fence = False
+    for number, line in enumerate(content.splitlines()):
+        if _FENCE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = _HEADING.match(line)
+        if match:
+            sections.append(Section(len(match.group(1)), match.group(2), number))
+    return sections
+
+
+def parse_document(path: Path, raw: bytes, st: os.stat_result) -> ParsedDocument:
+    """
+    Parse a document from its raw bytes.
+
+    Invalid frontmatter doesn't raise: the document gets empty metadata,
+    the whole file as content, and the problem in ``error``.
+
+    Args:
+        path: File the bytes came from
+        raw: File contents
+        st: File stat taken before reading
+
+    Raises:
+        UnicodeDecodeError: If the file isn't UTF-8
+    """
+    text = raw.decode("utf-8")
+    error: str | None = None
+    try:
+        post = frontmatter.loads(text)
+        metadata = post.metadata
+        content = post.content
+    except yaml.YAMLError as e:
+        metadata, content, error = {}, text, f"Invalid YAML frontmatter: {e}"
+    except Exception as e:
+        metadata, content, error = {}, text, f"Invalid frontmatter: {e}"
+    if not isinstance(metadata, dict):
+        error = error or f"Frontmatter is not a mapping (got {type(metadata).__name__})"
+        metadata = {}
+
+    if content is text:
+        content_start, content_end = 0, len(text)
+    else:
+        # frontmatter strips the body, so it ends where the text does once
+        # trailing whitespace is dropped
+        content_end = len(text.rstrip()) if content else 0
+        content_start = content_end - len(content)
+    return ParsedDocument(
+        path=path,
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+        checksum=hashlib.md5(raw).hexdigest(),
+        metadata=metadata,
+        content_start=content_start,
+        content_end=content_end,
+        sections=parse_sections(content),
+        error=error,
+        _text=text,
+    )
+
+
+def _encode(obj: Any) -> Any:
+    """JSON fallback for YAML scalar types that JSON lacks."""
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, date):
+        return {"__date__": obj.isoformat()}
+    raise TypeError(f"Cannot cache {type(obj).__name__} values")
+
+
+def _decode(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+class _Index:
+    """Cached documents for one directory."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.documents: dict[str, ParsedDocument] = {}
+        self.dirty = False
+
+
+class DocumentCache:
+    """
+    Stat-validated cache of parsed markdown documents.
+
+    Example:
+        >>> cache = get_document_cache()
+        >>> with cache.batch():
+        ...     docs = [cache.load(p) for p in specs_dir.glob("*.md")]
+        >>> docs[0].metadata.get("status")
+    """
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the on-disk indexes, or None to
+                cache in memory only
+        """
+        self.cache_dir = cache_dir
+        self._indexes: dict[Path, _Index] = {}
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+
+    def _index_for(self, directory: Path) -> _Index:
+        index = self._indexes.get(directory)
+        if index is not None:
+            return index
+        name = hashlib.sha1(str(directory).encode()).hexdigest()[:16]
+        cache_dir = self.cache_dir or Path()
+        index = _Index(cache_dir / f"{name}.json")
+        if self.cache_dir is not None:
+            self._read_index(index, directory)
+        self._indexes[directory] = index
+        return index
+
+    def _read_index(self, index: _Index, directory: Path) -> None:
+        try:
+            data = json.loads(index.path.read_text(encoding="utf-8"), object_hook=_decode)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.debug("Discarding unreadable document index %s", index.path, exc_info=True)
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CACHE_VERSION
+            or data.get("directory") != str(directory)
+        ):
+            return
+        try:
+            for name, entry in data["documents"].items():
+                index.documents[name] = ParsedDocument(
+                    path=directory / name,
+                    size=entry["size"],
+                    mtime_ns=entry["mtime_ns"],
+                    checksum=entry["checksum"],
+                    metadata=entry["metadata"],
+                    content_start=entry["content_start"],
+                    content_end=entry["content_end"],
+                    sections=[Section(*s) for s in entry["sections"]],
+                    error=entry["error"],
+                )
+        except (KeyError, TypeError, AttributeError):
+            logger.debug("Discarding invalid document index %s", index.path, exc_info=True)
+            index.documents.clear()
+
+    def _write_index(self, index: _Index, directory: Path) -> None:
+        if self.cache_dir is None:
+            index.dirty = False
+            return
+        documents: dict[str, Any] = {}
+        for name, doc in index.documents.items():
+            entry = {
+                "size": doc.size,
+                "mtime_ns": doc.mtime_ns,
+                "checksum": doc.checksum,
+                "metadata": doc.metadata,
+                "content_start": doc.content_start,
+                "content_end": doc.content_end,
+                "sections": [list(s) for s in doc.sections],
+                "error": doc.error,
+            }
+            try:
+                # Only cache documents whose metadata survives the round trip
+                json.dumps(entry, default=_encode)
+            except (TypeError, ValueError):
+                continue
+            documents[name] = entry
+        data = {"version": CACHE_VERSION, "directory": str(directory), "documents": documents}
+        try:
+            _write_atomic(
+                index.path,
+                json.dumps(data, default=_encode, separators=(",", ":")).encode("utf-8"),
+            )
+        except OSError:
+            logger.debug("Failed to write document index %s", index.path, exc_info=True)
+        index.dirty = False
+
+    def load(self, path: Path) -> ParsedDocument:
+        """
+        Get the parsed form of a file, parsing it only if it changed.
+
+        Args:
+            path: File to load
+
+        Returns:
+            The parsed document
+
+        Raises:
+            OSError: If the file can't be read (FileNotFoundError if missing)
+            UnicodeDecodeError: If the file isn't UTF-8
+        """
+        path = Path(path).absolute()
+        st = path.stat()
+        with self._lock:
+            index = self._index_for(path.parent)
+            cached = index.documents.get(path.name)
+            if cached and cached.size == st.st_size and cached.mtime_ns == st.st_mtime_ns:
+                return cached
+
+        raw = path.read_bytes()
+        with self._lock:
+            if cached and cached.checksum == hashlib.md5(raw).hexdigest():
+                cached.size, cached.mtime_ns = st.st_size, st.st_mtime_ns
+                doc = cached
+            else:
+                doc = parse_document(path, raw, st)
+            index.documents[path.name] = doc
+            index.dirty = True
+            if self._batch_depth == 0:
+                self._write_index(index, path.parent)
+        return doc
+
+    @contextmanager
+    def batch(self) -> Iterator[DocumentCache]:
+        """
+        Defer index writes until the block ends.
+
+        Use around loops that load many files so that each changed
+        directory's index is written once.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Write any changed indexes, dropping entries for deleted files."""
+        with self._lock:
+            for directory, index in self._indexes.items():
+                if not index.dirty:
+                    continue
+                for name in [n for n in index.documents if not (directory / n).exists()]:
+                    del index.documents[name]
+                self._write_index(index, directory)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary sibling so readers never see it partial."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def default_cache_dir() -> Path:
+    """The shared document cache directory under XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "cub" / "documents"
+
+
+_shared: DocumentCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_document_cache() -> DocumentCache:
+    """
+    Get the process-wide document cache.
+
+    Returns:
+        DocumentCache backed by default_cache_dir()
+    """
+    global _shared
+    cache_dir = default_cache_dir()
+    with _shared_lock:
+        if _shared is None or _shared.cache_dir != cache_dir:
+            _shared = DocumentCache(cache_dir)
+        return _shared
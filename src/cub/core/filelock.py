@@ -0,0 +1,101 @@
+"""
+Advisory file locks shared between cub processes.
+
+Several stores under .cub/ (the session index, tool metrics, the tool
+artifact index) are updated by more than one cub process at a time and
+serialize their read-modify-write cycles with a lock file. The lock is
+an OS lock held on an open descriptor (flock on POSIX, msvcrt.locking
+on Windows), so it is released when its holder exits or crashes and no
+stale-lock detection is needed. The lock file itself is never deleted:
+removing it while another process waits on it would let two processes
+lock different inodes under the same name.
+
+Example:
+    >>> with file_lock(store_dir / "store.lock", timeout=2.0) as locked:
+    ...     if locked:
+    ...         update_store()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Interval between attempts while waiting for a lock
+POLL_SECONDS = 0.01
+
+
+@contextmanager
+def file_lock(path: Path, *, timeout: float = 0.0, shared: bool = False) -> Iterator[bool]:
+    """
+    Hold a lock on path for the body of a with-block.
+
+    The file and its parent directories are created if missing.
+
+    Args:
+        path: Lock file
+        timeout: Seconds to wait for another holder to release it; 0 tries once
+        shared: Take a shared lock, which only excludes exclusive holders.
+            Windows has no shared locks, so there it is exclusive.
+
+    Yields:
+        Whether the lock was taken; False if it was still held elsewhere
+        after timeout, or the lock file couldn't be opened
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_CREAT | os.O_RDWR)
+    except OSError:
+        logger.debug("Failed to open lock file %s", path, exc_info=True)
+        yield False
+        return
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(fd, shared):
+            if time.monotonic() >= deadline:
+                yield False
+                return
+            time.sleep(POLL_SECONDS)
+        try:
+            yield True
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _try_lock(fd: int, shared: bool) -> bool:
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int, shared: bool) -> bool:
+        mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(fd, mode | fcntl.LOCK_NB)
+        except (BlockingIOError, PermissionError):
+            return False
+        return True
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -10,9 +10,13 @@ import json
 import re
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from cub.core.github.models import GitHubIssue, RepoInfo
 
+if TYPE_CHECKING:
+    from cub.core.services.pr_checks import CheckPoller
+
 
 class GitHubClientError(Exception):
     """Error from GitHub client operations."""
@@ -455,17 +459,29 @@ class GitHubClient:
         except (json.JSONDecodeError, OSError, FileNotFoundError):
             return []
 
-    def wait_for_checks(self, pr_ref: str | int, timeout: int = 600) -> bool:
+    def wait_for_checks(
+        self,
+        pr_ref: str | int,
+        timeout: int = 600,
+        *,
+        poller: CheckPoller | None = None,
+    ) -> bool:
         """
         Wait for PR checks to complete.
 
         Args:
             pr_ref: PR number or branch name
             timeout: Timeout in seconds
+            poller: Batched check poller to wait on instead of
+                `gh pr checks --watch` (used for numeric PR refs)
 
         Returns:
             True if all checks passed, False otherwise
         """
+        if poller is not None and str(pr_ref).isdigit():
+            summary = poller.wait_until_complete(int(pr_ref), timeout=timeout)
+            return summary is not None and summary.all_passed
+
         try:
             result = subprocess.run(
                 ["gh", "pr", "checks", str(pr_ref), "--watch"],
@@ -34,6 +34,7 @@ from . import (
 )
 from .async_backend import (
     AsyncHarnessBackend,
+    SessionRetainingBackend,
     detect_async_harness,
     get_async_backend,
     get_async_capabilities,
@@ -85,6 +86,7 @@ __all__ = [
     "get_capabilities",
     # Async backend interface
     "AsyncHarnessBackend",
+    "SessionRetainingBackend",
     "register_async_backend",
     "get_async_backend",
     "detect_async_harness",
@@ -164,6 +164,24 @@ class AsyncHarnessBackend(Protocol):
         ...
 
 
+@runtime_checkable
+class SessionRetainingBackend(Protocol):
+    """
+    Optional interface for backends that can keep a session warm across tasks.
+
+    The run loop opens a session per epic when session retention is
+    enabled, and closes it when the run ends.
+    """
+
+    def open_session(self, scope: str) -> None:
+        """Retain a session for tasks in scope (no-op if already open)."""
+        ...
+
+    def close_session(self) -> None:
+        """Close any retained session and stop retaining."""
+        ...
+
+
 # Backend registry
 _async_backends: dict[str, type[AsyncHarnessBackend]] = {}
 
@@ -22,6 +22,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
 from .async_backend import register_async_backend
+from .claude_session import RetainedSession, SessionKey
 
 # SDK permission mode type
 PermissionMode = Literal["default", "acceptEdits", "plan", "bypassPermissions"]
@@ -229,7 +230,7 @@ class ClaudeSDKBackend:
     - Native async streaming via query()
     - Hooks support for circuit breakers and tool interception
     - Custom tool definitions via MCP servers
-    - Stateful sessions via ClaudeSDKClient
+    - Optional retained sessions via ClaudeSDKClient (see open_session)
     - Token usage and cost tracking from ResultMessage
 
     Hook System:
@@ -241,6 +242,79 @@ class ClaudeSDKBackend:
     def __init__(self) -> None:
         """Initialize the harness with empty hook registry."""
         self._hooks: dict[HookEvent, list[HookHandler]] = {event: [] for event in HookEvent}
+        self._retain_scope: str | None = None
+        self._session: RetainedSession | None = None
+
+    def open_session(self, scope: str) -> None:
+        """
+        Retain one Claude Code session across tasks until close_session().
+
+        Tasks run while a session is open share a long-lived
+        ClaudeSDKClient instead of each starting a one-shot query(). The
+        conversation is cleared between tasks, but the process and its
+        cached system prompt prefix stay warm. A task whose system
+        prompt, working directory, model or permissions differ from the
+        session's starts a new session.
+
+        Opening a session for the scope already open is a no-op, so the
+        run loop can call this before every task in an epic.
+
+        Args:
+            scope: What the session is retained for (e.g. an epic ID)
+        """
+        if scope == self._retain_scope:
+            return
+        self.close_session()
+        self._retain_scope = scope
+
+    def close_session(self) -> None:
+        """Close the retained session, if any, and stop retaining."""
+        self._retain_scope = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _session_for(self, task_input: TaskInput) -> RetainedSession | None:
+        """Return the retained session a task should run in, if retaining."""
+        if self._retain_scope is None:
+            return None
+        if self._session is not None and not self._session.matches(task_input):
+            self._session.close()
+            self._session = None
+        if self._session is None:
+            self._session = RetainedSession(
+                _build_options(task_input),
+                key=SessionKey.for_task(task_input),
+                scope=self._retain_scope,
+            )
+        return self._session
+
+    async def _sdk_messages(
+        self, task_input: TaskInput, options: "ClaudeAgentOptions"
+    ) -> AsyncIterator[Any]:
+        """Yield SDK messages for a task from the retained session or query()."""
+        session = self._session_for(task_input)
+        if session is None:
+            from claude_agent_sdk import query
+
+            async for message in query(prompt=task_input.prompt, options=options):
+                yield message
+            return
+
+        try:
+            async for message in session.run(task_input.prompt):
+                yield message
+        finally:
+            if session.closed and self._session is session:
+                # Failed or abandoned; the next task reconnects
+                self._session = None
+
+    def _usage_for(self, sdk_message: Any) -> TokenUsage | None:
+        """Extract usage, with cost made per-task inside a retained session."""
+        usage = _extract_usage(sdk_message)
+        if usage is not None and self._session is not None:
+            usage.cost_usd = self._session.turn_cost(usage.cost_usd)
+        return usage
 
     @property
     def name(self) -> str:
@@ -424,8 +498,9 @@ class ClaudeSDKBackend:
         """
         Execute task with blocking execution (async).
 
-        Uses the SDK's query() function to run a single-shot task.
-        Collects all messages and returns complete result.
+        Uses the SDK's query() function to run a single-shot task, or the
+        retained session if one is open (see open_session). Collects all
+        messages and returns complete result.
 
         Hook execution points:
         - PRE_TASK: Before task execution (can block task)
@@ -453,7 +528,6 @@ class ClaudeSDKBackend:
             CLINotFoundError,
             ProcessError,
             ResultMessage,
-            query,
         )
 
         start_time = time.time()
@@ -494,7 +568,7 @@ class ClaudeSDKBackend:
 
         try:
             try:
-                async for sdk_message in query(prompt=task_input.prompt, options=options):
+                async for sdk_message in self._sdk_messages(task_input, options):
                     # Parse message for history
                     parsed = _parse_sdk_message(sdk_message)
                     if parsed is not None:
@@ -515,7 +589,7 @@ class ClaudeSDKBackend:
                         output_chunks.append(text)
 
                     # Extract usage from ResultMessage
-                    msg_usage = _extract_usage(sdk_message)
+                    msg_usage = self._usage_for(sdk_message)
                     if msg_usage is not None:
                         usage = msg_usage
 
@@ -640,7 +714,8 @@ class ClaudeSDKBackend:
         """
         Execute task with streaming output (async generator).
 
-        Uses the SDK's query() function with real-time text extraction.
+        Uses the SDK's query() function (or the retained session, if one
+        is open) with real-time text extraction.
         Yields text chunks as they're generated. The final yielded
         value is a TokenUsage object with usage data for the session.
 
@@ -671,7 +746,6 @@ class ClaudeSDKBackend:
             CLIConnectionError,
             CLINotFoundError,
             ProcessError,
-            query,
         )
 
         # Execute PRE_TASK hooks - can block task execution
@@ -697,14 +771,14 @@ class ClaudeSDKBackend:
         usage: TokenUsage | None = None
         try:
             try:
-                async for sdk_message in query(prompt=task_input.prompt, options=options):
+                async for sdk_message in self._sdk_messages(task_input, options):
                     # Extract and yield text chunks
                     text = _extract_text_from_message(sdk_message)
                     if text:
                         yield text
 
                     # Capture usage from ResultMessage
-                    msg_usage = _extract_usage(sdk_message)
+                    msg_usage = self._usage_for(sdk_message)
                     if msg_usage is not None:
                         usage = msg_usage
 
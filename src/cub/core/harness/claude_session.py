@@ -0,0 +1,286 @@
+"""
+Retained Claude SDK sessions.
+
+A RetainedSession keeps one ClaudeSDKClient (and the Claude Code process
+behind it) alive across consecutive tasks, instead of paying process
+startup and a cold system prompt for every one-shot query(). Between
+tasks the conversation is reset with /clear, so each task still starts
+from a clean context while the process and its cached system prompt
+prefix stay warm.
+
+The SDK requires a client to be connected, used and disconnected from the
+same async task, but the run loop drives each task through its own
+asyncio.run(). The client therefore lives in a worker task on a private
+event loop thread, and callers talk to it through that loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .models import TaskInput
+
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeAgentOptions
+
+logger = logging.getLogger(__name__)
+
+# Prompt sent between tasks to drop the previous task's conversation
+RESET_PROMPT = "/clear"
+
+
+class SessionKey(NamedTuple):
+    """TaskInput fields that must match for a task to reuse a session."""
+
+    system_prompt: str | None
+    working_dir: str | None
+    model: str | None
+    auto_approve: bool
+
+    @classmethod
+    def for_task(cls, task_input: TaskInput) -> SessionKey:
+        """Build the key for a task."""
+        return cls(
+            task_input.system_prompt,
+            task_input.working_dir,
+            task_input.model,
+            task_input.auto_approve,
+        )
+
+
+class _Turn:
+    """One task prompt queued for the worker, and its message stream."""
+
+    def __init__(self, prompt: str) -> None:
+        self.prompt = prompt
+        self.messages: asyncio.Queue[Any] = asyncio.Queue()
+
+
+class _Failure(NamedTuple):
+    error: BaseException
+
+
+_DONE = object()
+
+
+class RetainedSession:
+    """
+    A ClaudeSDKClient kept alive across the tasks of one scope (e.g. an epic).
+
+    Example:
+        >>> session = RetainedSession(options, key=SessionKey.for_task(task_input))
+        >>> async for message in session.run(task_input.prompt):
+        ...     handle(message)
+        >>> session.close()
+    """
+
+    def __init__(
+        self,
+        options: ClaudeAgentOptions,
+        *,
+        key: SessionKey,
+        scope: str | None = None,
+        client_factory: Callable[[ClaudeAgentOptions], Any] | None = None,
+    ) -> None:
+        """
+        Create a session. The client connects on the first run().
+
+        Args:
+            options: SDK options shared by every task in the session
+            key: Task fields the options were built from
+            scope: What the session is retained for (e.g. an epic ID)
+            client_factory: Builds the client (defaults to ClaudeSDKClient)
+        """
+        self.options = options
+        self.key = key
+        self.scope = scope
+        self.turns = 0
+        self._client_factory = client_factory
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pending: asyncio.Queue[_Turn | None] | None = None
+        self._worker: Future[None] | None = None
+        self._client: Any = None
+        self._in_turn = False
+        self._cost_baseline = 0.0
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the session has been closed or has failed."""
+        return self._closed
+
+    def matches(self, task_input: TaskInput) -> bool:
+        """Whether a task can run in this session."""
+        return not self._closed and SessionKey.for_task(task_input) == self.key
+
+    def turn_cost(self, total_cost_usd: float | None) -> float | None:
+        """
+        Convert a result's session-cumulative cost to this turn's cost.
+
+        Claude Code reports total_cost_usd for the whole process, so a
+        retained session's later results include earlier tasks' spend.
+
+        Args:
+            total_cost_usd: total_cost_usd from the turn's ResultMessage
+
+        Returns:
+            Cost of the turn alone, or None if no cost was reported
+        """
+        if total_cost_usd is None:
+            return None
+        cost = total_cost_usd - self._cost_baseline
+        if cost < 0:
+            # The process reset its counter; the total is all this turn's
+            cost = total_cost_usd
+        self._cost_baseline = total_cost_usd
+        return cost
+
+    async def run(self, prompt: str) -> AsyncIterator[Any]:
+        """
+        Run one task prompt and yield its SDK messages.
+
+        Can be awaited from any event loop. If the caller stops early the
+        turn is interrupted and the session closed, since the client
+        would otherwise still be mid-response for the next task.
+
+        Raises:
+            RuntimeError: If the session is closed
+            Exception: SDK errors from connecting or querying; the session
+                is closed when these occur
+        """
+        if self._closed:
+            raise RuntimeError("Session is closed")
+        self._start()
+        turn = _Turn(prompt)
+        assert self._pending is not None
+        await self._call(self._pending.put(turn))
+
+        finished = False
+        try:
+            while True:
+                item = await self._call(turn.messages.get())
+                if item is _DONE:
+                    finished = True
+                    return
+                if isinstance(item, _Failure):
+                    finished = True
+                    self.close()
+                    raise item.error
+                yield item
+        finally:
+            if not finished and not self._closed:
+                logger.debug("Session turn abandoned; closing session")
+                self.close(interrupt=True)
+
+    def close(self, *, interrupt: bool = False) -> None:
+        """
+        Disconnect the client and stop the worker thread.
+
+        Args:
+            interrupt: Interrupt a turn still in progress first
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._loop is None or self._pending is None:
+            return
+
+        loop, pending = self._loop, self._pending
+        try:
+            if interrupt:
+                asyncio.run_coroutine_threadsafe(self._interrupt(), loop).result(timeout=5)
+            asyncio.run_coroutine_threadsafe(pending.put(None), loop).result(timeout=5)
+            if self._worker is not None:
+                self._worker.result(timeout=30)
+        except Exception:
+            logger.debug("Retained session did not shut down cleanly", exc_info=True)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            if not loop.is_running():
+                loop.close()
+
+    # ------------------------------------------------------------------
+    # Worker side (runs on the session's own loop)
+    # ------------------------------------------------------------------
+
+    def _start(self) -> None:
+        """Start the loop thread and worker task on first use."""
+        if self._loop is not None:
+            return
+        loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=loop.run_forever, name="cub-claude-session", daemon=True
+        )
+        self._thread.start()
+        self._loop = loop
+        self._pending = asyncio.Queue()
+        self._worker = asyncio.run_coroutine_threadsafe(self._serve(), loop)
+
+    async def _call(self, coro: Any) -> Any:
+        """Run a coroutine on the session loop and await it from this one."""
+        assert self._loop is not None
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    def _new_client(self) -> Any:
+        if self._client_factory is not None:
+            return self._client_factory(self.options)
+        from claude_agent_sdk import ClaudeSDKClient
+
+        return ClaudeSDKClient(self.options)
+
+    async def _serve(self) -> None:
+        """Own the client: connect, run turns in order, disconnect."""
+        assert self._pending is not None
+        try:
+            while True:
+                turn = await self._pending.get()
+                if turn is None:
+                    return
+                try:
+                    if self._client is None:
+                        self._client = self._new_client()
+                        await self._client.connect()
+                    elif self.turns:
+                        await self._reset(self._client)
+                    self._in_turn = True
+                    await self._client.query(turn.prompt)
+                    async for message in self._client.receive_response():
+                        await turn.messages.put(message)
+                    self.turns += 1
+                    await turn.messages.put(_DONE)
+                except Exception as e:
+                    await turn.messages.put(_Failure(e))
+                    return
+                finally:
+                    self._in_turn = False
+        finally:
+            if self._client is not None:
+                try:
+                    await self._client.disconnect()
+                except Exception:
+                    logger.debug("Error disconnecting retained session", exc_info=True)
+
+    async def _interrupt(self) -> None:
+        """Interrupt the turn in progress, if any."""
+        if self._in_turn and self._client is not None:
+            try:
+                await self._client.interrupt()
+            except Exception:
+                logger.debug("Failed to interrupt retained session", exc_info=True)
+
+    async def _reset(self, client: Any) -> None:
+        """Clear the conversation, keeping the process (and its cache) warm."""
+        await client.query(RESET_PROMPT)
+        async for message in client.receive_response():
+            total = getattr(message, "total_cost_usd", None)
+            if isinstance(total, (int, float)):
+                # Spend before the reset belongs to earlier turns
+                self._cost_baseline = float(total)
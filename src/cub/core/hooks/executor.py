@@ -60,6 +60,7 @@ from pydantic import BaseModel
 
 from cub.core.hooks.discovery import discover_hooks
 from cub.core.hooks.models import HookConfig, HookResult
+from cub.core.profiling import span
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +150,8 @@ class HookExecutor:
         # Execute each script
         results: list[HookResult] = []
         for script in scripts:
-            result = self._execute_script(script, hook_name, context)
+            with span("hooks.script", "hooks", hook=hook_name, script=script.name):
+                result = self._execute_script(script, hook_name, context)
             results.append(result)
 
             # Log result
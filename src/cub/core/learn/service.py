@@ -9,14 +9,15 @@ Provides high-level operations for:
 
 from __future__ import annotations
 
-import json
 import logging
-import statistics
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import compress
 from pathlib import Path
 
+from cub.core.ledger.analytics import LedgerAnalytics, LedgerColumns, outlier_rows
+
 logger = logging.getLogger(__name__)
 
 
@@ -266,9 +267,9 @@ class LearnService:
         elif since_days:
             cutoff_date = datetime.utcnow() - timedelta(days=since_days)
 
-        # Load ledger entries
-        entries = self._load_entries(cutoff_date)
-        if not entries:
+        # Load ledger entries as columns
+        columns = self._load_columns(cutoff_date)
+        if not len(columns):
             logger.info("No entries found for analysis")
             return LearnResult(
                 entries_analyzed=0,
@@ -276,15 +277,15 @@ class LearnService:
             )
 
         # Calculate time range
-        time_range_days = self._calculate_time_range(entries)
+        time_range_days = columns.time_range_days()
 
         # Detect patterns
         patterns: list[Pattern] = []
-        patterns.extend(self._detect_failure_patterns(entries))
-        patterns.extend(self._detect_cost_outliers(entries))
-        patterns.extend(self._detect_duration_outliers(entries))
-        patterns.extend(self._detect_escalation_patterns(entries))
-        patterns.extend(self._extract_lessons_learned(entries))
+        patterns.extend(self._detect_failure_patterns(columns))
+        patterns.extend(self._detect_cost_outliers(columns))
+        patterns.extend(self._detect_duration_outliers(columns))
+        patterns.extend(self._detect_escalation_patterns(columns))
+        patterns.extend(self._extract_lessons_learned(columns))
 
         # Generate suggestions
         suggestions = self._generate_suggestions(patterns)
@@ -293,7 +294,7 @@ class LearnService:
         result = LearnResult(
             patterns=patterns,
             suggestions=suggestions,
-            entries_analyzed=len(entries),
+            entries_analyzed=len(columns),
             time_range_days=time_range_days,
         )
 
@@ -303,84 +304,32 @@ class LearnService:
 
         return result
 
-    def _load_entries(
-        self, cutoff_date: datetime | None
-    ) -> list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]]:
+    def _load_columns(self, cutoff_date: datetime | None) -> LedgerColumns:
         """
-        Load ledger entries, optionally filtered by date.
+        Load ledger entries as columns, optionally filtered by date.
+
+        Entries come from the shared ledger analytics cache, so only task
+        files added or changed since the last run are parsed.
 
         Args:
-            cutoff_date: Only include entries after this date
+            cutoff_date: Only include entries completed after this date
 
         Returns:
-            List of ledger entry dictionaries
+            LedgerColumns with one row per entry
         """
-        entries: list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]] = []
-
-        # Load from by-task directory
         by_task_dir = self.ledger_dir / "by-task"
         if not by_task_dir.exists():
             logger.warning(f"Ledger by-task directory not found: {by_task_dir}")
-            return entries
+            return LedgerColumns()
 
-        for task_file in by_task_dir.glob("*.json"):
-            try:
-                with task_file.open("r") as f:
-                    entry = json.load(f)
-
-                # Filter by date if specified
-                if cutoff_date:
-                    completed_at = entry.get("completed_at")
-                    if completed_at:
-                        try:
-                            entry_date = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
-                            # Make cutoff_date timezone-aware for comparison
-                            cutoff_aware = cutoff_date.replace(tzinfo=entry_date.tzinfo)
-                            if entry_date < cutoff_aware:
-                                continue
-                        except (ValueError, AttributeError):
-                            pass
-
-                entries.append(entry)
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse {task_file}: {e}")
-            except Exception as e:
-                logger.warning(f"Failed to load {task_file}: {e}")
+        columns = LedgerAnalytics(self.ledger_dir).load()
+        if cutoff_date:
+            columns = columns.take(columns.since(cutoff_date))
 
-        logger.info(f"Loaded {len(entries)} ledger entries")
-        return entries
+        logger.info(f"Loaded {len(columns)} ledger entries")
+        return columns
 
-    def _calculate_time_range(
-        self,
-        entries: list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]],
-    ) -> int:
-        """Calculate the time range covered by entries in days."""
-        dates: list[datetime] = []
-
-        for entry in entries:
-            completed_at = entry.get("completed_at")
-            if completed_at and isinstance(completed_at, str):
-                try:
-                    parsed = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
-                    # Normalize to naive UTC for consistent comparison
-                    if parsed.tzinfo is not None:
-                        parsed = parsed.replace(tzinfo=None)
-                    dates.append(parsed)
-                except (ValueError, AttributeError):
-                    pass
-
-        if not dates:
-            return 0
-
-        min_date = min(dates)
-        max_date = max(dates)
-        return (max_date - min_date).days + 1
-
-    def _detect_failure_patterns(
-        self,
-        entries: list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]],
-    ) -> list[Pattern]:
+    def _detect_failure_patterns(self, columns: LedgerColumns) -> list[Pattern]:
         """
         Detect repeated failure patterns.
 
@@ -390,22 +339,11 @@ class LearnService:
         """
         patterns: list[Pattern] = []
 
-        # Collect error categories
+        # Collect error categories of failed attempts
         error_counts: dict[str, list[str]] = {}  # category -> task IDs
-
-        for entry in entries:
-            # Check attempts for failures
-            attempts = entry.get("attempts", [])
-            if isinstance(attempts, list):
-                for attempt in attempts:
-                    if isinstance(attempt, dict) and not attempt.get("success", True):
-                        error_cat = attempt.get("error_category", "unknown")
-                        if isinstance(error_cat, str):
-                            task_id = entry.get("id", "unknown")
-                            if isinstance(task_id, str):
-                                if error_cat not in error_counts:
-                                    error_counts[error_cat] = []
-                                error_counts[error_cat].append(task_id)
+        failures = columns.failures
+        for row, error_cat in zip(failures.rows, failures.values, strict=True):
+            error_counts.setdefault(error_cat, []).append(columns.ids[row])
 
         # Create patterns for repeated failures
         for error_cat, task_ids in error_counts.items():
@@ -424,10 +362,7 @@ class LearnService:
 
         return patterns
 
-    def _detect_cost_outliers(
-        self,
-        entries: list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]],
-    ) -> list[Pattern]:
+    def _detect_cost_outliers(self, columns: LedgerColumns) -> list[Pattern]:
         """
         Detect tasks with unusually high costs.
 
@@ -435,55 +370,35 @@ class LearnService:
         """
         patterns: list[Pattern] = []
 
-        # Collect costs
-        costs: list[tuple[str, float]] = []  # (task_id, cost)
-
-        for entry in entries:
-            cost = entry.get("cost_usd", 0.0)
-            task_id = entry.get("id", "unknown")
-            if isinstance(cost, (int, float)) and isinstance(task_id, str) and cost > 0:
-                costs.append((task_id, float(cost)))
-
-        if len(costs) < 3:  # Need enough data points
+        # Only tasks with a recorded cost
+        rows = [i for i, cost in enumerate(columns.cost_usd) if cost > 0]
+        if len(rows) < 3:  # Need enough data points
             return patterns
 
-        # Calculate statistics
-        cost_values = [c[1] for c in costs]
-        mean_cost = statistics.mean(cost_values)
-        try:
-            stddev_cost = statistics.stdev(cost_values)
-        except statistics.StatisticsError:
+        found = outlier_rows(columns.cost_usd, rows, self.COST_OUTLIER_STDDEV)
+        if found is None:
             return patterns
-
-        if stddev_cost == 0:
-            return patterns
-
-        # Find outliers
-        threshold = mean_cost + (self.COST_OUTLIER_STDDEV * stddev_cost)
-        outliers = [(tid, c) for tid, c in costs if c > threshold]
+        outliers, mean_cost, threshold = found
 
         if outliers:
             patterns.append(
                 Pattern(
                     category=PatternCategory.COST_OUTLIER,
                     description=f"Tasks with costs above ${threshold:.2f} (mean: ${mean_cost:.2f})",
-                    evidence=[tid for tid, _ in outliers],
+                    evidence=[columns.ids[i] for i in outliers],
                     frequency=len(outliers),
                     confidence=0.8,
                     metadata={
                         "mean_cost": mean_cost,
                         "threshold": threshold,
-                        "max_cost": max(c for _, c in outliers),
+                        "max_cost": max(columns.cost_usd[i] for i in outliers),
                     },
                 )
             )
 
         return patterns
 
-    def _detect_duration_outliers(
-        self,
-        entries: list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]],
-    ) -> list[Pattern]:
+    def _detect_duration_outliers(self, columns: LedgerColumns) -> list[Pattern]:
         """
         Detect tasks with unusually long durations.
 
@@ -491,32 +406,15 @@ class LearnService:
         """
         patterns: list[Pattern] = []
 
-        # Collect durations
-        durations: list[tuple[str, int]] = []  # (task_id, duration_seconds)
-
-        for entry in entries:
-            duration = entry.get("duration_seconds", 0)
-            task_id = entry.get("id", "unknown")
-            if isinstance(duration, int) and isinstance(task_id, str) and duration > 0:
-                durations.append((task_id, duration))
-
-        if len(durations) < 3:  # Need enough data points
+        # Only tasks with a recorded duration
+        rows = [i for i, duration in enumerate(columns.duration_seconds) if duration > 0]
+        if len(rows) < 3:  # Need enough data points
             return patterns
 
-        # Calculate statistics
-        duration_values = [d[1] for d in durations]
-        mean_duration = statistics.mean(duration_values)
-        try:
-            stddev_duration = statistics.stdev(duration_values)
-        except statistics.StatisticsError:
+        found = outlier_rows(columns.duration_seconds, rows, self.DURATION_OUTLIER_STDDEV)
+        if found is None:
             return patterns
-
-        if stddev_duration == 0:
-            return patterns
-
-        # Find outliers
-        threshold = mean_duration + (self.DURATION_OUTLIER_STDDEV * stddev_duration)
-        outliers = [(tid, d) for tid, d in durations if d > threshold]
+        outliers, mean_duration, threshold = found
 
         if outliers:
             threshold_minutes = int(threshold / 60)
@@ -526,23 +424,20 @@ class LearnService:
                 Pattern(
                     category=PatternCategory.DURATION_OUTLIER,
                     description=desc,
-                    evidence=[tid for tid, _ in outliers],
+                    evidence=[columns.ids[i] for i in outliers],
                     frequency=len(outliers),
                     confidence=0.8,
                     metadata={
                         "mean_duration_seconds": mean_duration,
                         "threshold_seconds": threshold,
-                        "max_duration_seconds": max(d for _, d in outliers),
+                        "max_duration_seconds": max(columns.duration_seconds[i] for i in outliers),
                     },
                 )
             )
 
         return patterns
 
-    def _detect_escalation_patterns(
-        self,
-        entries: list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]],
-    ) -> list[Pattern]:
+    def _detect_escalation_patterns(self, columns: LedgerColumns) -> list[Pattern]:
         """
         Detect patterns in task escalations.
 
@@ -550,17 +445,8 @@ class LearnService:
         """
         patterns: list[Pattern] = []
 
-        # Collect escalation data
-        escalated_tasks: list[str] = []
-        total_tasks = len(entries)
-
-        for entry in entries:
-            outcome = entry.get("outcome", {})
-            if isinstance(outcome, dict):
-                if outcome.get("escalated", False):
-                    task_id = entry.get("id", "unknown")
-                    if isinstance(task_id, str):
-                        escalated_tasks.append(task_id)
+        escalated_tasks = list(compress(columns.ids, columns.escalated))
+        total_tasks = len(columns)
 
         if escalated_tasks and total_tasks > 0:
             escalation_rate = len(escalated_tasks) / total_tasks
@@ -582,10 +468,7 @@ class LearnService:
 
         return patterns
 
-    def _extract_lessons_learned(
-        self,
-        entries: list[dict[str, str | int | float | list[str] | dict[str, str | int | float]]],
-    ) -> list[Pattern]:
+    def _extract_lessons_learned(self, columns: LedgerColumns) -> list[Pattern]:
         """
         Extract explicit lessons learned from task outcomes.
 
@@ -593,37 +476,19 @@ class LearnService:
         """
         patterns: list[Pattern] = []
 
-        # Collect all lessons
-        lessons: dict[str, list[str]] = {}  # lesson -> task IDs
-
-        for entry in entries:
-            task_id = entry.get("id", "unknown")
-            if not isinstance(task_id, str):
-                task_id = "unknown"
-
-            entry_lessons = entry.get("lessons_learned", [])
-            if isinstance(entry_lessons, list):
-                for lesson in entry_lessons:
-                    if isinstance(lesson, str) and lesson.strip():
-                        # Normalize lesson text for grouping
-                        normalized = lesson.strip().lower()
-                        if normalized not in lessons:
-                            lessons[normalized] = []
-                        lessons[normalized].append(task_id)
+        # Normalized lesson -> (first original wording, task IDs)
+        lessons: dict[str, tuple[str, list[str]]] = {}
+        for row, lesson in zip(columns.lessons.rows, columns.lessons.values, strict=True):
+            text = lesson.strip()
+            if not text:
+                continue
+            # Normalize lesson text for grouping
+            _, task_ids = lessons.setdefault(text.lower(), (text, []))
+            task_ids.append(columns.ids[row])
 
         # Create patterns for recurring lessons
-        for lesson_text, task_ids in lessons.items():
+        for original, task_ids in lessons.values():
             if len(task_ids) >= self.MIN_PATTERN_FREQUENCY:
-                # Get original casing from first occurrence
-                original = lesson_text
-                for entry in entries:
-                    entry_lessons = entry.get("lessons_learned", [])
-                    if isinstance(entry_lessons, list):
-                        for les in entry_lessons:
-                            if isinstance(les, str) and les.strip().lower() == lesson_text:
-                                original = les.strip()
-                                break
-
                 patterns.append(
                     Pattern(
                         category=PatternCategory.LESSON_LEARNED,
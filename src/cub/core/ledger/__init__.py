@@ -33,6 +33,8 @@ Example:
     57000
 """
 
+from cub.core.ledger.analytics import LedgerAnalytics, LedgerColumns
+from cub.core.ledger.artifact_store import ArtifactStore
 from cub.core.ledger.artifacts import ArtifactManager
 from cub.core.ledger.extractor import InsightExtraction, extract_insights
 from cub.core.ledger.harness_log import (
@@ -55,6 +57,7 @@ from cub.core.ledger.models import (
     Lineage,
     Outcome,
     PlanEntry,
+    ResourceTelemetry,
     RunEntry,
     StateTransition,
     TaskChanged,
@@ -79,6 +82,7 @@ __all__ = [
     "EpicSummary",
     "LedgerStats",
     "PlanEntry",
+    "ResourceTelemetry",
     "RunEntry",
     # CI monitoring models
     "CICheckRecord",
@@ -103,6 +107,7 @@ __all__ = [
     "LedgerWriter",
     # Artifacts
     "ArtifactManager",
+    "ArtifactStore",
     # Harness log
     "HarnessLogEvent",
     "HarnessLogWriter",
@@ -114,4 +119,7 @@ __all__ = [
     # Extraction
     "InsightExtraction",
     "extract_insights",
+    # Analytics
+    "LedgerAnalytics",
+    "LedgerColumns",
 ]
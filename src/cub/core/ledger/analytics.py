@@ -0,0 +1,440 @@
+"""
+Columnar analytics over ledger task entries.
+
+Learn and retro need a handful of numeric and categorical fields from
+every task entry, not the full entries. Parsing each by-task/*.json file
+on every run makes both commands scale with the size of the ledger's
+history, so this module materialises those fields once into columns:
+typed arrays (stdlib ``array``) for numbers and flags, plain lists for
+strings, and flattened (row, value) pairs for per-task lists such as
+failed attempts and lessons learned.
+
+The columns are cached under .cub/cache/ledger/ together with each task
+file's size and mtime. Loading re-parses only the task files that were
+added or changed since the cache was written and drops removed ones, so
+after the first run the cost is one small JSON read plus a directory
+scan.
+
+Example:
+    >>> columns = LedgerAnalytics(Path(".cub/ledger")).load()
+    >>> recent = columns.take(columns.since(cutoff))
+    >>> mean, stdev = column_stats(recent.cost_usd)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import statistics
+import tempfile
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when the column layout or extraction rules change
+ANALYTICS_CACHE_VERSION = 1
+
+# Numeric columns and their array typecodes
+NUMERIC_COLUMNS: dict[str, str] = {
+    "completed_at": "d",  # POSIX timestamp (UTC); NaN if missing or unparseable
+    "cost_usd": "d",
+    "duration_seconds": "q",
+    "success": "b",  # outcome.success
+    "escalated": "b",  # outcome.escalated
+    "outcome_cost_usd": "d",  # outcome.total_cost_usd
+    "outcome_attempts": "q",  # outcome.total_attempts
+    "commit_count": "q",
+    "file_size": "q",
+    "file_mtime_ns": "q",
+}
+
+# Per-task lists stored as flattened (row, value) pairs
+LIST_COLUMNS = ("failures", "lessons", "decisions")
+
+
+def _parse_timestamp(value: object) -> float:
+    """Convert an ISO timestamp to POSIX seconds, treating naive times as UTC."""
+    if not isinstance(value, str) or not value:
+        return math.nan
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return math.nan
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _number(value: object, default: float = 0) -> float:
+    # bool is an int subclass but never a meaningful amount here
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return default
+
+
+def _strings(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [v for v in value if isinstance(v, str)]
+
+
+@dataclass
+class FlatList:
+    """A per-task list column stored as parallel row and value lists."""
+
+    rows: array[int] = field(default_factory=lambda: array("q"))
+    values: list[str] = field(default_factory=list)
+
+    def append(self, row: int, value: str) -> None:
+        """Add a value for a row."""
+        self.rows.append(row)
+        self.values.append(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class LedgerColumns:
+    """
+    Columnar view of ledger task entries.
+
+    Row ``i`` of every column describes the same task. Flattened list
+    columns refer to rows by index.
+    """
+
+    files: list[str] = field(default_factory=list)
+    ids: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)  # task snapshot title
+    completed_at: array[float] = field(default_factory=lambda: array("d"))
+    cost_usd: array[float] = field(default_factory=lambda: array("d"))
+    duration_seconds: array[int] = field(default_factory=lambda: array("q"))
+    success: array[int] = field(default_factory=lambda: array("b"))
+    escalated: array[int] = field(default_factory=lambda: array("b"))
+    outcome_cost_usd: array[float] = field(default_factory=lambda: array("d"))
+    outcome_attempts: array[int] = field(default_factory=lambda: array("q"))
+    commit_count: array[int] = field(default_factory=lambda: array("q"))
+    file_size: array[int] = field(default_factory=lambda: array("q"))
+    file_mtime_ns: array[int] = field(default_factory=lambda: array("q"))
+    failures: FlatList = field(default_factory=FlatList)  # failed attempt error categories
+    lessons: FlatList = field(default_factory=FlatList)
+    decisions: FlatList = field(default_factory=FlatList)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows_by_id(self) -> dict[str, int]:
+        """Map task IDs to rows."""
+        return {task_id: row for row, task_id in enumerate(self.ids)}
+
+    def append_entry(
+        self, file_name: str, signature: tuple[int, int], entry: dict[str, Any]
+    ) -> None:
+        """
+        Add a row from a raw ledger entry (as stored in by-task/*.json).
+
+        Args:
+            file_name: Task file name, relative to by-task/
+            signature: (size, mtime_ns) of the file when it was read
+            entry: Parsed JSON of the entry
+        """
+        row = len(self.ids)
+        outcome = entry.get("outcome")
+        if not isinstance(outcome, dict):
+            outcome = {}
+        task = entry.get("task")
+        title = task.get("title") if isinstance(task, dict) else None
+        task_id = entry.get("id")
+        commits = entry.get("commits")
+        duration = entry.get("duration_seconds")
+
+        self.files.append(file_name)
+        self.ids.append(task_id if isinstance(task_id, str) else "unknown")
+        self.titles.append(title if isinstance(title, str) else "Untitled")
+        self.completed_at.append(_parse_timestamp(entry.get("completed_at")))
+        self.cost_usd.append(float(_number(entry.get("cost_usd"))))
+        # Only whole seconds count as a recorded duration
+        self.duration_seconds.append(
+            duration if isinstance(duration, int) and not isinstance(duration, bool) else 0
+        )
+        self.success.append(1 if outcome.get("success") else 0)
+        self.escalated.append(1 if outcome.get("escalated") else 0)
+        self.outcome_cost_usd.append(float(_number(outcome.get("total_cost_usd"))))
+        self.outcome_attempts.append(int(_number(outcome.get("total_attempts"), 1)))
+        self.commit_count.append(len(commits) if isinstance(commits, list) else 0)
+        self.file_size.append(signature[0])
+        self.file_mtime_ns.append(signature[1])
+
+        attempts = entry.get("attempts")
+        for attempt in attempts if isinstance(attempts, list) else []:
+            if isinstance(attempt, dict) and not attempt.get("success", True):
+                category = attempt.get("error_category", "unknown")
+                if isinstance(category, str):
+                    self.failures.append(row, category)
+        for lesson in _strings(entry.get("lessons_learned")):
+            self.lessons.append(row, lesson)
+        for decision in _strings(entry.get("decisions")):
+            self.decisions.append(row, decision)
+
+    def take(self, rows: Sequence[int]) -> LedgerColumns:
+        """
+        Select rows, in the given order.
+
+        Returns:
+            New LedgerColumns holding only those rows, renumbered from 0
+        """
+        result = LedgerColumns()
+        result.files = [self.files[i] for i in rows]
+        result.ids = [self.ids[i] for i in rows]
+        result.titles = [self.titles[i] for i in rows]
+        for name, typecode in NUMERIC_COLUMNS.items():
+            source: array[Any] = getattr(self, name)
+            setattr(result, name, array(typecode, [source[i] for i in rows]))
+        for name in LIST_COLUMNS:
+            source_list: FlatList = getattr(self, name)
+            by_row: dict[int, list[str]] = {}
+            for row, value in zip(source_list.rows, source_list.values, strict=True):
+                by_row.setdefault(row, []).append(value)
+            target: FlatList = getattr(result, name)
+            for new_row, old_row in enumerate(rows):
+                for value in by_row.get(old_row, []):
+                    target.append(new_row, value)
+        return result
+
+    def since(self, cutoff: datetime) -> list[int]:
+        """
+        Rows completed at or after a cutoff, plus rows with no usable date.
+
+        Args:
+            cutoff: Earliest completion time; naive times are taken as UTC
+        """
+        if cutoff.tzinfo is None:
+            cutoff = cutoff.replace(tzinfo=timezone.utc)
+        threshold = cutoff.timestamp()
+        return [i for i, ts in enumerate(self.completed_at) if math.isnan(ts) or ts >= threshold]
+
+    def time_range_days(self) -> int:
+        """Days between the earliest and latest completion, inclusive."""
+        stamps = [ts for ts in self.completed_at if not math.isnan(ts)]
+        if not stamps:
+            return 0
+        return int((max(stamps) - min(stamps)) // 86400) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise for the cache file."""
+        data: dict[str, Any] = {
+            "files": self.files,
+            "ids": self.ids,
+            "titles": self.titles,
+        }
+        for name in NUMERIC_COLUMNS:
+            data[name] = getattr(self, name).tolist()
+        for name in LIST_COLUMNS:
+            flat: FlatList = getattr(self, name)
+            data[name] = {"rows": flat.rows.tolist(), "values": flat.values}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LedgerColumns:
+        """
+        Load from the cache file format.
+
+        Raises:
+            ValueError: If columns are missing, mistyped or misaligned
+        """
+        try:
+            columns = cls(
+                files=list(data["files"]),
+                ids=list(data["ids"]),
+                titles=list(data["titles"]),
+            )
+            for name, typecode in NUMERIC_COLUMNS.items():
+                setattr(columns, name, array(typecode, data[name]))
+            for name in LIST_COLUMNS:
+                flat = data[name]
+                setattr(columns, name, FlatList(array("q", flat["rows"]), list(flat["values"])))
+        except (KeyError, TypeError, OverflowError) as e:
+            raise ValueError(f"Invalid ledger analytics cache: {e}") from e
+        size = len(columns.ids)
+        lengths = [len(columns.files), len(columns.titles)]
+        lengths += [len(getattr(columns, name)) for name in NUMERIC_COLUMNS]
+        if any(n != size for n in lengths):
+            raise ValueError("Invalid ledger analytics cache: misaligned columns")
+        for name in LIST_COLUMNS:
+            flat_list: FlatList = getattr(columns, name)
+            if len(flat_list.rows) != len(flat_list.values) or any(
+                not 0 <= r < size for r in flat_list.rows
+            ):
+                raise ValueError(f"Invalid ledger analytics cache: bad {name} rows")
+        return columns
+
+
+def column_stats(values: Iterable[float]) -> tuple[float, float] | None:
+    """
+    Mean and sample standard deviation of a column.
+
+    Returns:
+        (mean, stdev), or None with fewer than two values
+    """
+    data = list(values)
+    if len(data) < 2:
+        return None
+    mean = statistics.fmean(data)
+    return mean, statistics.stdev(data, mean)
+
+
+def outlier_rows(
+    values: Sequence[float], rows: Sequence[int], stddevs: float
+) -> tuple[list[int], float, float] | None:
+    """
+    Find rows whose value is more than ``stddevs`` above the mean.
+
+    Statistics are taken over the given rows only.
+
+    Args:
+        values: Column to test
+        rows: Rows to consider
+        stddevs: Standard deviations above the mean that count as an outlier
+
+    Returns:
+        (outlier rows, mean, threshold), or None if the rows don't vary
+        or there are fewer than two of them
+    """
+    selected = array("d", [values[i] for i in rows])
+    stats = column_stats(selected)
+    if stats is None or stats[1] == 0:
+        return None
+    mean, stdev = stats
+    threshold = mean + stddevs * stdev
+    return (
+        [row for row, value in zip(rows, selected, strict=True) if value > threshold],
+        mean,
+        threshold,
+    )
+
+
+class LedgerAnalytics:
+    """
+    Loads ledger task entries as cached, incrementally refreshed columns.
+
+    Example:
+        >>> analytics = LedgerAnalytics(project_dir / ".cub" / "ledger")
+        >>> columns = analytics.load()
+        >>> len(columns)
+        1523
+    """
+
+    def __init__(self, ledger_dir: Path, cache_file: Path | None = None) -> None:
+        """
+        Initialize analytics for a ledger.
+
+        Args:
+            ledger_dir: Path to .cub/ledger
+            cache_file: Where to keep the columns (defaults to
+                .cub/cache/ledger/columns.json next to the ledger)
+        """
+        self.ledger_dir = ledger_dir
+        self.by_task_dir = ledger_dir / "by-task"
+        self.cache_file = cache_file or ledger_dir.parent / "cache" / "ledger" / "columns.json"
+
+    def load(self) -> LedgerColumns:
+        """
+        Load columns for every task entry, refreshing the cache as needed.
+
+        Returns:
+            Columns with one row per readable task file, ordered by file name
+        """
+        current = self._scan()
+        cached = self._read_cache()
+
+        keep: list[int] = []
+        known: set[str] = set()
+        for row, name in enumerate(cached.files):
+            signature = current.get(name)
+            if signature == (cached.file_size[row], cached.file_mtime_ns[row]):
+                keep.append(row)
+                known.add(name)
+
+        changed = sorted(name for name in current if name not in known)
+        if not changed and len(keep) == len(cached):
+            return cached
+
+        columns = cached.take(keep)
+        for name in changed:
+            entry = self._read_entry(name)
+            if entry is not None:
+                columns.append_entry(name, current[name], entry)
+        order = sorted(range(len(columns)), key=columns.files.__getitem__)
+        columns = columns.take(order)
+        self._write_cache(columns)
+        logger.debug(
+            "Ledger analytics: %d cached, %d parsed, %d removed",
+            len(keep),
+            len(changed),
+            len(cached) - len(keep),
+        )
+        return columns
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """Signature (size, mtime_ns) of each task file."""
+        signatures: dict[str, tuple[int, int]] = {}
+        try:
+            with os.scandir(self.by_task_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        st = entry.stat()
+                        signatures[entry.name] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            pass
+        return signatures
+
+    def _read_entry(self, name: str) -> dict[str, Any] | None:
+        path = self.by_task_dir / name
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load {path}: {e}")
+            return None
+        if not isinstance(data, dict):
+            logger.warning(f"Failed to load {path}: not a ledger entry")
+            return None
+        return data
+
+    def _read_cache(self) -> LedgerColumns:
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return LedgerColumns()
+        except (OSError, ValueError):
+            logger.debug("Discarding unreadable ledger analytics cache", exc_info=True)
+            return LedgerColumns()
+        if not isinstance(data, dict) or data.get("version") != ANALYTICS_CACHE_VERSION:
+            return LedgerColumns()
+        try:
+            return LedgerColumns.from_dict(data.get("columns") or {})
+        except ValueError:
+            logger.debug("Discarding invalid ledger analytics cache", exc_info=True)
+            return LedgerColumns()
+
+    def _write_cache(self, columns: LedgerColumns) -> None:
+        """Write the columns atomically. Failures are logged and ignored."""
+        data = {"version": ANALYTICS_CACHE_VERSION, "columns": columns.to_dict()}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.cache_file)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("Failed to write ledger analytics cache", exc_info=True)
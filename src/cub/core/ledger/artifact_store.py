@@ -0,0 +1,294 @@
+"""
+Content-addressed storage for ledger artifacts.
+
+Every attempt writes a prompt file and a harness log. The system prompt is
+nearly identical from one attempt to the next, and the harness log for an
+attempt is written both under by-run/ and by-task/. ArtifactStore keeps each
+distinct piece of content once, gzip-compressed, at
+
+    .cub/ledger/objects/{sha256[:2]}/{sha256[2:]}.gz
+
+and writes a small JSON manifest ({name}.ref) where the plain file would
+have been. A manifest lists the objects whose concatenation is the
+artifact. Prompts are split at their "System Prompt" / "Task Prompt"
+headings, so every attempt that used the same system prompt shares one
+object for it.
+
+Readers go through ArtifactStore.read(), which takes the artifact's plain
+path and reads whichever form exists (a plain file wins), so ledgers
+written before the store existed, or with it disabled, keep working.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+REF_SUFFIX = ".ref"
+
+# Headings that separate the system prompt from the task prompt, in both
+# the ledger (# ...) and run (## ...) prompt layouts
+_PROMPT_SECTION = re.compile(r"^(#{1,2} (?:System|Task) Prompt\n\n)", re.MULTILINE)
+
+# Plain artifact files written per attempt, by directory layout
+_TASK_ARTIFACT = re.compile(r"^\d{3}-(?:prompt\.md|harness\.jsonl|patch\.diff)$")
+_RUN_ARTIFACTS = ("prompt.md", "harness.log")
+
+
+def ref_path(path: Path) -> Path:
+    """Manifest path for an artifact's plain path."""
+    return path.with_name(path.name + REF_SUFFIX)
+
+
+def split_prompt(text: str) -> list[str]:
+    """
+    Split a rendered prompt into separately stored parts.
+
+    The section headings become parts of their own, so the system prompt
+    body is stored identically whichever layout it was written in.
+
+    Args:
+        text: Prompt file content
+
+    Returns:
+        Parts whose concatenation is ``text``
+    """
+    return [part for part in _PROMPT_SECTION.split(text) if part]
+
+
+@dataclass
+class CompactResult:
+    """Outcome of moving plain artifact files into the store."""
+
+    files: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+class ArtifactStore:
+    """
+    Deduplicating, compressed store for prompt files and harness logs.
+
+    Example:
+        >>> store = ArtifactStore(Path(".cub/ledger"))
+        >>> store.write(task_dir / "001-prompt.md", split_prompt(prompt))
+        >>> store.read(task_dir / "001-prompt.md")
+        '---\\nattempt: 1\\n...'
+    """
+
+    def __init__(self, ledger_dir: Path) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            ledger_dir: Path to .cub/ledger directory
+        """
+        self.ledger_dir = ledger_dir
+        self.objects_dir = ledger_dir / "objects"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest[2:]}.gz"
+
+    def put(self, data: bytes) -> str:
+        """
+        Store a blob, unless an identical one is already stored.
+
+        Args:
+            data: Content to store
+
+        Returns:
+            SHA-256 hex digest identifying the blob
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest
+        # mtime=0 keeps the compressed bytes reproducible
+        _write_atomic(path, gzip.compress(data, mtime=0))
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        Read a stored blob.
+
+        Raises:
+            FileNotFoundError: If no blob has this digest
+            ValueError: If the stored blob is corrupt
+        """
+        try:
+            data = gzip.decompress(self._object_path(digest).read_bytes())
+        except (EOFError, gzip.BadGzipFile) as e:
+            raise ValueError(f"Corrupt artifact object {digest}: {e}") from e
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt artifact object {digest}: checksum mismatch")
+        return data
+
+    def write(self, path: Path, content: str | Sequence[str]) -> Path:
+        """
+        Store an artifact in place of a plain file.
+
+        Args:
+            path: Plain path the artifact would otherwise be written to
+            content: Artifact text, or parts to store separately (see
+                split_prompt)
+
+        Returns:
+            Path to the manifest
+        """
+        parts = [content] if isinstance(content, str) else list(content)
+        blobs = [part.encode("utf-8") for part in parts if part]
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "size": sum(len(blob) for blob in blobs),
+            "parts": [self.put(blob) for blob in blobs],
+        }
+        manifest_path = ref_path(path)
+        _write_atomic(manifest_path, (json.dumps(manifest) + "\n").encode("utf-8"))
+        path.unlink(missing_ok=True)
+        return manifest_path
+
+    def _manifest(self, path: Path) -> dict[str, object]:
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError as e:
+            raise ValueError(f"Invalid artifact manifest {path}: {e}") from e
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported artifact manifest {path}")
+        return manifest
+
+    def read_bytes(self, path: Path) -> bytes:
+        """
+        Read an artifact, stored or plain.
+
+        Args:
+            path: The artifact's plain path (or its manifest path)
+
+        Raises:
+            FileNotFoundError: If the artifact doesn't exist in either form
+            ValueError: If the manifest or an object is corrupt
+        """
+        if path.name.endswith(REF_SUFFIX):
+            manifest_path = path
+        else:
+            # write() removes the plain file, so one that exists is newer
+            # than any manifest next to it
+            manifest_path = ref_path(path)
+            if path.exists() or not manifest_path.exists():
+                return path.read_bytes()
+        parts = self._manifest(manifest_path).get("parts")
+        if not isinstance(parts, list):
+            raise ValueError(f"Invalid artifact manifest {manifest_path}")
+        return b"".join(self.get(str(digest)) for digest in parts)
+
+    def read(self, path: Path) -> str:
+        """Read an artifact as text (see read_bytes)."""
+        return self.read_bytes(path).decode("utf-8")
+
+    def exists(self, path: Path) -> bool:
+        """Whether an artifact exists at a plain path, in either form."""
+        return path.exists() or ref_path(path).exists()
+
+    def size(self, path: Path) -> int:
+        """
+        Uncompressed size of an artifact, in bytes.
+
+        Raises:
+            FileNotFoundError: If the artifact doesn't exist in either form
+        """
+        manifest_path = ref_path(path)
+        if not path.exists() and manifest_path.exists():
+            size = self._manifest(manifest_path).get("size")
+            if isinstance(size, int):
+                return size
+        return path.stat().st_size
+
+    def absorb(self, path: Path) -> Path | None:
+        """
+        Move a plain artifact file into the store.
+
+        Prompt files are split into parts so their system prompts dedupe.
+
+        Returns:
+            Manifest path, or None if there was no plain file
+        """
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        if path.name.endswith("prompt.md"):
+            return self.write(path, split_prompt(text))
+        return self.write(path, text)
+
+    def plain_artifacts(self) -> Iterator[Path]:
+        """Plain attempt artifact files under by-task/ and by-run/."""
+        by_task = self.ledger_dir / "by-task"
+        if by_task.is_dir():
+            for task_dir in sorted(by_task.iterdir()):
+                if not task_dir.is_dir():
+                    continue
+                for path in sorted(task_dir.iterdir()):
+                    if path.is_file() and _TASK_ARTIFACT.match(path.name):
+                        yield path
+        by_run = self.ledger_dir / "by-run"
+        if by_run.is_dir():
+            for task_dir in sorted(by_run.glob("*/tasks/*")):
+                for name in _RUN_ARTIFACTS:
+                    path = task_dir / name
+                    if path.is_file():
+                        yield path
+
+    def compact(self, *, dry_run: bool = False) -> CompactResult:
+        """
+        Move every plain artifact file in the ledger into the store.
+
+        This is the migration for ledgers written before the store was
+        enabled. It is safe to run repeatedly.
+
+        Args:
+            dry_run: Only count the files that would be moved
+
+        Returns:
+            Files moved, with their plain size and the size of the objects
+            and manifests added for them
+        """
+        result = CompactResult()
+        objects_before = _tree_size(self.objects_dir)
+        for path in list(self.plain_artifacts()):
+            result.files += 1
+            result.bytes_before += path.stat().st_size
+            if dry_run:
+                continue
+            manifest_path = self.absorb(path)
+            if manifest_path is not None:
+                result.bytes_after += manifest_path.stat().st_size
+        if not dry_run:
+            result.bytes_after += _tree_size(self.objects_dir) - objects_before
+        return result
+
+
+def _tree_size(directory: Path) -> int:
+    if not directory.is_dir():
+        return 0
+    return sum(p.stat().st_size for p in directory.rglob("*") if p.is_file())
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
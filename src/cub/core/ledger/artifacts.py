@@ -4,10 +4,15 @@ Artifact path management for cub ledger.
 Manages artifact storage with flattened numbering at the task level.
 Replaces the old attempts/ subdirectory structure with direct task-level
 artifact files: {task_id}/{attempt:03d}-{type}.{ext}
+
+Artifacts may be stored plain or in the ledger's ArtifactStore (as
+{attempt:03d}-{type}.{ext}.ref); lookups and reads accept either.
 """
 
 from pathlib import Path
 
+from cub.core.ledger.artifact_store import ArtifactStore
+
 
 class ArtifactManager:
     """Manages artifact paths and auto-numbering for task attempts.
@@ -50,6 +55,7 @@ class ArtifactManager:
         """
         self.ledger_dir = ledger_dir
         self.by_task_dir = ledger_dir / "by-task"
+        self.store = ArtifactStore(ledger_dir)
 
     def get_artifact_path(
         self,
@@ -186,7 +192,9 @@ class ArtifactManager:
         """Get all artifact paths for a specific attempt.
 
         Returns a dictionary mapping artifact type to path for all artifacts
-        that exist for the given attempt.
+        that exist for the given attempt. Paths are the plain artifact paths
+        even when the artifact is held in the artifact store; read them with
+        read_artifact().
 
         Args:
             task_id: Task ID to check
@@ -206,11 +214,41 @@ class ArtifactManager:
 
         for artifact_type in self.ARTIFACT_EXTENSIONS:
             path = self.get_artifact_path(task_id, attempt_number, artifact_type)
-            if path.exists():
+            if self.store.exists(path):
                 artifacts[artifact_type] = path
 
         return artifacts
 
+    def read_artifact(
+        self,
+        task_id: str,
+        attempt_number: int,
+        artifact_type: str
+    ) -> str | None:
+        """Read an artifact's content, whether stored plain or compressed.
+
+        Args:
+            task_id: Task ID
+            attempt_number: Attempt number
+            artifact_type: Type of artifact ('prompt', 'harness', or 'patch')
+
+        Returns:
+            Artifact text, or None if the attempt has no such artifact
+
+        Raises:
+            ValueError: If artifact_type is not recognized, or the stored
+                artifact is corrupt
+
+        Example:
+            >>> manager = ArtifactManager(Path(".cub/ledger"))
+            >>> prompt = manager.read_artifact("cub-048a-0.1", 1, "prompt")
+        """
+        path = self.get_artifact_path(task_id, attempt_number, artifact_type)
+        try:
+            return self.store.read(path)
+        except FileNotFoundError:
+            return None
+
     def ensure_task_dir(self, task_id: str) -> Path:
         """Ensure task directory exists and return its path.
 
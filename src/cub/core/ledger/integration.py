@@ -45,6 +45,7 @@ from cub.core.ledger.models import (
     LedgerEntry,
     Lineage,
     Outcome,
+    ResourceTelemetry,
     StateTransition,
     TaskChanged,
     TaskSnapshot,
@@ -53,6 +54,7 @@ from cub.core.ledger.models import (
     WorkflowState,
 )
 from cub.core.ledger.writer import LedgerWriter
+from cub.core.profiling import profiled
 
 if TYPE_CHECKING:
     from cub.core.tasks.backend import TaskBackend
@@ -86,6 +88,7 @@ class LedgerIntegration:
         self._active_entries: dict[str, LedgerEntry] = {}
         self._task_snapshots: dict[str, TaskSnapshot] = {}
 
+    @profiled("ledger.task_start", "ledger")
     def on_task_start(
         self,
         task: Task,
@@ -178,6 +181,7 @@ class LedgerIntegration:
 
         return entry
 
+    @profiled("ledger.attempt_start", "ledger")
     def on_attempt_start(
         self,
         task_id: str,
@@ -223,6 +227,7 @@ class LedgerIntegration:
 
         return prompt_path
 
+    @profiled("ledger.attempt_end", "ledger")
     def on_attempt_end(
         self,
         task_id: str,
@@ -239,6 +244,8 @@ class LedgerIntegration:
         error_category: str | None = None,
         error_summary: str | None = None,
         started_at: datetime | None = None,
+        prompt_prefix_hash: str | None = None,
+        resources: ResourceTelemetry | None = None,
     ) -> Attempt:
         """Handle attempt end event - writes log and records attempt.
 
@@ -259,6 +266,8 @@ class LedgerIntegration:
             error_category: Category of error if failed
             error_summary: Brief error description if failed
             started_at: When the attempt started (for duration calculation)
+            prompt_prefix_hash: Hash of the prompt prefix the harness was sent
+            resources: CPU, memory and I/O sampled during the attempt
 
         Returns:
             The Attempt record that was created
@@ -286,6 +295,8 @@ class LedgerIntegration:
             tokens=tokens or TokenUsage(),
             cost_usd=cost_usd,
             duration_seconds=duration_seconds,
+            prompt_prefix_hash=prompt_prefix_hash,
+            resources=resources,
         )
 
         # Update active entry if we have one
@@ -319,6 +330,7 @@ class LedgerIntegration:
 
         return attempt
 
+    @profiled("ledger.task_close", "ledger")
     def on_task_close(
         self,
         task_id: str,
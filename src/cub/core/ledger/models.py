@@ -7,6 +7,7 @@ and outcomes. These models support the knowledge retention system described
 in specs/researching/knowledge-retention-system.md.
 """
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Literal
@@ -159,6 +160,40 @@ class TaskChanged(BaseModel):
     notes: str | None = Field(default=None, description="Additional notes about the change")
 
 
+class ResourceTelemetry(BaseModel):
+    """Resource use sampled while an attempt or sandbox ran.
+
+    Totals cover the whole sampled process tree (or container). The
+    samples are a downsampled time series of (elapsed seconds, cumulative
+    CPU-seconds, RSS bytes), kept small enough to store per attempt.
+    """
+
+    source: Literal["proc", "docker"] = Field(
+        ..., description="Where samples came from: /proc or docker stats"
+    )
+    duration_seconds: float = Field(default=0.0, ge=0.0, description="Time sampled")
+    peak_rss_bytes: int = Field(default=0, ge=0, description="Highest resident memory seen")
+    cpu_seconds: float = Field(default=0.0, ge=0.0, description="CPU time used (user + system)")
+    read_bytes: int = Field(default=0, ge=0, description="Bytes read from storage")
+    write_bytes: int = Field(default=0, ge=0, description="Bytes written to storage")
+    samples: list[tuple[float, float, int]] = Field(
+        default_factory=list,
+        description="Time series of (elapsed seconds, CPU-seconds, RSS bytes)",
+    )
+
+    @property
+    def peak_rss_mb(self) -> float:
+        """Get peak resident memory in MiB."""
+        return self.peak_rss_bytes / (1024 * 1024)
+
+    @property
+    def average_cpus(self) -> float:
+        """Get average CPU cores used over the sampled time."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.cpu_seconds / self.duration_seconds
+
+
 class Attempt(BaseModel):
     """Record of a single execution attempt on a task.
 
@@ -185,6 +220,13 @@ class Attempt(BaseModel):
     )
     cost_usd: float = Field(default=0.0, ge=0.0, description="Cost for this attempt in USD")
     duration_seconds: int = Field(default=0, ge=0, description="Attempt duration in seconds")
+    prompt_prefix_hash: str | None = Field(
+        default=None,
+        description="Hash of the cacheable prompt prefix (see prompt_builder.hash_prompt_prefix)",
+    )
+    resources: ResourceTelemetry | None = Field(
+        default=None, description="CPU, memory and I/O sampled during the attempt"
+    )
 
     @property
     def duration_minutes(self) -> float:
@@ -771,6 +813,9 @@ class EpicAggregates(BaseModel):
     # Token metrics
     total_tokens: int = Field(default=0, ge=0, description="Total tokens consumed")
     avg_tokens_per_task: int = Field(default=0, ge=0, description="Average tokens per task")
+    total_cache_read_tokens: int = Field(
+        default=0, ge=0, description="Input tokens served from the prompt cache"
+    )
 
     # Duration metrics
     total_duration_seconds: int = Field(
@@ -973,11 +1018,110 @@ class LedgerStats(BaseModel):
         return self.average_duration_seconds / 60.0
 
 
-def compute_aggregates(task_entries: list[LedgerEntry]) -> EpicAggregates:
+class RunCacheStats(BaseModel):
+    """Prompt cache usage for one run session.
+
+    Summed over the attempts recorded with the run's ID. Prompt tokens are
+    every input token the provider saw: uncached input, cache reads and
+    cache writes.
+    """
+
+    run_id: str = Field(..., description="Run session ID")
+    attempts: int = Field(default=0, ge=0, description="Attempts recorded in the run")
+    input_tokens: int = Field(default=0, ge=0, description="Uncached input tokens")
+    cache_read_tokens: int = Field(default=0, ge=0, description="Input tokens read from cache")
+    cache_creation_tokens: int = Field(
+        default=0, ge=0, description="Input tokens written to cache"
+    )
+    prompt_prefixes: list[str] = Field(
+        default_factory=list,
+        description="Distinct prompt prefix hashes seen in the run, in first-seen order",
+    )
+    started_at: datetime | None = Field(
+        default=None, description="Start of the run's first attempt"
+    )
+
+    @property
+    def prompt_tokens(self) -> int:
+        """All input tokens, cached or not."""
+        return self.input_tokens + self.cache_read_tokens + self.cache_creation_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from cache (0.0-1.0)."""
+        if self.prompt_tokens == 0:
+            return 0.0
+        return self.cache_read_tokens / self.prompt_tokens
+
+
+class TaskContribution(BaseModel):
+    """What one task ledger entry contributes to its epic's aggregates.
+
+    Stored per task in the epic membership index so an epic can be
+    re-aggregated after one task changes without re-reading every other
+    task's ledger entry.
+    """
+
+    task_id: str = Field(..., description="Task ID")
+    success: bool = Field(default=False, description="Whether the task succeeded")
+    escalated: bool = Field(default=False, description="Whether the task escalated")
+    cost_usd: float = Field(default=0.0, ge=0.0, description="Task cost in USD")
+    attempts: int = Field(default=0, ge=0, description="Number of attempts")
+    total_tokens: int = Field(default=0, ge=0, description="Tokens consumed")
+    cache_read_tokens: int = Field(default=0, ge=0, description="Tokens read from prompt cache")
+    duration_seconds: int = Field(default=0, ge=0, description="Task duration in seconds")
+    model: str = Field(default="", description="Final model used (empty if unknown)")
+    stage: str = Field(default="dev_complete", description="Workflow stage")
+    started_at: datetime | None = Field(default=None, description="Task start time (UTC)")
+    completed_at: datetime = Field(..., description="Task completion time (UTC)")
+    commits: list[CommitRef] = Field(
+        default_factory=list, description="Commits recorded for the task"
+    )
+
+    @classmethod
+    def from_ledger_entry(cls, entry: LedgerEntry) -> "TaskContribution":
+        """Extract an entry's contribution to epic aggregates."""
+        outcome = entry.outcome
+        if outcome and outcome.final_model:
+            model = outcome.final_model
+        else:
+            model = entry.harness_model
+        if entry.workflow:
+            stage = entry.workflow.stage
+        elif entry.workflow_stage:
+            stage = entry.workflow_stage.value
+        else:
+            stage = "dev_complete"
+        return cls(
+            task_id=entry.id,
+            success=bool(outcome and outcome.success),
+            escalated=bool(outcome and outcome.escalated),
+            cost_usd=outcome.total_cost_usd if outcome else entry.cost_usd,
+            attempts=outcome.total_attempts if outcome else entry.iterations,
+            total_tokens=entry.tokens.total_tokens,
+            cache_read_tokens=entry.tokens.cache_read_tokens,
+            duration_seconds=(
+                outcome.total_duration_seconds if outcome else entry.duration_seconds
+            ),
+            model=model,
+            stage=stage,
+            started_at=entry.started_at,
+            completed_at=entry.completed_at,
+            commits=list(entry.commits),
+        )
+
+
+def compute_aggregates(
+    task_entries: Sequence[LedgerEntry | TaskContribution],
+) -> EpicAggregates:
     """Compute epic aggregates from child task ledger entries.
 
+    Accepts full ledger entries or their stored TaskContributions, so an
+    epic can be re-aggregated from its membership index after a single
+    task changes.
+
     Args:
-        task_entries: List of completed task ledger entries
+        task_entries: Completed task ledger entries or their contributions
 
     Returns:
         Computed aggregates for the epic
@@ -994,53 +1138,46 @@ def compute_aggregates(task_entries: list[LedgerEntry]) -> EpicAggregates:
     if not task_entries:
         return EpicAggregates()
 
-    total_tasks = len(task_entries)
-    tasks_completed = sum(1 for t in task_entries if t.outcome and t.outcome.success)
+    tasks = [
+        t if isinstance(t, TaskContribution) else TaskContribution.from_ledger_entry(t)
+        for t in task_entries
+    ]
+
+    total_tasks = len(tasks)
+    tasks_completed = sum(1 for t in tasks if t.success)
     tasks_failed = total_tasks - tasks_completed
 
     # Cost metrics
-    costs = [t.outcome.total_cost_usd if t.outcome else t.cost_usd for t in task_entries]
+    costs = [t.cost_usd for t in tasks]
     total_cost = sum(costs)
     avg_cost = total_cost / total_tasks if total_tasks > 0 else 0.0
     min_cost = min(costs) if costs else 0.0
     max_cost = max(costs) if costs else 0.0
 
     # Escalation metrics
-    escalations = sum(1 for t in task_entries if t.outcome and t.outcome.escalated)
+    escalations = sum(1 for t in tasks if t.escalated)
     escalation_rate = escalations / total_tasks if total_tasks > 0 else 0.0
 
     # Attempt metrics
-    total_attempts = sum(
-        t.outcome.total_attempts if t.outcome else t.iterations for t in task_entries
-    )
+    total_attempts = sum(t.attempts for t in tasks)
     avg_attempts = total_attempts / total_tasks if total_tasks > 0 else 0.0
 
     # Token metrics
-    total_tokens = sum(t.tokens.total_tokens for t in task_entries)
+    total_tokens = sum(t.total_tokens for t in tasks)
     avg_tokens = total_tokens // total_tasks if total_tasks > 0 else 0
+    total_cache_read = sum(t.cache_read_tokens for t in tasks)
 
     # Duration metrics
-    total_duration = sum(
-        t.outcome.total_duration_seconds if t.outcome else t.duration_seconds
-        for t in task_entries
-    )
+    total_duration = sum(t.duration_seconds for t in tasks)
     avg_duration = total_duration // total_tasks if total_tasks > 0 else 0
 
     # Model usage tracking
-    models_used_set: set[str] = set()
     model_counts: dict[str, int] = {}
+    for task in tasks:
+        if task.model:
+            model_counts[task.model] = model_counts.get(task.model, 0) + 1
 
-    for task in task_entries:
-        if task.outcome and task.outcome.final_model:
-            model = task.outcome.final_model
-            models_used_set.add(model)
-            model_counts[model] = model_counts.get(model, 0) + 1
-        elif task.harness_model:
-            model = task.harness_model
-            models_used_set.add(model)
-            model_counts[model] = model_counts.get(model, 0) + 1
-
-    models_used = sorted(list(models_used_set))
+    models_used = sorted(model_counts)
     most_common_model = max(model_counts.items(), key=lambda x: x[1])[0] if model_counts else ""
 
     return EpicAggregates(
@@ -1058,6 +1195,7 @@ def compute_aggregates(task_entries: list[LedgerEntry]) -> EpicAggregates:
         avg_attempts_per_task=avg_attempts,
         total_tokens=total_tokens,
         avg_tokens_per_task=avg_tokens,
+        total_cache_read_tokens=total_cache_read,
         total_duration_seconds=total_duration,
         avg_duration_seconds=avg_duration,
         models_used=models_used,
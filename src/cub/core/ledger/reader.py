@@ -17,6 +17,7 @@ from cub.core.ledger.models import (
     LedgerStats,
     PlanEntry,
     PlanFilters,
+    RunCacheStats,
     RunEntry,
     RunFilters,
     VerificationStatus,
@@ -298,6 +299,43 @@ class LedgerReader:
 
         return stats
 
+    def get_cache_stats(
+        self,
+        since: str | None = None,
+        epic: str | None = None,
+    ) -> list[RunCacheStats]:
+        """Summarize prompt cache usage per run from recorded attempts.
+
+        Args:
+            since: Only include tasks completed on or after this date (YYYY-MM-DD)
+            epic: Only include tasks in this epic
+
+        Returns:
+            RunCacheStats per run ID, oldest run first
+        """
+        runs: dict[str, RunCacheStats] = {}
+        for index_entry in self.list_tasks(since=since, epic=epic):
+            entry = self.get_task(index_entry.id)
+            if entry is None:
+                continue
+            for attempt in entry.attempts:
+                run = runs.get(attempt.run_id)
+                if run is None:
+                    run = runs[attempt.run_id] = RunCacheStats(run_id=attempt.run_id)
+                run.attempts += 1
+                run.input_tokens += attempt.tokens.input_tokens
+                run.cache_read_tokens += attempt.tokens.cache_read_tokens
+                run.cache_creation_tokens += attempt.tokens.cache_creation_tokens
+                prefix = attempt.prompt_prefix_hash
+                if prefix and prefix not in run.prompt_prefixes:
+                    run.prompt_prefixes.append(prefix)
+                # timestamp() so naive and aware start times compare
+                started = attempt.started_at.timestamp()
+                if run.started_at is None or started < run.started_at.timestamp():
+                    run.started_at = attempt.started_at
+
+        return sorted(runs.values(), key=lambda r: r.started_at.timestamp() if r.started_at else 0)
+
     def get_plan(self, plan_id: str) -> PlanEntry | None:
         """Get full plan entry for a plan.
 
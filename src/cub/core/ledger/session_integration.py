@@ -7,7 +7,8 @@ loop's LedgerIntegration which maintains state in memory, SessionLedgerIntegrati
 reconstructs state from forensics logs on each invocation.
 
 Key Differences from LedgerIntegration:
-- Stateless: Each method call reads forensics JSONL to rebuild session state
+- Stateless: Each method call rebuilds session state from the forensics JSONL,
+  resuming from a checkpoint so only events appended since the last call are read
 - Task association: Tasks may be claimed mid-session, not at start
 - Synthesis: Ledger entry is synthesized at session end from forensics log
 - Partial data: Session may end without task association (no ledger entry)
@@ -25,14 +26,20 @@ Example:
     ...     session_id="claude-20260128-123456",
     ...     forensics_path=Path(".cub/ledger/forensics/claude-20260128-123456.jsonl")
     ... )
+
+Checkpoint location:
+- .cub/ledger/forensics/{session_id}.state.json (next to the forensics log)
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from cub.core.ledger.models import (
     Attempt,
@@ -54,6 +61,20 @@ from cub.core.ledger.writer import LedgerWriter
 if TYPE_CHECKING:
     from cub.core.tasks.models import Task
 
+# Suffix of the reducer checkpoint written next to a forensics log
+CHECKPOINT_SUFFIX = ".state.json"
+CHECKPOINT_VERSION = 1
+
+# Leading bytes of the log hashed into the checkpoint, to detect a rewritten log
+_FINGERPRINT_BYTES = 4096
+
+_DATETIME_FIELDS = ("started_at", "ended_at", "task_claimed_at", "task_closed_at")
+
+
+def checkpoint_path(forensics_path: Path) -> Path:
+    """Return the reducer checkpoint path for a forensics log."""
+    return forensics_path.with_name(forensics_path.stem + CHECKPOINT_SUFFIX)
+
 
 class SessionState:
     """Reconstructed state from forensics log.
@@ -106,6 +127,25 @@ class SessionState:
             return 0
         return int((self.ended_at - self.started_at).total_seconds())
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize state to a JSON-compatible dict."""
+        data = dict(vars(self))
+        for name in _DATETIME_FIELDS:
+            value = data[name]
+            data[name] = value.isoformat() if value else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SessionState:
+        """Deserialize state written by to_dict()."""
+        state = cls()
+        for name, default in list(vars(state).items()):
+            value = data.get(name, default)
+            if name in _DATETIME_FIELDS and value is not None:
+                value = datetime.fromisoformat(value)
+            setattr(state, name, value)
+        return state
+
 
 class SessionLedgerIntegration:
     """Ledger integration for direct harness sessions.
@@ -114,9 +154,11 @@ class SessionLedgerIntegration:
     in a harness (Claude Code, etc.) rather than via `cub run`. It reconstructs
     session state from forensics logs and synthesizes ledger entries at session end.
 
-    The integration is stateless - each method call reads the forensics log from
-    scratch to rebuild the current state. This matches the hook execution model
-    where each hook invocation is a separate process.
+    The integration is stateless - each method call rebuilds the current state
+    from the forensics log. This matches the hook execution model where each hook
+    invocation is a separate process. To keep long sessions cheap, the reduced
+    state is checkpointed next to the log with the byte offset it covers, so each
+    call only processes the events appended since (see reduce_forensics).
 
     Attributes:
         writer: The underlying LedgerWriter for file operations
@@ -150,21 +192,127 @@ class SessionLedgerIntegration:
         if not forensics_path.exists():
             raise FileNotFoundError(f"Forensics file not found: {forensics_path}")
 
-        with forensics_path.open("r", encoding="utf-8") as f:
+        with forensics_path.open("rb") as f:
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+                self._apply_line(state, line)
 
-                try:
-                    event = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+        return state
 
-                self._process_event(state, event)
+    def reduce_forensics(self, forensics_path: Path) -> SessionState:
+        """Reconstruct session state, processing only events added since last time.
 
+        Resumes from the checkpoint next to the forensics log, applies the
+        complete lines appended after its offset, and writes a new checkpoint.
+        The result is the same as read_forensics(). A missing, unreadable or
+        stale checkpoint (the log was truncated or rewritten) falls back to
+        reading the whole log.
+
+        A trailing line without a newline may still be being written by a hook,
+        so it is applied to the returned state but not to the checkpoint.
+
+        Args:
+            forensics_path: Path to forensics JSONL file
+
+        Returns:
+            SessionState object with reconstructed state
+
+        Raises:
+            FileNotFoundError: If forensics file doesn't exist
+        """
+        if not forensics_path.exists():
+            raise FileNotFoundError(f"Forensics file not found: {forensics_path}")
+
+        with forensics_path.open("rb") as f:
+            state, offset = self._load_checkpoint(forensics_path, f)
+            f.seek(offset)
+            data = f.read()
+
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                self._apply_line(state, line)
+
+            if end:
+                offset += end
+                f.seek(0)
+                fingerprint = hashlib.sha256(f.read(min(offset, _FINGERPRINT_BYTES)))
+                self._save_checkpoint(forensics_path, state, offset, fingerprint.hexdigest())
+
+        # Incomplete last line: include it now, re-read it once it's finished
+        self._apply_line(state, data[end:])
         return state
 
+    def _load_checkpoint(self, forensics_path: Path, log: BinaryIO) -> tuple[SessionState, int]:
+        """Load the checkpointed state and the log offset it covers.
+
+        Returns:
+            (state, offset), or a fresh state and offset 0 if there is no
+            checkpoint that still matches the log
+        """
+        try:
+            checkpoint = json.loads(checkpoint_path(forensics_path).read_text(encoding="utf-8"))
+            if checkpoint.get("version") != CHECKPOINT_VERSION:
+                return SessionState(), 0
+            offset = int(checkpoint["offset"])
+            state = SessionState.from_dict(checkpoint["state"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return SessionState(), 0
+
+        # The checkpoint must end on a line boundary of this same log
+        if offset <= 0 or offset > os.fstat(log.fileno()).st_size:
+            return SessionState(), 0
+        log.seek(offset - 1)
+        if log.read(1) != b"\n":
+            return SessionState(), 0
+        log.seek(0)
+        fingerprint = hashlib.sha256(log.read(min(offset, _FINGERPRINT_BYTES))).hexdigest()
+        if fingerprint != checkpoint.get("fingerprint"):
+            return SessionState(), 0
+
+        return state, offset
+
+    def _save_checkpoint(
+        self, forensics_path: Path, state: SessionState, offset: int, fingerprint: str
+    ) -> None:
+        """Atomically write the reducer checkpoint (best-effort)."""
+        path = checkpoint_path(forensics_path)
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "offset": offset,
+            "fingerprint": fingerprint,
+            "state": state.to_dict(),
+        }
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=path.parent,
+                prefix=f".{path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                json.dump(checkpoint, tmp)
+                tmp_path = Path(tmp.name)
+            tmp_path.replace(path)
+        except OSError:
+            # A missing checkpoint only costs a full re-read next time
+            pass
+
+    def _apply_line(self, state: SessionState, line: bytes) -> None:
+        """Parse one forensics log line and apply it to state.
+
+        Blank and unparseable lines are skipped.
+        """
+        line = line.strip()
+        if not line:
+            return
+
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return
+
+        self._process_event(state, event)
+
     def _process_event(self, state: SessionState, event: dict[str, Any]) -> None:
         """Process a single forensics event and update state.
 
@@ -271,7 +419,7 @@ class SessionLedgerIntegration:
         """
         # Read forensics to reconstruct state
         try:
-            state = self.read_forensics(forensics_path)
+            state = self.reduce_forensics(forensics_path)
         except FileNotFoundError:
             # No forensics file - nothing to do
             return None
@@ -532,7 +680,7 @@ class SessionLedgerIntegration:
             SessionState if forensics exist, None otherwise
         """
         try:
-            state = self.read_forensics(forensics_path)
+            state = self.reduce_forensics(forensics_path)
             return state
         except FileNotFoundError:
             return None
@@ -549,7 +697,7 @@ class SessionLedgerIntegration:
             SessionState if forensics exist, None otherwise
         """
         try:
-            return self.read_forensics(forensics_path)
+            return self.reduce_forensics(forensics_path)
         except FileNotFoundError:
             return None
 
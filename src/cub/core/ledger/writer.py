@@ -6,12 +6,17 @@ Provides write access to the completed work ledger stored in
 """
 
 import json
+import os
+import tempfile
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
+from pydantic import ValidationError
 
+from cub.core.ledger.artifact_store import ArtifactStore, split_prompt
 from cub.core.ledger.artifacts import ArtifactManager
 from cub.core.ledger.models import (
     EpicEntry,
@@ -19,9 +24,13 @@ from cub.core.ledger.models import (
     LedgerIndex,
     PlanEntry,
     RunEntry,
+    TaskContribution,
     compute_aggregates,
 )
 
+# Bump when the epic membership index layout changes
+EPIC_INDEX_VERSION = 2
+
 
 class LedgerWriter:
     """Write completed task records to the ledger.
@@ -35,11 +44,13 @@ class LedgerWriter:
         >>> writer.create_entry(entry)
     """
 
-    def __init__(self, ledger_dir: Path) -> None:
+    def __init__(self, ledger_dir: Path, artifact_store: ArtifactStore | None = None) -> None:
         """Initialize ledger writer.
 
         Args:
             ledger_dir: Path to .cub/ledger directory
+            artifact_store: Store prompt files and harness logs here,
+                deduplicated and compressed, instead of as plain files
         """
         self.ledger_dir = ledger_dir
         self.index_file = ledger_dir / "index.jsonl"
@@ -47,7 +58,9 @@ class LedgerWriter:
         self.by_epic_dir = ledger_dir / "by-epic"
         self.by_plan_dir = ledger_dir / "by-plan"
         self.by_run_dir = ledger_dir / "by-run"
+        self.epic_index_dir = ledger_dir / "epic-index"
         self.artifact_manager = ArtifactManager(ledger_dir)
+        self.artifact_store = artifact_store
 
     def create_entry(self, entry: LedgerEntry) -> None:
         """Create a new ledger entry.
@@ -72,6 +85,7 @@ class LedgerWriter:
 
         # Update index (append)
         self._update_index(entry)
+        self._index_epic_member(entry)
 
     def _append_to_index(self, entry: LedgerEntry) -> None:
         """Append entry to index.jsonl.
@@ -149,6 +163,7 @@ class LedgerWriter:
 
         # Update index
         self._update_index(entry)
+        self._index_epic_member(entry)
 
     def rebuild_index(self) -> None:
         """Rebuild index.jsonl from all task files.
@@ -264,6 +279,7 @@ class LedgerWriter:
         # Validate and update index
         entry = LedgerEntry.model_validate(data)
         self._update_index(entry)
+        self._index_epic_member(entry)
 
         return True
 
@@ -310,7 +326,8 @@ class LedgerWriter:
             started_at: Attempt start time (defaults to now)
 
         Returns:
-            Path to the written prompt file
+            Path to the prompt file. With an artifact store this is the
+            plain path; read it with ArtifactManager.read_artifact().
 
         Example:
             >>> writer = LedgerWriter(Path(".cub/ledger"))
@@ -347,8 +364,11 @@ class LedgerWriter:
         ]
         full_content = "\n".join(content_parts)
 
-        # Write to file
-        prompt_file.write_text(full_content, encoding="utf-8")
+        # Write to file, or to the store so the system prompt is kept once
+        if self.artifact_store is not None:
+            self.artifact_store.write(prompt_file, split_prompt(full_content))
+        else:
+            prompt_file.write_text(full_content, encoding="utf-8")
 
         return prompt_file
 
@@ -368,7 +388,8 @@ class LedgerWriter:
             log_content: The harness log content
 
         Returns:
-            Path to the written log file
+            Path to the log file (the plain path when using an artifact
+            store)
 
         Example:
             >>> writer = LedgerWriter(Path(".cub/ledger"))
@@ -386,7 +407,10 @@ class LedgerWriter:
         )
 
         # Write log content
-        log_file.write_text(log_content, encoding="utf-8")
+        if self.artifact_store is not None:
+            self.artifact_store.write(log_file, log_content)
+        else:
+            log_file.write_text(log_content, encoding="utf-8")
 
         return log_file
 
@@ -441,15 +465,20 @@ class LedgerWriter:
             data = json.load(f)
             return EpicEntry.model_validate(data)
 
-    def update_epic_aggregates(self, epic_id: str) -> EpicEntry | None:
+    def update_epic_aggregates(self, epic_id: str, *, full: bool = False) -> EpicEntry | None:
         """Recompute and update epic aggregates from child task ledger entries.
 
-        Reads all task ledger entries that belong to this epic, computes
-        aggregated metrics (cost, duration, tokens, etc.), and updates the
-        epic entry.
+        Aggregates are computed from the epic's membership index, which
+        holds each member task's contribution (see TaskContribution) and
+        the signature of its ledger file. Only members whose file changed
+        since they were indexed are re-read, so closing one task doesn't
+        re-parse every other task in the ledger. If there is no index for
+        the epic yet, or ``full`` is set, every task entry is scanned and
+        the index is rebuilt.
 
         Args:
             epic_id: Epic ID to update
+            full: Ignore the membership index and rescan all task entries
 
         Returns:
             Updated EpicEntry if epic exists, None otherwise
@@ -464,33 +493,83 @@ class LedgerWriter:
         if not epic_entry:
             return None
 
-        # Find all task entries for this epic
-        task_entries = []
-        if self.by_task_dir.exists():
-            for task_file in self.by_task_dir.glob("*.json"):
-                with task_file.open(encoding="utf-8") as f:
-                    data = json.load(f)
-                    task_entry = LedgerEntry.model_validate(data)
+        members = None if full else self._refresh_epic_index(epic_id, epic_entry.task_ids)
+        if members is None:
+            members = self._scan_epic_members().get(epic_id, {})
+            self._save_epic_index(epic_id, members)
+
+        self._apply_aggregates(epic_entry, [c for c, _ in members.values()])
+
+        # Write updated entry
+        self._write_epic_entry(epic_entry)
+        return epic_entry
+
+    def verify_epic_aggregates(self, *, fix: bool = False) -> list[str]:
+        """Check stored epic aggregates against a full rescan of task entries.
 
-                    # Check if task belongs to this epic
-                    if task_entry.lineage.epic_id == epic_id or task_entry.epic_id == epic_id:
-                        task_entries.append(task_entry)
+        Reads every task entry once and compares the aggregates, task IDs
+        and workflow stage each epic would get from a full recompute with
+        what is stored in its entry.json. Use this to catch drift from
+        task entries written outside LedgerWriter (e.g. merged from git).
 
+        Args:
+            fix: Rewrite mismatched epics from the rescan and rebuild
+                every epic's membership index
+
+        Returns:
+            IDs of epics whose stored aggregates didn't match, sorted
+
+        Example:
+            >>> writer = LedgerWriter(Path(".cub/ledger"))
+            >>> writer.verify_epic_aggregates()
+            ['cub-e2p']
+        """
+        if not self.by_epic_dir.exists():
+            return []
+
+        scanned = self._scan_epic_members()
+        mismatched: list[str] = []
+        for epic_dir in sorted(self.by_epic_dir.iterdir()):
+            if not epic_dir.is_dir():
+                continue
+            stored = self.get_epic_entry(epic_dir.name)
+            if stored is None:
+                continue
+
+            members = scanned.get(stored.id, {})
+            expected = stored.model_copy(deep=True)
+            self._apply_aggregates(expected, [c for c, _ in members.values()])
+            if (
+                expected.aggregates != stored.aggregates
+                or set(expected.task_ids) != set(stored.task_ids)
+                or expected.workflow.stage != stored.workflow.stage
+            ):
+                mismatched.append(stored.id)
+                if fix:
+                    self._write_epic_entry(expected)
+            if fix:
+                self._save_epic_index(stored.id, members)
+
+        return mismatched
+
+    def _apply_aggregates(
+        self, epic_entry: EpicEntry, contributions: list[TaskContribution]
+    ) -> None:
+        """Set an epic's aggregates, bounds and stage from its members."""
         # Compute aggregates from child tasks
-        epic_entry.aggregates = compute_aggregates(task_entries)
-        epic_entry.task_ids = [t.id for t in task_entries]
+        epic_entry.aggregates = compute_aggregates(contributions)
+        epic_entry.task_ids = [c.task_id for c in contributions]
 
         # Update temporal bounds
-        if task_entries:
-            started_times = [t.started_at for t in task_entries if t.started_at]
+        if contributions:
+            started_times = [c.started_at for c in contributions if c.started_at]
             if started_times:
                 epic_entry.started_at = min(started_times)
 
-            completed_times = [t.completed_at for t in task_entries]
-            epic_entry.completed_at = max(completed_times) if completed_times else None
+            epic_entry.completed_at = max(c.completed_at for c in contributions)
 
             # Update commit range
-            all_commits = [c for t in task_entries for c in t.commits]
+            all_commits = [commit for c in contributions for commit in c.commits]
             if all_commits:
                 # Sort by timestamp
                 sorted_commits = sorted(all_commits, key=lambda c: c.timestamp)
@@ -498,22 +577,21 @@ class LedgerWriter:
                 epic_entry.last_commit = sorted_commits[-1]
 
         # Compute epic workflow stage based on child task stages
-        epic_entry.workflow.stage = self._compute_epic_stage(task_entries)
+        epic_entry.workflow.stage = self._compute_epic_stage(contributions)
         epic_entry.workflow.stage_updated_at = datetime.now(timezone.utc)
 
         # Update timestamp
         epic_entry.updated_at = datetime.now(timezone.utc)
 
-        # Write updated entry
-        epic_dir = self.by_epic_dir / epic_id
+    def _write_epic_entry(self, epic_entry: EpicEntry) -> None:
+        """Write an epic entry to by-epic/{epic-id}/entry.json."""
+        epic_dir = self.by_epic_dir / epic_entry.id
         epic_dir.mkdir(parents=True, exist_ok=True)
         entry_file = epic_dir / "entry.json"
         with entry_file.open("w", encoding="utf-8") as f:
             json.dump(epic_entry.model_dump(mode="json"), f, indent=2, default=str)
 
-        return epic_entry
-
-    def _compute_epic_stage(self, task_entries: list[LedgerEntry]) -> str:
+    def _compute_epic_stage(self, task_entries: Iterable[LedgerEntry | TaskContribution]) -> str:
         """Compute epic workflow stage based on child task stages.
 
         The epic stage is determined by the least-progressed child task:
@@ -523,26 +601,23 @@ class LedgerWriter:
         - If all tasks are released, epic is released
 
         Args:
-            task_entries: List of task ledger entries in the epic
+            task_entries: Task ledger entries in the epic, or their contributions
 
         Returns:
             Epic workflow stage string
         """
-        if not task_entries:
-            return "dev_complete"
-
         # Define stage progression order
         stage_order = ["dev_complete", "needs_review", "validated", "released"]
 
         # Get all task stages
-        task_stages = []
-        for task in task_entries:
-            if task.workflow:
-                task_stages.append(task.workflow.stage)
-            elif task.workflow_stage:
-                task_stages.append(task.workflow_stage.value)
-            else:
-                task_stages.append("dev_complete")
+        task_stages = [
+            task.stage
+            if isinstance(task, TaskContribution)
+            else TaskContribution.from_ledger_entry(task).stage
+            for task in task_entries
+        ]
+        if not task_stages:
+            return "dev_complete"
 
         # Epic stage is the minimum (least progressed) of all task stages
         min_stage_idx = min(
@@ -552,6 +627,147 @@ class LedgerWriter:
 
         return stage_order[min_stage_idx]
 
+    # ------------------------------------------------------------------
+    # Epic membership index
+    #
+    # epic-index/{epic-id}.json maps each member task ID to its
+    # TaskContribution and the (mtime_ns, size) of its by-task file when
+    # it was indexed. It is a cache: the ledger entries stay the source
+    # of truth, and a full rescan rebuilds it.
+    # ------------------------------------------------------------------
+
+    def _file_signature(self, task_id: str) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) of a task's ledger file, or None if missing."""
+        try:
+            stat = (self.by_task_dir / f"{task_id}.json").stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_task_entry(self, task_id: str) -> LedgerEntry | None:
+        """Read a task entry, returning None if it's missing or invalid."""
+        try:
+            return self.get_entry(task_id)
+        except (OSError, ValueError, ValidationError):
+            return None
+
+    def _load_epic_index(
+        self, epic_id: str
+    ) -> dict[str, tuple[TaskContribution, tuple[int, int]]] | None:
+        """Load an epic's membership index, or None if missing or unreadable."""
+        index_file = self.epic_index_dir / f"{epic_id}.json"
+        try:
+            data = json.loads(index_file.read_text(encoding="utf-8"))
+            if data.get("version") != EPIC_INDEX_VERSION:
+                return None
+            return {
+                task_id: (
+                    TaskContribution.model_validate(member["contribution"]),
+                    (member["signature"][0], member["signature"][1]),
+                )
+                for task_id, member in data["tasks"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, IndexError, ValidationError):
+            return None
+
+    def _save_epic_index(
+        self, epic_id: str, members: dict[str, tuple[TaskContribution, tuple[int, int]]]
+    ) -> None:
+        """Atomically write an epic's membership index."""
+        self.epic_index_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": EPIC_INDEX_VERSION,
+            "tasks": {
+                task_id: {
+                    "signature": list(signature),
+                    "contribution": contribution.model_dump(mode="json"),
+                }
+                for task_id, (contribution, signature) in sorted(members.items())
+            },
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.epic_index_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.epic_index_dir / f"{epic_id}.json")
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _index_epic_member(self, entry: LedgerEntry) -> None:
+        """Record a just-written task entry in its epic's membership index.
+
+        Only updates an index that already exists; an epic without one is
+        indexed by a full scan on its next aggregate update. A task that
+        moved out of an epic is dropped from that epic's index when the
+        epic is next refreshed, since its file signature will have changed.
+        """
+        signature = self._file_signature(entry.id)
+        if signature is None:
+            return
+        contribution = TaskContribution.from_ledger_entry(entry)
+        for epic_id in {entry.lineage.epic_id, entry.epic_id}:
+            members = self._load_epic_index(epic_id) if epic_id else None
+            if epic_id and members is not None:
+                members[entry.id] = (contribution, signature)
+                self._save_epic_index(epic_id, members)
+
+    def _refresh_epic_index(
+        self, epic_id: str, extra_task_ids: Iterable[str] = ()
+    ) -> dict[str, tuple[TaskContribution, tuple[int, int]]] | None:
+        """Bring an epic's membership index up to date without a full scan.
+
+        Checks the signature of each indexed member and of any task the
+        epic entry lists, re-reading only files that changed or aren't
+        indexed yet. Members whose file is gone or that now belong to
+        another epic are dropped.
+
+        Returns:
+            Refreshed members, or None if the epic has no usable index
+        """
+        members = self._load_epic_index(epic_id)
+        if members is None:
+            return None
+
+        changed = False
+        for task_id in dict.fromkeys([*members, *extra_task_ids]):
+            signature = self._file_signature(task_id)
+            indexed = members.get(task_id)
+            if indexed is not None and indexed[1] == signature:
+                continue
+            entry = self._load_task_entry(task_id) if signature else None
+            if signature and entry and epic_id in (entry.lineage.epic_id, entry.epic_id):
+                members[task_id] = (TaskContribution.from_ledger_entry(entry), signature)
+                changed = True
+            elif indexed is not None:
+                del members[task_id]
+                changed = True
+
+        if changed:
+            self._save_epic_index(epic_id, members)
+        return members
+
+    def _scan_epic_members(
+        self,
+    ) -> dict[str, dict[str, tuple[TaskContribution, tuple[int, int]]]]:
+        """Read every task entry and group contributions by epic ID."""
+        by_epic: dict[str, dict[str, tuple[TaskContribution, tuple[int, int]]]] = {}
+        if not self.by_task_dir.exists():
+            return by_epic
+
+        for task_file in sorted(self.by_task_dir.glob("*.json")):
+            stat = task_file.stat()
+            with task_file.open(encoding="utf-8") as f:
+                data = json.load(f)
+                task_entry = LedgerEntry.model_validate(data)
+
+            contribution = TaskContribution.from_ledger_entry(task_entry)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            for epic_id in {task_entry.lineage.epic_id, task_entry.epic_id}:
+                if epic_id:
+                    by_epic.setdefault(epic_id, {})[task_entry.id] = (contribution, signature)
+        return by_epic
+
     def add_task_to_epic(self, epic_id: str, task_id: str) -> bool:
         """Add a task to an epic and update aggregates.
 
@@ -0,0 +1,418 @@
+"""
+Span-based profiling for cub runs.
+
+With profiling on (``cub run --profile`` or ``CUB_PROFILE=1``), the run
+loop and the subsystems it drives record timed spans: task selection,
+prompt generation, ledger writes, git amends, hooks, sync commits and the
+harness invocation itself. That shows where an iteration's time goes, and
+how much of it is cub's own overhead rather than waiting on the harness.
+
+Spans are appended to ``profile.jsonl`` in the run's ledger directory as
+the run goes, and converted to ``trace.json`` (Chrome trace event format)
+when it ends. The trace opens in Perfetto (ui.perfetto.dev),
+chrome://tracing or speedscope, which renders it as a flamegraph.
+
+Instrumentation is free when profiling is off: ``span()`` returns a shared
+no-op context manager and ``profiled`` functions call straight through.
+
+Storage location:
+- .cub/ledger/by-run/{run_id}/profile.jsonl
+- .cub/ledger/by-run/{run_id}/trace.json
+
+Example:
+    >>> profiler = Profiler(run_dir)
+    >>> activate(profiler)
+    >>> with span("ledger.write", "ledger", task_id="cub-123"):
+    ...     write_entry()
+    >>> deactivate(profiler)
+    >>> summary = profiler.close()
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+# Environment variable that turns profiling on for any run
+PROFILE_ENV = "CUB_PROFILE"
+
+SPANS_FILE = "profile.jsonl"
+TRACE_FILE = "trace.json"
+
+# Category of spans spent waiting on the AI harness; everything else is overhead
+HARNESS_CATEGORY = "harness"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+def profiling_requested() -> bool:
+    """Whether CUB_PROFILE asks for profiling."""
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def run_profile_dir(project_dir: Path, run_id: str) -> Path:
+    """Return the ledger directory a run's profile is written to."""
+    return project_dir / ".cub" / "ledger" / "by-run" / run_id
+
+
+@dataclass(frozen=True)
+class Span:
+    """
+    One timed operation.
+
+    Times are microseconds since the profiler started. ``depth`` is the
+    nesting level within the span's thread, and ``main`` marks spans
+    recorded on the thread that created the profiler (the run loop).
+    """
+
+    name: str
+    category: str
+    start_us: int
+    duration_us: int
+    thread_id: int
+    depth: int
+    main: bool
+    args: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": self.name,
+            "cat": self.category,
+            "ts": self.start_us,
+            "dur": self.duration_us,
+            "tid": self.thread_id,
+            "depth": self.depth,
+            "main": self.main,
+        }
+        if self.args:
+            data["args"] = self.args
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Span:
+        return cls(
+            name=data["name"],
+            category=data.get("cat", ""),
+            start_us=int(data["ts"]),
+            duration_us=int(data["dur"]),
+            thread_id=int(data.get("tid", 0)),
+            depth=int(data.get("depth", 0)),
+            main=bool(data.get("main", True)),
+            args=data.get("args") or {},
+        )
+
+
+@dataclass(frozen=True)
+class SpanTotal:
+    """Aggregate timings of all spans with one name."""
+
+    name: str
+    category: str
+    count: int
+    total_seconds: float
+    self_seconds: float
+    max_seconds: float
+
+
+@dataclass(frozen=True)
+class ProfileSummary:
+    """
+    Where a run's time went.
+
+    ``wall_seconds`` covers the top-level spans of the run loop's thread;
+    ``harness_seconds`` is the part of it spent in harness spans, and
+    ``overhead_seconds`` the rest.
+    """
+
+    wall_seconds: float
+    harness_seconds: float
+    spans: list[SpanTotal]
+
+    @property
+    def overhead_seconds(self) -> float:
+        return max(self.wall_seconds - self.harness_seconds, 0.0)
+
+    @property
+    def overhead_percentage(self) -> float:
+        return self.overhead_seconds / self.wall_seconds * 100 if self.wall_seconds else 0.0
+
+
+class Profiler:
+    """
+    Records spans for one run.
+
+    Completed spans are buffered in memory and appended to the spans file
+    by flush(), which the run loop calls once per iteration so a crashed
+    run still leaves its profile behind.
+    """
+
+    def __init__(
+        self,
+        run_dir: Path,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Create a profiler writing to a run directory.
+
+        Args:
+            run_dir: Directory for profile.jsonl and trace.json
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        self.run_dir = Path(run_dir)
+        self.spans_path = self.run_dir / SPANS_FILE
+        self.trace_path = self.run_dir / TRACE_FILE
+        self._clock = clock
+        self._origin = clock()
+        self._main_thread = threading.get_ident()
+        self._pending: list[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, category: str = "cub", **args: Any) -> Iterator[None]:
+        """Time the body of a with-block as a span."""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = self._clock()
+        try:
+            yield
+        finally:
+            end = self._clock()
+            self._local.depth = depth
+            self.record(
+                Span(
+                    name=name,
+                    category=category,
+                    start_us=int((start - self._origin) * 1_000_000),
+                    duration_us=int((end - start) * 1_000_000),
+                    thread_id=threading.get_ident(),
+                    depth=depth,
+                    main=threading.get_ident() == self._main_thread,
+                    args={k: v for k, v in args.items() if v is not None},
+                )
+            )
+
+    def record(self, span: Span) -> None:
+        """Add a completed span."""
+        with self._lock:
+            self._pending.append(span)
+
+    def flush(self) -> None:
+        """Append buffered spans to the spans file."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.spans_path, "a", encoding="utf-8") as f:
+            for s in pending:
+                f.write(json.dumps(s.to_dict(), default=str) + "\n")
+
+    def close(self) -> ProfileSummary:
+        """
+        Flush remaining spans and write the Chrome trace.
+
+        Returns:
+            Summary of every span recorded for the run
+        """
+        self.flush()
+        spans = load_spans(self.spans_path)
+        write_chrome_trace(spans, self.trace_path, process_name=f"cub {self.run_dir.name}")
+        return summarize(spans)
+
+
+_active: Profiler | None = None
+
+
+def activate(profiler: Profiler) -> None:
+    """Make a profiler receive the spans recorded by span() and profiled."""
+    global _active
+    _active = profiler
+
+
+def deactivate(profiler: Profiler | None = None) -> None:
+    """Stop recording spans (only if ``profiler`` is the active one, when given)."""
+    global _active
+    if profiler is None or _active is profiler:
+        _active = None
+
+
+def active_profiler() -> Profiler | None:
+    """Return the active profiler, if profiling is on."""
+    return _active
+
+
+def span(name: str, category: str = "cub", **args: Any) -> AbstractContextManager[None]:
+    """
+    Time a with-block as a span of the active profiler.
+
+    Does nothing when profiling is off.
+    """
+    profiler = _active
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name, category, **args)
+
+
+def profiled(name: str, category: str = "cub") -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator recording each call of a function as a span."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def load_spans(path: Path) -> list[Span]:
+    """
+    Read spans from a profile.jsonl file.
+
+    Unreadable lines (e.g. a partial line from an interrupted run) are skipped.
+
+    Returns:
+        Spans in file order, or an empty list if the file doesn't exist
+    """
+    spans: list[Span] = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    spans.append(Span.from_dict(json.loads(line)))
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return spans
+
+
+def chrome_trace(spans: list[Span], *, process_name: str = "cub") -> dict[str, Any]:
+    """Convert spans to a Chrome trace event document."""
+    pid = 1
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": process_name}}
+    ]
+    for s in sorted(spans, key=lambda s: (s.start_us, -s.duration_us)):
+        events.append(
+            {
+                "name": s.name,
+                "cat": s.category,
+                "ph": "X",
+                "ts": s.start_us,
+                "dur": s.duration_us,
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": s.args,
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(spans: list[Span], path: Path, *, process_name: str = "cub") -> None:
+    """Write spans as a Chrome trace JSON file, atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        encoding="utf-8",
+        dir=path.parent,
+        delete=False,
+        suffix=".tmp",
+    ) as tmp:
+        json.dump(chrome_trace(spans, process_name=process_name), tmp)
+        tmp_path = Path(tmp.name)
+    tmp_path.replace(path)
+
+
+def summarize(spans: list[Span]) -> ProfileSummary:
+    """
+    Total up spans by name, with self time excluding nested spans.
+
+    Returns:
+        ProfileSummary with spans ordered by self time, largest first
+    """
+    child_us: list[int] = [0] * len(spans)
+    by_thread: dict[int, list[int]] = {}
+    for i, s in enumerate(spans):
+        by_thread.setdefault(s.thread_id, []).append(i)
+
+    # Attribute each span's duration to its innermost enclosing span
+    for indices in by_thread.values():
+        indices.sort(key=lambda i: (spans[i].start_us, spans[i].depth))
+        stack: list[int] = []
+        for i in indices:
+            s = spans[i]
+            while stack and spans[stack[-1]].depth >= s.depth:
+                stack.pop()
+            if stack:
+                child_us[stack[-1]] += s.duration_us
+            stack.append(i)
+
+    totals: dict[str, list[Any]] = {}
+    wall_us = harness_us = 0
+    for i, s in enumerate(spans):
+        total = totals.setdefault(s.name, [s.category, 0, 0, 0, 0])
+        total[1] += 1
+        total[2] += s.duration_us
+        total[3] += max(s.duration_us - child_us[i], 0)
+        total[4] = max(total[4], s.duration_us)
+        if s.main and s.depth == 0:
+            wall_us += s.duration_us
+        if s.main and s.category == HARNESS_CATEGORY:
+            harness_us += s.duration_us
+
+    span_totals = [
+        SpanTotal(
+            name=name,
+            category=category,
+            count=count,
+            total_seconds=total_us / 1_000_000,
+            self_seconds=self_us / 1_000_000,
+            max_seconds=max_us / 1_000_000,
+        )
+        for name, (category, count, total_us, self_us, max_us) in totals.items()
+    ]
+    span_totals.sort(key=lambda t: t.self_seconds, reverse=True)
+    return ProfileSummary(
+        wall_seconds=wall_us / 1_000_000,
+        harness_seconds=harness_us / 1_000_000,
+        spans=span_totals,
+    )
+
+
+def load_summary(run_dir: Path) -> ProfileSummary | None:
+    """
+    Summarise the profile recorded for a run.
+
+    Returns:
+        ProfileSummary, or None if the run wasn't profiled
+    """
+    spans = load_spans(Path(run_dir) / SPANS_FILE)
+    return summarize(spans) if spans else None
+
+
+def format_summary(summary: ProfileSummary) -> str:
+    """One-line description of overhead versus harness time."""
+    return (
+        f"{summary.wall_seconds:.1f}s profiled: harness {summary.harness_seconds:.1f}s, "
+        f"cub overhead {summary.overhead_seconds:.2f}s ({summary.overhead_percentage:.1f}%)"
+    )
@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from cub.core.ledger.analytics import LedgerAnalytics
+
 logger = logging.getLogger(__name__)
 
 
@@ -319,49 +321,25 @@ class RetroService:
         first_commit = epic_data.get("first_commit")
         last_commit = epic_data.get("last_commit")
 
-        # Count commits by collecting from all tasks
+        # Collect task details from the ledger columns
         task_ids = epic_data.get("task_ids", [])
-        total_commits = 0
-        task_list: list[dict[str, str | float | int | bool]] = []
-        all_decisions: list[str] = []
-        all_lessons: list[str] = []
-
-        # Load task details
-        for task_id in task_ids:
-            task_path = self.ledger_dir / "by-task" / f"{task_id}.json"
-            if not task_path.exists():
-                continue
-
-            try:
-                with task_path.open("r") as f:
-                    task_data = json.load(f)
-
-                # Count commits
-                commits = task_data.get("commits", [])
-                total_commits += len(commits)
-
-                # Extract task info
-                outcome = task_data.get("outcome", {})
-                task_list.append({
-                    "id": task_id,
-                    "title": task_data.get("task", {}).get("title", "Untitled"),
-                    "success": outcome.get("success", False),
-                    "cost_usd": outcome.get("total_cost_usd", 0.0),
-                    "attempts": outcome.get("total_attempts", 1),
-                })
-
-                # Collect decisions and lessons
-                decisions = task_data.get("decisions", [])
-                if decisions:
-                    all_decisions.extend(decisions)
-
-                lessons = task_data.get("lessons_learned", [])
-                if lessons:
-                    all_lessons.extend(lessons)
-
-            except Exception as e:
-                logger.warning(f"Failed to load task {task_id}: {e}")
-                continue
+        columns = LedgerAnalytics(self.ledger_dir).load()
+        rows_by_id = columns.rows_by_id()
+        tasks = columns.take([rows_by_id[t] for t in task_ids if t in rows_by_id])
+
+        total_commits = sum(tasks.commit_count)
+        task_list: list[dict[str, str | float | int | bool]] = [
+            {
+                "id": tasks.ids[i],
+                "title": tasks.titles[i],
+                "success": bool(tasks.success[i]),
+                "cost_usd": tasks.outcome_cost_usd[i],
+                "attempts": tasks.outcome_attempts[i],
+            }
+            for i in range(len(tasks))
+        ]
+        all_decisions = list(tasks.decisions.values)
+        all_lessons = list(tasks.lessons.values)
 
         # Create report
         report = RetroReport(
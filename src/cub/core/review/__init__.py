@@ -6,6 +6,7 @@ by examining ledger entries, verification status, spec drift, and more.
 """
 
 from cub.core.review.assessor import EpicAssessor, PlanAssessor, TaskAssessor
+from cub.core.review.cache import AssessmentCache
 from cub.core.review.formatter import to_json
 from cub.core.review.models import (
     AssessmentGrade,
@@ -18,6 +19,7 @@ from cub.core.review.models import (
 )
 
 __all__ = [
+    "AssessmentCache",
     "AssessmentGrade",
     "EpicAssessment",
     "EpicAssessor",
@@ -12,14 +12,17 @@ Supports two levels of analysis:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from cub.core.ledger.models import LedgerEntry
 from cub.core.ledger.reader import LedgerReader
 from cub.core.plans import get_epic_ids
+from cub.core.review.cache import AssessmentCache
 from cub.core.review.models import (
     AcceptanceCriterion,
     AssessmentGrade,
@@ -34,6 +37,9 @@ from cub.utils.project import get_project_root
 
 logger = logging.getLogger(__name__)
 
+# Default bound on concurrent deep analyses (each one is an LLM call)
+DEFAULT_MAX_WORKERS = 4
+
 
 class TaskAssessor:
     """Assess individual task implementations from ledger entries.
@@ -50,15 +56,24 @@ class TaskAssessor:
         self,
         ledger_reader: LedgerReader,
         project_root: Path | None = None,
+        *,
+        cache: AssessmentCache | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
         """Initialize the task assessor.
 
         Args:
             ledger_reader: LedgerReader instance for accessing ledger data
             project_root: Project root directory (auto-detected if None)
+            cache: Optional assessment cache; disabled if None
+            max_workers: Maximum concurrent deep analyses
         """
         self.ledger = ledger_reader
         self.project_root = project_root or get_project_root()
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        # Parsed entries keyed by task ID, with the checksum they were parsed from
+        self._entries: dict[str, tuple[str, LedgerEntry]] = {}
 
     def assess_task(self, task_id: str, *, deep: bool = False) -> TaskAssessment:
         """Assess a single task from its ledger entry.
@@ -70,23 +85,156 @@ class TaskAssessor:
         Returns:
             TaskAssessment with grade, issues, and summary
         """
-        entry = self.ledger.get_task(task_id)
-        if not entry:
-            return TaskAssessment(
-                task_id=task_id,
-                title="Unknown",
-                grade=AssessmentGrade.UNKNOWN,
-                issues=[
-                    ReviewIssue(
-                        type=IssueType.NOT_IN_LEDGER,
-                        severity=IssueSeverity.CRITICAL,
-                        description=f"Task {task_id} not found in ledger",
-                        recommendation="Ensure the task was completed and recorded in the ledger",
-                    )
-                ],
-                summary="Task not found in ledger",
+        return self.assess_tasks([task_id], deep=deep)[0]
+
+    def assess_tasks(self, task_ids: list[str], *, deep: bool = False) -> list[TaskAssessment]:
+        """Assess several tasks, reusing cached results where possible.
+
+        Ledger entries are read once, files changed by all uncached tasks are
+        looked up with a single git invocation, and deep analyses run
+        concurrently on a pool bounded by ``max_workers``.
+
+        Args:
+            task_ids: Task IDs to assess
+            deep: If True, perform LLM-based deep analysis
+
+        Returns:
+            TaskAssessments in the same order as task_ids
+        """
+        loaded = self.load_entries(task_ids)
+        results: dict[str, TaskAssessment] = {}
+        pending: list[tuple[str, LedgerEntry, str]] = []
+
+        for task_id in dict.fromkeys(task_ids):
+            item = loaded.get(task_id)
+            if item is None:
+                results[task_id] = self._not_found(task_id)
+                continue
+            checksum, entry = item
+            key = AssessmentCache.make_key(
+                checksum,
+                self._commit_hashes(entry),
+                deep=deep,
+                worktree=self._worktree_state(entry),
             )
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                logger.debug(f"Using cached assessment for {task_id}")
+                results[task_id] = cached
+            else:
+                pending.append((task_id, entry, key))
+
+        commit_files = self._get_commit_files(
+            [h for _, entry, _ in pending for h in self._commit_hashes(entry)]
+        )
+
+        def assess(entry: LedgerEntry) -> TaskAssessment:
+            return self._assess_entry(entry, deep=deep, commit_files=commit_files)
+
+        workers = min(self.max_workers, len(pending)) if deep else 1
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    task_id: executor.submit(assess, entry) for task_id, entry, _ in pending
+                }
+                assessments = {task_id: future.result() for task_id, future in futures.items()}
+        else:
+            assessments = {task_id: assess(entry) for task_id, entry, _ in pending}
+
+        for task_id, _, key in pending:
+            assessment = assessments[task_id]
+            results[task_id] = assessment
+            # Don't cache deep runs whose analysis failed or was unavailable
+            if self.cache and not (deep and assessment.deep_analysis is None):
+                self.cache.set(key, assessment)
+
+        return [results[task_id] for task_id in task_ids]
 
+    def load_entries(self, task_ids: list[str]) -> dict[str, tuple[str, LedgerEntry]]:
+        """Load ledger entries along with the checksum of their raw file.
+
+        Entries are parsed at most once per assessor while their file is
+        unchanged. Missing or unreadable entries are omitted.
+
+        Args:
+            task_ids: Task IDs to load
+
+        Returns:
+            Mapping of task ID to (checksum, entry)
+        """
+        loaded: dict[str, tuple[str, LedgerEntry]] = {}
+        for task_id in dict.fromkeys(task_ids):
+            task_file = self.ledger.by_task_dir / f"{task_id}.json"
+            try:
+                raw = task_file.read_bytes()
+            except OSError:
+                continue
+            checksum = hashlib.sha256(raw).hexdigest()
+            memo = self._entries.get(task_id)
+            if memo is not None and memo[0] == checksum:
+                loaded[task_id] = memo
+                continue
+            try:
+                entry = LedgerEntry.model_validate_json(raw)
+            except ValueError as e:
+                logger.warning(f"Failed to parse ledger entry {task_id}: {e}")
+                continue
+            self._entries[task_id] = (checksum, entry)
+            loaded[task_id] = (checksum, entry)
+        return loaded
+
+    def get_loaded_entry(self, task_id: str) -> LedgerEntry | None:
+        """Get an entry already parsed by load_entries, without touching disk."""
+        memo = self._entries.get(task_id)
+        return memo[1] if memo else None
+
+    def _worktree_state(self, entry: LedgerEntry) -> list[str]:
+        """Describe the working-tree state the structural checks depend on.
+
+        Specified files and their tests can appear or disappear on disk
+        without the ledger entry or its commits changing, so which ones are
+        missing is part of the cache key.
+        """
+        description = entry.task.description if entry.task else ""
+        specified_files = self._parse_specified_files(description)
+        return [f"file:{f}" for f in self._check_files_exist(specified_files)] + [
+            f"test:{f}" for f in self._check_tests_exist(specified_files)
+        ]
+
+    def _not_found(self, task_id: str) -> TaskAssessment:
+        """Build the assessment for a task missing from the ledger."""
+        return TaskAssessment(
+            task_id=task_id,
+            title="Unknown",
+            grade=AssessmentGrade.UNKNOWN,
+            issues=[
+                ReviewIssue(
+                    type=IssueType.NOT_IN_LEDGER,
+                    severity=IssueSeverity.CRITICAL,
+                    description=f"Task {task_id} not found in ledger",
+                    recommendation="Ensure the task was completed and recorded in the ledger",
+                )
+            ],
+            summary="Task not found in ledger",
+        )
+
+    def _assess_entry(
+        self,
+        entry: LedgerEntry,
+        *,
+        deep: bool = False,
+        commit_files: dict[str, list[str]] | None = None,
+    ) -> TaskAssessment:
+        """Assess a loaded ledger entry.
+
+        Args:
+            entry: Ledger entry to assess
+            deep: If True, perform LLM-based deep analysis
+            commit_files: Pre-fetched files per commit hash (see _get_commit_files)
+
+        Returns:
+            TaskAssessment with grade, issues, and summary
+        """
         issues: list[ReviewIssue] = []
 
         # Ledger-based checks
@@ -101,7 +249,7 @@ class TaskAssessor:
         acceptance_criteria = self._parse_acceptance_criteria(description)
 
         # Get actual files changed from commits (more reliable than ledger)
-        actual_files = self._get_files_from_commits(entry)
+        actual_files = self._get_files_from_commits(entry, commit_files)
         if actual_files:
             logger.debug(f"Found {len(actual_files)} files from commits: {actual_files}")
 
@@ -140,7 +288,7 @@ class TaskAssessor:
             has_commits = len(entry.commits) > 0
 
         return TaskAssessment(
-            task_id=task_id,
+            task_id=entry.id,
             title=entry.title,
             grade=grade,
             issues=issues,
@@ -402,7 +550,69 @@ class TaskAssessor:
 
         return missing
 
-    def _get_files_from_commits(self, entry: LedgerEntry) -> list[str]:
+    @staticmethod
+    def _commit_hashes(entry: LedgerEntry) -> list[str]:
+        """Get the commit hashes recorded for a ledger entry."""
+        commits = entry.commits if entry.commits else []
+        if entry.outcome and entry.outcome.commits:
+            commits = entry.outcome.commits
+        return [c.hash if hasattr(c, "hash") else str(c) for c in commits]
+
+    def _get_commit_files(self, commit_hashes: list[str]) -> dict[str, list[str]]:
+        """Get files changed by many commits with a single git invocation.
+
+        Runs one ``git show --name-only`` over all commits, falling back to
+        one call per commit if the batch fails (e.g. an unknown hash).
+
+        Args:
+            commit_hashes: Commit hashes as recorded in the ledger (may be short)
+
+        Returns:
+            Mapping of each requested hash to the files it changed
+        """
+        hashes = list(dict.fromkeys(h for h in commit_hashes if h))
+        if not hashes:
+            return {}
+
+        files_by_hash: dict[str, list[str]] = {}
+        try:
+            result = subprocess.run(
+                ["git", "show", "--name-only", "--format=%x00%H", *hashes],
+                capture_output=True,
+                text=True,
+                check=False,
+                cwd=self.project_root,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to batch git lookup for {len(hashes)} commits: {e}")
+            return {}
+
+        if result.returncode == 0:
+            full_files: dict[str, list[str]] = {}
+            for block in result.stdout.split("\0")[1:]:
+                lines = [line.strip() for line in block.split("\n")]
+                if lines and lines[0]:
+                    full_files[lines[0]] = [line for line in lines[1:] if line]
+            for commit_hash in hashes:
+                for full_hash, files in full_files.items():
+                    if full_hash.startswith(commit_hash):
+                        files_by_hash[commit_hash] = files
+                        break
+            return files_by_hash
+
+        if len(hashes) == 1:
+            logger.debug(f"Failed to get files from commit {hashes[0]}: {result.stderr.strip()}")
+            return {}
+
+        for commit_hash in hashes:
+            files_by_hash.update(self._get_commit_files([commit_hash]))
+        return files_by_hash
+
+    def _get_files_from_commits(
+        self,
+        entry: LedgerEntry,
+        commit_files: dict[str, list[str]] | None = None,
+    ) -> list[str]:
         """Get actual files changed from git commits.
 
         Uses git show --name-only to get files from each commit in the ledger.
@@ -410,33 +620,18 @@ class TaskAssessor:
 
         Args:
             entry: Ledger entry with commit references
+            commit_files: Pre-fetched files per commit hash; looked up if None
 
         Returns:
             List of file paths that were changed in the commits
         """
-        files: set[str] = set()
+        commit_hashes = self._commit_hashes(entry)
+        if commit_files is None:
+            commit_files = self._get_commit_files(commit_hashes)
 
-        # Get commits from entry
-        commits = entry.commits if entry.commits else []
-        if entry.outcome and entry.outcome.commits:
-            commits = entry.outcome.commits
-
-        for commit in commits:
-            commit_hash = commit.hash if hasattr(commit, "hash") else str(commit)
-            try:
-                result = subprocess.run(
-                    ["git", "show", "--name-only", "--format=", commit_hash],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    cwd=self.project_root,
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split("\n"):
-                        if line.strip():
-                            files.add(line.strip())
-            except Exception as e:
-                logger.debug(f"Failed to get files from commit {commit_hash}: {e}")
+        files: set[str] = set()
+        for commit_hash in commit_hashes:
+            files.update(commit_files.get(commit_hash, []))
 
         return list(files)
 
@@ -670,14 +865,26 @@ class TaskAssessor:
 class EpicAssessor:
     """Assess epic implementations by aggregating task assessments."""
 
-    def __init__(self, ledger_reader: LedgerReader) -> None:
+    def __init__(
+        self,
+        ledger_reader: LedgerReader,
+        *,
+        project_root: Path | None = None,
+        cache: AssessmentCache | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
         """Initialize the epic assessor.
 
         Args:
             ledger_reader: LedgerReader instance for accessing ledger data
+            project_root: Project root directory (auto-detected if None)
+            cache: Optional assessment cache; disabled if None
+            max_workers: Maximum concurrent deep analyses
         """
         self.ledger = ledger_reader
-        self.task_assessor = TaskAssessor(ledger_reader)
+        self.task_assessor = TaskAssessor(
+            ledger_reader, project_root, cache=cache, max_workers=max_workers
+        )
 
     def assess_epic(self, epic_id: str, *, deep: bool = False) -> EpicAssessment:
         """Assess all tasks in an epic.
@@ -690,9 +897,27 @@ class EpicAssessor:
             EpicAssessment with task assessments and aggregate metrics
         """
         # Get all tasks in this epic from ledger
-        index_entries = self.ledger.list_tasks(epic=epic_id)
+        task_ids = [entry.id for entry in self.ledger.list_tasks(epic=epic_id)]
+        task_assessments = self.task_assessor.assess_tasks(task_ids, deep=deep)
+        return self.build_assessment(epic_id, task_ids, task_assessments)
 
-        if not index_entries:
+    def build_assessment(
+        self,
+        epic_id: str,
+        task_ids: list[str],
+        task_assessments: list[TaskAssessment],
+    ) -> EpicAssessment:
+        """Aggregate already-computed task assessments into an epic assessment.
+
+        Args:
+            epic_id: Epic ID being assessed
+            task_ids: Task IDs in the epic
+            task_assessments: Assessments for task_ids, in the same order
+
+        Returns:
+            EpicAssessment with aggregate metrics
+        """
+        if not task_ids:
             return EpicAssessment(
                 epic_id=epic_id,
                 title="Unknown",
@@ -700,16 +925,11 @@ class EpicAssessor:
                 summary=f"No tasks found in ledger for epic {epic_id}",
             )
 
-        # Assess each task
-        task_assessments = [
-            self.task_assessor.assess_task(entry.id, deep=deep) for entry in index_entries
-        ]
-
-        # Get epic title from first task's parent info or use ID
+        # Get epic title from the tasks' lineage or use ID
         epic_title = epic_id  # Default to ID
-        for entry in index_entries:
-            full_entry = self.ledger.get_task(entry.id)
-            if full_entry and full_entry.lineage.epic_id == epic_id:
+        for task_id in task_ids:
+            entry = self.task_assessor.get_loaded_entry(task_id)
+            if entry and entry.lineage.epic_id == epic_id:
                 epic_title = f"Epic {epic_id}"
                 break
 
@@ -770,20 +990,36 @@ class EpicAssessor:
 class PlanAssessor:
     """Assess plan implementations by finding and assessing all epics."""
 
-    def __init__(self, ledger_reader: LedgerReader, plans_root: Path) -> None:
+    def __init__(
+        self,
+        ledger_reader: LedgerReader,
+        plans_root: Path,
+        *,
+        project_root: Path | None = None,
+        cache: AssessmentCache | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
         """Initialize the plan assessor.
 
         Args:
             ledger_reader: LedgerReader instance for accessing ledger data
             plans_root: Path to plans directory (e.g., ./plans)
+            project_root: Project root directory (auto-detected if None)
+            cache: Optional assessment cache; disabled if None
+            max_workers: Maximum concurrent deep analyses
         """
         self.ledger = ledger_reader
         self.plans_root = plans_root
-        self.epic_assessor = EpicAssessor(ledger_reader)
+        self.epic_assessor = EpicAssessor(
+            ledger_reader, project_root=project_root, cache=cache, max_workers=max_workers
+        )
 
     def assess_plan(self, plan_slug: str, *, deep: bool = False) -> PlanAssessment:
         """Assess a plan by finding its epics and tasks.
 
+        Tasks from all epics are assessed together so deep analysis shares
+        one bounded worker pool across the whole plan.
+
         Args:
             plan_slug: Plan slug (e.g., 'unified-tracking-model')
             deep: If True, run LLM-based deep analysis on each task
@@ -804,13 +1040,13 @@ class PlanAssessor:
         epic_ids = get_epic_ids(plan_dir)
 
         # Also search ledger for tasks with this plan in lineage (fallback)
-        all_entries = self.ledger.list_tasks()
-        for entry in all_entries:
-            full_entry = self.ledger.get_task(entry.id)
-            if full_entry and full_entry.lineage.plan_file:
-                if plan_slug in full_entry.lineage.plan_file:
-                    if full_entry.lineage.epic_id and full_entry.lineage.epic_id not in epic_ids:
-                        epic_ids.append(full_entry.lineage.epic_id)
+        task_assessor = self.epic_assessor.task_assessor
+        index_entries = self.ledger.list_tasks()
+        all_entries = task_assessor.load_entries([e.id for e in index_entries])
+        for _, full_entry in all_entries.values():
+            if full_entry.lineage.plan_file and plan_slug in full_entry.lineage.plan_file:
+                if full_entry.lineage.epic_id and full_entry.lineage.epic_id not in epic_ids:
+                    epic_ids.append(full_entry.lineage.epic_id)
 
         # Deduplicate while preserving order
         seen: set[str] = set()
@@ -828,8 +1064,20 @@ class PlanAssessor:
                 summary=f"No epics found for plan {plan_slug}",
             )
 
-        # Assess each epic
-        epic_assessments = [self.epic_assessor.assess_epic(eid, deep=deep) for eid in epic_ids]
+        # Assess every task in the plan in one batch, then aggregate per epic
+        epic_task_ids = {
+            eid: [entry.id for entry in index_entries if entry.epic == eid] for eid in epic_ids
+        }
+        all_task_ids = [tid for ids in epic_task_ids.values() for tid in ids]
+        assessments = dict(
+            zip(all_task_ids, task_assessor.assess_tasks(all_task_ids, deep=deep))
+        )
+        epic_assessments = [
+            self.epic_assessor.build_assessment(
+                eid, ids, [assessments[tid] for tid in ids]
+            )
+            for eid, ids in epic_task_ids.items()
+        ]
 
         # Aggregate counts
         epics_total = len(epic_assessments)
@@ -0,0 +1,126 @@
+"""
+On-disk cache for task assessments.
+
+Assessments are stored under .cub/cache/review/ as one JSON file per key.
+The key is derived from the checksum of the task's ledger entry file, the
+commit hashes it references, and which of the task's specified files and
+tests are missing from the working tree, so an assessment is reused only
+while the recorded work and the files it is checked against are unchanged.
+Re-reviewing an unchanged epic skips the git lookups and (with --deep) the
+LLM analysis.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from cub.core.review.models import TaskAssessment
+
+logger = logging.getLogger(__name__)
+
+# Bump when assessment logic changes in a way that invalidates stored results
+CACHE_VERSION = 2
+
+
+class AssessmentCache:
+    """File-backed cache of TaskAssessment results.
+
+    Example:
+        >>> cache = AssessmentCache.for_project(Path("."))
+        >>> key = AssessmentCache.make_key(checksum, ["abc123"], deep=False)
+        >>> cached = cache.get(key)
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cached assessments in
+        """
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> AssessmentCache:
+        """Create a cache in the project's .cub/cache/review directory."""
+        return cls(project_root / ".cub" / "cache" / "review")
+
+    @staticmethod
+    def make_key(
+        entry_checksum: str,
+        commit_hashes: list[str],
+        *,
+        deep: bool,
+        worktree: list[str] | None = None,
+    ) -> str:
+        """Build a cache key for a task assessment.
+
+        Args:
+            entry_checksum: Checksum of the raw ledger entry file
+            commit_hashes: Commit hashes recorded for the task
+            deep: Whether the assessment includes deep analysis
+            worktree: Working-tree state the checks depend on, e.g. the
+                specified files and tests that are missing on disk
+
+        Returns:
+            Hex digest identifying the assessment inputs
+        """
+        raw = "|".join(
+            [
+                f"v{CACHE_VERSION}",
+                "deep" if deep else "structural",
+                entry_checksum,
+                ",".join(sorted(commit_hashes)),
+                ",".join(sorted(worktree or [])),
+            ]
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> TaskAssessment | None:
+        """Return the cached assessment for a key, or None on a miss."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return TaskAssessment.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError, ValueError):
+            logger.debug("Discarding unreadable review cache entry %s", path, exc_info=True)
+            return None
+
+    def set(self, key: str, assessment: TaskAssessment) -> None:
+        """Store an assessment. Write failures are logged and ignored."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(assessment.model_dump(mode="json"), f)
+                os.replace(tmp_path, self._path(key))
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("Failed to write review cache entry", exc_info=True)
+
+    def clear(self) -> int:
+        """Remove all cached assessments.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
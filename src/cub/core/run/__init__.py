@@ -28,6 +28,8 @@ from cub.core.run.models import (
     RunResult,
 )
 from cub.core.run.prompt_builder import (
+    build_system_prompt,
+    build_task_prompt,
     generate_direct_task_prompt,
     generate_epic_context,
     generate_retry_context,
@@ -37,6 +39,8 @@ from cub.core.run.prompt_builder import (
 
 __all__ = [
     # Prompt builder
+    "build_system_prompt",
+    "build_task_prompt",
     "generate_direct_task_prompt",
     "generate_epic_context",
     "generate_retry_context",
@@ -12,6 +12,7 @@ The RunLoop coordinates:
 - Result recording (via LedgerIntegration)
 - Circuit breaker monitoring
 - Hook lifecycle coordination
+- Span profiling of each iteration (when ``config.profile`` is set)
 
 Usage:
     >>> from cub.core.run.loop import RunLoop
@@ -25,6 +26,7 @@ Usage:
 
 from __future__ import annotations
 
+import os
 import time
 from collections.abc import Generator
 from datetime import datetime
@@ -32,16 +34,22 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from cub.core.circuit_breaker import CircuitBreaker, CircuitBreakerTrippedError
+from cub.core.harness.async_backend import SessionRetainingBackend
 from cub.core.harness.models import HarnessResult, TaskInput
-from cub.core.ledger.models import CommitRef
+from cub.core.ledger.models import CommitRef, ResourceTelemetry
+from cub.core.profiling import Profiler, ProfileSummary, profiled, run_profile_dir, span
+from cub.core.profiling import activate as activate_profiler
+from cub.core.profiling import deactivate as deactivate_profiler
 from cub.core.run.budget import BudgetConfig, BudgetManager
 from cub.core.run.interrupt import InterruptHandler
 from cub.core.run.models import RunConfig, RunEvent, RunEventType, RunResult
 from cub.core.run.prompt_builder import (
     generate_system_prompt,
     generate_task_prompt,
+    hash_prompt_prefix,
 )
 from cub.core.tasks.models import NON_EXECUTABLE_TYPES, Task, TaskStatus
+from cub.core.telemetry import ProcTreeSampler
 
 if TYPE_CHECKING:
     from cub.core.harness.async_backend import AsyncHarnessBackend
@@ -162,8 +170,15 @@ class RunLoop:
         # When on_task_failure="retry", holds the task ID to retry next iteration
         self._retry_task_id: str | None = None
 
-        # Generate system prompt once
+        # Generate system prompt once; it is the cached prefix of every task
         self._system_prompt = generate_system_prompt(Path(config.project_dir))
+        self._prompt_prefix_hash = hash_prompt_prefix(self._system_prompt)
+
+        # Span profiling, written next to the run's status in the ledger
+        self.profiler: Profiler | None = None
+        self.profile_summary: ProfileSummary | None = None
+        if config.profile:
+            self.profiler = Profiler(run_profile_dir(Path(config.project_dir), self.run_id))
 
     @property
     def budget_manager(self) -> BudgetManager:
@@ -195,6 +210,9 @@ class RunLoop:
         """
         Execute the run loop, yielding events.
 
+        When profiling, spans are recorded for the whole execution and the
+        profile is summarised into ``profile_summary`` once it finishes.
+
         This is the main entry point. It implements the state machine:
         pick task → execute → record → next. Each significant state
         transition yields a RunEvent for the consumer to handle.
@@ -208,6 +226,22 @@ class RunLoop:
             ...     if event.event_type == RunEventType.TASK_COMPLETED:
             ...         print(f"Done: {event.task_id}")
         """
+        if self.profiler is None:
+            yield from self._execute_loop()
+            return
+
+        activate_profiler(self.profiler)
+        try:
+            yield from self._execute_loop()
+        finally:
+            deactivate_profiler(self.profiler)
+            try:
+                self.profile_summary = self.profiler.close()
+            except OSError:
+                pass  # Non-fatal
+
+    def _execute_loop(self) -> Generator[RunEvent, None, None]:
+        """Run the pick-task → execute → record cycle (see execute())."""
         self._start_time = time.time()
         self._phase = "running"
 
@@ -282,7 +316,8 @@ class RunLoop:
                 )
 
                 # Select task
-                task = self._select_task()
+                with span("run.select_task", "run"):
+                    task = self._select_task()
                 if task is None:
                     # Emit events for any tasks that exhausted retries
                     for exhausted_id in self._retries_exhausted:
@@ -304,7 +339,10 @@ class RunLoop:
                 )
 
                 # Execute task
-                yield from self._execute_task(task)
+                with span("run.task", "run", task_id=task.id, iteration=self._iteration):
+                    yield from self._execute_task(task)
+                if self.profiler is not None:
+                    self.profiler.flush()
 
                 # Check if execution set a terminal phase
                 if self._phase in ("failed", "stopped"):
@@ -339,6 +377,9 @@ class RunLoop:
                 self._run_hook("post-loop")
             return
 
+        finally:
+            self._close_harness_session()
+
         # Run post-loop hooks
         if self.config.hooks_enabled:
             self._run_hook("post-loop")
@@ -544,9 +585,10 @@ class RunLoop:
 
         # Claim task (mark as in_progress)
         try:
-            self.task_backend.update_task(
-                task.id, status=TaskStatus.IN_PROGRESS, assignee=self.run_id
-            )
+            with span("tasks.claim", "tasks"):
+                self.task_backend.update_task(
+                    task.id, status=TaskStatus.IN_PROGRESS, assignee=self.run_id
+                )
         except Exception:
             pass  # Non-fatal
 
@@ -565,11 +607,12 @@ class RunLoop:
                 pass  # Non-fatal
 
         # Generate task prompt
-        task_prompt = generate_task_prompt(
-            task,
-            self.task_backend,
-            self.ledger_integration if self.config.ledger_enabled else None,
-        )
+        with span("prompt.generate", "prompt"):
+            task_prompt = generate_task_prompt(
+                task,
+                self.task_backend,
+                self.ledger_integration if self.config.ledger_enabled else None,
+            )
 
         # Get model from task label, CLI arg, or default
         task_model = self.config.model or task.model_label
@@ -626,13 +669,26 @@ class RunLoop:
             if self.status_writer:
                 harness_log_path = self.status_writer.get_harness_log_path(task.id)
 
-            # Invoke harness with circuit breaker
-            result = self._invoke_harness(task_input, harness_log_path)
+            # Invoke harness with circuit breaker, sampling the resources
+            # used by this process and the harness processes it starts
+            self._retain_harness_session(task)
+            sampler = ProcTreeSampler(os.getpid())
+            sampler.start()
+            try:
+                with span("harness.invoke", "harness", model=task_model):
+                    result = self._invoke_harness(task_input, harness_log_path)
+            finally:
+                resources = sampler.stop()
 
             # Record attempt end in ledger
             self._record_attempt_end(
-                task, attempt_number, result, attempt_start_time, harness_log_path
+                task, attempt_number, result, attempt_start_time, harness_log_path, resources
             )
+            if self.status_writer:
+                try:
+                    self.status_writer.store_harness_log(task.id)
+                except Exception:
+                    pass  # Non-fatal
 
         except CircuitBreakerTrippedError as e:
             # Circuit breaker timeout
@@ -727,10 +783,11 @@ class RunLoop:
 
             # Close task in backend
             try:
-                self.task_backend.close_task(
-                    task.id,
-                    reason="Completed by autonomous execution",
-                )
+                with span("tasks.close", "tasks"):
+                    self.task_backend.close_task(
+                        task.id,
+                        reason="Completed by autonomous execution",
+                    )
             except Exception:
                 pass  # Non-fatal, work is done
 
@@ -866,6 +923,26 @@ class RunLoop:
     # Harness invocation
     # -----------------------------------------------------------------------
 
+    def _retain_harness_session(self, task: Task) -> None:
+        """Keep the harness session warm across the tasks of an epic, if enabled."""
+        if not self.config.retain_session or not isinstance(
+            self.harness_backend, SessionRetainingBackend
+        ):
+            return
+        scope = task.parent or self.config.epic
+        if scope:
+            self.harness_backend.open_session(scope)
+        else:
+            self.harness_backend.close_session()
+
+    def _close_harness_session(self) -> None:
+        """Close any session retained by the harness."""
+        if isinstance(self.harness_backend, SessionRetainingBackend):
+            try:
+                self.harness_backend.close_session()
+            except Exception:
+                pass  # Non-fatal
+
     def _invoke_harness(
         self,
         task_input: TaskInput,
@@ -912,6 +989,7 @@ class RunLoop:
         result: HarnessResult,
         attempt_start_time: datetime,
         harness_log_path: Path | None,
+        resources: ResourceTelemetry | None = None,
     ) -> None:
         """Record attempt end in ledger."""
         if not self.ledger_integration or not self.config.ledger_enabled:
@@ -943,6 +1021,8 @@ class RunLoop:
                 cost_usd=result.usage.cost_usd or 0.0,
                 duration_seconds=int(result.duration_seconds),
                 started_at=attempt_start_time,
+                prompt_prefix_hash=self._prompt_prefix_hash,
+                resources=resources,
             )
         except Exception:
             pass  # Non-fatal
@@ -1001,6 +1081,7 @@ class RunLoop:
         except Exception:
             pass  # Non-fatal
 
+    @profiled("ledger.finalize", "ledger")
     def _finalize_ledger(
         self,
         task: Task,
@@ -1053,6 +1134,7 @@ class RunLoop:
         except Exception:
             pass  # Non-fatal
 
+    @profiled("git.amend", "git")
     def _commit_task_completion(self, task_id: str, epic_id: str | None) -> None:
         """Amend the task completion commit to include ledger files.
 
@@ -1196,11 +1278,12 @@ class RunLoop:
                 session_id=self.run_id,
             )
 
-            if async_hook:
-                run_hooks_async(hook_name, context, project_dir)
-                return True
-            else:
-                return run_hooks(hook_name, context, project_dir)
+            with span(f"hooks.{hook_name}", "hooks"):
+                if async_hook:
+                    run_hooks_async(hook_name, context, project_dir)
+                    return True
+                else:
+                    return run_hooks(hook_name, context, project_dir)
         except Exception:
             return False
 
@@ -1218,6 +1301,7 @@ class RunLoop:
         return max(percentages) if percentages else None
 
     @staticmethod
+    @profiled("git.current_commit", "git")
     def _get_current_commit() -> str | None:
         """Get current git commit hash."""
         try:
@@ -50,6 +50,7 @@ class RunConfig:
         session_name: Session name for tracking (auto-generated if None).
         stream: Stream harness output in real-time.
         debug: Enable debug logging.
+        retain_session: Keep one harness session alive across an epic's tasks.
         max_iterations: Maximum loop iterations (from config or --once).
         max_task_iterations: Maximum retries per task (from guardrails).
         on_task_failure: What to do on task failure ("stop" or "continue").
@@ -63,6 +64,7 @@ class RunConfig:
         hooks_fail_fast: Whether hook failures stop the run.
         sync_enabled: Whether to auto-sync task state.
         iteration_warning_threshold: Budget warning threshold (0.0–1.0).
+        profile: Record timing spans to the run's ledger directory.
         project_dir: Project directory path (as string for serializability).
     """
 
@@ -83,6 +85,7 @@ class RunConfig:
     session_name: str | None = None
     stream: bool = False
     debug: bool = False
+    retain_session: bool = False
 
     # Loop limits
     max_iterations: int = 100
@@ -105,6 +108,7 @@ class RunConfig:
     hooks_fail_fast: bool = False
     sync_enabled: bool = False
     iteration_warning_threshold: float = 0.8
+    profile: bool = False
 
     # Project context
     project_dir: str = "."
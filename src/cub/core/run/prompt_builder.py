@@ -10,9 +10,20 @@ Context Composition Hierarchy:
     3. Epic context - generated from task backend
     4. Retry context - generated from ledger
 
+Prefix Stability:
+    Providers cache prompts by exact prefix, so sections are laid out from
+    most to least stable (project, plan, epic, task) and normalized so the
+    same inputs always render to the same bytes. Everything before the
+    first task-specific section is the cacheable prefix; its hash is
+    recorded on each ledger attempt so cache misses can be traced to a
+    changed prefix.
+
 Key functions:
     generate_system_prompt: Builds the system prompt from project context files
     generate_task_prompt: Builds the full task prompt with context
+    build_system_prompt: Builds the system prompt as a PromptLayout
+    build_task_prompt: Builds the task prompt as a PromptLayout
+    hash_prompt_prefix: Hashes a cacheable prompt prefix
     generate_direct_task_prompt: Builds a task prompt for direct mode
     generate_epic_context: Builds epic context for tasks in an epic
     generate_retry_context: Builds retry context for previously-failed tasks
@@ -21,11 +32,16 @@ Key functions:
 Data models:
     PromptConfig: Configuration inputs for system prompt generation
     TaskPrompt: Structured output from task prompt generation
+    PromptSection: One section of a prompt, tagged with its stability
+    PromptLayout: Sections ordered from most to least stable
 """
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from enum import IntEnum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -97,6 +113,97 @@ class TaskPrompt:
     has_retry_context: bool = False
 
 
+class PromptStability(IntEnum):
+    """How often a prompt section changes, from most to least stable."""
+
+    PROJECT = 0  # Changes only when project files are edited
+    PLAN = 1  # Shared by every task in a plan
+    EPIC = 2  # Shared by every task in an epic
+    TASK = 3  # Differs for every task or attempt
+
+
+@dataclass(frozen=True)
+class PromptSection:
+    """One section of a prompt.
+
+    Attributes:
+        name: Section identifier (e.g. ``"runloop"``, ``"current-task"``).
+        text: Section content.
+        stability: How often the content changes.
+    """
+
+    name: str
+    text: str
+    stability: PromptStability
+
+
+@dataclass(frozen=True)
+class PromptLayout:
+    """A prompt's sections in render order, most stable first.
+
+    Build with :meth:`compose`, which normalizes each section and sorts by
+    stability (keeping the given order within a tier), so equal inputs
+    always render byte-identical text.
+
+    Attributes:
+        sections: Normalized, non-empty sections in render order.
+    """
+
+    sections: tuple[PromptSection, ...] = ()
+
+    @classmethod
+    def compose(cls, sections: Iterable[PromptSection]) -> PromptLayout:
+        """Normalize and order sections, dropping empty ones."""
+        normalized = [
+            PromptSection(s.name, normalize_prompt_text(s.text), s.stability) for s in sections
+        ]
+        ordered = sorted((s for s in normalized if s.text), key=lambda s: s.stability)
+        return cls(tuple(ordered))
+
+    @property
+    def text(self) -> str:
+        """The rendered prompt."""
+        return _SECTION_SEPARATOR.join(s.text for s in self.sections)
+
+    @property
+    def prefix(self) -> str:
+        """Rendered text before the first task-specific section."""
+        return _SECTION_SEPARATOR.join(
+            s.text for s in self.sections if s.stability < PromptStability.TASK
+        )
+
+    @property
+    def prefix_hash(self) -> str:
+        """Hash of :attr:`prefix`."""
+        return hash_prompt_prefix(self.prefix)
+
+
+_SECTION_SEPARATOR = "\n\n"
+
+
+def normalize_prompt_text(text: str) -> str:
+    """Normalize text so equivalent content renders to identical bytes.
+
+    Converts line endings to ``\\n``, strips trailing whitespace from each
+    line and drops leading and trailing blank lines.
+    """
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def hash_prompt_prefix(*parts: str) -> str:
+    """Hash a prompt prefix made of one or more rendered parts.
+
+    Returns:
+        First 16 hex digits of the SHA-256 of the parts, in order.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
 # ---------------------------------------------------------------------------
 # Fallback prompt
 # ---------------------------------------------------------------------------
@@ -145,23 +252,19 @@ def load_plan_context(project_dir: Path, plan_slug: str) -> str | None:
 # ---------------------------------------------------------------------------
 
 
-def generate_system_prompt(project_dir: Path, plan_slug: str | None = None) -> str:
-    """Generate the system prompt for the harness.
+def build_system_prompt(project_dir: Path, plan_slug: str | None = None) -> PromptLayout:
+    """Build the system prompt as an ordered layout.
 
-    Searches for prompt files in priority order and returns the first found.
-    If a plan_slug is provided, plan-level context is appended.
-    Falls back to a minimal hardcoded prompt if nothing is found.
-
-    Context Composition:
-    1. System runloop (.cub/runloop.md) - core loop instructions
-    2. Plan context (plans/<slug>/prompt-context.md) - if plan_slug provided
+    See :func:`generate_system_prompt` for how the content is chosen.
+    The whole system prompt is prefix: it contains no task-specific
+    sections, so every task in a run shares it.
 
     Args:
         project_dir: Path to the project root directory.
         plan_slug: Optional plan slug to inject plan-level context.
 
     Returns:
-        System prompt content with optional plan context.
+        PromptLayout with the runloop and any plan context.
     """
     config = PromptConfig(project_dir=project_dir, plan_slug=plan_slug)
 
@@ -171,14 +274,36 @@ def generate_system_prompt(project_dir: Path, plan_slug: str | None = None) -> s
         if prompt_file.exists():
             system_prompt = prompt_file.read_text(encoding="utf-8")
             break
+    sections = [PromptSection("runloop", system_prompt, PromptStability.PROJECT)]
 
     # Inject plan context if available
     if plan_slug:
         plan_context = load_plan_context(project_dir, plan_slug)
         if plan_context:
-            system_prompt = f"{system_prompt}\n\n{plan_context}"
+            sections.append(PromptSection("plan-context", plan_context, PromptStability.PLAN))
+
+    return PromptLayout.compose(sections)
+
+
+def generate_system_prompt(project_dir: Path, plan_slug: str | None = None) -> str:
+    """Generate the system prompt for the harness.
+
+    Searches for prompt files in priority order and returns the first found.
+    If a plan_slug is provided, plan-level context is appended.
+    Falls back to a minimal hardcoded prompt if nothing is found.
 
-    return system_prompt
+    Context Composition:
+    1. System runloop (.cub/runloop.md) - core loop instructions
+    2. Plan context (plans/<slug>/prompt-context.md) - if plan_slug provided
+
+    Args:
+        project_dir: Path to the project root directory.
+        plan_slug: Optional plan slug to inject plan-level context.
+
+    Returns:
+        System prompt content with optional plan context.
+    """
+    return build_system_prompt(project_dir, plan_slug).text
 
 
 # ---------------------------------------------------------------------------
@@ -234,18 +359,26 @@ def generate_epic_context(task: Task, task_backend: TaskBackend) -> str | None:
     Returns:
         Epic context string, or ``None`` if task has no parent epic.
     """
+    sections = _epic_sections(task, task_backend)
+    if not sections:
+        return None
+    return "\n".join(section.text for section in sections)
+
+
+def _epic_sections(task: Task, task_backend: TaskBackend) -> list[PromptSection]:
+    """Build the epic summary (shared by siblings) and sibling progress sections."""
     from cub.core.tasks.models import TaskStatus
 
     # Skip if task has no parent
     if not task.parent:
-        return None
+        return []
 
     # Fetch the parent epic
     epic = task_backend.get_task(task.parent)
     if not epic:
-        return None
+        return []
 
-    # Build epic context
+    # Build epic summary; identical for every task in the epic
     context_parts: list[str] = []
     context_parts.append("## Epic Context\n")
     context_parts.append(f"This task belongs to epic: **{epic.id}** - {epic.title}\n")
@@ -260,6 +393,7 @@ def generate_epic_context(task: Task, task_backend: TaskBackend) -> str | None:
         context_parts.append("Epic Purpose:")
         context_parts.append(truncated)
         context_parts.append("")
+    sections = [PromptSection("epic", "\n".join(context_parts), PromptStability.EPIC)]
 
     # Fetch sibling tasks (all tasks with same parent)
     sibling_tasks = task_backend.list_tasks(parent=task.parent)
@@ -269,20 +403,27 @@ def generate_epic_context(task: Task, task_backend: TaskBackend) -> str | None:
         completed = [t for t in sibling_tasks if t.status == TaskStatus.CLOSED]
         remaining = [t for t in sibling_tasks if t.status != TaskStatus.CLOSED and t.id != task.id]
 
+        progress_parts: list[str] = []
         if completed:
-            context_parts.append("Completed Sibling Tasks:")
+            progress_parts.append("Completed Sibling Tasks:")
             for t in completed:
-                context_parts.append(f"- ✓ {t.id}: {t.title}")
-            context_parts.append("")
+                progress_parts.append(f"- ✓ {t.id}: {t.title}")
+            progress_parts.append("")
 
         if remaining:
-            context_parts.append("Remaining Sibling Tasks:")
+            progress_parts.append("Remaining Sibling Tasks:")
             for t in remaining:
                 status_icon = "◐" if t.status == TaskStatus.IN_PROGRESS else "○"
-                context_parts.append(f"- {status_icon} {t.id}: {t.title}")
-            context_parts.append("")
+                progress_parts.append(f"- {status_icon} {t.id}: {t.title}")
+            progress_parts.append("")
 
-    return "\n".join(context_parts)
+        if progress_parts:
+            # Changes as siblings close, so it belongs with the task sections
+            sections.append(
+                PromptSection("epic-progress", "\n".join(progress_parts), PromptStability.TASK)
+            )
+
+    return sections
 
 
 # ---------------------------------------------------------------------------
@@ -387,15 +528,17 @@ def generate_retry_context(
 # ---------------------------------------------------------------------------
 
 
-def generate_task_prompt(
+def build_task_prompt(
     task: Task,
     task_backend: TaskBackend,
     ledger_integration: LedgerIntegration | None = None,
-) -> str:
-    """Generate the full task prompt for a specific task.
+) -> PromptLayout:
+    """Build the task prompt as an ordered layout.
 
-    Combines task details, acceptance criteria, epic context, retry context,
-    and backend-specific management instructions into a single prompt.
+    The epic summary, shared by every task in the epic, comes first so
+    consecutive tasks share a prefix. Sibling progress, the task itself,
+    retry context, task management instructions (which name the task) and
+    the completion workflow follow.
 
     Args:
         task: Task to generate prompt for.
@@ -403,51 +546,79 @@ def generate_task_prompt(
         ledger_integration: Optional ledger integration for retry context.
 
     Returns:
-        Rendered task prompt string.
+        PromptLayout for the task.
     """
-    # Build the task prompt
-    prompt_parts: list[str] = []
-
-    # Add task header
-    prompt_parts.append("## CURRENT TASK\n")
-    prompt_parts.append(f"Task ID: {task.id}")
-    prompt_parts.append(f"Type: {task.type.value if hasattr(task.type, 'value') else task.type}")
-    prompt_parts.append(f"Title: {task.title}\n")
+    sections = _epic_sections(task, task_backend)
 
-    # Add description
-    prompt_parts.append("Description:")
-    prompt_parts.append(task.description or "(No description provided)")
-    prompt_parts.append("")
+    # Add task header and description
+    task_type_str = task.type.value if hasattr(task.type, "value") else task.type
+    task_parts: list[str] = []
+    task_parts.append("## CURRENT TASK\n")
+    task_parts.append(f"Task ID: {task.id}")
+    task_parts.append(f"Type: {task_type_str}")
+    task_parts.append(f"Title: {task.title}\n")
+    task_parts.append("Description:")
+    task_parts.append(task.description or "(No description provided)")
 
     # Add acceptance criteria if present
     if task.acceptance_criteria:
-        prompt_parts.append("Acceptance Criteria:")
+        task_parts.append("")
+        task_parts.append("Acceptance Criteria:")
         for criterion in task.acceptance_criteria:
-            prompt_parts.append(f"- {criterion}")
-        prompt_parts.append("")
-
-    # Add epic context if available
-    epic_ctx = generate_epic_context(task, task_backend)
-    if epic_ctx:
-        prompt_parts.append(epic_ctx)
+            task_parts.append(f"- {criterion}")
+    sections.append(PromptSection("current-task", "\n".join(task_parts), PromptStability.TASK))
 
     # Add retry context if available
-    retry_ctx: str | None = None
     if ledger_integration:
         retry_ctx = generate_retry_context(task, ledger_integration)
         if retry_ctx:
-            prompt_parts.append(retry_ctx)
+            sections.append(PromptSection("retry", retry_ctx, PromptStability.TASK))
 
     # Add backend-specific task management instructions
-    prompt_parts.append("## Task Management\n")
-    prompt_parts.append(task_backend.get_agent_instructions(task.id))
-    prompt_parts.append("")
+    sections.append(
+        PromptSection(
+            "task-management",
+            "## Task Management\n\n" + task_backend.get_agent_instructions(task.id),
+            PromptStability.TASK,
+        )
+    )
 
     # Add completion workflow (backend-agnostic)
-    task_type_str = task.type.value if hasattr(task.type, "value") else task.type
-    prompt_parts.append("## When Complete\n")
-    prompt_parts.append("1. Run feedback loops (typecheck, test, lint)")
-    prompt_parts.append("2. Mark the task complete (see Task Management above)")
-    prompt_parts.append(f"3. Commit: `{task_type_str}({task.id}): {task.title}`")
+    sections.append(
+        PromptSection(
+            "when-complete",
+            "\n".join(
+                [
+                    "## When Complete\n",
+                    "1. Run feedback loops (typecheck, test, lint)",
+                    "2. Mark the task complete (see Task Management above)",
+                    f"3. Commit: `{task_type_str}({task.id}): {task.title}`",
+                ]
+            ),
+            PromptStability.TASK,
+        )
+    )
 
-    return "\n".join(prompt_parts)
+    return PromptLayout.compose(sections)
+
+
+def generate_task_prompt(
+    task: Task,
+    task_backend: TaskBackend,
+    ledger_integration: LedgerIntegration | None = None,
+) -> str:
+    """Generate the full task prompt for a specific task.
+
+    Combines epic context, task details, acceptance criteria, retry context,
+    and backend-specific management instructions into a single prompt,
+    ordered by :func:`build_task_prompt`.
+
+    Args:
+        task: Task to generate prompt for.
+        task_backend: The task backend instance.
+        ledger_integration: Optional ledger integration for retry context.
+
+    Returns:
+        Rendered task prompt string.
+    """
+    return build_task_prompt(task, task_backend, ledger_integration).text
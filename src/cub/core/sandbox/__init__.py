@@ -44,6 +44,7 @@ from .models import (
     SandboxState,
     SandboxStatus,
 )
+from .pool import SandboxPool
 from .provider import (
     SandboxProvider,
     detect_provider,
@@ -77,6 +78,8 @@ __all__ = [
     "list_available_providers",
     "is_provider_available",
     "get_capabilities",
+    # Warm container pool
+    "SandboxPool",
     # State management
     "ActiveSandbox",
     "save_sandbox_state",
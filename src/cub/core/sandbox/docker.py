@@ -3,15 +3,31 @@ Docker-based sandbox provider.
 
 This module implements the SandboxProvider protocol for Docker,
 providing isolated execution environments using Docker containers.
+
+Projects in a git repository are seeded copy-on-write: a base volume
+holding a copy of the project is kept per commit, and each sandbox's
+/project is an overlay of a small per-sandbox upper volume on that base.
+Only files that changed since the base was copied are seeded into the
+upper layer, and diff/export only look at what the upper layer holds.
+Projects without a commit, or daemons that can't mount overlay volumes,
+get a full copy of the project instead.
 """
 
+import io
 import json
+import logging
 import shutil
 import subprocess
+import tarfile
+import tempfile
 import time
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+from cub.core.ledger.models import ResourceTelemetry
+from cub.core.telemetry import DockerStatsSampler
 
 from .models import (
     ResourceUsage,
@@ -21,6 +37,33 @@ from .models import (
     SandboxStatus,
 )
 from .provider import register_provider
+from .seed import (
+    Manifest,
+    TreeDelta,
+    diff_trees,
+    head_commit,
+    load_manifest,
+    manifest_path,
+    project_key,
+    save_manifest,
+    snapshot_tree,
+)
+
+logger = logging.getLogger(__name__)
+
+# Label on base volumes; value is the project key
+BASE_LABEL = "cub.sandbox.base-of"
+
+# Label on a sandbox's overlay volume; value is the base volume beneath it
+LOWER_LABEL = "cub.sandbox.lower"
+
+# File at the end of a delta's tar stream listing the deleted paths,
+# NUL-separated (a long list would overflow the command line as arguments)
+DELETED_LIST = ".cub-sandbox-deleted"
+
+# Runs the command that follows with NUL-separated paths read from stdin
+# as extra arguments, in as many batches as the command line allows
+XARGS_NUL = "xargs -0 -r"
 
 
 @register_provider("docker")
@@ -33,7 +76,11 @@ class DockerProvider:
     - Network isolation option
     - Resource limits (memory, CPU)
     - Security hardening (no-new-privileges)
-    - Fast startup (~2-5s)
+    - Fast startup (~2-5s), with copy-on-write seeding from a
+      per-commit base volume
+
+    Set ``provider_opts["seed"] = "copy"`` to always copy the whole
+    project instead.
     """
 
     # Default Docker image for sandbox execution
@@ -43,6 +90,11 @@ class DockerProvider:
     DEFAULT_MEMORY = "4g"
     DEFAULT_CPUS = 2.0
 
+    def __init__(self) -> None:
+        """Initialize the provider."""
+        # Open telemetry streams by sandbox ID
+        self._samplers: dict[str, DockerStatsSampler] = {}
+
     @property
     def name(self) -> str:
         """Provider name."""
@@ -91,8 +143,9 @@ class DockerProvider:
         """
         Start a new Docker sandbox with the project.
 
-        Creates a Docker volume, copies the project to it, and starts
-        a container running cub.
+        Seeds a volume with the project (copy-on-write from a per-commit
+        base where possible, otherwise a full copy) and starts a container
+        running cub on it.
 
         Args:
             project_dir: Local project directory to sandbox
@@ -108,31 +161,13 @@ class DockerProvider:
         sandbox_id = f"cub-sandbox-{int(time.time())}"
         volume_name = f"{sandbox_id}_work"
 
-        # Get configuration values with defaults
-        image = str(config.provider_opts.get("image", self.DEFAULT_IMAGE))
-        memory = config.memory or self.DEFAULT_MEMORY
-        cpus = config.cpus or self.DEFAULT_CPUS
+        seed = str(config.provider_opts.get("seed", "overlay"))
 
         try:
-            # Create Docker volume
-            self._run_docker(["volume", "create", volume_name])
-
-            # Copy project to volume using alpine container
-            project_path = str(project_dir.resolve())
-            self._run_docker(
-                [
-                    "run",
-                    "--rm",
-                    "-v",
-                    f"{project_path}:/source:ro",
-                    "-v",
-                    f"{volume_name}:/dest",
-                    "alpine",
-                    "sh",
-                    "-c",
-                    "cp -a /source/. /dest/",
-                ]
-            )
+            # Seed the project volume
+            if seed != "overlay" or not self._seed_overlay(project_dir, sandbox_id):
+                self.run_docker(["volume", "create", volume_name])
+                self._copy_project(project_dir, volume_name)
 
             # Build container run command
             docker_cmd = [
@@ -142,40 +177,21 @@ class DockerProvider:
                 "--detach",
                 "-v",
                 f"{volume_name}:/project",
-                "-w",
-                "/project",
-                "--memory",
-                memory,
-                f"--cpus={cpus}",
-                "--security-opt",
-                "no-new-privileges",
-                "--pids-limit",
-                "256",
+                *self.container_args(config),
             ]
 
-            # Network isolation
-            if not config.network:
-                docker_cmd.extend(["--network", "none"])
-
-            # Environment variables
-            for key, value in config.env.items():
-                docker_cmd.extend(["-e", f"{key}={value}"])
-
-            # Add image
-            docker_cmd.append(image)
-
             # Add cub run command with any cub_args
             docker_cmd.extend(["cub", "run"])
             docker_cmd.extend(config.cub_args)
 
             # Launch container
-            self._run_docker(docker_cmd)
+            self.run_docker(docker_cmd)
 
             return sandbox_id
 
         except subprocess.CalledProcessError as e:
             # Cleanup on failure
-            self._cleanup_resources(sandbox_id, volume_name, ignore_errors=True)
+            self.cleanup_resources(sandbox_id, volume_name, ignore_errors=True)
             raise RuntimeError(f"Failed to start sandbox: {e.stderr}") from e
 
     def stop(self, sandbox_id: str) -> None:
@@ -193,7 +209,7 @@ class DockerProvider:
             raise ValueError(f"Sandbox not found: {sandbox_id}")
 
         try:
-            self._run_docker(["stop", sandbox_id])
+            self.run_docker(["stop", sandbox_id])
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to stop sandbox: {e.stderr}") from e
 
@@ -215,7 +231,7 @@ class DockerProvider:
 
         # Get container inspect data
         try:
-            result = self._run_docker(
+            result = self.run_docker(
                 [
                     "inspect",
                     sandbox_id,
@@ -251,10 +267,16 @@ class DockerProvider:
             if not finished.startswith("0001-"):
                 stopped_at = self._parse_docker_timestamp(finished)
 
-        # Get resource usage for running containers
+        # Get resource usage for running containers, from the telemetry
+        # stream if one is open rather than a one-off docker stats
         resources = None
         if state == SandboxState.RUNNING:
-            resources = self._get_resource_usage(sandbox_id)
+            sampler = self._samplers.get(sandbox_id)
+            stats = sampler.latest_stats if sampler is not None else None
+            if stats is not None:
+                resources = self._parse_stats(stats)
+            else:
+                resources = self._get_resource_usage(sandbox_id)
 
         # Get exit code
         exit_code = state_data.get("ExitCode")
@@ -312,7 +334,7 @@ class DockerProvider:
             return self._stream_logs(cmd, callback)
         else:
             # Get all logs at once
-            result = self._run_docker(cmd, check=False)
+            result = self.run_docker(cmd, check=False)
             output = result.stdout + result.stderr
             return output
 
@@ -320,7 +342,9 @@ class DockerProvider:
         """
         Get changes made in sandbox.
 
-        Runs git diff inside the container to get all file changes.
+        Runs git diff inside the container to get all file changes. For
+        copy-on-write sandboxes the diff is limited to paths present in
+        the upper layer, since nothing else can have changed.
 
         Args:
             sandbox_id: Sandbox to diff
@@ -334,21 +358,23 @@ class DockerProvider:
         if not self._container_exists(sandbox_id):
             raise ValueError(f"Sandbox not found: {sandbox_id}")
 
+        upper_paths = self._upper_paths(sandbox_id)
+        if upper_paths == []:
+            return ""
+        # The upper layer's paths go to git on stdin, since there can be
+        # more of them than fit on a command line
+        paths = _nul_list(upper_paths) if upper_paths is not None else None
+
         # Check if container is running
         status = self.status(sandbox_id)
         if status.state == SandboxState.RUNNING:
             # Execute git diff in running container
+            if paths is None:
+                cmd = ["exec", sandbox_id, "git", "diff", "HEAD"]
+            else:
+                cmd = ["exec", "-i", sandbox_id, "sh", "-c", f"{XARGS_NUL} git diff HEAD --"]
             try:
-                result = self._run_docker(
-                    [
-                        "exec",
-                        sandbox_id,
-                        "git",
-                        "diff",
-                        "HEAD",
-                    ],
-                    check=False,
-                )
+                result = self.run_docker(cmd, check=False, input=paths)
                 return result.stdout
             except subprocess.CalledProcessError:
                 pass
@@ -356,21 +382,13 @@ class DockerProvider:
         # For stopped containers, we need to start a temporary container
         # with the same volume to get the diff
         volume_name = f"{sandbox_id}_work"
+        cmd = ["run", "--rm", "-v", f"{volume_name}:/project", "-w", "/project"]
+        if paths is None:
+            cmd += ["alpine/git", "diff", "HEAD"]
+        else:
+            cmd += ["-i", "--entrypoint", "sh", "alpine/git", "-c", f"{XARGS_NUL} git diff HEAD --"]
         try:
-            result = self._run_docker(
-                [
-                    "run",
-                    "--rm",
-                    "-v",
-                    f"{volume_name}:/project",
-                    "-w",
-                    "/project",
-                    "alpine/git",
-                    "diff",
-                    "HEAD",
-                ],
-                check=False,
-            )
+            result = self.run_docker(cmd, check=False, input=paths)
             return result.stdout
         except subprocess.CalledProcessError:
             return ""
@@ -400,10 +418,14 @@ class DockerProvider:
         dest_path.mkdir(parents=True, exist_ok=True)
         volume_name = f"{sandbox_id}_work"
 
-        if changed_only:
+        upper_paths = self._upper_paths(sandbox_id) if changed_only else None
+        if upper_paths is not None:
+            self._export_upper(sandbox_id, dest_path, upper_paths)
+
+        elif changed_only:
             # Get list of changed files
             try:
-                result = self._run_docker(
+                result = self.run_docker(
                     [
                         "run",
                         "--rm",
@@ -434,7 +456,7 @@ class DockerProvider:
                 # Copy file from volume
                 try:
                     cp_cmd = f"cp '/project/{filepath}' '/dest/{filepath}' 2>/dev/null || true"
-                    self._run_docker(
+                    self.run_docker(
                         [
                             "run",
                             "--rm",
@@ -454,7 +476,7 @@ class DockerProvider:
         else:
             # Copy entire project
             try:
-                self._run_docker(
+                self.run_docker(
                     [
                         "run",
                         "--rm",
@@ -485,14 +507,45 @@ class DockerProvider:
         """
         volume_name = f"{sandbox_id}_work"
 
-        # Check if container or volume exists
+        # Check if container or volume exists (base volumes are shared
+        # between sandboxes and kept)
         container_exists = self._container_exists(sandbox_id)
         volume_exists = self._volume_exists(volume_name)
 
         if not container_exists and not volume_exists:
             raise ValueError(f"Sandbox not found: {sandbox_id}")
 
-        self._cleanup_resources(sandbox_id, volume_name, ignore_errors=False)
+        self.cleanup_resources(sandbox_id, volume_name, ignore_errors=False)
+
+    def start_telemetry(self, sandbox_id: str) -> None:
+        """
+        Start streaming resource telemetry for a sandbox.
+
+        Keeps one ``docker stats`` stream open until stop_telemetry();
+        status() reads resource usage from it meanwhile.
+
+        Args:
+            sandbox_id: Sandbox to sample
+        """
+        if sandbox_id in self._samplers:
+            return
+        sampler = DockerStatsSampler(sandbox_id)
+        sampler.start()
+        self._samplers[sandbox_id] = sampler
+
+    def stop_telemetry(self, sandbox_id: str) -> ResourceTelemetry | None:
+        """
+        Stop a sandbox's telemetry stream.
+
+        Args:
+            sandbox_id: Sandbox being sampled
+
+        Returns:
+            Peak memory, CPU-seconds, block I/O and a compact time series,
+            or None if nothing was sampled
+        """
+        sampler = self._samplers.pop(sandbox_id, None)
+        return sampler.stop() if sampler is not None else None
 
     def get_version(self) -> str:
         """
@@ -502,19 +555,384 @@ class DockerProvider:
             Docker version string or 'unknown'
         """
         try:
-            result = self._run_docker(["version", "--format", "{{.Server.Version}}"])
+            result = self.run_docker(["version", "--format", "{{.Server.Version}}"])
             return result.stdout.strip()
         except subprocess.CalledProcessError:
             return "unknown"
 
     # =========================================================================
-    # Private helpers
+    # Project seeding
+    # =========================================================================
+
+    def _copy_project(self, project_dir: Path, volume_name: str) -> None:
+        """Copy the whole project into a volume using an alpine container."""
+        project_path = str(project_dir.resolve())
+        self.run_docker(
+            [
+                "run",
+                "--rm",
+                "-v",
+                f"{project_path}:/source:ro",
+                "-v",
+                f"{volume_name}:/dest",
+                "alpine",
+                "sh",
+                "-c",
+                "cp -a /source/. /dest/",
+            ]
+        )
+
+    def _seed_overlay(self, project_dir: Path, sandbox_id: str) -> bool:
+        """
+        Seed a sandbox's project volume copy-on-write.
+
+        Creates ``<sandbox>_upper`` for the sandbox's writes and
+        ``<sandbox>_work``, an overlay of it on the base volume for the
+        project's HEAD commit, then copies in files changed since the base
+        was taken.
+
+        Returns:
+            False if copy-on-write isn't possible (no commit, or the daemon
+            can't mount overlay volumes) and a full copy is needed
+
+        Raises:
+            subprocess.CalledProcessError: If building the base volume fails
+        """
+        commit = head_commit(project_dir)
+        if commit is None:
+            return False
+        project_dir = project_dir.resolve()
+        base = self.ensure_base(project_dir, commit)
+        if base is None:
+            return False
+        base_name, manifest = base
+
+        volume_name = f"{sandbox_id}_work"
+        upper_name = f"{sandbox_id}_upper"
+        try:
+            self.run_docker(["volume", "create", upper_name])
+            self.run_docker(
+                [
+                    "run",
+                    "--rm",
+                    "-v",
+                    f"{upper_name}:/upper",
+                    "alpine",
+                    "mkdir",
+                    "-p",
+                    "/upper/data",
+                    "/upper/work",
+                ]
+            )
+            lower_dir = self._volume_mountpoint(base_name)
+            upper_dir = self._volume_mountpoint(upper_name)
+            self.run_docker(
+                [
+                    "volume",
+                    "create",
+                    "--driver",
+                    "local",
+                    "--label",
+                    f"{LOWER_LABEL}={base_name}",
+                    "--opt",
+                    "type=overlay",
+                    "--opt",
+                    "device=overlay",
+                    "--opt",
+                    f"o=lowerdir={lower_dir},upperdir={upper_dir}/data,workdir={upper_dir}/work",
+                    volume_name,
+                ]
+            )
+            # The overlay is only mounted when a container uses it, so
+            # seeding the delta also checks that the mount works
+            self._seed_delta(
+                volume_name, project_dir, diff_trees(manifest, snapshot_tree(project_dir))
+            )
+        except (subprocess.CalledProcessError, OSError):
+            logger.info("Overlay seeding failed; falling back to a full copy", exc_info=True)
+            self.run_docker(["volume", "rm", volume_name], check=False)
+            self.run_docker(["volume", "rm", upper_name], check=False)
+            return False
+        return True
+
+    def ensure_base(self, project_dir: Path, commit: str) -> tuple[str, Manifest] | None:
+        """
+        Get (building if needed) the base volume for a project commit.
+
+        Returns:
+            Base volume name and the manifest of what it contains, or None
+            if an existing base can't be used or replaced
+        """
+        key = project_key(project_dir)
+        base_name = f"cub-base-{key}-{commit[:12]}"
+        manifest_file = manifest_path(project_dir, base_name)
+
+        manifest = load_manifest(manifest_file)
+        if self._volume_exists(base_name):
+            if manifest is not None:
+                return base_name, manifest
+            # Contents unknown; only replace it if no sandbox sits on it
+            if self._base_in_use(base_name):
+                return None
+            self.run_docker(["volume", "rm", base_name], check=False)
+
+        # Snapshot before copying: a file modified mid-copy then looks
+        # changed and is re-seeded, rather than silently missed
+        manifest = snapshot_tree(project_dir)
+        self.run_docker(["volume", "create", "--label", f"{BASE_LABEL}={key}", base_name])
+        try:
+            self._copy_project(project_dir, base_name)
+        except subprocess.CalledProcessError:
+            self.run_docker(["volume", "rm", base_name], check=False)
+            raise
+        try:
+            save_manifest(manifest_file, manifest)
+        except OSError:
+            # The base still works for this sandbox; later ones rebuild it
+            # or fall back to a full copy
+            logger.debug("Failed to save sandbox base manifest", exc_info=True)
+        self.prune_bases(project_dir, key, keep=base_name)
+        return base_name, manifest
+
+    def prune_bases(self, project_dir: Path, key: str, keep: str) -> None:
+        """Remove a project's older base volumes that no sandbox sits on."""
+        result = self.run_docker(
+            ["volume", "ls", "-q", "--filter", f"label={BASE_LABEL}={key}"],
+            check=False,
+        )
+        for name in result.stdout.split():
+            if name == keep or self._base_in_use(name):
+                continue
+            self.run_docker(["volume", "rm", name], check=False)
+            manifest_path(project_dir, name).unlink(missing_ok=True)
+
+    def _base_in_use(self, base_name: str) -> bool:
+        """Check whether any sandbox's overlay volume sits on a base."""
+        result = self.run_docker(
+            ["volume", "ls", "-q", "--filter", f"label={LOWER_LABEL}={base_name}"],
+            check=False,
+        )
+        return bool(result.stdout.strip())
+
+    def _volume_mountpoint(self, volume_name: str) -> str:
+        """Get a volume's directory on the Docker host."""
+        result = self.run_docker(["volume", "inspect", "--format", "{{.Mountpoint}}", volume_name])
+        return result.stdout.strip()
+
+    def _seed_delta(self, volume_name: str, project_dir: Path, delta: TreeDelta) -> None:
+        """
+        Apply a working tree delta to a project volume.
+
+        Changed files are streamed in as a tar archive; deleted files are
+        removed (leaving whiteouts in an overlay's upper layer).
+
+        Raises:
+            subprocess.CalledProcessError: If the seeding container fails
+            OSError: If the docker command can't be run
+        """
+        self.stream_delta(
+            ["docker", "run", "--rm", "-i", "-v", f"{volume_name}:/project", "alpine"],
+            project_dir,
+            delta,
+        )
+
+    def stream_delta(self, prefix: list[str], project_dir: Path, delta: TreeDelta) -> None:
+        """
+        Stream a working tree delta into /project through a docker command.
+
+        Args:
+            prefix: Command that runs a shell with /project mounted
+                (``docker run ...`` or ``docker exec ...`` up to the program)
+            project_dir: Project the delta was taken from
+            delta: Files to copy in and delete
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails
+            OSError: If the command can't be run
+        """
+        cmd = [
+            *prefix,
+            "sh",
+            "-c",
+            f"tar -xf - -C /project && cd /project && {XARGS_NUL} rm -rf -- < {DELETED_LIST}"
+            f" && rm -f {DELETED_LIST}",
+        ]
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+            )
+            try:
+                assert process.stdin is not None
+                with tarfile.open(fileobj=process.stdin, mode="w|") as archive:
+                    for path in delta.changed:
+                        try:
+                            archive.add(project_dir / path, arcname=path, recursive=False)
+                        except FileNotFoundError:
+                            continue  # Removed since the snapshot
+                    deleted = b"".join(path.encode() + b"\0" for path in delta.deleted)
+                    info = tarfile.TarInfo(DELETED_LIST)
+                    info.size = len(deleted)
+                    info.mode = 0o600
+                    archive.addfile(info, io.BytesIO(deleted))
+                process.stdin.close()
+                returncode = process.wait(timeout=300)
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+            if returncode != 0:
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(
+                    returncode, cmd, "", stderr.read().decode("utf-8", "replace")
+                )
+
+    def _upper_paths(self, sandbox_id: str) -> list[str] | None:
+        """
+        List paths written in a copy-on-write sandbox's upper layer.
+
+        Deleted files appear too (as overlay whiteouts). Paths under .git
+        are left out. Paths are listed NUL-separated, so names with
+        newlines or surrounding whitespace come through intact.
+
+        Returns:
+            Relative paths, or None if the sandbox was seeded by full copy
+        """
+        upper_name = f"{sandbox_id}_upper"
+        if not self._volume_exists(upper_name):
+            return None
+        result = self.run_docker(
+            [
+                "run",
+                "--rm",
+                "-v",
+                f"{upper_name}:/upper:ro",
+                "-w",
+                "/upper/data",
+                "alpine",
+                "find",
+                ".",
+                "!",
+                "-type",
+                "d",
+                "-print0",
+            ],
+            check=False,
+        )
+        paths: list[str] = []
+        for entry in result.stdout.split("\0"):
+            path = entry.removeprefix("./")
+            if path and path != ".git" and not path.startswith(".git/"):
+                paths.append(path)
+        return paths
+
+    def _export_upper(self, sandbox_id: str, dest_path: Path, upper_paths: list[str]) -> None:
+        """
+        Export a copy-on-write sandbox's changed files from its upper layer.
+
+        Git narrows the upper layer's paths to those that differ from HEAD
+        (as a full-copy export would), then the files are copied straight
+        out of the upper volume in one container. Both steps read their
+        paths NUL-separated from stdin.
+        """
+        if not upper_paths:
+            return
+        result = self.run_docker(
+            [
+                "run",
+                "--rm",
+                "-i",
+                "-v",
+                f"{sandbox_id}_work:/project",
+                "-w",
+                "/project",
+                "--entrypoint",
+                "sh",
+                "alpine/git",
+                "-c",
+                f"{XARGS_NUL} git diff --name-only -z HEAD --",
+            ],
+            check=False,
+            input=_nul_list(upper_paths),
+        )
+        changed = [path for path in result.stdout.split("\0") if path]
+        if not changed:
+            return
+
+        # Whiteouts (deleted files) are character devices; skip them
+        copy_script = (
+            'for f in "$@"; do '
+            '{ [ -f "$f" ] || [ -L "$f" ]; } || continue; '
+            'mkdir -p "/dest/$(dirname "$f")" && cp -a "$f" "/dest/$f"; '
+            "done"
+        )
+        try:
+            self.run_docker(
+                [
+                    "run",
+                    "--rm",
+                    "-i",
+                    "-v",
+                    f"{sandbox_id}_upper:/upper:ro",
+                    "-v",
+                    f"{dest_path}:/dest",
+                    "-w",
+                    "/upper/data",
+                    "alpine",
+                    "sh",
+                    "-c",
+                    f"{XARGS_NUL} sh -c '{copy_script}' sh",
+                ],
+                input=_nul_list(changed),
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to export sandbox: {e.stderr}") from e
+
     # =========================================================================
+    # Docker building blocks (also used by SandboxPool)
+    # =========================================================================
+
+    def container_args(self, config: SandboxConfig) -> list[str]:
+        """
+        Build the ``docker run`` options and image shared by every sandbox.
 
-    def _run_docker(
+        Covers the working directory, resource limits, security options,
+        network isolation and environment, ending with the image name.
+        """
+        image = str(config.provider_opts.get("image", self.DEFAULT_IMAGE))
+        memory = config.memory or self.DEFAULT_MEMORY
+        cpus = config.cpus or self.DEFAULT_CPUS
+
+        args = [
+            "-w",
+            "/project",
+            "--memory",
+            memory,
+            f"--cpus={cpus}",
+            "--security-opt",
+            "no-new-privileges",
+            "--pids-limit",
+            "256",
+        ]
+
+        # Network isolation
+        if not config.network:
+            args.extend(["--network", "none"])
+
+        # Environment variables
+        for key, value in config.env.items():
+            args.extend(["-e", f"{key}={value}"])
+
+        args.append(image)
+        return args
+
+    def run_docker(
         self,
         args: list[str],
         check: bool = True,
+        input: str | None = None,
     ) -> subprocess.CompletedProcess[str]:
         """
         Run a docker command.
@@ -522,6 +940,7 @@ class DockerProvider:
         Args:
             args: Docker command arguments
             check: Raise on non-zero exit code
+            input: Text to send to the command's stdin (pass ``-i`` in args)
 
         Returns:
             CompletedProcess result
@@ -529,6 +948,7 @@ class DockerProvider:
         cmd = ["docker"] + args
         result = subprocess.run(
             cmd,
+            input=input,
             capture_output=True,
             text=True,
             timeout=300,  # 5 minute timeout
@@ -542,6 +962,40 @@ class DockerProvider:
             )
         return result
 
+    def cleanup_resources(
+        self,
+        sandbox_id: str,
+        volume_name: str,
+        ignore_errors: bool = True,
+    ) -> None:
+        """
+        Clean up container and volume.
+
+        Args:
+            sandbox_id: Container name
+            volume_name: Volume name
+            ignore_errors: Suppress errors during cleanup
+        """
+        # Stop and remove container
+        try:
+            self.run_docker(["rm", "-f", sandbox_id], check=False)
+        except subprocess.CalledProcessError:
+            if not ignore_errors:
+                raise
+
+        # Remove volume, then the upper layer of a copy-on-write sandbox
+        # (the overlay volume has to go first)
+        for name in (volume_name, f"{sandbox_id}_upper"):
+            try:
+                self.run_docker(["volume", "rm", name], check=False)
+            except subprocess.CalledProcessError:
+                if not ignore_errors:
+                    raise
+
+    # =========================================================================
+    # Private helpers
+    # =========================================================================
+
     def _stream_logs(
         self,
         cmd: list[str],
@@ -579,7 +1033,7 @@ class DockerProvider:
 
     def _container_exists(self, container_name: str) -> bool:
         """Check if a container exists."""
-        result = self._run_docker(
+        result = self.run_docker(
             ["ps", "-a", "--filter", f"name=^{container_name}$", "--format", "{{.Names}}"],
             check=False,
         )
@@ -587,7 +1041,7 @@ class DockerProvider:
 
     def _volume_exists(self, volume_name: str) -> bool:
         """Check if a volume exists."""
-        result = self._run_docker(
+        result = self.run_docker(
             ["volume", "ls", "--filter", f"name=^{volume_name}$", "--format", "{{.Name}}"],
             check=False,
         )
@@ -604,7 +1058,7 @@ class DockerProvider:
             ResourceUsage object or None if unavailable
         """
         try:
-            result = self._run_docker(
+            result = self.run_docker(
                 [
                     "stats",
                     sandbox_id,
@@ -618,35 +1072,37 @@ class DockerProvider:
             if not result.stdout.strip():
                 return None
 
-            stats = json.loads(result.stdout)
-
-            # Parse memory (e.g., "1.2GiB / 4GiB")
-            mem_usage = stats.get("MemUsage", "")
-            mem_used = None
-            mem_limit = None
-            if " / " in mem_usage:
-                parts = mem_usage.split(" / ")
-                mem_used = parts[0].strip()
-                mem_limit = parts[1].strip()
-
-            # Parse CPU (e.g., "45.23%")
-            cpu_str = stats.get("CPUPerc", "").rstrip("%")
-            cpu_percent = None
-            if cpu_str:
-                try:
-                    cpu_percent = float(cpu_str)
-                except ValueError:
-                    pass
-
-            return ResourceUsage(
-                memory_used=mem_used,
-                memory_limit=mem_limit,
-                cpu_percent=cpu_percent,
-            )
+            return self._parse_stats(json.loads(result.stdout))
 
         except (subprocess.CalledProcessError, json.JSONDecodeError):
             return None
 
+    def _parse_stats(self, stats: dict[str, Any]) -> ResourceUsage:
+        """Build ResourceUsage from one ``docker stats`` JSON record."""
+        # Parse memory (e.g., "1.2GiB / 4GiB")
+        mem_usage = str(stats.get("MemUsage", ""))
+        mem_used = None
+        mem_limit = None
+        if " / " in mem_usage:
+            parts = mem_usage.split(" / ")
+            mem_used = parts[0].strip()
+            mem_limit = parts[1].strip()
+
+        # Parse CPU (e.g., "45.23%")
+        cpu_str = str(stats.get("CPUPerc", "")).rstrip("%")
+        cpu_percent = None
+        if cpu_str:
+            try:
+                cpu_percent = float(cpu_str)
+            except ValueError:
+                pass
+
+        return ResourceUsage(
+            memory_used=mem_used,
+            memory_limit=mem_limit,
+            cpu_percent=cpu_percent,
+        )
+
     def _parse_docker_timestamp(self, timestamp: str) -> datetime | None:
         """
         Parse Docker timestamp to datetime.
@@ -676,30 +1132,7 @@ class DockerProvider:
         except ValueError:
             return None
 
-    def _cleanup_resources(
-        self,
-        sandbox_id: str,
-        volume_name: str,
-        ignore_errors: bool = True,
-    ) -> None:
-        """
-        Clean up container and volume.
-
-        Args:
-            sandbox_id: Container name
-            volume_name: Volume name
-            ignore_errors: Suppress errors during cleanup
-        """
-        # Stop and remove container
-        try:
-            self._run_docker(["rm", "-f", sandbox_id], check=False)
-        except subprocess.CalledProcessError:
-            if not ignore_errors:
-                raise
 
-        # Remove volume
-        try:
-            self._run_docker(["volume", "rm", volume_name], check=False)
-        except subprocess.CalledProcessError:
-            if not ignore_errors:
-                raise
+def _nul_list(paths: list[str]) -> str:
+    """Join paths for ``xargs -0``."""
+    return "".join(f"{path}\0" for path in paths)
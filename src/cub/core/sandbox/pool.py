@@ -0,0 +1,461 @@
+"""
+Warm container pool for Docker sandboxes.
+
+Starting a sandbox creates a container from the image, applies resource
+limits and security options, and brings up its network before cub runs.
+For repeated sandboxed runs of the same project, a SandboxPool keeps those
+containers started and idle between runs instead:
+
+- An idle pooled container runs a no-op command with the sandbox's limits
+  applied. Its ``<id>_work`` volume holds a fresh copy of the project's
+  base volume (see :mod:`cub.core.sandbox.seed`), which is mounted
+  read-only at /base.
+- ``acquire`` claims an idle container, seeds the files that changed since
+  the base was taken, and returns its sandbox ID. ``run`` then runs cub in
+  it with ``docker exec``.
+- ``release`` resets the work volume from /base and returns the container
+  to the pool, so the copy happens after a run rather than before the next.
+
+Pool state lives in Docker itself, so separate cub processes share a pool.
+A container is claimed by renaming it from its idle name to its sandbox
+ID; Docker renames are atomic, so two processes can't claim the same one.
+The idle name records when the container was released, which is what the
+idle TTL is measured against. The sandbox ID records the claiming process
+and when it claimed the container, so a container whose owner crashed or
+was killed before releasing it is removed once that process is gone or
+the claim TTL has passed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import secrets
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from .docker import LOWER_LABEL, DockerProvider
+from .models import SandboxConfig, SandboxState, SandboxStatus
+from .seed import diff_trees, head_commit, project_key, snapshot_tree
+
+logger = logging.getLogger(__name__)
+
+# Label on pooled containers and their volumes; value is the pool key
+POOL_LABEL = "cub.sandbox.pool"
+
+# Label on pooled containers; value is the commit their base was taken at
+COMMIT_LABEL = "cub.sandbox.commit"
+
+# Idle containers are named "<pool id>.idle-<released at>"
+IDLE_MARKER = ".idle-"
+
+# Containers in use are named "<pool id>.claim-<owner pid>-<claimed at>"
+CLAIM_MARKER = ".claim-"
+
+# What an idle pooled container runs: nothing, until it's stopped
+IDLE_COMMAND = ["sh", "-c", "trap 'exit 0' TERM; while :; do sleep 3600 & wait $!; done"]
+
+# Replace a work volume's contents with a fresh copy of the base
+RESET_SCRIPT = "find /project -mindepth 1 -delete && cp -a /base/. /project/"
+
+
+def pool_id(container_name: str) -> str:
+    """
+    The stable part of a pooled container's name.
+
+    It stays the same while the container is renamed between idle and in
+    use, and names the container's ``<pool id>_work`` volume.
+    """
+    return container_name.split(".", 1)[0]
+
+
+class PoolMember(NamedTuple):
+    """A pooled container as listed by Docker."""
+
+    name: str
+    pool: str
+    commit: str
+    running: bool
+
+    @property
+    def pool_id(self) -> str:
+        """The container's name without its idle or claim suffix."""
+        return pool_id(self.name)
+
+    @property
+    def idle_since(self) -> float | None:
+        """When the container was released, or None if it's in use."""
+        if IDLE_MARKER not in self.name:
+            return None
+        try:
+            return float(self.name.rsplit(IDLE_MARKER, 1)[1])
+        except ValueError:
+            return 0.0
+
+    @property
+    def claim(self) -> tuple[int, float] | None:
+        """Owner pid and claim time of a container in use, if recorded."""
+        if CLAIM_MARKER not in self.name:
+            return None
+        pid, _, claimed_at = self.name.rsplit(CLAIM_MARKER, 1)[1].partition("-")
+        try:
+            return int(pid), float(claimed_at)
+        except ValueError:
+            return 0, 0.0
+
+
+class SandboxPool:
+    """
+    Pool of warm Docker sandbox containers.
+
+    Example:
+        >>> pool = SandboxPool(DockerProvider(), max_size=4, idle_ttl=900)
+        >>> sandbox_id = pool.acquire(project_dir, config)
+        >>> if sandbox_id is None:
+        ...     sandbox_id = provider.start(project_dir, config)  # not poolable
+        >>> status = pool.run(sandbox_id, config, callback=print)
+        >>> pool.release(sandbox_id)
+    """
+
+    def __init__(
+        self,
+        provider: DockerProvider,
+        *,
+        max_size: int = 4,
+        idle_ttl: float = 900,
+        claim_ttl: float = 12 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create a pool.
+
+        Args:
+            provider: Docker provider used to build bases and run commands
+            max_size: Maximum number of pooled containers, idle or in use,
+                across all projects
+            idle_ttl: Seconds an idle container is kept before removal
+            claim_ttl: Seconds after which a container still in use is
+                assumed abandoned and removed, even if its owner is alive
+            clock: Time source (for tests)
+        """
+        self.provider = provider
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.claim_ttl = claim_ttl
+        self._clock = clock
+
+    def pool_key(self, project_dir: Path, config: SandboxConfig) -> str:
+        """
+        Identify the pool a sandbox can be served from.
+
+        Containers are only interchangeable if they were started for the
+        same project with the same image, limits, network and environment.
+        """
+        material = [str(project_dir.resolve()), self.provider.container_args(config)]
+        return hashlib.sha256(json.dumps(material).encode()).hexdigest()[:12]
+
+    def acquire(self, project_dir: Path, config: SandboxConfig) -> str | None:
+        """
+        Hand out a warm container for a project.
+
+        Claims an idle container from the project's pool, or starts a new
+        one if the pool has room, then seeds the files that changed since
+        the project's base volume was taken.
+
+        Args:
+            project_dir: Project to run in the sandbox
+            config: Sandbox configuration
+
+        Returns:
+            Sandbox ID, or None if the project can't be pooled (no commit,
+            or no usable base volume) or the pool is full of containers in
+            use; the caller should start a sandbox normally
+        """
+        commit = head_commit(project_dir)
+        if commit is None:
+            return None
+        project_dir = project_dir.resolve()
+        try:
+            base = self.provider.ensure_base(project_dir, commit)
+        except subprocess.CalledProcessError:
+            logger.info("Failed to build sandbox base volume; not pooling", exc_info=True)
+            return None
+        if base is None:
+            return None
+        base_name, manifest = base
+
+        key = self.pool_key(project_dir, config)
+        listed = self._members()
+        members = self._prune(listed, key, commit)
+        if len(members) < len(listed):
+            # Removed containers may have been the last users of an old base
+            self.provider.prune_bases(project_dir, project_key(project_dir), keep=base_name)
+
+        sandbox_id = self._claim(members, key, commit)
+        if sandbox_id is None:
+            if len(members) >= self.max_size and not self._evict_one(members):
+                return None
+            try:
+                sandbox_id = self._create(key, commit, base_name, config)
+            except subprocess.CalledProcessError:
+                logger.info("Failed to start pooled sandbox", exc_info=True)
+                return None
+
+        delta = diff_trees(manifest, snapshot_tree(project_dir))
+        if delta:
+            try:
+                self.provider.stream_delta(
+                    ["docker", "exec", "-i", "-u", "0", sandbox_id], project_dir, delta
+                )
+            except (subprocess.CalledProcessError, OSError):
+                logger.info("Failed to seed pooled sandbox", exc_info=True)
+                self._discard(sandbox_id)
+                return None
+        return sandbox_id
+
+    def run(
+        self,
+        sandbox_id: str,
+        config: SandboxConfig,
+        callback: Callable[[str], None] | None = None,
+    ) -> SandboxStatus:
+        """
+        Run cub in an acquired container and wait for it to finish.
+
+        Args:
+            sandbox_id: Sandbox returned by acquire()
+            config: Sandbox configuration (for cub_args)
+            callback: Optional callback for each line of output
+
+        Returns:
+            SandboxStatus of the run, with cub's exit code
+        """
+        started_at = datetime.now()
+        process = subprocess.Popen(
+            ["docker", "exec", sandbox_id, "cub", "run", *config.cub_args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        try:
+            if process.stdout:
+                for line in process.stdout:
+                    if callback:
+                        callback(line)
+        finally:
+            exit_code = process.wait()
+
+        return SandboxStatus(
+            id=sandbox_id,
+            provider=self.provider.name,
+            state=SandboxState.STOPPED,
+            started_at=started_at,
+            stopped_at=datetime.now(),
+            exit_code=exit_code,
+        )
+
+    def release(self, sandbox_id: str) -> bool:
+        """
+        Reset an acquired container's work volume and return it to the pool.
+
+        Containers that have stopped (e.g. after an interrupted run) or
+        can't be reset are removed instead. Expired idle containers are
+        pruned afterwards.
+
+        Args:
+            sandbox_id: Sandbox returned by acquire()
+
+        Returns:
+            True if the container went back into the pool
+        """
+        reset = self.provider.run_docker(
+            ["exec", "-u", "0", sandbox_id, "sh", "-c", RESET_SCRIPT], check=False
+        )
+        returned = reset.returncode == 0
+        if returned:
+            idle_name = f"{pool_id(sandbox_id)}{IDLE_MARKER}{int(self._clock())}"
+            rename = self.provider.run_docker(["rename", sandbox_id, idle_name], check=False)
+            returned = rename.returncode == 0
+        if not returned:
+            self._discard(sandbox_id)
+        self.prune()
+        return returned
+
+    def prune(self) -> int:
+        """
+        Remove idle containers past the idle TTL or no longer running, and
+        containers in use whose owner is gone or whose claim has expired.
+
+        Returns:
+            Number of containers removed
+        """
+        members = self._members()
+        return len(members) - len(self._prune(members, None, None))
+
+    # =========================================================================
+    # Private helpers
+    # =========================================================================
+
+    def _members(self) -> list[PoolMember]:
+        """List every pooled container, across all pools."""
+        result = self.provider.run_docker(
+            [
+                "ps",
+                "-a",
+                "--filter",
+                f"label={POOL_LABEL}",
+                "--format",
+                f'{{{{.Names}}}}\t{{{{.Label "{POOL_LABEL}"}}}}'
+                f'\t{{{{.Label "{COMMIT_LABEL}"}}}}\t{{{{.State}}}}',
+            ],
+            check=False,
+        )
+        members: list[PoolMember] = []
+        for line in result.stdout.splitlines():
+            fields = line.strip().split("\t")
+            if len(fields) == 4:
+                name, pool, commit, state = fields
+                members.append(PoolMember(name, pool, commit, state == "running"))
+        return members
+
+    def _prune(
+        self, members: list[PoolMember], key: str | None, commit: str | None
+    ) -> list[PoolMember]:
+        """
+        Remove containers that can't or shouldn't be handed out.
+
+        That is idle containers past the idle TTL, no longer running, or
+        (for the given pool) seeded from a commit other than the given one,
+        and abandoned containers in use (see _abandoned).
+
+        Returns:
+            The members that remain
+        """
+        now = self._clock()
+        kept: list[PoolMember] = []
+        for member in members:
+            idle_since = member.idle_since
+            if idle_since is not None:
+                remove = (
+                    not member.running
+                    or now - idle_since > self.idle_ttl
+                    or (member.pool == key and member.commit != commit)
+                )
+            else:
+                remove = self._abandoned(member, now)
+            if remove:
+                self._discard(member.name)
+            else:
+                kept.append(member)
+        return kept
+
+    def _abandoned(self, member: PoolMember, now: float) -> bool:
+        """
+        Check whether a container in use was left behind by its owner.
+
+        It was if the claim is older than the claim TTL or the claiming
+        process has exited (e.g. cub was killed before releasing it).
+        Containers claimed without an owner recorded are left alone.
+        """
+        claim = member.claim
+        if claim is None:
+            return False
+        pid, claimed_at = claim
+        return now - claimed_at > self.claim_ttl or not _pid_alive(pid)
+
+    def _claim(self, members: list[PoolMember], key: str, commit: str) -> str | None:
+        """Claim the most recently released idle container of a pool."""
+        candidates = [
+            m for m in members if m.idle_since is not None and m.pool == key and m.commit == commit
+        ]
+        for member in sorted(candidates, key=lambda m: m.idle_since or 0.0, reverse=True):
+            sandbox_id = self._claim_name(member.pool_id)
+            result = self.provider.run_docker(["rename", member.name, sandbox_id], check=False)
+            if result.returncode == 0:
+                return sandbox_id
+        return None
+
+    def _claim_name(self, container_pool_id: str) -> str:
+        """Name for a container claimed by this process, now."""
+        return f"{container_pool_id}{CLAIM_MARKER}{os.getpid()}-{int(self._clock())}"
+
+    def _evict_one(self, members: list[PoolMember]) -> bool:
+        """Make room by removing the longest-idle container, if any is idle."""
+        idle = [m for m in members if m.idle_since is not None]
+        if not idle:
+            return False
+        oldest = min(idle, key=lambda m: m.idle_since or 0.0)
+        self._discard(oldest.name)
+        return True
+
+    def _create(self, key: str, commit: str, base_name: str, config: SandboxConfig) -> str:
+        """
+        Start a new pooled container, claimed by the caller.
+
+        Raises:
+            subprocess.CalledProcessError: If the container can't be started
+        """
+        sandbox_id = self._claim_name(f"cub-pool-{key}-{secrets.token_hex(4)}")
+        volume_name = f"{pool_id(sandbox_id)}_work"
+        try:
+            # Labelled as sitting on the base so the base isn't pruned
+            self.provider.run_docker(
+                [
+                    "volume",
+                    "create",
+                    "--label",
+                    f"{LOWER_LABEL}={base_name}",
+                    "--label",
+                    f"{POOL_LABEL}={key}",
+                    volume_name,
+                ]
+            )
+            self.provider.run_docker(
+                [
+                    "run",
+                    "--name",
+                    sandbox_id,
+                    "--detach",
+                    "--label",
+                    f"{POOL_LABEL}={key}",
+                    "--label",
+                    f"{COMMIT_LABEL}={commit}",
+                    "-v",
+                    f"{volume_name}:/project",
+                    "-v",
+                    f"{base_name}:/base:ro",
+                    *self.provider.container_args(config),
+                    *IDLE_COMMAND,
+                ]
+            )
+            self.provider.run_docker(["exec", "-u", "0", sandbox_id, "sh", "-c", RESET_SCRIPT])
+        except subprocess.CalledProcessError:
+            self._discard(sandbox_id)
+            raise
+        return sandbox_id
+
+    def _discard(self, container_name: str) -> None:
+        """Remove a pooled container and its work volume."""
+        self.provider.cleanup_resources(container_name, f"{pool_id(container_name)}_work")
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process on this host is still running."""
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":
+        # os.kill would terminate the process; assume alive
+        return True
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        # Exists, but belongs to another user
+        return True
+    except OSError:
+        return False
+    return True
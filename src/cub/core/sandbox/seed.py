@@ -0,0 +1,146 @@
+"""
+Copy-on-write project seeding for sandboxes.
+
+Copying a whole project into every sandbox makes start time and disk use
+scale with repository size. Instead, a provider keeps one read-only base
+copy of the project per commit and gives each sandbox a writable layer on
+top of it. This module tracks what the base contains so each new sandbox
+only needs the files that changed since the base was taken.
+
+A manifest records each file's size and modification time when the base
+was copied. Comparing it against the working tree (an rsync-style
+size/mtime check, no hashing) gives the delta to seed into the writable
+layer.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+# File path (relative, POSIX separators) -> (size, mtime_ns)
+Manifest = dict[str, tuple[int, int]]
+
+# Where manifests are kept, relative to the project; left out of snapshots
+# since saving a manifest would otherwise change the tree it describes
+MANIFEST_DIR = ".cub/cache/sandbox"
+
+
+class TreeDelta(NamedTuple):
+    """Files to copy into, and delete from, a sandbox's writable layer."""
+
+    changed: list[str]
+    deleted: list[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.deleted)
+
+
+def snapshot_tree(root: Path) -> Manifest:
+    """
+    Record the size and mtime of every file under a directory.
+
+    Symlinks are recorded as themselves (not followed) and directories
+    are implied by the files they contain. The manifest directory is
+    skipped.
+
+    Args:
+        root: Directory to snapshot
+
+    Returns:
+        Manifest of every non-directory entry under root
+    """
+    manifest: Manifest = {}
+    root_str = str(root)
+    for dirpath, dirnames, filenames in os.walk(root_str):
+        rel_dir = os.path.relpath(dirpath, root_str)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        if prefix == ".cub/cache/":
+            dirnames[:] = [d for d in dirnames if prefix + d != MANIFEST_DIR]
+        # os.walk lists symlinks to directories as directories; record
+        # them as entries rather than descending
+        names = filenames + [d for d in dirnames if os.path.islink(os.path.join(dirpath, d))]
+        for name in names:
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            manifest[prefix + name] = (st.st_size, st.st_mtime_ns)
+    return manifest
+
+
+def diff_trees(base: Manifest, current: Manifest) -> TreeDelta:
+    """
+    Compare a base manifest with the current tree.
+
+    Args:
+        base: Manifest taken when the base was copied
+        current: Manifest of the working tree now
+
+    Returns:
+        TreeDelta of new or modified files and files no longer present
+    """
+    changed = sorted(path for path, sig in current.items() if base.get(path) != sig)
+    deleted = sorted(path for path in base if path not in current)
+    return TreeDelta(changed, deleted)
+
+
+def load_manifest(path: Path) -> Manifest | None:
+    """Load a manifest, or None if it is missing or unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    try:
+        return {name: (int(sig[0]), int(sig[1])) for name, sig in data.items()}
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def save_manifest(path: Path, manifest: Manifest) -> None:
+    """Write a manifest atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def manifest_path(project_dir: Path, base_name: str) -> Path:
+    """Where the manifest for a base copy of a project is kept."""
+    return project_dir / MANIFEST_DIR / f"{base_name}.json"
+
+
+def project_key(project_dir: Path) -> str:
+    """Short stable identifier for a project directory."""
+    return hashlib.sha256(str(project_dir.resolve()).encode()).hexdigest()[:12]
+
+
+def head_commit(project_dir: Path) -> str | None:
+    """
+    Get the project's HEAD commit.
+
+    Returns:
+        Commit SHA, or None if the project isn't a git repository
+    """
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(project_dir), "rev-parse", "--verify", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
@@ -17,6 +17,7 @@ Modules:
     ledger: LedgerService provides ledger queries and stats.
     status: StatusService aggregates project state from multiple sources.
     suggestions: SuggestionService provides smart recommendations for next actions.
+    pr_checks: CheckPoller batches CI check polling for many PRs.
     models: Data models used across services (ProjectStats, EpicProgress, etc.)
 """
 
@@ -32,6 +33,7 @@ from cub.core.services.ledger import (
     StatsQuery,
 )
 from cub.core.services.models import EpicProgress, LedgerStats, ProjectStats
+from cub.core.services.pr_checks import CheckPoller, get_shared_poller
 from cub.core.services.pr_monitor import (
     CheckPollError,
     CheckState,
@@ -71,6 +73,8 @@ __all__ = [
     "MonitorState",
     "RetryAttempt",
     "RetryReason",
+    "CheckPoller",
+    "get_shared_poller",
     # Status service
     "StatusService",
     "StatusServiceError",
@@ -34,6 +34,7 @@ from cub.core.launch import (
     resolve_harness_binary,
 )
 from cub.core.launch.models import EnvironmentInfo, LaunchConfig
+from cub.core.services.pr_checks import shared_poller_for_project
 from cub.core.services.pr_monitor import MonitorResult, PRMonitorService
 
 logger = logging.getLogger(__name__)
@@ -256,6 +257,7 @@ class LaunchService:
             poll_interval=poll_interval or pr_config.poll_interval,
             retry_timeout=retry_timeout or pr_config.retry_timeout,
             max_retries=max_retries if max_retries is not None else pr_config.max_retries,
+            poller=shared_poller_for_project(self._project_dir),
         )
 
         def _run_monitor() -> None:
@@ -20,7 +20,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from cub.core.ledger.models import LedgerStats, VerificationStatus
+from cub.core.ledger.models import LedgerStats, RunCacheStats, VerificationStatus
 from cub.core.ledger.reader import LedgerReader
 from cub.core.ledger.writer import LedgerWriter
 from cub.utils.project import get_project_root
@@ -322,6 +322,29 @@ class LedgerService:
 
         return self._reader.get_stats(since=since, epic=filters.epic)
 
+    def cache_stats(self, filters: StatsQuery | None = None) -> list[RunCacheStats]:
+        """
+        Get prompt cache usage per run.
+
+        Args:
+            filters: Optional filters on which tasks' attempts are counted
+
+        Returns:
+            RunCacheStats per run, oldest first
+
+        Example:
+            >>> for run in service.cache_stats():
+            ...     print(f"{run.run_id}: {run.cache_hit_ratio:.0%}")
+        """
+        if filters is None:
+            filters = StatsQuery()
+
+        since = filters.since
+        if isinstance(since, datetime):
+            since = since.strftime("%Y-%m-%d")
+
+        return self._reader.get_cache_stats(since=since, epic=filters.epic)
+
     # ============================================================================
     # Writer methods (for workflow management)
     # ============================================================================
@@ -0,0 +1,858 @@
+"""
+Batched CI check polling for many pull requests.
+
+A single CheckPoller watches every PR of interest in a repository and
+fetches their check state with one GraphQL query per poll, instead of
+one `gh pr checks` process per PR per interval:
+- Watched PRs are aliased into a single `repository { prN: pullRequest(...) }`
+  query, so the request count doesn't grow with the number of PRs
+- Requests carry `If-None-Match` whenever the API handed out an ETag;
+  a 304 response counts as "nothing changed"
+- Each PR's next poll is scheduled from how long its pending checks
+  usually take (learned from completed runs across all PRs), backing
+  off exponentially while nothing changes
+- Subscribers are notified per PR, and only when that PR's checks change
+
+Usage:
+    >>> from cub.core.github.models import RepoInfo
+    >>> poller = get_shared_poller(RepoInfo(owner="octo", repo="app"))
+    >>> unsubscribe = poller.subscribe(42, lambda s: print(s.all_passed))
+    >>> poller.start()
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Protocol
+
+import httpx
+
+from cub.core.github.models import RepoInfo
+from cub.core.services.pr_monitor import (
+    CheckPollError,
+    CheckResult,
+    CheckSummary,
+    parse_check_state,
+    parse_datetime,
+)
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Poll scheduling bounds (seconds)
+DEFAULT_MIN_INTERVAL = 5.0
+DEFAULT_BASE_INTERVAL = 30.0
+DEFAULT_MAX_INTERVAL = 300.0
+
+# How long wait_until_complete() accepts a PR reporting no checks at all
+# before deciding it has none (no CI, or no required checks)
+DEFAULT_NO_CHECKS_GRACE = 60.0
+
+# Growth of the poll interval while a PR's checks are unchanged
+BACKOFF_FACTOR = 1.5
+
+# Weight of the newest observation in the per-check duration average
+DURATION_SMOOTHING = 0.3
+
+_CHECKS_FRAGMENT = """
+fragment prChecks on PullRequest {
+  number
+  commits(last: 1) {
+    nodes {
+      commit {
+        oid
+        statusCheckRollup {
+          contexts(first: 100) {
+            nodes {
+              __typename
+              ... on CheckRun {
+                name status conclusion startedAt completedAt detailsUrl
+              }
+              ... on StatusContext {
+                context state createdAt targetUrl
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# ============================================================================
+# Query building and parsing
+# ============================================================================
+
+
+def build_checks_query(repo: RepoInfo, pr_numbers: Iterable[int]) -> str:
+    """
+    Build one GraphQL query fetching check state for several PRs.
+
+    Each PR is aliased as ``pr<number>`` so results can be mapped back.
+
+    Args:
+        repo: Repository the PRs belong to
+        pr_numbers: PR numbers to include
+
+    Returns:
+        GraphQL query text (stable for the same set of PRs)
+    """
+    fields = "\n".join(
+        f"    pr{number}: pullRequest(number: {number}) {{ ...prChecks }}"
+        for number in sorted(set(pr_numbers))
+    )
+    return (
+        "query {\n"
+        f"  repository(owner: {json.dumps(repo.owner)}, name: {json.dumps(repo.repo)}) {{\n"
+        f"{fields}\n"
+        "  }\n"
+        "}\n"
+        f"{_CHECKS_FRAGMENT}"
+    )
+
+
+def parse_pr_checks(
+    pr_data: dict[str, Any] | None, *, polled_at: datetime | None = None
+) -> CheckSummary:
+    """
+    Convert one aliased pullRequest result into a CheckSummary.
+
+    Handles both check runs (GitHub Actions, apps) and legacy commit
+    status contexts.
+
+    Args:
+        pr_data: The ``prN`` object from a checks query (None if missing)
+        polled_at: Timestamp to record on the summary
+
+    Returns:
+        CheckSummary for the PR's head commit
+    """
+    summary = CheckSummary(polled_at=polled_at or datetime.now(tz=timezone.utc))
+    commits = ((pr_data or {}).get("commits") or {}).get("nodes") or []
+    if not commits:
+        return summary
+    commit = (commits[-1] or {}).get("commit") or {}
+    rollup = commit.get("statusCheckRollup") or {}
+    for node in (rollup.get("contexts") or {}).get("nodes") or []:
+        if not node:
+            continue
+        if node.get("__typename") == "StatusContext":
+            state = parse_check_state(node.get("state"))
+            created_at = parse_datetime(node.get("createdAt"))
+            summary.checks.append(
+                CheckResult(
+                    name=node.get("context") or "unknown",
+                    state=state,
+                    conclusion=node.get("state"),
+                    started_at=created_at,
+                    completed_at=created_at if state.is_terminal else None,
+                    url=node.get("targetUrl"),
+                )
+            )
+        else:
+            status = node.get("status")
+            raw = node.get("conclusion") if status == "COMPLETED" else status
+            summary.checks.append(
+                CheckResult(
+                    name=node.get("name") or "unknown",
+                    state=parse_check_state(raw),
+                    conclusion=raw,
+                    started_at=parse_datetime(node.get("startedAt")),
+                    completed_at=parse_datetime(node.get("completedAt")),
+                    url=node.get("detailsUrl"),
+                )
+            )
+    return summary
+
+
+def _fingerprint(summary: CheckSummary) -> tuple[tuple[str, str, str | None], ...]:
+    """Identity of a summary's check states, ignoring poll time."""
+    return tuple(
+        sorted(
+            (
+                c.name,
+                c.state.value,
+                c.completed_at.isoformat() if c.completed_at else None,
+            )
+            for c in summary.checks
+        )
+    )
+
+
+# ============================================================================
+# Expected check durations
+# ============================================================================
+
+
+class CheckDurationModel:
+    """
+    Expected run time per check name, as an exponential moving average.
+
+    Check names are shared across PRs in a repository ("test", "lint"),
+    so what one PR's completed runs teach is used to schedule the others.
+    """
+
+    def __init__(self, smoothing: float = DURATION_SMOOTHING) -> None:
+        """
+        Initialize the model.
+
+        Args:
+            smoothing: Weight of the newest observation (0-1)
+        """
+        self._smoothing = smoothing
+        self._expected: dict[str, float] = {}
+        self._seen: set[tuple[str, datetime, datetime]] = set()
+
+    def expected(self, name: str) -> float | None:
+        """Expected duration in seconds for a check, or None if never seen."""
+        return self._expected.get(name)
+
+    def observe(self, summary: CheckSummary) -> None:
+        """Learn from checks in a summary that have finished."""
+        for check in summary.checks:
+            if not check.state.is_terminal or not check.started_at or not check.completed_at:
+                continue
+            key = (check.name, check.started_at, check.completed_at)
+            if key in self._seen:
+                continue
+            if len(self._seen) > 10_000:
+                self._seen.clear()
+            self._seen.add(key)
+            duration = (check.completed_at - check.started_at).total_seconds()
+            if duration < 0:
+                continue
+            previous = self._expected.get(check.name)
+            self._expected[check.name] = (
+                duration
+                if previous is None
+                else previous + self._smoothing * (duration - previous)
+            )
+
+    def expected_remaining(self, summary: CheckSummary, now: datetime) -> float | None:
+        """
+        Seconds until the next pending check is expected to finish.
+
+        Returns:
+            Smallest expected remaining time over pending checks with a
+            known duration (negative when overdue), or None if unknown
+        """
+        remaining: list[float] = []
+        for check in summary.pending_checks:
+            expected = self._expected.get(check.name)
+            if expected is None:
+                continue
+            elapsed = (now - check.started_at).total_seconds() if check.started_at else 0.0
+            remaining.append(expected - elapsed)
+        return min(remaining) if remaining else None
+
+
+# ============================================================================
+# Transports
+# ============================================================================
+
+
+@dataclass
+class GraphQLResponse:
+    """Result of one GraphQL request."""
+
+    data: dict[str, Any] | None = None
+    etag: str | None = None
+    not_modified: bool = False
+
+
+class GraphQLTransport(Protocol):
+    """Executes GraphQL queries against the GitHub API."""
+
+    def execute(self, query: str, *, etag: str | None = None) -> GraphQLResponse:
+        """Run a query, sending ``etag`` as If-None-Match when given."""
+        ...
+
+
+def _graphql_data(payload: Any) -> dict[str, Any]:
+    """Extract ``data`` from a GraphQL payload, raising if there is none."""
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if isinstance(data, dict):
+        return data
+    errors = payload.get("errors") if isinstance(payload, dict) else None
+    message = errors[0].get("message", "unknown error") if errors else "no data returned"
+    raise CheckPollError(f"GitHub GraphQL error: {message}")
+
+
+class HTTPGraphQLTransport:
+    """
+    GraphQL over a persistent HTTPS connection.
+
+    Supports conditional requests: the last ETag is sent back as
+    If-None-Match and a 304 is reported as ``not_modified``.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        api_url: str = GITHUB_API_URL,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            token: GitHub token for the Authorization header
+            api_url: API root (override for GitHub Enterprise or tests)
+            timeout: Request timeout in seconds
+        """
+        self._client = httpx.Client(
+            base_url=api_url.rstrip("/"),
+            timeout=timeout,
+            headers={
+                "Authorization": f"bearer {token}",
+                "Accept": "application/json",
+                "User-Agent": "cub-pr-monitor",
+            },
+        )
+
+    def execute(self, query: str, *, etag: str | None = None) -> GraphQLResponse:
+        """Run a query. Raises CheckPollError on transport or API errors."""
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            response = self._client.post("/graphql", json={"query": query}, headers=headers)
+        except httpx.HTTPError as e:
+            raise CheckPollError(f"GitHub GraphQL request failed: {e}") from e
+
+        if response.status_code == 304:
+            return GraphQLResponse(etag=etag, not_modified=True)
+        if response.status_code >= 400:
+            raise CheckPollError(f"GitHub GraphQL request failed: HTTP {response.status_code}")
+        try:
+            payload = response.json()
+        except ValueError as e:
+            raise CheckPollError(f"Failed to parse GraphQL response: {e}") from e
+        return GraphQLResponse(data=_graphql_data(payload), etag=response.headers.get("ETag"))
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._client.close()
+
+
+class GhGraphQLTransport:
+    """GraphQL via `gh api graphql`, for when no token is available directly."""
+
+    def __init__(self, timeout: float = 30.0) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            timeout: Seconds to wait for the gh process
+        """
+        self._timeout = timeout
+
+    def execute(self, query: str, *, etag: str | None = None) -> GraphQLResponse:
+        """Run a query. ``etag`` is ignored (gh doesn't expose conditional requests)."""
+        try:
+            result = subprocess.run(
+                ["gh", "api", "graphql", "-f", f"query={query}"],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=self._timeout,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise CheckPollError("gh api graphql timed out") from e
+        except FileNotFoundError as e:
+            raise CheckPollError("gh CLI not found") from e
+
+        # gh exits non-zero on partial GraphQL errors but still prints the data
+        try:
+            payload = json.loads(result.stdout) if result.stdout.strip() else None
+        except json.JSONDecodeError as e:
+            if result.returncode != 0:
+                stderr = result.stderr.strip() if result.stderr else "unknown error"
+                raise CheckPollError(f"gh api graphql failed: {stderr}") from e
+            raise CheckPollError(f"Failed to parse GraphQL response: {e}") from e
+        if payload is None and result.returncode != 0:
+            stderr = result.stderr.strip() if result.stderr else "unknown error"
+            raise CheckPollError(f"gh api graphql failed: {stderr}")
+        return GraphQLResponse(data=_graphql_data(payload))
+
+
+def resolve_github_token() -> str | None:
+    """Find a GitHub token from GH_TOKEN, GITHUB_TOKEN, or `gh auth token`."""
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(var)
+        if token:
+            return token
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def default_transport() -> GraphQLTransport:
+    """Direct HTTPS when a token is available, otherwise `gh api graphql`."""
+    token = resolve_github_token()
+    if token:
+        return HTTPGraphQLTransport(token, api_url=os.environ.get("GITHUB_API_URL", GITHUB_API_URL))
+    return GhGraphQLTransport()
+
+
+# ============================================================================
+# Poller
+# ============================================================================
+
+
+@dataclass
+class _WatchedPR:
+    """Polling state for one PR."""
+
+    refs: int = 0
+    subscribers: list[Callable[[CheckSummary], Any]] = field(default_factory=list)
+    summary: CheckSummary | None = None
+    fingerprint: tuple[tuple[str, str, str | None], ...] | None = None
+    interval: float = 0.0
+    next_poll: float = 0.0
+
+
+class CheckPoller:
+    """
+    Poll CI checks for many PRs of one repository from a single place.
+
+    PRs are added with watch()/subscribe() and polled together by
+    poll_once(), either called directly or from the background thread
+    started by start().
+
+    Example:
+        >>> poller = CheckPoller(RepoInfo(owner="octo", repo="app"))
+        >>> poller.watch(41)
+        >>> poller.watch(42)
+        >>> summaries = poller.poll_once()  # one request for both PRs
+    """
+
+    def __init__(
+        self,
+        repo: RepoInfo,
+        *,
+        transport: GraphQLTransport | None = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        base_interval: float = DEFAULT_BASE_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        durations: CheckDurationModel | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the poller.
+
+        Args:
+            repo: Repository whose PRs are polled
+            transport: GraphQL transport (defaults to default_transport())
+            min_interval: Shortest delay between polls of a PR
+            base_interval: Delay used when nothing is known about a PR's checks
+            max_interval: Longest delay between polls of a PR
+            durations: Shared expected-duration model
+            clock: Monotonic clock, injectable for tests
+        """
+        self.repo = repo
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.durations = durations or CheckDurationModel()
+        self._transport = transport
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._watched: dict[int, _WatchedPR] = {}
+        self._etags: dict[str, str] = {}
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    @property
+    def transport(self) -> GraphQLTransport:
+        """The GraphQL transport, created on first use."""
+        if self._transport is None:
+            self._transport = default_transport()
+        return self._transport
+
+    @property
+    def running(self) -> bool:
+        """Whether the background polling thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------
+    # Watching and subscriptions
+    # ------------------------------------------------------------------
+
+    def watch(self, pr_number: int) -> None:
+        """Start polling a PR (reference counted; pair with unwatch())."""
+        with self._cond:
+            watched = self._watched.setdefault(pr_number, _WatchedPR())
+            watched.refs += 1
+            self._cond.notify_all()
+
+    def unwatch(self, pr_number: int) -> None:
+        """Release one watch on a PR; polling stops when none remain."""
+        with self._cond:
+            watched = self._watched.get(pr_number)
+            if watched is None:
+                return
+            watched.refs -= 1
+            if watched.refs <= 0:
+                del self._watched[pr_number]
+
+    def subscribe(
+        self, pr_number: int, callback: Callable[[CheckSummary], Any]
+    ) -> Callable[[], None]:
+        """
+        Call ``callback`` whenever a PR's checks change.
+
+        Args:
+            pr_number: PR to follow
+            callback: Receives the new CheckSummary (called from the poller)
+
+        Returns:
+            Function that cancels the subscription
+        """
+        with self._cond:
+            watched = self._watched.setdefault(pr_number, _WatchedPR())
+            watched.refs += 1
+            watched.subscribers.append(callback)
+            current = watched.summary
+            self._cond.notify_all()
+        if current is not None:
+            callback(current)
+
+        cancelled = False
+
+        def unsubscribe() -> None:
+            nonlocal cancelled
+            if cancelled:
+                return
+            cancelled = True
+            with self._cond:
+                entry = self._watched.get(pr_number)
+                if entry is not None and callback in entry.subscribers:
+                    entry.subscribers.remove(callback)
+            self.unwatch(pr_number)
+
+        return unsubscribe
+
+    def refresh(self, pr_number: int) -> None:
+        """Make a watched PR due now (e.g. after re-running its checks)."""
+        with self._cond:
+            watched = self._watched.get(pr_number)
+            if watched is not None:
+                watched.next_poll = 0.0
+                watched.interval = 0.0
+                self._cond.notify_all()
+
+    def latest(self, pr_number: int) -> CheckSummary | None:
+        """Most recent summary for a watched PR, without polling."""
+        with self._cond:
+            watched = self._watched.get(pr_number)
+            return watched.summary if watched else None
+
+    def next_poll_in(self, pr_number: int) -> float | None:
+        """Seconds until a watched PR is next polled (None if not watched)."""
+        with self._cond:
+            watched = self._watched.get(pr_number)
+            if watched is None:
+                return None
+            return max(0.0, watched.next_poll - self._clock())
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    def poll_once(
+        self, *, force: bool = False, now: datetime | None = None
+    ) -> dict[int, CheckSummary]:
+        """
+        Poll every PR that is due, in a single request.
+
+        Args:
+            force: Poll all watched PRs regardless of schedule
+            now: Wall-clock time to evaluate check ages against
+
+        Returns:
+            Latest summary of each PR that was polled
+
+        Raises:
+            CheckPollError: If the request fails (polled PRs back off)
+        """
+        tick = self._clock()
+        with self._cond:
+            due = sorted(n for n, w in self._watched.items() if force or w.next_poll <= tick)
+        if not due:
+            return {}
+
+        query = build_checks_query(self.repo, due)
+        try:
+            response = self.transport.execute(query, etag=self._etags.get(query))
+            repository = None if response.not_modified else (response.data or {}).get("repository")
+            if not response.not_modified and not isinstance(repository, dict):
+                raise CheckPollError(f"Repository {self.repo.full_name} not found")
+        except CheckPollError:
+            with self._cond:
+                for number in due:
+                    watched = self._watched.get(number)
+                    if watched is not None:
+                        watched.interval = self._clamp(
+                            max(watched.interval, self.base_interval) * BACKOFF_FACTOR
+                        )
+                        watched.next_poll = tick + watched.interval
+            raise
+
+        polled_at = now or datetime.now(tz=timezone.utc)
+        results: dict[int, CheckSummary] = {}
+        notifications: list[tuple[list[Callable[[CheckSummary], Any]], CheckSummary]] = []
+        with self._cond:
+            if response.etag:
+                if len(self._etags) > 256:
+                    self._etags.clear()
+                self._etags[query] = response.etag
+            for number in due:
+                watched = self._watched.get(number)
+                if watched is None:
+                    continue
+                changed = False
+                if repository is not None:
+                    summary = parse_pr_checks(repository.get(f"pr{number}"), polled_at=polled_at)
+                    self.durations.observe(summary)
+                    fingerprint = _fingerprint(summary)
+                    changed = fingerprint != watched.fingerprint
+                    watched.summary, watched.fingerprint = summary, fingerprint
+                    if changed:
+                        notifications.append((list(watched.subscribers), summary))
+                watched.interval = self._next_interval(watched, changed, polled_at)
+                watched.next_poll = tick + watched.interval
+                if watched.summary is not None:
+                    results[number] = watched.summary
+            self._cond.notify_all()
+
+        for subscribers, summary in notifications:
+            for callback in subscribers:
+                try:
+                    callback(summary)
+                except Exception:
+                    logger.exception("PR check subscriber failed")
+        return results
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.max_interval, max(self.min_interval, seconds))
+
+    def _next_interval(self, watched: _WatchedPR, changed: bool, now: datetime) -> float:
+        """Choose the delay before a PR's next poll."""
+        summary = watched.summary
+        if summary is not None and summary.checks and not summary.is_pending:
+            # Settled: only a re-run or new push will change it
+            return self.max_interval
+
+        expected = self.durations.expected_remaining(summary, now) if summary else None
+        if expected is not None and expected > 0:
+            # Wake up around when the next check should finish
+            return self._clamp(expected)
+
+        # Unknown or overdue: start short and back off while unchanged
+        start = self.min_interval if expected is not None else self.base_interval
+        if changed or not watched.interval:
+            return self._clamp(start)
+        return self._clamp(watched.interval * BACKOFF_FACTOR)
+
+    # ------------------------------------------------------------------
+    # Waiting
+    # ------------------------------------------------------------------
+
+    def get_summary(self, pr_number: int, *, timeout: float = 30.0) -> CheckSummary:
+        """
+        Return the latest summary for a PR, fetching it if none exists yet.
+
+        When the background thread is running this waits for its next
+        poll; otherwise it polls synchronously (batched with any other
+        due PRs).
+
+        Raises:
+            CheckPollError: If no summary is available within ``timeout``
+        """
+        self.watch(pr_number)
+        try:
+            deadline = self._clock() + timeout
+            while True:
+                with self._cond:
+                    watched = self._watched[pr_number]
+                    if watched.summary is not None:
+                        return watched.summary
+                    if self.running:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            raise CheckPollError(
+                                f"Timed out waiting for checks on PR #{pr_number}"
+                            )
+                        self._cond.wait(remaining)
+                        continue
+                self.poll_once()
+                summary = self.latest(pr_number)
+                if summary is None:
+                    raise CheckPollError(f"No check results for PR #{pr_number}")
+                return summary
+        finally:
+            self.unwatch(pr_number)
+
+    def wait_until_complete(
+        self,
+        pr_number: int,
+        *,
+        timeout: float,
+        no_checks_grace: float = DEFAULT_NO_CHECKS_GRACE,
+    ) -> CheckSummary | None:
+        """
+        Block until a PR has checks and none are pending.
+
+        Starts the background thread if needed. A PR that keeps reporting
+        no checks for ``no_checks_grace`` seconds is taken to have none,
+        and its empty summary is returned.
+
+        Returns:
+            Final summary, or None if ``timeout`` elapsed first
+        """
+        self.watch(pr_number)
+        self.start()
+        try:
+            deadline = self._clock() + timeout
+            empty_since: float | None = None
+            with self._cond:
+                while True:
+                    summary = self._watched[pr_number].summary
+                    if summary is not None and summary.checks and not summary.is_pending:
+                        return summary
+                    now = self._clock()
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return None
+                    if summary is not None and not summary.checks:
+                        # Checks may not have been created yet; give them a while
+                        if empty_since is None:
+                            empty_since = now
+                        grace_left = empty_since + no_checks_grace - now
+                        if grace_left <= 0:
+                            return summary
+                        remaining = min(remaining, grace_left)
+                    else:
+                        empty_since = None
+                    self._cond.wait(remaining)
+        finally:
+            self.unwatch(pr_number)
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background polling thread (no-op if running)."""
+        with self._cond:
+            if self.running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"pr-check-poller-{self.repo.full_name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background polling thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+                if not self._watched:
+                    self._cond.wait()
+                    continue
+                delay = min(w.next_poll for w in self._watched.values()) - self._clock()
+                if delay > 0:
+                    self._cond.wait(delay if math.isfinite(delay) else None)
+                    continue
+            try:
+                self.poll_once()
+            except CheckPollError as e:
+                logger.warning("PR check poll failed for %s: %s", self.repo.full_name, e)
+            except Exception:
+                logger.exception("PR check poller crashed while polling")
+
+
+_shared_pollers: dict[str, CheckPoller] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_poller(repo: RepoInfo) -> CheckPoller:
+    """
+    Return the process-wide poller for a repository.
+
+    Every monitor in the process that uses this poller shares one
+    request stream and one expected-duration model.
+    """
+    with _shared_lock:
+        poller = _shared_pollers.get(repo.full_name)
+        if poller is None:
+            poller = CheckPoller(repo)
+            _shared_pollers[repo.full_name] = poller
+        return poller
+
+
+def shared_poller_for_project(project_dir: Path) -> CheckPoller | None:
+    """Shared poller for the GitHub repository behind a project's origin remote."""
+    try:
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    repo = RepoInfo.from_remote_url(result.stdout.strip()) if result.returncode == 0 else None
+    return get_shared_poller(repo) if repo else None
+
+
+__all__ = [
+    "CheckDurationModel",
+    "CheckPoller",
+    "GhGraphQLTransport",
+    "GraphQLResponse",
+    "GraphQLTransport",
+    "HTTPGraphQLTransport",
+    "build_checks_query",
+    "default_transport",
+    "get_shared_poller",
+    "parse_pr_checks",
+    "resolve_github_token",
+    "shared_poller_for_project",
+]
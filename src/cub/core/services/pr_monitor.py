@@ -26,7 +26,10 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cub.core.services.pr_checks import CheckPoller
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +191,50 @@ class MonitorResult:
         return (self.completed_at - self.started_at).total_seconds()
 
 
+# Check states from `gh pr checks` and check conclusions/status states from
+# the GraphQL API. Unlisted states count as PENDING. Of the GraphQL values:
+# - ACTION_REQUIRED is a final conclusion waiting on a person. It counts as
+#   FAILURE (it used to fall through to PENDING, which kept monitors
+#   waiting until they timed out).
+# - EXPECTED is a required status context that hasn't reported yet.
+_STATE_MAP: dict[str, CheckState] = {
+    "SUCCESS": CheckState.SUCCESS,
+    "PASS": CheckState.SUCCESS,
+    "FAILURE": CheckState.FAILURE,
+    "FAIL": CheckState.FAILURE,
+    "CANCELLED": CheckState.CANCELLED,
+    "TIMED_OUT": CheckState.TIMED_OUT,
+    "ERROR": CheckState.ERROR,
+    "PENDING": CheckState.PENDING,
+    "QUEUED": CheckState.PENDING,
+    "IN_PROGRESS": CheckState.RUNNING,
+    "RUNNING": CheckState.RUNNING,
+    "REQUESTED": CheckState.PENDING,
+    "WAITING": CheckState.PENDING,
+    "EXPECTED": CheckState.PENDING,
+    "ACTION_REQUIRED": CheckState.FAILURE,
+    "STARTUP_FAILURE": CheckState.ERROR,
+    "STALE": CheckState.ERROR,
+    "SKIPPED": CheckState.SUCCESS,
+    "NEUTRAL": CheckState.SUCCESS,
+}
+
+
+def parse_check_state(state: str | None) -> CheckState:
+    """Map a gh CLI or GraphQL check state/conclusion to a CheckState."""
+    return _STATE_MAP.get((state or "").upper(), CheckState.PENDING)
+
+
+def parse_datetime(dt_str: str | None) -> datetime | None:
+    """Parse an ISO datetime string (GitHub style, trailing Z) to a datetime."""
+    if not dt_str:
+        return None
+    try:
+        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
 # ============================================================================
 # Exceptions
 # ============================================================================
@@ -236,6 +283,7 @@ class PRMonitorService:
         poll_interval: int = 30,
         retry_timeout: int = 600,
         max_retries: int = 3,
+        poller: CheckPoller | None = None,
     ) -> None:
         """
         Initialize monitor with configuration.
@@ -244,10 +292,13 @@ class PRMonitorService:
             poll_interval: Seconds between check polls
             retry_timeout: Total timeout in seconds for all retries
             max_retries: Maximum number of retry attempts
+            poller: Shared batched poller to read check state from instead
+                of running `gh pr checks` per poll
         """
         self._poll_interval = poll_interval
         self._retry_timeout = retry_timeout
         self._max_retries = max_retries
+        self._poller = poller
 
     @property
     def poll_interval(self) -> int:
@@ -272,7 +323,8 @@ class PRMonitorService:
         """
         Poll CI check status for a PR.
 
-        Uses `gh pr checks` to get current check states.
+        Uses the shared poller's latest result when one is configured,
+        otherwise `gh pr checks`.
 
         Args:
             pr_number: The PR number to check
@@ -283,6 +335,9 @@ class PRMonitorService:
         Raises:
             CheckPollError: If polling fails
         """
+        if self._poller is not None:
+            return self._poller.get_summary(pr_number)
+
         try:
             result = subprocess.run(
                 [
@@ -330,38 +385,11 @@ class PRMonitorService:
 
     def _parse_check_state(self, check_data: dict[str, str | None]) -> CheckState:
         """Parse check state from gh CLI output."""
-        state_str = (check_data.get("state") or "").upper()
-
-        state_map: dict[str, CheckState] = {
-            "SUCCESS": CheckState.SUCCESS,
-            "PASS": CheckState.SUCCESS,
-            "FAILURE": CheckState.FAILURE,
-            "FAIL": CheckState.FAILURE,
-            "CANCELLED": CheckState.CANCELLED,
-            "TIMED_OUT": CheckState.TIMED_OUT,
-            "ERROR": CheckState.ERROR,
-            "PENDING": CheckState.PENDING,
-            "QUEUED": CheckState.PENDING,
-            "IN_PROGRESS": CheckState.RUNNING,
-            "RUNNING": CheckState.RUNNING,
-            "REQUESTED": CheckState.PENDING,
-            "WAITING": CheckState.PENDING,
-            "STARTUP_FAILURE": CheckState.ERROR,
-            "STALE": CheckState.ERROR,
-            "SKIPPED": CheckState.SUCCESS,
-            "NEUTRAL": CheckState.SUCCESS,
-        }
-
-        return state_map.get(state_str, CheckState.PENDING)
+        return parse_check_state(check_data.get("state"))
 
     def _parse_datetime(self, dt_str: str | None) -> datetime | None:
         """Parse ISO datetime string to datetime object."""
-        if not dt_str:
-            return None
-        try:
-            return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            return None
+        return parse_datetime(dt_str)
 
     # ============================================================================
     # Failure detection
@@ -563,6 +591,24 @@ class PRMonitorService:
         Returns:
             MonitorResult with final state and retry history
         """
+        # Keep the PR on the shared poller's schedule for the whole run
+        if self._poller is not None:
+            self._poller.watch(pr_number)
+            self._poller.start()
+        try:
+            return self._monitor_loop(pr_number, on_poll=on_poll, on_retry=on_retry)
+        finally:
+            if self._poller is not None:
+                self._poller.unwatch(pr_number)
+
+    def _monitor_loop(
+        self,
+        pr_number: int,
+        *,
+        on_poll: Callable[[CheckSummary], Any] | None,
+        on_retry: Callable[[RetryAttempt], Any] | None,
+    ) -> MonitorResult:
+        """Poll → detect → wait → retry loop behind monitor_pr()."""
         result = MonitorResult(state=MonitorState.POLLING)
         start_time = time.monotonic()
         retry_count = 0
@@ -663,6 +709,8 @@ class PRMonitorService:
             result.retry_attempts.append(attempt)
             if on_retry is not None:
                 on_retry(attempt)
+            if self._poller is not None:
+                self._poller.refresh(pr_number)
 
             # Wait for checks to start again
             time.sleep(self._poll_interval)
@@ -700,4 +748,6 @@ __all__ = [
     "RetryAttempt",
     "RetryError",
     "RetryReason",
+    "parse_check_state",
+    "parse_datetime",
 ]
@@ -27,8 +27,10 @@ from typing import TYPE_CHECKING
 from cub.core.config.loader import load_config
 from cub.core.config.models import CubConfig
 from cub.core.harness.async_backend import detect_async_harness, get_async_backend
+from cub.core.ledger.artifact_store import ArtifactStore
 from cub.core.ledger.integration import LedgerIntegration
 from cub.core.ledger.writer import LedgerWriter
+from cub.core.profiling import profiling_requested
 from cub.core.run.interrupt import InterruptHandler
 from cub.core.run.loop import RunLoop
 from cub.core.run.models import RunConfig, RunEvent, RunResult
@@ -217,7 +219,10 @@ class RunService:
         )
         if should_enable_ledger:
             ledger_dir = resolved_dir / ".cub" / "ledger"
-            ledger_writer = LedgerWriter(ledger_dir)
+            artifact_store = (
+                ArtifactStore(ledger_dir) if resolved_config.ledger.compress_artifacts else None
+            )
+            ledger_writer = LedgerWriter(ledger_dir, artifact_store)
             ledger_integration = LedgerIntegration(ledger_writer, task_backend)
 
         # Initialize sync service
@@ -317,7 +322,12 @@ class RunService:
         effective_run_id = run_id or run_config.session_name or None
         status_writer = self._status_writer
         if status_writer is None and effective_run_id is not None:
-            status_writer = StatusWriter(self._project_dir, effective_run_id)
+            artifact_store = None
+            if self._config.ledger.compress_artifacts:
+                artifact_store = ArtifactStore(self._project_dir / ".cub" / "ledger")
+            status_writer = StatusWriter(
+                self._project_dir, effective_run_id, artifact_store=artifact_store
+            )
 
         # Register interrupt handler
         if self._interrupt_handler is not None:
@@ -427,6 +437,7 @@ class RunService:
         budget_cost: float | None = None,
         no_circuit_breaker: bool = False,
         no_sync: bool = False,
+        profile: bool = False,
     ) -> RunConfig:
         """
         Build a ``RunConfig`` from high-level parameters and loaded config.
@@ -449,6 +460,7 @@ class RunService:
             budget_cost: Cost budget limit (USD).
             no_circuit_breaker: Disable circuit breaker.
             no_sync: Disable auto-sync.
+            profile: Record timing spans (also enabled by ``CUB_PROFILE``).
 
         Returns:
             A fully-resolved ``RunConfig``.
@@ -469,6 +481,7 @@ class RunService:
             session_name=session_name,
             stream=stream,
             debug=debug,
+            retain_session=cfg.harness.retain_session,
             max_iterations=resolved_max_iterations,
             max_task_iterations=cfg.guardrails.max_task_iterations,
             on_task_failure=cfg.loop.on_task_failure,
@@ -483,6 +496,7 @@ class RunService:
             hooks_fail_fast=cfg.hooks.fail_fast,
             sync_enabled=sync_enabled,
             iteration_warning_threshold=cfg.guardrails.iteration_warning_threshold,
+            profile=profile or profiling_requested(),
             project_dir=str(self._project_dir),
         )
 
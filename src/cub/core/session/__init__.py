@@ -6,10 +6,12 @@ executions. It supports the unified tracking system that captures task
 execution history, costs, and progress.
 """
 
+from cub.core.session.index import SessionIndex
 from cub.core.session.manager import RunSessionError, RunSessionManager
 from cub.core.session.models import (
     RunSession,
     SessionBudget,
+    SessionIndexEntry,
     SessionStatus,
     generate_run_id,
 )
@@ -18,7 +20,9 @@ __all__ = [
     "RunSession",
     "SessionBudget",
     "SessionStatus",
+    "SessionIndexEntry",
     "generate_run_id",
+    "SessionIndex",
     "RunSessionManager",
     "RunSessionError",
 ]
@@ -0,0 +1,303 @@
+"""
+Session index and archive for run sessions.
+
+Session files accumulate in .cub/ledger/by-run/, one per run. Listing
+sessions or finding the running ones used to mean parsing every file.
+The index keeps one compact entry per session (state, pid, timestamps)
+in a single file that RunSessionManager updates whenever it writes a
+session, so those questions are answered from one small read.
+
+Finished sessions older than a cutoff can be moved into a gzip-compressed
+JSONL roll-up, which keeps both the directory and the index proportional
+to recent activity.
+
+Both files live in by-run/_sessions/ so that tools which treat every
+by-run/*.json file as a run record don't pick them up.
+
+Several cub processes may update the index at once, so every
+read-modify-write of it happens under an exclusive lock file. If the lock
+can't be taken, the index is deleted instead, and the next reader rebuilds
+it from the session files rather than trusting an index that may have
+lost an update.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from cub.core.filelock import file_lock
+from cub.core.session.models import RunSession, SessionIndexEntry
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = "_sessions"
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+ARCHIVE_FILE = "archive.jsonl.gz"
+INDEX_VERSION = 1
+
+# How long an index update waits for another process's lock
+LOCK_WAIT_SECONDS = 5.0
+
+
+def alive_pids(pids: Iterable[int]) -> set[int]:
+    """
+    Check which processes are still running, in one batch.
+
+    On Linux this is a single listing of /proc. Elsewhere each pid is
+    probed with signal 0.
+
+    Args:
+        pids: Process IDs to check
+
+    Returns:
+        The subset of pids that are running
+    """
+    wanted = set(pids)
+    if not wanted:
+        return set()
+
+    proc = Path("/proc")
+    if (proc / "self").exists():
+        try:
+            return wanted & {int(name) for name in os.listdir(proc) if name.isdigit()}
+        except OSError:
+            pass
+
+    if sys.platform == "win32":
+        # os.kill would terminate the process; assume alive
+        return wanted
+
+    alive: set[int] = set()
+    for pid in wanted:
+        try:
+            os.kill(pid, 0)
+        except PermissionError:
+            # Exists, but belongs to another user
+            alive.add(pid)
+        except OSError:
+            continue
+        else:
+            alive.add(pid)
+    return alive
+
+
+def process_start_time(pid: int) -> int | None:
+    """
+    When a process started, to tell it apart from a later one reusing its pid.
+
+    Reads the start time (clock ticks since boot) from /proc/<pid>/stat,
+    so it's only available on Linux. The value is only meaningful when
+    compared with another from the same machine and boot.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        The start time, or None if the process doesn't exist or the
+        platform has no /proc
+    """
+    try:
+        stat = (Path("/proc") / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # The command name (field 2) may contain spaces and parentheses
+    fields = stat.rpartition(")")[2].split()
+    try:
+        # starttime is field 22; fields here start at field 3
+        return int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+class SessionIndex:
+    """
+    Index of run sessions, plus the archive of old ones.
+
+    Example:
+        >>> index = SessionIndex(cub_dir / "ledger" / "by-run")
+        >>> index.upsert(session)
+        >>> running = [e for e in index.load().values() if e.status.is_active]
+    """
+
+    def __init__(self, sessions_dir: Path) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            sessions_dir: Directory holding the session files
+        """
+        self.sessions_dir = sessions_dir
+        self.index_dir = sessions_dir / INDEX_DIR
+        self.path = self.index_dir / INDEX_FILE
+        self.lock_path = self.index_dir / LOCK_FILE
+        self.archive_path = self.index_dir / ARCHIVE_FILE
+
+    def load(self) -> dict[str, SessionIndexEntry] | None:
+        """
+        Read the index.
+
+        Returns:
+            Entries keyed by run ID, or None if the index is missing or
+            unreadable and needs rebuilding
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.debug("Discarding unreadable session index", exc_info=True)
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        try:
+            return {
+                run_id: SessionIndexEntry.model_validate(entry)
+                for run_id, entry in data.get("sessions", {}).items()
+            }
+        except (ValidationError, AttributeError):
+            logger.debug("Discarding invalid session index", exc_info=True)
+            return None
+
+    def save(self, entries: dict[str, SessionIndexEntry]) -> None:
+        """Write the index atomically. Failures are logged and ignored."""
+        data = {
+            "version": INDEX_VERSION,
+            "sessions": {
+                run_id: entry.model_dump(mode="json") for run_id, entry in entries.items()
+            },
+        }
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("Failed to write session index", exc_info=True)
+
+    def rebuild(self) -> dict[str, SessionIndexEntry]:
+        """
+        Rebuild the index by reading every session file.
+
+        Only needed when the index is missing, e.g. for sessions created
+        before it existed or after an update couldn't take the lock.
+
+        Returns:
+            The rebuilt entries
+        """
+        with self._locked() as locked:
+            entries = self._scan()
+            if locked:
+                self.save(entries)
+        return entries
+
+    def _scan(self) -> dict[str, SessionIndexEntry]:
+        """Read every session file into index entries."""
+        entries: dict[str, SessionIndexEntry] = {}
+        if self.sessions_dir.is_dir():
+            for path in self.sessions_dir.glob("*.json"):
+                if path.is_symlink():
+                    continue
+                try:
+                    session = RunSession.model_validate_json(path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    continue
+                entries[session.run_id] = SessionIndexEntry.from_session(session)
+        return entries
+
+    def entries(self) -> dict[str, SessionIndexEntry]:
+        """Read the index, rebuilding it first if needed."""
+        entries = self.load()
+        if entries is None:
+            entries = self.rebuild()
+        return entries
+
+    def upsert(self, session: RunSession) -> None:
+        """Record a session's current state."""
+        with self._locked() as locked:
+            if not locked:
+                self._invalidate()
+                return
+            entries = self.load()
+            if entries is None:
+                # The session file is already written, so the scan includes it
+                entries = self._scan()
+            entries[session.run_id] = SessionIndexEntry.from_session(session)
+            self.save(entries)
+
+    def remove(self, run_ids: Iterable[str]) -> None:
+        """Drop sessions from the index."""
+        with self._locked() as locked:
+            if not locked:
+                self._invalidate()
+                return
+            entries = self.load()
+            if entries is None:
+                entries = self._scan()
+            for run_id in run_ids:
+                entries.pop(run_id, None)
+            self.save(entries)
+
+    def _locked(self) -> AbstractContextManager[bool]:
+        """
+        Hold the index lock for the body of a with-block.
+
+        Yields:
+            Whether the lock was taken; False if another process held it
+            for longer than LOCK_WAIT_SECONDS, or it couldn't be created
+        """
+        return file_lock(self.lock_path, timeout=LOCK_WAIT_SECONDS)
+
+    def _invalidate(self) -> None:
+        """Delete the index so the next reader rebuilds it from session files."""
+        logger.debug("Session index is locked; dropping it to be rebuilt")
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            logger.debug("Failed to drop session index", exc_info=True)
+
+    def append_archive(self, sessions: list[RunSession]) -> None:
+        """
+        Append sessions to the compressed roll-up.
+
+        Each call adds a new gzip member, which gzip readers treat as a
+        continuation of the same stream.
+
+        Raises:
+            OSError: If the archive can't be written
+        """
+        if not sessions:
+            return
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.archive_path, "at", encoding="utf-8") as f:
+            for session in sessions:
+                f.write(session.model_dump_json() + "\n")
+
+    def iter_archive(self) -> Iterator[RunSession]:
+        """Yield archived sessions, oldest archive pass first."""
+        try:
+            with gzip.open(self.archive_path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield RunSession.model_validate_json(line)
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError):
+            logger.warning(f"Session archive is damaged: {self.archive_path}")
@@ -9,10 +9,21 @@ and updating progress.
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from cub.core.session.models import RunSession, SessionBudget, SessionStatus, generate_run_id
+from cub.core.session.index import SessionIndex, alive_pids, process_start_time
+from cub.core.session.models import (
+    RunSession,
+    SessionBudget,
+    SessionIndexEntry,
+    SessionStatus,
+    generate_run_id,
+)
+
+# Finished sessions older than this are moved into the archive
+DEFAULT_ARCHIVE_AFTER_DAYS = 30
 
 
 class RunSessionError(Exception):
@@ -26,14 +37,18 @@ class RunSessionManager:
     Manages run session lifecycle and persistence.
 
     Handles creation, updates, and detection of orphaned run sessions.
-    Uses symlink-based detection to identify active sessions and mark
-    abandoned ones.
+    Every session write also updates a compact session index, so finding
+    running sessions doesn't need to read each session file. Running
+    sessions whose process has exited are marked orphaned.
 
     Directory structure:
         .cub/ledger/by-run/
         ├── cub-20260124-143022.json
         ├── cub-20260124-150315.json
-        └── active-run.json -> cub-20260124-150315.json
+        ├── active-run.json -> cub-20260124-150315.json
+        └── _sessions/
+            ├── index.json          # one entry per session
+            └── archive.jsonl.gz    # old finished sessions
 
     Example:
         >>> manager = RunSessionManager(Path.cwd() / ".cub")
@@ -55,6 +70,7 @@ class RunSessionManager:
         self.cub_dir = cub_dir
         self.sessions_dir = cub_dir / self.SESSIONS_DIR
         self.active_symlink_path = self.sessions_dir / self.ACTIVE_SYMLINK
+        self.index = SessionIndex(self.sessions_dir)
 
     def _ensure_sessions_dir(self) -> None:
         """Ensure ledger/by-run directory exists."""
@@ -105,6 +121,8 @@ class RunSessionManager:
         content = json.dumps(data, indent=2, ensure_ascii=False)
         session_file.write_text(content)
 
+        self.index.upsert(session)
+
     def _update_active_symlink(self, run_id: str) -> None:
         """
         Update active-run.json symlink to point to current session.
@@ -181,13 +199,17 @@ class RunSessionManager:
             project_dir = self.cub_dir.parent
 
         # Create session
+        started_at = datetime.now(timezone.utc)
         session = RunSession(
             run_id=run_id,
-            started_at=datetime.now(timezone.utc),
+            started_at=started_at,
             project_dir=project_dir.resolve(),
             harness=harness,
             budget=budget,
             status=SessionStatus.RUNNING,
+            pid=os.getpid(),
+            pid_start_time=process_start_time(os.getpid()),
+            last_heartbeat=started_at,
         )
 
         # Write session file
@@ -259,6 +281,7 @@ class RunSessionManager:
             session.current_task = current_task
         if budget is not None:
             session.budget = budget
+        session.last_heartbeat = datetime.now(timezone.utc)
 
         # Write updated session
         self._write_session_file(session)
@@ -296,13 +319,37 @@ class RunSessionManager:
 
         return session
 
+    def list_sessions(self, status: SessionStatus | None = None) -> list[SessionIndexEntry]:
+        """
+        List sessions from the session index, most recent first.
+
+        Archived sessions are not included.
+
+        Args:
+            status: Only include sessions with this status
+
+        Returns:
+            Index entries for matching sessions
+        """
+        entries = [e for e in self.index.entries().values() if status is None or e.status == status]
+        return sorted(entries, key=lambda e: e.started_at, reverse=True)
+
+    def _active_run_id(self) -> str | None:
+        """Run ID the active-run.json symlink points to, without reading it."""
+        if not self.active_symlink_path.is_symlink():
+            return None
+        return Path(os.readlink(self.active_symlink_path)).stem
+
     def detect_orphans(self) -> list[RunSession]:
         """
         Detect and mark orphaned run sessions.
 
-        A session is orphaned if:
-        1. It has status=RUNNING
-        2. It's not the current active session
+        Only sessions the index lists as running are examined, and their
+        processes are checked in one batch. A running session is orphaned if:
+        1. Its process is no longer alive, or its pid now belongs to a
+           process that started at a different time, or
+        2. It isn't the active session and either predates pid tracking
+           or was started by this same process (and so was superseded)
 
         Returns:
             List of newly detected orphaned sessions
@@ -316,32 +363,87 @@ class RunSessionManager:
         if not self.sessions_dir.exists():
             return orphaned_sessions
 
-        # Get active session run_id (if any)
-        active_session = self.get_active_session()
-        active_run_id = active_session.run_id if active_session else None
+        running = self.list_sessions(SessionStatus.RUNNING)
+        if not running:
+            return orphaned_sessions
 
-        # Scan all session files
-        for session_file in self.sessions_dir.glob("*.json"):
-            # Skip the symlink itself
-            if session_file.name == self.ACTIVE_SYMLINK:
+        active_run_id = self._active_run_id()
+        alive = alive_pids(e.pid for e in running if e.pid is not None)
+        stale: list[str] = []
+
+        for entry in running:
+            if entry.pid is not None and entry.pid not in alive:
+                reason = f"Session process {entry.pid} is no longer running (process died or crash)"
+            elif (
+                entry.pid is not None
+                and entry.pid_start_time is not None
+                and process_start_time(entry.pid) != entry.pid_start_time
+            ):
+                reason = (
+                    f"Session process {entry.pid} is no longer running "
+                    "(process died or crash; pid reused)"
+                )
+            elif entry.run_id != active_run_id and entry.pid in (None, os.getpid()):
+                reason = "Session was still running but not active (process died or crash)"
+            else:
                 continue
 
-            run_id = session_file.stem
-
             try:
-                session = self._read_session_file(run_id)
-
-                # Check if session should be marked orphaned
-                if session.status == SessionStatus.RUNNING and run_id != active_run_id:
-                    # Mark as orphaned
-                    orphaned_session = self._mark_orphaned(
-                        run_id,
-                        reason="Session was still running but not active (process died or crash)",
-                    )
-                    orphaned_sessions.append(orphaned_session)
-
+                orphaned_sessions.append(self._mark_orphaned(entry.run_id, reason))
             except RunSessionError:
-                # Skip invalid session files
+                # Session file is gone or invalid; forget it
+                stale.append(entry.run_id)
                 continue
 
+            if entry.run_id == active_run_id:
+                self._clear_active_symlink()
+
+        if stale:
+            self.index.remove(stale)
+
         return orphaned_sessions
+
+    def archive_sessions(self, max_age_days: int = DEFAULT_ARCHIVE_AFTER_DAYS) -> int:
+        """
+        Move old finished sessions into the compressed archive.
+
+        Their session files are removed and they're dropped from the
+        index. Running sessions are never archived.
+
+        Args:
+            max_age_days: Archive sessions that ended more than this many
+                days ago
+
+        Returns:
+            Number of sessions archived
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        candidates = [
+            entry
+            for entry in self.index.entries().values()
+            if entry.status.is_terminal and (entry.ended_at or entry.started_at) < cutoff
+        ]
+        if not candidates:
+            return 0
+
+        sessions: list[RunSession] = []
+        gone: list[str] = []
+        for entry in candidates:
+            try:
+                sessions.append(self._read_session_file(entry.run_id))
+            except RunSessionError:
+                gone.append(entry.run_id)
+
+        try:
+            self.index.append_archive(sessions)
+        except OSError as e:
+            raise RunSessionError(f"Failed to write session archive: {e}") from e
+
+        for session in sessions:
+            self._get_session_file_path(session.run_id).unlink(missing_ok=True)
+        self.index.remove([s.run_id for s in sessions] + gone)
+        return len(sessions)
+
+    def iter_archived_sessions(self) -> list[RunSession]:
+        """Return sessions from the archive, oldest first."""
+        return list(self.index.iter_archive())
@@ -171,6 +171,16 @@ class RunSession(BaseModel):
         default=None, description="Reason for orphan status (process died, crash, etc.)"
     )
 
+    # Liveness
+    pid: int | None = Field(default=None, description="Process ID of the `cub run` process")
+    pid_start_time: int | None = Field(
+        default=None,
+        description="Start time of the `cub run` process, to detect pid reuse",
+    )
+    last_heartbeat: datetime | None = Field(
+        default=None, description="When the run last reported progress (UTC)"
+    )
+
     model_config = ConfigDict(
         populate_by_name=True,  # Allow both snake_case and camelCase
     )
@@ -241,3 +251,31 @@ class RunSession(BaseModel):
         self.orphaned_reason = reason
         if self.ended_at is None:
             self.ended_at = self.orphaned_at
+
+
+class SessionIndexEntry(BaseModel):
+    """
+    Compact summary of a run session, kept in the session index.
+
+    Holds just enough to list sessions and check whether a running one
+    is still alive without reading its session file.
+    """
+
+    run_id: str = Field(..., description="Run identifier")
+    status: SessionStatus = Field(..., description="Session status")
+    pid: int | None = Field(default=None, description="Process ID of the run")
+    pid_start_time: int | None = Field(default=None, description="Start time of the run's process")
+    started_at: datetime = Field(..., description="When the session started (UTC)")
+    ended_at: datetime | None = Field(default=None, description="When the session ended (UTC)")
+
+    @classmethod
+    def from_session(cls, session: RunSession) -> "SessionIndexEntry":
+        """Summarise a full session."""
+        return cls(
+            run_id=session.run_id,
+            status=session.status,
+            pid=session.pid,
+            pid_start_time=session.pid_start_time,
+            started_at=session.started_at,
+            ended_at=session.ended_at,
+        )
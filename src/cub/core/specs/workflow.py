@@ -5,12 +5,10 @@ Provides the SpecWorkflow class that handles finding specs across stage
 directories and managing spec lifecycle transitions via git mv.
 """
 
-import re
 import subprocess
 from pathlib import Path
 
-import frontmatter
-
+from cub.core.documents import get_document_cache
 from cub.core.specs.models import Spec, Stage
 
 
@@ -106,24 +104,16 @@ class SpecWorkflow:
         Raises:
             ValueError: If file cannot be parsed
         """
-        post = frontmatter.load(path)
-        name = path.stem  # Filename without extension
-
-        # Extract title from first markdown heading if present
-        title: str | None = None
-        content = post.content
-        if content:
-            # Match first # heading
-            match = re.match(r"^#\s+(.+)$", content, re.MULTILINE)
-            if match:
-                title = match.group(1).strip()
+        doc = get_document_cache().load(path)
+        if doc.error:
+            raise ValueError(doc.error)
 
         return Spec.from_frontmatter_dict(
-            data=post.metadata,
-            name=name,
+            data=dict(doc.metadata),
+            name=path.stem,  # Filename without extension
             path=path,
             stage=stage,
-            title=title,
+            title=doc.title,  # First markdown heading, if present
         )
 
     def list_specs(self, stage: Stage | None = None) -> list[Spec]:
@@ -148,20 +138,21 @@ class SpecWorkflow:
         # in iteration over Stage (Python enum behavior for aliases)
         stages_to_scan = [stage] if stage else list(Stage)
 
-        for s in stages_to_scan:
-            stage_dir = self._get_stage_dir(s)
-            if not stage_dir.exists():
-                continue
-
-            for spec_file in stage_dir.glob("*.md"):
-                try:
-                    spec = self._parse_spec_file(spec_file, s)
-                    specs.append(spec)
-                except Exception as e:
-                    # Skip malformed files but continue processing
-                    print(f"Warning: Failed to parse {spec_file}: {e}")
+        with get_document_cache().batch():
+            for s in stages_to_scan:
+                stage_dir = self._get_stage_dir(s)
+                if not stage_dir.exists():
                     continue
 
+                for spec_file in stage_dir.glob("*.md"):
+                    try:
+                        spec = self._parse_spec_file(spec_file, s)
+                        specs.append(spec)
+                    except Exception as e:
+                        # Skip malformed files but continue processing
+                        print(f"Warning: Failed to parse {spec_file}: {e}")
+                        continue
+
         # Sort by name
         specs.sort(key=lambda s: s.name)
         return specs
@@ -5,6 +5,7 @@ This module provides models for tracking the state of cub runs,
 including current progress, budget usage, and event history.
 """
 
+from .journal import StatusJournalReader
 from .models import (
     BudgetStatus,
     EventLevel,
@@ -26,6 +27,7 @@ __all__ = [
     "RunPhase",
     "RunStatus",
     "TaskArtifact",
+    "StatusJournalReader",
     "StatusWriter",
     "get_latest_status",
     "list_runs",
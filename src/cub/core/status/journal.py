@@ -0,0 +1,127 @@
+"""
+Incremental reader for the status.jsonl journal.
+
+StatusWriter appends one compact record per status write:
+
+    {"op": "snapshot", "status": {...}}                     full status
+    {"op": "update", "fields": {...}, "events": [...]}      changes only
+
+Replaying the records in order rebuilds the current status. The reader
+remembers how far into the file it has read, so each poll only parses
+the records appended since the previous one. The writer periodically
+replaces the journal with one that starts from a snapshot record; the
+reader notices the new file and replays it from the start.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from .models import RunStatus
+
+
+class StatusJournalReader:
+    """
+    Tail a status.jsonl journal and rebuild the run status.
+
+    Example:
+        >>> reader = StatusJournalReader(run_dir / "status.jsonl")
+        >>> status = reader.read()  # replays the whole journal
+        >>> status = reader.read()  # only parses records appended since
+    """
+
+    def __init__(self, journal_path: Path):
+        """
+        Initialize the reader.
+
+        Args:
+            journal_path: Path to status.jsonl
+        """
+        self.journal_path = Path(journal_path)
+        self.offset = 0
+        self._inode: int | None = None
+        self._state: dict[str, Any] | None = None
+        self._status: RunStatus | None = None
+
+    def exists(self) -> bool:
+        """Whether the journal file exists."""
+        return self.journal_path.exists()
+
+    def reset(self) -> None:
+        """Forget everything read so far and start again from the top."""
+        self.offset = 0
+        self._inode = None
+        self._state = None
+        self._status = None
+
+    def read(self) -> RunStatus | None:
+        """
+        Apply any new records and return the current status.
+
+        A trailing record that is still being written is left for the
+        next call.
+
+        Returns:
+            RunStatus if the journal holds a valid status, None otherwise
+        """
+        try:
+            st = self.journal_path.stat()
+        except OSError:
+            self.reset()
+            return None
+        size = st.st_size
+
+        if size < self.offset or st.st_ino != self._inode:
+            # Truncated or replaced: replay from the start
+            self.reset()
+            self._inode = st.st_ino
+        if size == self.offset:
+            return self._status
+
+        try:
+            with self.journal_path.open("rb") as f:
+                f.seek(self.offset)
+                chunk = f.read(size - self.offset)
+        except OSError:
+            return self._status
+
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return self._status
+        self.offset += end
+
+        changed = False
+        for line in chunk[:end].splitlines():
+            changed = self._apply(line) or changed
+
+        if changed and self._state is not None:
+            try:
+                self._status = RunStatus(**self._state)
+            except (TypeError, ValidationError):
+                self._status = None
+        return self._status
+
+    def _apply(self, line: bytes) -> bool:
+        """Apply one journal record. Returns True if the state changed."""
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return False
+        if not isinstance(record, dict):
+            return False
+
+        op = record.get("op")
+        if op == "snapshot" and isinstance(record.get("status"), dict):
+            self._state = record["status"]
+            return True
+        if op == "update" and self._state is not None:
+            fields = record.get("fields")
+            if isinstance(fields, dict):
+                self._state.update(fields)
+            events = record.get("events")
+            if isinstance(events, list):
+                self._state.setdefault("events", []).extend(events)
+            return True
+        return False
@@ -12,6 +12,7 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from cub.core.harness.models import TokenUsage
+from cub.core.ledger.models import ResourceTelemetry
 
 
 class RunPhase(str, Enum):
@@ -187,6 +188,9 @@ class RunArtifact(BaseModel):
     tasks_completed: int = Field(default=0, ge=0, description="Number of tasks completed")
     tasks_failed: int = Field(default=0, ge=0, description="Number of tasks failed")
     budget: BudgetStatus | None = Field(default=None, description="Aggregate budget totals")
+    resources: ResourceTelemetry | None = Field(
+        default=None, description="Resource use sampled for the run (sandbox runs)"
+    )
 
     model_config = ConfigDict(
         validate_assignment=True,
@@ -2,15 +2,40 @@
 Status writer for cub runs.
 
 Writes RunStatus to status.json for real-time monitoring.
+
+Every write appends a compact record to a status.jsonl journal next to
+the snapshot: the first record holds the full status, and later ones hold
+only the top-level fields that changed plus any new events. Rewrites of
+the status.json snapshot are coalesced to a few per second, so a chatty
+run loop doesn't re-serialise and rename the whole status on every event.
+Watchers can tail the journal from a byte offset (see journal.py)
+instead of re-parsing the snapshot on each poll. Once the journal grows
+past a size limit, the next snapshot write restarts it with a single
+full record, so a watcher attaching late replays one record rather than
+the whole run.
 """
 
 import json
+import logging
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from cub.core.ledger.artifact_store import ArtifactStore, split_prompt
+
 from .models import RunArtifact, RunStatus, TaskArtifact
 
+logger = logging.getLogger(__name__)
+
+# Maximum status.json rewrites per second
+DEFAULT_SNAPSHOT_RATE = 4.0
+
+# Restart status.jsonl from a snapshot record once it is this large
+DEFAULT_JOURNAL_LIMIT = 1024 * 1024
+
 
 class StatusWriter:
     """
@@ -19,19 +44,38 @@ class StatusWriter:
     Writes status.json to .cub/ledger/by-run/{session}/status.json for
     consumption by the dashboard UI or other monitoring tools.
 
+    Each write is also appended to status.jsonl, and snapshot rewrites
+    are coalesced to at most ``snapshot_rate`` per second. A write that
+    is held back is flushed by a timer once the interval has passed, and
+    writes that finish the run are never held back.
+
     Example:
         >>> writer = StatusWriter(project_dir, "camel-20260114")
         >>> writer.write(status)
         >>> # status.json is now at .cub/ledger/by-run/camel-20260114/status.json
     """
 
-    def __init__(self, project_dir: Path, run_id: str):
+    def __init__(
+        self,
+        project_dir: Path,
+        run_id: str,
+        *,
+        snapshot_rate: float = DEFAULT_SNAPSHOT_RATE,
+        journal_limit: int = DEFAULT_JOURNAL_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+        artifact_store: ArtifactStore | None = None,
+    ):
         """
         Initialize the status writer.
 
         Args:
             project_dir: Project root directory
             run_id: Unique run identifier (used as directory name)
+            snapshot_rate: Maximum status.json rewrites per second
+            journal_limit: Restart status.jsonl once it reaches this many bytes
+            clock: Monotonic time source (for tests)
+            artifact_store: Store task prompts and harness logs here,
+                deduplicated and compressed, instead of as plain files
         """
         self.project_dir = project_dir
         self.run_id = run_id
@@ -41,13 +85,26 @@ class StatusWriter:
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
         self.status_path = self.run_dir / "status.json"
+        self.journal_path = self.run_dir / "status.jsonl"
         self.run_artifact_path = self.run_dir / "run.json"
+        self.artifact_store = artifact_store
+
+        self._min_interval = 1.0 / snapshot_rate
+        self._journal_limit = journal_limit
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._journaled: dict[str, Any] | None = None
+        self._last_snapshot: float | None = None
+        self._pending: dict[str, Any] | None = None
+        self._timer: threading.Timer | None = None
 
     def write(self, status: RunStatus) -> None:
         """
-        Write status to status.json.
+        Record a status update.
 
-        Uses atomic write (temp file + rename) to prevent corruption.
+        Appends the change to status.jsonl and rewrites status.json,
+        unless a snapshot was written less than the coalescing interval
+        ago, in which case the rewrite is deferred.
 
         Args:
             status: RunStatus to serialize
@@ -58,25 +115,125 @@ class StatusWriter:
         # Serialize to JSON
         data = status.model_dump(mode="json")
 
-        # Write atomically
+        with self._lock:
+            self._append_journal(data)
+
+            now = self._clock()
+            last = self._last_snapshot
+            if last is None or now - last >= self._min_interval or status.is_finished:
+                self._cancel_timer()
+                self._pending = None
+                self._write_snapshot(data)
+                return
+
+            # Defer: the latest data wins when the timer fires
+            self._pending = data
+            if self._timer is None:
+                delay = self._min_interval - (now - last)
+                self._timer = threading.Timer(delay, self._flush_deferred)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write any deferred snapshot to status.json now."""
+        with self._lock:
+            self._cancel_timer()
+            data, self._pending = self._pending, None
+            if data is not None:
+                self._write_snapshot(data)
+
+    def _flush_deferred(self) -> None:
+        """Timer callback: flush, logging rather than raising on failure."""
+        try:
+            self.flush()
+        except OSError:
+            logger.debug("Failed to write deferred status snapshot", exc_info=True)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write_snapshot(self, data: dict[str, Any]) -> None:
+        """Write status.json atomically (temp file + rename)."""
         temp_path = self.status_path.with_suffix(".json.tmp")
         try:
             with temp_path.open("w") as f:
-                json.dump(data, f, indent=2, default=self._json_serializer)
+                json.dump(data, f, separators=(",", ":"), default=self._json_serializer)
             temp_path.rename(self.status_path)
         except Exception:
             # Clean up temp file on failure
             if temp_path.exists():
                 temp_path.unlink()
             raise
+        self._last_snapshot = self._clock()
+        self._compact_journal()
+
+    def _compact_journal(self) -> None:
+        """
+        Restart status.jsonl from one snapshot record once it's too large.
+
+        The journal is replaced rather than truncated, so a reader never
+        sees it empty; readers notice the new file and replay it.
+        """
+        data = self._journaled
+        if data is None:
+            return
+        try:
+            if self.journal_path.stat().st_size < self._journal_limit:
+                return
+        except OSError:
+            return
+        record = {"op": "snapshot", "status": data}
+        line = json.dumps(record, separators=(",", ":"), default=self._json_serializer)
+        temp_path = self.journal_path.with_suffix(".jsonl.tmp")
+        try:
+            temp_path.write_text(line + "\n", encoding="utf-8")
+            temp_path.replace(self.journal_path)
+        except OSError:
+            # The journal just keeps growing until the next try
+            logger.debug("Failed to compact %s", self.journal_path, exc_info=True)
+            temp_path.unlink(missing_ok=True)
+
+    def _append_journal(self, data: dict[str, Any]) -> None:
+        """Append the difference from the previous write to status.jsonl."""
+        previous = self._journaled
+        record: dict[str, Any]
+        if previous is None:
+            record = {"op": "snapshot", "status": data}
+        else:
+            fields = {
+                key: value
+                for key, value in data.items()
+                if key != "events" and previous.get(key) != value
+            }
+            record = {"op": "update", "fields": fields}
+            old_events = previous.get("events", [])
+            new_events = data.get("events", [])
+            appended = len(new_events) >= len(old_events) and (
+                not old_events or new_events[len(old_events) - 1] == old_events[-1]
+            )
+            if appended:
+                if len(new_events) > len(old_events):
+                    record["events"] = new_events[len(old_events) :]
+            else:
+                fields["events"] = new_events
+
+        line = json.dumps(record, separators=(",", ":"), default=self._json_serializer)
+        with self.journal_path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        self._journaled = data
 
     def read(self) -> RunStatus | None:
         """
         Read status from status.json.
 
+        Any deferred snapshot is flushed first.
+
         Returns:
             RunStatus if file exists and is valid, None otherwise
         """
+        self.flush()
         if not self.status_path.exists():
             return None
 
@@ -98,6 +255,9 @@ class StatusWriter:
         Args:
             artifact: RunArtifact to serialize
         """
+        # The run is wrapping up, so bring status.json up to date too
+        self.flush()
+
         # Serialize to JSON
         data = artifact.model_dump(mode="json")
 
@@ -201,8 +361,26 @@ class StatusWriter:
 {task_prompt}
 """
 
-        # Write to file
-        prompt_path.write_text(content, encoding="utf-8")
+        # Write to file, or to the store so the system prompt is kept once
+        if self.artifact_store is not None:
+            self.artifact_store.write(prompt_path, split_prompt(content))
+        else:
+            prompt_path.write_text(content, encoding="utf-8")
+
+    def store_harness_log(self, task_id: str) -> None:
+        """
+        Move a finished task's harness.log into the artifact store.
+
+        The harness writes harness.log as plain text while it runs; once
+        the attempt has been recorded the log can be stored compressed,
+        sharing its content with the ledger's copy. Does nothing without
+        an artifact store.
+
+        Args:
+            task_id: Task identifier
+        """
+        if self.artifact_store is not None:
+            self.artifact_store.absorb(self.get_harness_log_path(task_id))
 
     def write_task_artifact(self, task_id: str, artifact: TaskArtifact) -> None:
         """
@@ -6,6 +6,7 @@ analyzing tasks, git history, ledger entries, and milestones to recommend
 specific actions with rationale.
 """
 
+from cub.core.suggestions.cache import SuggestionCache
 from cub.core.suggestions.engine import SuggestionEngine, WelcomeMessage
 from cub.core.suggestions.models import (
     ProjectSnapshot,
@@ -36,5 +37,6 @@ __all__ = [
     "rank_suggestions",
     # Engine
     "SuggestionEngine",
+    "SuggestionCache",
     "WelcomeMessage",
 ]
@@ -0,0 +1,196 @@
+"""
+Short-lived on-disk cache for suggestion source results.
+
+Each source's suggestions are stored under .cub/cache/suggestions/ as one
+JSON file per source, together with the key they were computed for. A
+source's key fingerprints the state it reads (task files, the ledger
+index, git HEAD and index), so a stored result is reused only while that
+state is unchanged. Results also expire after a short TTL, which bounds
+staleness from changes a key doesn't see, such as edits to tracked files
+that haven't been staged, or time passing for "last 24h" checks.
+
+This makes repeated ``cub`` and ``cub suggest`` invocations in a session
+return almost instantly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from cub.core.suggestions.models import Suggestion
+
+logger = logging.getLogger(__name__)
+
+# Bump when suggestion logic changes in a way that invalidates stored results
+CACHE_VERSION = 1
+
+# Seconds a stored result is reused for, even if its key still matches
+DEFAULT_TTL = 120.0
+
+
+def file_signature(paths: Iterable[Path]) -> str:
+    """Summarise the size and mtime of files, noting any that are missing.
+
+    Args:
+        paths: Files (or directories) to fingerprint
+
+    Returns:
+        String that changes whenever any of the files is written,
+        created or removed
+    """
+    parts: list[str] = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            parts.append(f"{path}:-")
+            continue
+        parts.append(f"{path}:{st.st_size}:{st.st_mtime_ns}")
+    return "|".join(parts)
+
+
+def git_signature(project_dir: Path) -> str | None:
+    """Fingerprint a repository's HEAD commit and index.
+
+    Args:
+        project_dir: Directory inside the repository
+
+    Returns:
+        Signature string, or None if git is unavailable or this isn't a
+        repository
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--absolute-git-dir", "HEAD"],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    lines = result.stdout.split()
+    if result.returncode != 0 or len(lines) != 2:
+        return None
+    git_dir, head = lines
+    return f"{head}|{file_signature([Path(git_dir) / 'index'])}"
+
+
+class SuggestionCache:
+    """File-backed cache of per-source suggestions.
+
+    Example:
+        >>> cache = SuggestionCache.for_project(Path("."))
+        >>> suggestions = cache.get("GitSource", key)
+        >>> if suggestions is None:
+        ...     suggestions = source.get_suggestions()
+        ...     cache.set("GitSource", key, suggestions)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cached results in
+            ttl: Seconds a stored result stays valid
+            clock: Time source (for tests)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._clock = clock
+
+    @classmethod
+    def for_project(cls, project_dir: Path, ttl: float = DEFAULT_TTL) -> SuggestionCache:
+        """Create a cache in the project's .cub/cache/suggestions directory."""
+        return cls(project_dir / ".cub" / "cache" / "suggestions", ttl=ttl)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from a source's state fingerprints.
+
+        Returns:
+            Hex digest identifying the source's inputs
+        """
+        raw = "\n".join([f"v{CACHE_VERSION}", *parts])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.json"
+
+    def get(self, name: str, key: str) -> list[Suggestion] | None:
+        """Return a source's cached suggestions, or None on a miss.
+
+        Args:
+            name: Source name
+            key: Key the caller would compute the suggestions for
+        """
+        path = self._path(name)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.debug("Discarding unreadable suggestion cache %s", path, exc_info=True)
+            return None
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+        stored_at = data.get("stored_at")
+        if (
+            not isinstance(stored_at, (int, float))
+            or not 0 <= self._clock() - stored_at <= self.ttl
+        ):
+            return None
+        try:
+            return [Suggestion.model_validate(s) for s in data.get("suggestions", [])]
+        except (ValidationError, TypeError):
+            logger.debug("Discarding invalid suggestion cache %s", path, exc_info=True)
+            return None
+
+    def set(self, name: str, key: str, suggestions: list[Suggestion]) -> None:
+        """Store a source's suggestions. Write failures are logged and ignored."""
+        data = {
+            "key": key,
+            "stored_at": self._clock(),
+            "suggestions": [s.model_dump(mode="json") for s in suggestions],
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self._path(name))
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("Failed to write suggestion cache", exc_info=True)
+
+    def clear(self) -> int:
+        """Remove all cached results.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
@@ -3,11 +3,20 @@ Suggestion engine for cub.
 
 Composes data sources, applies ranking, and provides the public API
 for getting smart suggestions about what to do next.
+
+Sources are queried concurrently, each with a timeout, so a slow source
+(git on a large repository, a big ledger) can't stall the welcome screen;
+its suggestions are left out of that call instead. Results are memoised
+per source in a SuggestionCache.
 """
 
+import logging
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
+from cub.core.suggestions.cache import SuggestionCache
 from cub.core.suggestions.models import Suggestion
 from cub.core.suggestions.ranking import rank_suggestions
 from cub.core.suggestions.sources import (
@@ -18,6 +27,11 @@ from cub.core.suggestions.sources import (
     TaskSource,
 )
 
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for each source before leaving it out
+DEFAULT_SOURCE_TIMEOUT = 3.0
+
 
 @dataclass
 class WelcomeMessage:
@@ -48,13 +62,24 @@ class SuggestionEngine:
     actionable recommendations.
     """
 
-    def __init__(self, project_dir: Path | None = None):
+    def __init__(
+        self,
+        project_dir: Path | None = None,
+        *,
+        source_timeout: float = DEFAULT_SOURCE_TIMEOUT,
+        cache: SuggestionCache | None = None,
+    ):
         """Initialize suggestion engine.
 
         Args:
             project_dir: Project directory path (defaults to cwd)
+            source_timeout: Seconds to wait for each source
+            cache: Cache for source results (defaults to the project's
+                .cub/cache/suggestions)
         """
         self.project_dir = project_dir or Path.cwd()
+        self.source_timeout = source_timeout
+        self.cache = cache or SuggestionCache.for_project(self.project_dir)
 
         # Initialize data sources
         self.sources: list[SuggestionSource] = [
@@ -67,8 +92,9 @@ class SuggestionEngine:
     def get_suggestions(self, limit: int | None = None) -> list[Suggestion]:
         """Get ranked list of suggestions.
 
-        Collects suggestions from all sources, ranks them, and returns
-        the top N suggestions.
+        Collects suggestions from all sources concurrently, ranks them,
+        and returns the top N suggestions. Sources that fail or don't
+        finish within the timeout are skipped.
 
         Args:
             limit: Maximum number of suggestions to return (None = all)
@@ -76,16 +102,35 @@ class SuggestionEngine:
         Returns:
             Ranked list of suggestions (highest priority first)
         """
-        # Collect suggestions from all sources
-        all_suggestions: list[Suggestion] = []
-        for source in self.sources:
+        results: list[list[Suggestion] | None] = [None] * len(self.sources)
+
+        def collect(index: int, source: SuggestionSource) -> None:
             try:
-                source_suggestions = source.get_suggestions()
-                all_suggestions.extend(source_suggestions)
+                results[index] = self._collect(source)
             except Exception:
                 # If a source fails, continue with others
                 # This ensures we always provide some suggestions
-                continue
+                logger.debug("Suggestion source %r failed", source, exc_info=True)
+
+        # Daemon threads: a source that times out keeps running (and fills
+        # the cache for next time) without holding up the caller or exit
+        threads = [
+            threading.Thread(target=collect, args=(i, source), name="cub-suggest", daemon=True)
+            for i, source in enumerate(self.sources)
+        ]
+        deadline = time.monotonic() + self.source_timeout
+        for thread in threads:
+            thread.start()
+        for source, thread in zip(self.sources, threads, strict=True):
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                logger.debug("Suggestion source %r timed out", source)
+
+        # Keep source order so ranking ties break the same way every time
+        all_suggestions: list[Suggestion] = []
+        for source_suggestions in results:
+            if source_suggestions is not None:
+                all_suggestions.extend(source_suggestions)
 
         # Rank all suggestions
         ranked_suggestions = rank_suggestions(all_suggestions)
@@ -96,6 +141,21 @@ class SuggestionEngine:
 
         return ranked_suggestions
 
+    def _collect(self, source: SuggestionSource) -> list[Suggestion]:
+        """Get one source's suggestions, from the cache if still valid."""
+        key_method = getattr(source, "cache_key", None)
+        key = key_method() if callable(key_method) else None
+        if not isinstance(key, str):
+            return source.get_suggestions()
+
+        name = type(source).__name__
+        cached = self.cache.get(name, key)
+        if cached is not None:
+            return cached
+        suggestions = source.get_suggestions()
+        self.cache.set(name, key, suggestions)
+        return suggestions
+
     def get_next_action(self) -> Suggestion | None:
         """Get single best recommendation for what to do next.
 
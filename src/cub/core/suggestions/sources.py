@@ -14,6 +14,7 @@ from typing import Protocol, runtime_checkable
 
 from cub.core.ledger.models import VerificationStatus, WorkflowStage
 from cub.core.ledger.reader import LedgerReader
+from cub.core.suggestions.cache import SuggestionCache, file_signature, git_signature
 from cub.core.suggestions.models import Suggestion, SuggestionCategory
 from cub.core.tasks.backend import TaskBackend, get_backend
 from cub.core.tasks.models import Task, TaskPriority, TaskStatus, TaskType
@@ -26,6 +27,10 @@ class SuggestionSource(Protocol):
 
     Each source analyzes a specific aspect of project state
     (tasks, git, ledger, milestones) and generates relevant suggestions.
+
+    Sources may also provide a ``cache_key() -> str | None`` method that
+    cheaply fingerprints the state they read. The engine then reuses
+    their results from a short-lived cache while the key is unchanged.
     """
 
     def get_suggestions(self) -> list[Suggestion]:
@@ -37,6 +42,17 @@ class SuggestionSource(Protocol):
         ...
 
 
+def _task_storage_signature(project_dir: Path, backend: TaskBackend) -> str:
+    """Fingerprint the files task backends read from."""
+    beads_dir = project_dir / ".beads"
+    try:
+        beads_files = sorted(p for p in beads_dir.iterdir() if p.is_file())
+    except OSError:
+        beads_files = []
+    paths = [*beads_files, project_dir / ".cub" / "tasks.jsonl", project_dir / "prd.json"]
+    return f"{type(backend).__name__}|{file_signature(paths)}"
+
+
 class TaskSource:
     """Generates suggestions from task backend state.
 
@@ -53,6 +69,10 @@ class TaskSource:
         self.project_dir = project_dir or Path.cwd()
         self.backend: TaskBackend = get_backend(project_dir=self.project_dir)
 
+    def cache_key(self) -> str:
+        """Key identifying the task state suggestions are computed from."""
+        return SuggestionCache.make_key(_task_storage_signature(self.project_dir, self.backend))
+
     def get_suggestions(self) -> list[Suggestion]:
         """Generate task-related suggestions.
 
@@ -217,6 +237,11 @@ class GitSource:
         """
         self.project_dir = project_dir or Path.cwd()
 
+    def cache_key(self) -> str | None:
+        """Key identifying the repository state, or None outside git."""
+        signature = git_signature(self.project_dir)
+        return SuggestionCache.make_key(signature) if signature else None
+
     def get_suggestions(self) -> list[Suggestion]:
         """Generate git-related suggestions.
 
@@ -383,6 +408,11 @@ class LedgerSource:
         except Exception:
             self.ledger = None
 
+    def cache_key(self) -> str:
+        """Key identifying the ledger state suggestions are computed from."""
+        index = self.project_dir / ".cub" / "ledger" / "index.jsonl"
+        return SuggestionCache.make_key(file_signature([index]))
+
     def get_suggestions(self) -> list[Suggestion]:
         """Generate ledger-related suggestions.
 
@@ -501,6 +531,10 @@ class MilestoneSource:
         self.project_dir = project_dir or Path.cwd()
         self.backend: TaskBackend = get_backend(project_dir=self.project_dir)
 
+    def cache_key(self) -> str:
+        """Key identifying the task state suggestions are computed from."""
+        return SuggestionCache.make_key(_task_storage_signature(self.project_dir, self.backend))
+
     def get_suggestions(self) -> list[Suggestion]:
         """Generate milestone-related suggestions.
 
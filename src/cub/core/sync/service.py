@@ -22,7 +22,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from cub.core.profiling import profiled
 from cub.core.sync.models import SyncConflict, SyncResult, SyncState, SyncStatus
+from cub.core.sync.task_index import TaskIndex
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +57,7 @@ class SyncService:
     DEFAULT_BRANCH = "cub-sync"
     DEFAULT_TASKS_FILE = ".cub/tasks.jsonl"
     STATE_FILE = ".cub/.sync-state.json"
+    INDEX_FILE = ".cub/.sync-index.json"
 
     def __init__(
         self,
@@ -81,6 +84,11 @@ class SyncService:
         """Full path to the sync state file."""
         return self.project_dir / self.STATE_FILE
 
+    @property
+    def index_file_path(self) -> Path:
+        """Full path to the per-task hash index file."""
+        return self.project_dir / self.INDEX_FILE
+
     @property
     def tasks_file_path(self) -> Path:
         """Full path to the tasks file."""
@@ -181,6 +189,39 @@ class SyncService:
                 temp_path.unlink()
             raise
 
+    def _load_task_hashes(self) -> tuple[str | None, dict[str, str]]:
+        """
+        Load per-task line hashes recorded at the last sync commit.
+
+        Returns:
+            Tuple of (commit SHA the hashes describe, task ID -> line hash).
+        """
+        try:
+            data = json.loads(self.index_file_path.read_text())
+            commit_sha = data.get("commit_sha")
+            tasks = data.get("tasks")
+            if isinstance(tasks, dict):
+                return (commit_sha if isinstance(commit_sha, str) else None), tasks
+        except (OSError, ValueError, AttributeError):
+            pass
+        return None, {}
+
+    def _save_task_hashes(self, commit_sha: str, hashes: dict[str, str]) -> None:
+        """Record per-task line hashes for a sync commit. Errors are logged."""
+        temp_path = self.index_file_path.with_suffix(".tmp")
+        try:
+            self.index_file_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps({"commit_sha": commit_sha, "tasks": hashes}))
+            temp_path.replace(self.index_file_path)
+        except OSError as e:
+            logger.warning("Failed to save sync task index: %s", e)
+            temp_path.unlink(missing_ok=True)
+
+    def _known_line_hashes(self) -> dict[str, str]:
+        """Line hash -> task ID for every task recorded at the last sync commit."""
+        _, hashes = self._load_task_hashes()
+        return {line_hash: task_id for task_id, line_hash in hashes.items()}
+
     def _is_git_repo(self) -> bool:
         """Check if we're in a git repository."""
         try:
@@ -328,6 +369,7 @@ class SyncService:
 
         return current_tree_sha
 
+    @profiled("sync.commit", "sync")
     def commit(self, message: str | None = None) -> str:
         """
         Commit current task state to the sync branch.
@@ -358,15 +400,35 @@ class SyncService:
                 f"Tasks file not found: {self.tasks_file_path}. Create the file before committing."
             )
 
-        # Read tasks file content
-        tasks_content = self.tasks_file_path.read_text()
+        return self._commit_content(self.tasks_file_path.read_text(), message)
+
+    def _commit_content(
+        self,
+        tasks_content: str,
+        message: str | None = None,
+        *,
+        merge_parent: str | None = None,
+        index: TaskIndex | None = None,
+    ) -> str:
+        """
+        Commit the given tasks content to the sync branch.
 
+        Args:
+            tasks_content: Full tasks file content to store.
+            message: Commit message. Defaults to "Update tasks".
+            merge_parent: Extra parent (e.g. the merged remote tip), making
+                this a merge commit so the next pull has the right base.
+            index: Task index of ``tasks_content`` if the caller has one.
+
+        Returns:
+            SHA of the created (or unchanged) commit.
+        """
         # Compute content hash for change detection
         content_hash = self._hash_file_content(tasks_content)
 
         # Check if content has changed
         state = self._load_state()
-        if state.last_tasks_hash == content_hash:
+        if state.last_tasks_hash == content_hash and merge_parent is None:
             logger.info("No changes to commit (content hash unchanged)")
             # Return the existing commit SHA if no changes
             if state.last_commit_sha:
@@ -396,9 +458,12 @@ class SyncService:
 
         # Step 4: Create commit with commit-tree
         if parent_sha:
-            # Normal commit with parent
+            # Normal commit with parent (plus the merged tip, if any)
+            parent_args = ["-p", parent_sha]
+            if merge_parent and merge_parent != parent_sha:
+                parent_args += ["-p", merge_parent]
             commit_sha = self._run_git(
-                ["commit-tree", tree_sha, "-p", parent_sha, "-m", message],
+                ["commit-tree", tree_sha, *parent_args, "-m", message],
             )
         else:
             # Root commit (shouldn't happen if initialized, but handle it)
@@ -416,9 +481,12 @@ class SyncService:
             message,
         )
 
-        # Step 6: Update sync state
+        # Step 6: Update sync state and per-task hashes
         state.mark_synced(commit_sha, content_hash)
         self._save_state(state)
+        if index is None:
+            index = TaskIndex.from_content(tasks_content, self._known_line_hashes())
+        self._save_task_hashes(commit_sha, index.hashes())
 
         return commit_sha
 
@@ -482,6 +550,25 @@ class SyncService:
         except GitError:
             return None
 
+    def _get_blob_sha(self, ref: str, file_path: str) -> str | None:
+        """
+        Get the blob SHA of a file in a git ref without reading its content.
+
+        Returns:
+            Blob SHA, or None if the ref or file doesn't exist.
+        """
+        try:
+            return self._run_git(["rev-parse", "--verify", "--quiet", f"{ref}:{file_path}"])
+        except GitError:
+            return None
+
+    def _get_merge_base(self, ref_a: str, ref_b: str) -> str | None:
+        """Get the best common ancestor of two refs, or None if unrelated."""
+        try:
+            return self._run_git(["merge-base", ref_a, ref_b]) or None
+        except GitError:
+            return None
+
     def _parse_tasks_from_jsonl(self, content: str) -> dict[str, dict[str, Any]]:
         """
         Parse JSONL content into a dict of tasks keyed by ID.
@@ -550,23 +637,93 @@ class SyncService:
 
         return None
 
+    def _pick_winner(
+        self, local_task: dict[str, Any], remote_task: dict[str, Any]
+    ) -> tuple[str, datetime | None, datetime | None]:
+        """
+        Decide which side wins a conflict by last-write-wins on updated_at.
+
+        Returns:
+            Tuple of (winner, local_updated_at, remote_updated_at), where
+            winner is "local" or "remote". Missing timestamps lose; if
+            neither side has one, remote (the incoming change) wins.
+        """
+        local_updated = self._get_task_updated_at(local_task)
+        remote_updated = self._get_task_updated_at(remote_task)
+        if local_updated is None or (
+            remote_updated is not None and remote_updated > local_updated
+        ):
+            return "remote", local_updated, remote_updated
+        return "local", local_updated, remote_updated
+
+    def _merge_task_fields(
+        self,
+        base_task: dict[str, Any],
+        local_task: dict[str, Any],
+        remote_task: dict[str, Any],
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Three-way merge of one task's fields.
+
+        Fields changed on only one side take that side's value. Fields
+        changed differently on both sides are collisions and keep the local
+        value for the caller to resolve; ``updated_at`` never collides and
+        takes the later timestamp.
+
+        Returns:
+            Tuple of (merged_task, colliding_field_names).
+        """
+        missing = object()
+        merged = dict(local_task)
+        collisions: list[str] = []
+        for key in dict.fromkeys([*local_task, *remote_task]):
+            base_value = base_task.get(key, missing)
+            local_value = local_task.get(key, missing)
+            remote_value = remote_task.get(key, missing)
+            if local_value == remote_value or remote_value == base_value:
+                continue
+            if local_value == base_value:
+                if remote_value is missing:
+                    merged.pop(key, None)
+                else:
+                    merged[key] = remote_value
+            elif key == "updated_at":
+                winner, _, _ = self._pick_winner(local_task, remote_task)
+                if winner == "remote":
+                    merged[key] = remote_value
+            else:
+                collisions.append(key)
+        return merged, collisions
+
     def _merge_tasks(
         self,
         local_tasks: dict[str, dict[str, Any]],
         remote_tasks: dict[str, dict[str, Any]],
+        base_tasks: dict[str, dict[str, Any]] | None = None,
     ) -> tuple[dict[str, dict[str, Any]], list[SyncConflict], int]:
         """
-        Merge remote tasks into local tasks using last-write-wins strategy.
+        Merge remote tasks into local tasks.
 
-        For each task:
+        With ``base_tasks`` (the tasks at the last common sync commit) this
+        is a three-way merge:
+        - Changed on one side only: take that side (including deletions)
+        - Changed on both sides: merge field by field; fields changed
+          differently on both sides are resolved by last-write-wins on
+          ``updated_at`` and reported as a conflict
+
+        Without a base, falls back to last-write-wins on whole tasks:
         - If only in local: keep local version
         - If only in remote: add remote version
         - If in both with same content: no change
         - If in both with different content: use version with later updated_at
 
+        Tasks taken wholesale from one side are the same dict objects that
+        were passed in.
+
         Args:
             local_tasks: Local tasks dict (task_id -> task_data).
             remote_tasks: Remote tasks dict (task_id -> task_data).
+            base_tasks: Tasks at the merge base, or None if unknown.
 
         Returns:
             Tuple of (merged_tasks, conflicts, tasks_updated_count).
@@ -575,85 +732,143 @@ class SyncService:
         conflicts: list[SyncConflict] = []
         tasks_updated = 0
 
-        for task_id, remote_task in remote_tasks.items():
-            if task_id not in local_tasks:
-                # Task only exists remotely - add it
-                merged[task_id] = remote_task
-                tasks_updated += 1
-                logger.debug("Added task %s from remote", task_id)
-            else:
-                local_task = local_tasks[task_id]
+        for task_id in dict.fromkeys([*local_tasks, *remote_tasks]):
+            local_task = local_tasks.get(task_id)
+            remote_task = remote_tasks.get(task_id)
+            if local_task == remote_task:
+                # No conflict - same content
+                continue
 
-                # Check if tasks are identical
-                if json.dumps(local_task, sort_keys=True) == json.dumps(
-                    remote_task, sort_keys=True
-                ):
-                    # No conflict - same content
+            if base_tasks is not None:
+                base_task = base_tasks.get(task_id)
+                if remote_task == base_task:
+                    # Only local changed
+                    continue
+                if local_task == base_task:
+                    # Only remote changed
+                    if remote_task is None:
+                        merged.pop(task_id, None)
+                        logger.debug("Removed task %s deleted on remote", task_id)
+                    else:
+                        merged[task_id] = remote_task
+                        logger.debug("Applied remote change to task %s", task_id)
+                    tasks_updated += 1
+                    continue
+                if local_task is None or remote_task is None:
+                    # Deleted on one side, modified on the other: keep the edit
+                    if remote_task is not None:
+                        merged[task_id] = remote_task
+                        tasks_updated += 1
+                    logger.info("Task %s deleted on one side and edited on the other", task_id)
                     continue
 
-                # Different content - resolve using last-write-wins
-                local_updated = self._get_task_updated_at(local_task)
-                remote_updated = self._get_task_updated_at(remote_task)
-
-                # Determine winner
-                winner: str
-                if local_updated is None and remote_updated is None:
-                    # No timestamps - prefer remote (incoming changes)
-                    winner = "remote"
-                elif local_updated is None:
-                    # Only remote has timestamp - prefer remote
-                    winner = "remote"
-                elif remote_updated is None:
-                    # Only local has timestamp - prefer local
-                    winner = "local"
-                elif remote_updated > local_updated:
-                    # Remote is newer
-                    winner = "remote"
-                else:
-                    # Local is newer or same time
-                    winner = "local"
-
-                # Record conflict
-                conflict = SyncConflict(
-                    task_id=task_id,
-                    local_updated_at=local_updated,
-                    remote_updated_at=remote_updated,
-                    resolution="last_write_wins",
-                    winner=winner,
+                fields, collisions = self._merge_task_fields(
+                    base_task or {}, local_task, remote_task
                 )
-                conflicts.append(conflict)
-
-                if winner == "remote":
-                    merged[task_id] = remote_task
-                    tasks_updated += 1
-                    logger.info(
-                        "Conflict on %s: using remote (updated %s vs local %s)",
-                        task_id,
-                        remote_updated,
-                        local_updated,
+                if collisions:
+                    winner, local_updated, remote_updated = self._pick_winner(
+                        local_task, remote_task
+                    )
+                    if winner == "remote":
+                        for key in collisions:
+                            if key in remote_task:
+                                fields[key] = remote_task[key]
+                            else:
+                                fields.pop(key, None)
+                    conflicts.append(
+                        SyncConflict(
+                            task_id=task_id,
+                            local_updated_at=local_updated,
+                            remote_updated_at=remote_updated,
+                            resolution="last_write_wins",
+                            winner=winner,
+                        )
                     )
-                else:
                     logger.info(
-                        "Conflict on %s: keeping local (updated %s vs remote %s)",
+                        "Conflict on %s fields %s: using %s",
                         task_id,
-                        local_updated,
-                        remote_updated,
+                        ", ".join(collisions),
+                        winner,
                     )
+                if fields != local_task:
+                    merged[task_id] = fields
+                    tasks_updated += 1
+                continue
+
+            if remote_task is None:
+                # Task only exists locally - keep it
+                continue
+            if local_task is None:
+                # Task only exists remotely - add it
+                merged[task_id] = remote_task
+                tasks_updated += 1
+                logger.debug("Added task %s from remote", task_id)
+                continue
+
+            # Different content - resolve using last-write-wins
+            winner, local_updated, remote_updated = self._pick_winner(local_task, remote_task)
+
+            # Record conflict
+            conflict = SyncConflict(
+                task_id=task_id,
+                local_updated_at=local_updated,
+                remote_updated_at=remote_updated,
+                resolution="last_write_wins",
+                winner=winner,
+            )
+            conflicts.append(conflict)
+
+            if winner == "remote":
+                merged[task_id] = remote_task
+                tasks_updated += 1
+                logger.info(
+                    "Conflict on %s: using remote (updated %s vs local %s)",
+                    task_id,
+                    remote_updated,
+                    local_updated,
+                )
+            else:
+                logger.info(
+                    "Conflict on %s: keeping local (updated %s vs remote %s)",
+                    task_id,
+                    local_updated,
+                    remote_updated,
+                )
 
         return merged, conflicts, tasks_updated
 
+    def _task_line(
+        self,
+        task_id: str,
+        task: dict[str, Any],
+        local_index: TaskIndex,
+        remote_index: TaskIndex,
+    ) -> str:
+        """JSONL line for a merged task, reusing the original line when unchanged."""
+        for index in (local_index, remote_index):
+            entry = index.get(task_id)
+            if entry is not None and index.task(task_id) is task:
+                return entry.line
+        return json.dumps(task, ensure_ascii=False)
+
+    @profiled("sync.pull", "sync")
     def pull(self) -> SyncResult:
         """
         Pull and merge remote changes into local task state.
 
-        Fetches the sync branch from remote, compares with local tasks,
-        detects conflicts, and applies last-write-wins resolution based
-        on the `updated_at` timestamp. Commits the merged result locally.
+        Fetches the sync branch from remote and three-way merges its tasks
+        with local tasks, using the last common sync commit as the base.
+        Tasks are compared by per-task line hashes, so only tasks that
+        differ are parsed and merged. The result is committed locally as a
+        merge of the remote tip.
 
         Conflict Resolution:
-        - Same task modified in both local and remote triggers a conflict
-        - The version with the later `updated_at` timestamp wins
+        - A task changed on only one side takes that side's version
+        - A task changed on both sides is merged field by field
+        - Fields changed differently on both sides trigger a conflict; the
+          version with the later `updated_at` timestamp wins
         - If timestamps are missing, remote changes take precedence
+        - Without a common base, whole tasks are resolved by last-write-wins
         - All conflicts are logged as warnings
 
         Returns:
@@ -701,9 +916,10 @@ class SyncService:
                 completed_at=datetime.now(),
             )
 
-        # Step 2: Get remote tasks content
-        remote_content = self._get_file_from_ref(remote_ref, self.tasks_file)
-        if remote_content is None:
+        # Step 2: Skip the merge entirely if remote tasks are unchanged since
+        # the last common sync commit (blob SHAs compare without reading)
+        remote_blob = self._get_blob_sha(remote_ref, self.tasks_file)
+        if remote_blob is None:
             # Remote branch exists but has no tasks file
             return SyncResult(
                 success=True,
@@ -714,17 +930,30 @@ class SyncService:
                 completed_at=datetime.now(),
             )
 
-        # Step 3: Get local tasks content
+        base_sha = self._get_merge_base(self.branch_ref, remote_ref)
+        if base_sha and self._get_blob_sha(base_sha, self.tasks_file) == remote_blob:
+            return SyncResult(
+                success=True,
+                operation="pull",
+                message="Local tasks are up to date with remote",
+                tasks_updated=0,
+                started_at=started_at,
+                completed_at=datetime.now(),
+            )
+
+        # Step 3: Index remote, local, and base tasks by line hash. Lines
+        # already recorded at the last sync commit aren't parsed at all.
+        known = self._known_line_hashes()
+        remote_index = TaskIndex.from_content(
+            self._get_file_from_ref(remote_ref, self.tasks_file) or "", known
+        )
         local_content = ""
         if self.tasks_file_path.exists():
             local_content = self.tasks_file_path.read_text()
+        local_index = TaskIndex.from_content(local_content, known)
 
-        # Step 4: Parse tasks
-        remote_tasks = self._parse_tasks_from_jsonl(remote_content)
-        local_tasks = self._parse_tasks_from_jsonl(local_content)
-
-        # Step 5: Check if there's anything to merge
-        if not remote_tasks:
+        # Step 4: Check if there's anything to merge
+        if not remote_index:
             return SyncResult(
                 success=True,
                 operation="pull",
@@ -734,9 +963,32 @@ class SyncService:
                 completed_at=datetime.now(),
             )
 
-        # Step 6: Merge tasks with conflict detection
+        base_index: TaskIndex | None = None
+        if base_sha:
+            base_index = TaskIndex.from_content(
+                self._get_file_from_ref(base_sha, self.tasks_file) or "", known
+            )
+
+        # Step 5: Find tasks that differ; only these are parsed and merged
+        changed: list[str] = []
+        for task_id in dict.fromkeys([*local_index, *remote_index]):
+            remote_hash = remote_index.hash_of(task_id)
+            if local_index.hash_of(task_id) == remote_hash:
+                continue
+            if base_index is not None and base_index.hash_of(task_id) == remote_hash:
+                # Only local changed since the base
+                continue
+            changed.append(task_id)
+
+        # Step 6: Merge changed tasks with conflict detection
         merged_tasks, conflicts, tasks_updated = self._merge_tasks(
-            local_tasks, remote_tasks
+            {t: local_index.task(t) for t in changed if t in local_index},
+            {t: remote_index.task(t) for t in changed if t in remote_index},
+            (
+                {t: base_index.task(t) for t in changed if t in base_index}
+                if base_index is not None
+                else None
+            ),
         )
 
         # Log warnings for conflicts
@@ -749,9 +1001,22 @@ class SyncService:
                 conflict.remote_updated_at,
             )
 
-        # Step 7: Write merged result if there were changes
+        # Step 7: Write merged result if there were changes, reusing the
+        # original lines of every task that wasn't rewritten by the merge
         if tasks_updated > 0:
-            merged_content = self._serialize_tasks_to_jsonl(merged_tasks)
+            changed_ids = set(changed)
+            lines: list[str] = []
+            for task_id in dict.fromkeys([*local_index, *remote_index]):
+                if task_id not in changed_ids:
+                    entry = local_index.get(task_id)
+                    if entry is not None:
+                        lines.append(entry.line)
+                    continue
+                merged_task = merged_tasks.get(task_id)
+                if merged_task is None:
+                    continue
+                lines.append(self._task_line(task_id, merged_task, local_index, remote_index))
+            merged_content = "\n".join(lines) + "\n" if lines else ""
 
             # Ensure .cub directory exists
             self.tasks_file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -771,8 +1036,15 @@ class SyncService:
             if conflicts:
                 commit_message += f" [{len(conflicts)} conflicts resolved]"
 
+            for index in (local_index, remote_index):
+                known.update({line_hash: t for t, line_hash in index.hashes().items()})
             try:
-                commit_sha = self.commit(commit_message)
+                commit_sha = self._commit_content(
+                    merged_content,
+                    commit_message,
+                    merge_parent=self._get_branch_sha(remote_ref),
+                    index=TaskIndex.from_content(merged_content, known),
+                )
             except (RuntimeError, GitError) as e:
                 return SyncResult(
                     success=False,
@@ -806,6 +1078,7 @@ class SyncService:
             completed_at=datetime.now(),
         )
 
+    @profiled("sync.push", "sync")
     def push(self) -> bool:
         """
         Push local sync branch to remote.
@@ -0,0 +1,128 @@
+"""
+Per-task content hashes for the synced tasks file.
+
+A TaskIndex maps each task in a JSONL tasks file to the hash of its raw
+line. Comparing two indexes finds the tasks that differ without parsing
+or re-serialising the ones that don't. Lines whose hash is already known
+(from the hashes stored at the last sync commit) don't even need to be
+parsed to learn their task ID, so building an index for an unchanged
+file costs one hash per line.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterator, Mapping
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+def hash_task_line(line: str) -> str:
+    """Hash one JSONL line (without its trailing newline)."""
+    return hashlib.sha256(line.encode()).hexdigest()
+
+
+class IndexedTask(NamedTuple):
+    """A task's raw JSONL line and its hash."""
+
+    task_id: str
+    hash: str
+    line: str
+
+
+class TaskIndex:
+    """
+    Ordered index of the tasks in a JSONL tasks file.
+
+    Example:
+        >>> index = TaskIndex.from_content(content, known={"ab12...": "task-1"})
+        >>> index.hash_of("task-1")
+        'ab12...'
+        >>> index.task("task-1")  # parsed on first access
+        {'id': 'task-1', ...}
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._entries: dict[str, IndexedTask] = {}
+        self._parsed: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def from_content(cls, content: str, known: Mapping[str, str] | None = None) -> TaskIndex:
+        """
+        Index JSONL content.
+
+        Invalid lines and objects without an ``id`` are skipped. When a
+        task ID appears more than once, the last line wins.
+
+        Args:
+            content: JSONL tasks file content
+            known: Line hash -> task ID for lines seen before; matching
+                lines are indexed without being parsed
+
+        Returns:
+            TaskIndex in file order
+        """
+        index = cls()
+        known = known or {}
+        for raw in content.splitlines():
+            line = raw.strip()
+            if not line:
+                continue
+            line_hash = hash_task_line(line)
+            task_id = known.get(line_hash)
+            if task_id is None:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping invalid JSONL line in tasks file")
+                    continue
+                if not isinstance(data, dict) or "id" not in data:
+                    continue
+                task_id = data["id"]
+                index._parsed[task_id] = data
+            else:
+                index._parsed.pop(task_id, None)
+            index._entries[task_id] = IndexedTask(task_id, line_hash, line)
+        return index
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, task_id: str) -> IndexedTask | None:
+        """Return the indexed line for a task, or None."""
+        return self._entries.get(task_id)
+
+    def hash_of(self, task_id: str) -> str | None:
+        """Return the line hash for a task, or None if absent."""
+        entry = self._entries.get(task_id)
+        return entry.hash if entry else None
+
+    def hashes(self) -> dict[str, str]:
+        """Task ID -> line hash, in file order."""
+        return {task_id: entry.hash for task_id, entry in self._entries.items()}
+
+    def task(self, task_id: str) -> dict[str, Any]:
+        """
+        Return a task's parsed dict, parsing its line on first access.
+
+        The same dict object is returned on every call, so callers can
+        use identity to tell which index a merged task came from.
+
+        Raises:
+            KeyError: If the task isn't in the index
+        """
+        parsed = self._parsed.get(task_id)
+        if parsed is None:
+            parsed = json.loads(self._entries[task_id].line)
+            self._parsed[task_id] = parsed
+        return parsed
@@ -740,10 +740,22 @@ def get_backend(
         from .both import BothBackend
         from .jsonl import JsonlBackend
 
+        shadow = False
+        sample_rate = 1.0
+        try:
+            from cub.core.config import load_config
+
+            backend_config = load_config(project_dir=project_dir).backend
+            shadow = backend_config.shadow
+            sample_rate = backend_config.compare_sample_rate
+        except Exception:
+            # Config loading failed, compare every operation inline
+            pass
+
         try:
             primary = BeadsBackend(project_dir=project_dir)
             secondary = JsonlBackend(project_dir=project_dir)
-            return BothBackend(primary, secondary)
+            return BothBackend(primary, secondary, shadow=shadow, sample_rate=sample_rate)
         except Exception as e:
             raise ValueError(f"Failed to initialize 'both' backend: {e}")
 
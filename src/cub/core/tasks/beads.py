@@ -11,9 +11,16 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from cub.core.profiling import profiled
+
 from .backend import TaskBackendDefaults, register_backend
+from .beads_snapshot import BeadsSnapshot
 from .models import Task, TaskCounts, TaskStatus
 
+# Initial --limit for bd list-style commands. If a page comes back full the
+# command is re-run with a larger limit, so results are never truncated.
+BD_PAGE_SIZE = 1000
+
 
 class BeadsNotAvailableError(Exception):
     """Raised when beads CLI is not installed or not available."""
@@ -36,6 +43,9 @@ class BeadsBackend(TaskBackendDefaults):
     the JSON output into Task models. All beads commands use --json
     flag for machine-readable output.
 
+    Reads are answered from .beads/issues.jsonl instead when that export
+    is current (see BeadsSnapshot), which avoids a subprocess per query.
+
     Example:
         >>> backend = BeadsBackend()
         >>> tasks = backend.list_tasks(status=TaskStatus.OPEN)
@@ -53,6 +63,7 @@ class BeadsBackend(TaskBackendDefaults):
             BeadsNotAvailableError: If bd CLI is not installed
         """
         self.project_dir = project_dir or Path.cwd()
+        self._snapshot = BeadsSnapshot(self.project_dir / ".beads")
 
         # Check if bd is available
         if not self._is_bd_available():
@@ -65,6 +76,7 @@ class BeadsBackend(TaskBackendDefaults):
         """Check if bd CLI is available in PATH."""
         return shutil.which("bd") is not None
 
+    @profiled("tasks.bd", "tasks")
     def _run_bd(
         self, args: list[str], check: bool = True, expect_json: bool = True
     ) -> dict[str, Any] | list[dict[str, Any]]:
@@ -119,6 +131,35 @@ class BeadsBackend(TaskBackendDefaults):
             error_msg = e.stderr.strip() if e.stderr else str(e)
             raise BeadsCommandError(f"bd command failed: {' '.join(cmd)}\nError: {error_msg}")
 
+    def _run_bd_list(self, command: list[str], filters: list[str]) -> list[dict[str, Any]]:
+        """
+        Run a list-style bd command without truncating its results.
+
+        bd has no offset flag to page with, so the command starts at
+        BD_PAGE_SIZE and is re-run with a larger --limit while a full page
+        comes back.
+
+        Args:
+            command: Command and its flags (e.g., ["list", "--json"])
+            filters: Filter arguments appended after --limit
+
+        Returns:
+            All matching raw tasks
+
+        Raises:
+            BeadsCommandError: If the command fails
+        """
+        limit = BD_PAGE_SIZE
+        while True:
+            result = self._run_bd([*command, "--limit", str(limit), *filters])
+
+            # Handle both list and single-item responses
+            if not isinstance(result, list):
+                return [result] if result else []
+            if len(result) < limit:
+                return result
+            limit *= 4
+
     def _transform_beads_task(self, raw_task: dict[str, Any]) -> Task:
         """
         Transform raw beads JSON into a Task model.
@@ -183,23 +224,25 @@ class BeadsBackend(TaskBackendDefaults):
         Returns:
             List of tasks matching the filter criteria
         """
-        args = ["list", "--json", "--limit", "1000"]
-
+        snapshot = self._snapshot.issues()
+        if snapshot is not None:
+            return [
+                self._transform_beads_task(t)
+                for t in snapshot
+                if (status is None or t.get("status") == status.value)
+                and (parent is None or t.get("parent") == parent)
+                and (label is None or label in (t.get("labels") or []))
+            ]
+
+        filters: list[str] = []
         if status:
-            args.extend(["--status", status.value])
+            filters.extend(["--status", status.value])
         if parent:
-            args.extend(["--parent", parent])
+            filters.extend(["--parent", parent])
         if label:
-            args.extend(["--label", label])
-
-        result = self._run_bd(args)
-
-        # Handle both list and single-item responses
-        if not isinstance(result, list):
-            raw_tasks = [result] if result else []
-        else:
-            raw_tasks = result
+            filters.extend(["--label", label])
 
+        raw_tasks = self._run_bd_list(["list", "--json"], filters)
         return [self._transform_beads_task(t) for t in raw_tasks]
 
     def get_task(self, task_id: str) -> Task | None:
@@ -212,6 +255,13 @@ class BeadsBackend(TaskBackendDefaults):
         Returns:
             Task object if found, None otherwise
         """
+        try:
+            raw_task = self._snapshot.get(task_id)
+        except LookupError:
+            pass
+        else:
+            return self._transform_beads_task(raw_task) if raw_task else None
+
         try:
             raw_tasks = self._run_bd(["show", task_id, "--json"])
 
@@ -253,45 +303,53 @@ class BeadsBackend(TaskBackendDefaults):
         Returns:
             List of ready tasks sorted by priority
         """
-        args = ["ready", "--json", "--limit", "1000"]
-
-        # Add label filter if specified (but NOT parent - we filter that in Python)
-        if label:
-            args.extend(["--label", label])
-
-        try:
-            result = self._run_bd(args)
-
-            # Handle both list and single-item responses
-            if not isinstance(result, list):
-                raw_tasks = [result] if result else []
-            else:
-                raw_tasks = result
+        by_id = self._snapshot.by_id()
+        if by_id is not None:
+            raw_tasks = [
+                t
+                for t in by_id.values()
+                if t.get("status") == "open"
+                and (label is None or label in (t.get("labels") or []))
+                and not self._has_open_blocker(t, by_id)
+            ]
+        else:
+            # Add label filter if specified (but NOT parent - we filter that in Python)
+            filters = ["--label", label] if label else []
+            try:
+                raw_tasks = self._run_bd_list(["ready", "--json"], filters)
+            except BeadsCommandError:
+                # If bd ready fails, return empty list
+                return []
 
-            tasks = [self._transform_beads_task(t) for t in raw_tasks]
+        tasks = [self._transform_beads_task(t) for t in raw_tasks]
 
-            # Filter by parent if specified
-            # Check both parent field AND epic: label for backwards compatibility
-            # The parent field is canonical; epic: label is a fallback
-            if parent:
-                filtered_tasks = []
-                for task in tasks:
-                    # Primary check: parent field matches
-                    if task.parent == parent:
-                        filtered_tasks.append(task)
-                        continue
-                    # Fallback check: epic:{parent} label exists
-                    if task.has_label(f"epic:{parent}"):
-                        filtered_tasks.append(task)
-                        continue
-                tasks = filtered_tasks
+        # Filter by parent if specified
+        # Check both parent field AND epic: label for backwards compatibility
+        # The parent field is canonical; epic: label is a fallback
+        if parent:
+            filtered_tasks = []
+            for task in tasks:
+                # Primary check: parent field matches
+                if task.parent == parent:
+                    filtered_tasks.append(task)
+                    continue
+                # Fallback check: epic:{parent} label exists
+                if task.has_label(f"epic:{parent}"):
+                    filtered_tasks.append(task)
+                    continue
+            tasks = filtered_tasks
 
-            # Sort by priority (P0 = 0 is highest priority)
-            return sorted(tasks, key=lambda t: t.priority_numeric)
+        # Sort by priority (P0 = 0 is highest priority)
+        return sorted(tasks, key=lambda t: t.priority_numeric)
 
-        except BeadsCommandError:
-            # If bd ready fails, return empty list
-            return []
+    @staticmethod
+    def _has_open_blocker(raw_task: dict[str, Any], by_id: dict[str, dict[str, Any]]) -> bool:
+        """Whether any of a raw task's dependencies is missing or not closed."""
+        for dep_id in raw_task.get("blocks") or []:
+            dep = by_id.get(dep_id)
+            if dep is None or dep.get("status") != "closed":
+                return True
+        return False
 
     def update_task(
         self,
@@ -471,13 +529,11 @@ class BeadsBackend(TaskBackendDefaults):
             TaskCounts object with total, open, in_progress, closed, and blocked counts
         """
         try:
-            result = self._run_bd(["list", "--json", "--limit", "1000"])
-
-            # Handle both list and single-item responses
-            if not isinstance(result, list):
-                raw_tasks = [result] if result else []
+            snapshot = self._snapshot.issues()
+            if snapshot is not None:
+                raw_tasks = snapshot
             else:
-                raw_tasks = result
+                raw_tasks = self._run_bd_list(["list", "--json"], [])
 
             # Count tasks by status
             total = len(raw_tasks)
@@ -486,20 +542,12 @@ class BeadsBackend(TaskBackendDefaults):
             closed = sum(1 for t in raw_tasks if t.get("status") == "closed")
 
             # Count blocked tasks (open tasks with unmet dependencies)
-            blocked_count = 0
-            for raw_task in raw_tasks:
-                if raw_task.get("status") == "open":
-                    # Check if task has dependencies
-                    blocks = raw_task.get("blocks", [])
-                    if blocks:
-                        # Check if any dependency is not closed
-                        for dep_id in blocks:
-                            dep_task_raw = next(
-                                (t for t in raw_tasks if t.get("id") == dep_id), None
-                            )
-                            if dep_task_raw is None or dep_task_raw.get("status") != "closed":
-                                blocked_count += 1
-                                break
+            by_id = {t["id"]: t for t in raw_tasks if "id" in t}
+            blocked_count = sum(
+                1
+                for t in raw_tasks
+                if t.get("status") == "open" and self._has_open_blocker(t, by_id)
+            )
 
             return TaskCounts(
                 total=total,
@@ -645,10 +693,16 @@ class BeadsBackend(TaskBackendDefaults):
                     f"bd import failed: {result.stderr.strip() or result.stdout.strip()}"
                 )
 
-            # Fetch the imported tasks
+            # Fetch the imported tasks with one listing rather than a
+            # `bd show` per task
+            try:
+                listed = {t.id: t for t in self.list_tasks()}
+            except BeadsCommandError as e:
+                raise ValueError(f"Failed to read back imported tasks: {e}")
+
             imported_tasks = []
             for task in tasks:
-                imported = self.get_task(task.id)
+                imported = listed.get(task.id)
                 if imported:
                     imported_tasks.append(imported)
                 else:
@@ -795,6 +849,21 @@ class BeadsBackend(TaskBackendDefaults):
         Returns:
             List of blocked tasks
         """
+        by_id = self._snapshot.by_id()
+        if by_id is not None:
+            tasks = [
+                self._transform_beads_task(t)
+                for t in by_id.values()
+                if t.get("status") == "open"
+                and (label is None or label in (t.get("labels") or []))
+                and self._has_open_blocker(t, by_id)
+            ]
+            if parent:
+                tasks = [
+                    t for t in tasks if t.parent == parent or t.has_label(f"epic:{parent}")
+                ]
+            return tasks
+
         try:
             # Try using bd blocked command if available
             args = ["blocked", "--json"]
@@ -834,23 +903,18 @@ class BeadsBackend(TaskBackendDefaults):
             # Get all open tasks and check their dependencies
             open_tasks = self.list_tasks(status=TaskStatus.OPEN, parent=parent, label=label)
 
+            # Look each dependency up once, rather than once per dependent
+            statuses: dict[str, TaskStatus | None] = {}
             blocked_tasks = []
             for task in open_tasks:
-                # Skip tasks with no dependencies
-                if not task.depends_on:
-                    continue
-
-                # Check if any dependency is not closed
-                has_open_dependency = False
                 for dep_id in task.depends_on:
-                    dep_task = self.get_task(dep_id)
-                    if dep_task is None or dep_task.status != TaskStatus.CLOSED:
-                        has_open_dependency = True
+                    if dep_id not in statuses:
+                        dep_task = self.get_task(dep_id)
+                        statuses[dep_id] = dep_task.status if dep_task else None
+                    if statuses[dep_id] != TaskStatus.CLOSED:
+                        blocked_tasks.append(task)
                         break
 
-                if has_open_dependency:
-                    blocked_tasks.append(task)
-
             return blocked_tasks
 
     def reopen_task(self, task_id: str, reason: str | None = None) -> Task:
@@ -1123,7 +1187,8 @@ class BeadsBackend(TaskBackendDefaults):
         Search for tasks using bd search.
 
         Uses the `bd search` command to perform full-text search across
-        task titles, descriptions, and IDs.
+        task titles, descriptions, and IDs. When the snapshot is current,
+        the same fields are matched case-insensitively in memory instead.
 
         Args:
             query: Search query string
@@ -1134,15 +1199,19 @@ class BeadsBackend(TaskBackendDefaults):
         Raises:
             ValueError: If search fails
         """
-        try:
-            result = self._run_bd(["search", query, "--json", "--limit", "1000"])
-
-            # Handle both list and single-item responses
-            if not isinstance(result, list):
-                raw_tasks = [result] if result else []
-            else:
-                raw_tasks = result
+        snapshot = self._snapshot.issues()
+        if snapshot is not None:
+            needle = query.lower()
+            return [
+                self._transform_beads_task(t)
+                for t in snapshot
+                if needle in t["id"].lower()
+                or needle in str(t.get("title") or "").lower()
+                or needle in str(t.get("description") or "").lower()
+            ]
 
+        try:
+            raw_tasks = self._run_bd_list(["search", query, "--json"], [])
             return [self._transform_beads_task(t) for t in raw_tasks]
 
         except BeadsCommandError as e:
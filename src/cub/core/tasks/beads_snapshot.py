@@ -0,0 +1,194 @@
+"""
+In-memory index over beads' on-disk JSONL snapshot.
+
+beads keeps its issues in a SQLite database and exports them to
+.beads/issues.jsonl, one issue per line. Reading that file is far cheaper
+than forking `bd` for every query, so BeadsBackend answers reads from it
+whenever it is known to be current.
+
+The snapshot is trusted only while the export is at least as new as the
+database (compared by mtime). Without a database there is nothing to
+compare against, so the snapshot is not used. Any write through `bd`, including ones made
+by an agent during a run, touches the database first, so reads fall back
+to `bd` until beads has re-exported. The parsed index is reloaded whenever
+the file's size or mtime changes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# File names used when .beads/metadata.json doesn't name them
+DEFAULT_DATABASE = "beads.db"
+DEFAULT_EXPORT = "issues.jsonl"
+
+# Statuses beads uses for deleted issues
+DELETED_STATUSES = frozenset({"tombstone", "deleted"})
+
+
+def normalize_issue(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert an exported issue into the shape `bd ... --json` returns.
+
+    The export stores relationships as a ``dependencies`` list, while
+    `bd` output has ``parent`` and ``blocks`` fields.
+
+    Args:
+        record: Issue as stored in the JSONL snapshot
+
+    Returns:
+        Issue dict accepted by BeadsBackend._transform_beads_task
+    """
+    issue = dict(record)
+    dependencies = record.get("dependencies")
+    if isinstance(dependencies, list):
+        blocks: list[str] = []
+        for dep in dependencies:
+            if not isinstance(dep, dict):
+                continue
+            target = dep.get("depends_on_id")
+            if not isinstance(target, str):
+                continue
+            dep_type = dep.get("type", "blocks")
+            if dep_type == "parent-child":
+                issue.setdefault("parent", target)
+            elif dep_type == "blocks":
+                blocks.append(target)
+        issue.setdefault("blocks", blocks)
+    return issue
+
+
+class BeadsSnapshot:
+    """
+    Cached view of .beads/issues.jsonl.
+
+    Example:
+        >>> snapshot = BeadsSnapshot(project_dir / ".beads")
+        >>> issues = snapshot.issues()
+        >>> if issues is None:
+        ...     issues = run_bd_list()
+    """
+
+    def __init__(self, beads_dir: Path) -> None:
+        """
+        Initialize the snapshot reader.
+
+        Args:
+            beads_dir: Path to the .beads directory
+        """
+        self.beads_dir = beads_dir
+        self._signature: tuple[str, int, int] | None = None
+        self._issues: list[dict[str, Any]] = []
+        self._by_id: dict[str, dict[str, Any]] = {}
+
+    def _file_names(self) -> tuple[str, str]:
+        """Database and export file names, from metadata.json if present."""
+        database, export = DEFAULT_DATABASE, DEFAULT_EXPORT
+        try:
+            metadata = json.loads((self.beads_dir / "metadata.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return database, export
+        if isinstance(metadata, dict):
+            if isinstance(metadata.get("database"), str):
+                database = metadata["database"]
+            if isinstance(metadata.get("jsonl_export"), str):
+                export = metadata["jsonl_export"]
+        return database, export
+
+    def _database_mtime_ns(self, database: str) -> int | None:
+        """Newest mtime of the database and its write-ahead log."""
+        try:
+            newest = (self.beads_dir / database).stat().st_mtime_ns
+        except OSError:
+            return None
+        try:
+            newest = max(newest, (self.beads_dir / f"{database}-wal").stat().st_mtime_ns)
+        except OSError:
+            pass
+        return newest
+
+    def _refresh(self) -> bool:
+        """
+        Make sure the index reflects a current snapshot.
+
+        Returns:
+            True if the index is usable, False if reads must go to `bd`
+        """
+        database, export = self._file_names()
+        database_mtime = self._database_mtime_ns(database)
+        if database_mtime is None:
+            return False
+        path = self.beads_dir / export
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if st.st_mtime_ns < database_mtime:
+            # Database has changes beads hasn't exported yet
+            return False
+
+        signature = (path.name, st.st_size, st.st_mtime_ns)
+        if signature == self._signature:
+            return True
+
+        issues: list[dict[str, Any]] = []
+        try:
+            with path.open(encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.debug("Skipping bad line %d in %s", line_number, path)
+                        continue
+                    if not isinstance(record, dict) or not isinstance(record.get("id"), str):
+                        continue
+                    if record.get("status") in DELETED_STATUSES or record.get("deleted_at"):
+                        continue
+                    issues.append(normalize_issue(record))
+        except OSError:
+            return False
+
+        self._issues = issues
+        self._by_id = {issue["id"]: issue for issue in issues}
+        self._signature = signature
+        return True
+
+    def issues(self) -> list[dict[str, Any]] | None:
+        """
+        All issues in the snapshot, in file order.
+
+        Returns:
+            Issues in `bd --json` shape, or None if there is no current
+            snapshot
+        """
+        if not self._refresh():
+            return None
+        return self._issues
+
+    def get(self, issue_id: str) -> dict[str, Any] | None:
+        """
+        Look up one issue.
+
+        Returns:
+            The issue, or None if it isn't in the snapshot
+
+        Raises:
+            LookupError: If there is no current snapshot to look in
+        """
+        if not self._refresh():
+            raise LookupError("No current beads snapshot")
+        return self._by_id.get(issue_id)
+
+    def by_id(self) -> dict[str, dict[str, Any]] | None:
+        """Issues keyed by ID, or None if there is no current snapshot."""
+        if not self._refresh():
+            return None
+        return self._by_id
@@ -8,20 +8,40 @@ returned, while the secondary backend's result is used for validation.
 This is useful for transitioning from one backend to another while ensuring
 both stay in sync, or for validating a new backend implementation against
 a trusted reference implementation.
+
+In shadow mode the secondary backend is taken off the critical path: its
+calls, the comparisons and the divergence log writes all run on a single
+background worker, in the order the operations were issued, so callers
+only ever wait for the primary. Comparisons can also be sampled to cut
+the secondary's load during long migrations.
 """
 
 import json
 import logging
+import random
+import threading
+from collections.abc import Callable
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from .backend import TaskBackend, TaskBackendDefaults, register_backend
 from .models import Task, TaskCounts, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _compare_values(primary: Any, secondary: Any) -> str | None:
+    """Compare two plain results, e.g. booleans or status tuples."""
+    if primary != secondary:
+        return f"{primary} != {secondary}"
+    return None
+
 
 @dataclass
 class TaskDivergence:
@@ -103,6 +123,10 @@ class BothBackend(TaskBackendDefaults):
         primary: TaskBackend,
         secondary: TaskBackend,
         divergence_log: Path | None = None,
+        *,
+        shadow: bool = False,
+        sample_rate: float = 1.0,
+        rng: Callable[[], float] = random.random,
     ):
         """
         Initialize the BothBackend wrapper.
@@ -111,10 +135,32 @@ class BothBackend(TaskBackendDefaults):
             primary: Primary backend (result is returned)
             secondary: Secondary backend (result is validated)
             divergence_log: Path to divergence log file (defaults to .cub/backend-divergence.log)
+            shadow: Run secondary calls and comparisons on a background worker
+                instead of inline
+            sample_rate: Fraction of operations to compare (0.0-1.0). Reads
+                that aren't sampled skip the secondary entirely; writes are
+                always applied to it so the two stay in sync.
+            rng: Source of uniform [0, 1) values for sampling
+
+        Raises:
+            ValueError: If sample_rate is outside 0.0-1.0
         """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+
         self.primary = primary
         self.secondary = secondary
         self.divergence_log = divergence_log or Path.cwd() / ".cub" / "backend-divergence.log"
+        self.shadow = shadow
+        self.sample_rate = sample_rate
+        self._rng = rng
+        self._rng_lock = threading.Lock()
+        # One worker keeps secondary operations in the order they were issued
+        self._executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="cub-shadow")
+            if shadow
+            else None
+        )
         self._ensure_log_dir()
 
     def _ensure_log_dir(self) -> None:
@@ -135,6 +181,113 @@ class BothBackend(TaskBackendDefaults):
         except Exception as e:
             logger.warning(f"Failed to log divergence: {e}")
 
+    def _sampled(self) -> bool:
+        """Decide whether to compare the current operation."""
+        if self.sample_rate >= 1.0:
+            return True
+        with self._rng_lock:
+            return self._rng() < self.sample_rate
+
+    def _shadow(
+        self,
+        operation: str,
+        call: Callable[[], T],
+        primary_result: T,
+        compare: Callable[[T, T], str | None],
+        *,
+        task_id: str | None = None,
+        where: str | None = None,
+        mutation: bool = False,
+        record: bool = True,
+    ) -> None:
+        """
+        Mirror an operation on the secondary backend and check the result.
+
+        Inline mode runs the secondary immediately. A failing secondary
+        write is logged and ignored; a failing secondary read propagates.
+        Shadow mode queues the same work on the background worker, where
+        every failure is logged and ignored.
+
+        Args:
+            operation: Operation name, used in logs and divergence records
+            call: Runs the operation on the secondary backend
+            primary_result: What the primary backend returned
+            compare: Returns a difference summary, or None if equivalent
+            task_id: Task the operation applies to, if any
+            where: How to name the call in warnings (defaults to
+                operation(task_id))
+            mutation: Whether the operation changes state. Mutations always
+                reach the secondary, even when not sampled for comparison.
+            record: Write divergences to the divergence log, not just warn
+        """
+        sampled = self._sampled()
+        if not sampled and not mutation:
+            return
+        if where is None:
+            where = f"{operation}({task_id})" if task_id else operation
+
+        def run() -> None:
+            try:
+                secondary_result = call()
+            except Exception as e:
+                if not mutation and not self.shadow:
+                    raise
+                logger.warning(f"Secondary backend {operation} failed: {e}")
+                return
+            if not sampled:
+                return
+            try:
+                diff = compare(primary_result, secondary_result)
+            except Exception as e:
+                logger.warning(f"Failed to compare {operation} results: {e}")
+                return
+            if not diff:
+                return
+            if not record:
+                logger.warning(f"Backend divergence in {where}: {diff}")
+                return
+            self._log_divergence(
+                TaskDivergence(
+                    timestamp=datetime.now(),
+                    operation=operation,
+                    task_id=task_id,
+                    primary_result=primary_result,
+                    secondary_result=secondary_result,
+                    difference_summary=diff,
+                )
+            )
+            logger.warning(f"Backend divergence detected in {where}: {diff}")
+
+        if self._executor is None:
+            run()
+        else:
+            self._executor.submit(run)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """
+        Wait for queued shadow work to finish.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the queue was drained, False on timeout
+        """
+        if self._executor is None:
+            return True
+        try:
+            self._executor.submit(lambda: None).result(timeout=timeout)
+        except futures.TimeoutError:
+            # Not the builtin TimeoutError before Python 3.11
+            return False
+        return True
+
+    def close(self) -> None:
+        """Finish queued shadow work and stop the background worker."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def _compare_tasks(self, primary_task: Task | None, secondary_task: Task | None) -> str | None:
         """
         Compare two tasks and return a summary of differences.
@@ -278,22 +431,12 @@ class BothBackend(TaskBackendDefaults):
             List of tasks from primary backend
         """
         primary_result = self.primary.list_tasks(status=status, parent=parent, label=label)
-        secondary_result = self.secondary.list_tasks(status=status, parent=parent, label=label)
-
-        # Compare results
-        diff = self._compare_task_lists(primary_result, secondary_result)
-        if diff:
-            divergence = TaskDivergence(
-                timestamp=datetime.now(),
-                operation="list_tasks",
-                task_id=None,
-                primary_result=primary_result,
-                secondary_result=secondary_result,
-                difference_summary=diff,
-            )
-            self._log_divergence(divergence)
-            logger.warning(f"Backend divergence detected in list_tasks: {diff}")
-
+        self._shadow(
+            "list_tasks",
+            lambda: self.secondary.list_tasks(status=status, parent=parent, label=label),
+            primary_result,
+            self._compare_task_lists,
+        )
         return primary_result
 
     def get_task(self, task_id: str) -> Task | None:
@@ -309,22 +452,13 @@ class BothBackend(TaskBackendDefaults):
             Task object from primary backend, or None if not found
         """
         primary_result = self.primary.get_task(task_id)
-        secondary_result = self.secondary.get_task(task_id)
-
-        # Compare results
-        diff = self._compare_tasks(primary_result, secondary_result)
-        if diff:
-            divergence = TaskDivergence(
-                timestamp=datetime.now(),
-                operation="get_task",
-                task_id=task_id,
-                primary_result=primary_result,
-                secondary_result=secondary_result,
-                difference_summary=diff,
-            )
-            self._log_divergence(divergence)
-            logger.warning(f"Backend divergence detected in get_task({task_id}): {diff}")
-
+        self._shadow(
+            "get_task",
+            lambda: self.secondary.get_task(task_id),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+        )
         return primary_result
 
     def get_ready_tasks(self, parent: str | None = None, label: str | None = None) -> list[Task]:
@@ -341,22 +475,12 @@ class BothBackend(TaskBackendDefaults):
             List of ready tasks from primary backend
         """
         primary_result = self.primary.get_ready_tasks(parent=parent, label=label)
-        secondary_result = self.secondary.get_ready_tasks(parent=parent, label=label)
-
-        # Compare results
-        diff = self._compare_task_lists(primary_result, secondary_result)
-        if diff:
-            divergence = TaskDivergence(
-                timestamp=datetime.now(),
-                operation="get_ready_tasks",
-                task_id=None,
-                primary_result=primary_result,
-                secondary_result=secondary_result,
-                difference_summary=diff,
-            )
-            self._log_divergence(divergence)
-            logger.warning(f"Backend divergence detected in get_ready_tasks: {diff}")
-
+        self._shadow(
+            "get_ready_tasks",
+            lambda: self.secondary.get_ready_tasks(parent=parent, label=label),
+            primary_result,
+            self._compare_task_lists,
+        )
         return primary_result
 
     def update_task(
@@ -395,29 +519,17 @@ class BothBackend(TaskBackendDefaults):
             task_id, status=status, assignee=assignee, description=description,
             labels=labels, title=title, priority=priority, notes=notes,
         )
-
-        try:
-            secondary_result = self.secondary.update_task(
+        self._shadow(
+            "update_task",
+            lambda: self.secondary.update_task(
                 task_id, status=status, assignee=assignee, description=description,
                 labels=labels, title=title, priority=priority, notes=notes,
-            )
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="update_task",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(f"Backend divergence detected in update_task({task_id}): {diff}")
-        except Exception as e:
-            logger.warning(f"Secondary backend update_task failed: {e}")
-
+            ),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            mutation=True,
+        )
         return primary_result
 
     def close_task(self, task_id: str, reason: str | None = None) -> Task:
@@ -437,26 +549,14 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If task not found or already closed in primary backend
         """
         primary_result = self.primary.close_task(task_id, reason=reason)
-
-        try:
-            secondary_result = self.secondary.close_task(task_id, reason=reason)
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="close_task",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(f"Backend divergence detected in close_task({task_id}): {diff}")
-        except Exception as e:
-            logger.warning(f"Secondary backend close_task failed: {e}")
-
+        self._shadow(
+            "close_task",
+            lambda: self.secondary.close_task(task_id, reason=reason),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            mutation=True,
+        )
         return primary_result
 
     def create_task(
@@ -499,8 +599,15 @@ class BothBackend(TaskBackendDefaults):
             parent=parent,
         )
 
-        try:
-            secondary_result = self.secondary.create_task(
+        def compare(primary: Task, secondary: Task) -> str | None:
+            # IDs may differ, so compare other fields
+            if primary.title != secondary.title:
+                return f"titles differ ({primary.title} != {secondary.title})"
+            return None
+
+        self._shadow(
+            "create_task",
+            lambda: self.secondary.create_task(
                 title=title,
                 description=description,
                 task_type=task_type,
@@ -508,17 +615,12 @@ class BothBackend(TaskBackendDefaults):
                 labels=labels,
                 depends_on=depends_on,
                 parent=parent,
-            )
-
-            # Compare results (IDs may differ, so compare other fields)
-            if primary_result.title != secondary_result.title:
-                logger.warning(
-                    f"Backend divergence in create_task: titles differ "
-                    f"({primary_result.title} != {secondary_result.title})"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend create_task failed: {e}")
-
+            ),
+            primary_result,
+            compare,
+            mutation=True,
+            record=False,
+        )
         return primary_result
 
     def get_task_counts(self) -> TaskCounts:
@@ -531,22 +633,12 @@ class BothBackend(TaskBackendDefaults):
             TaskCounts from primary backend
         """
         primary_result = self.primary.get_task_counts()
-        secondary_result = self.secondary.get_task_counts()
-
-        # Compare results
-        diff = self._compare_task_counts(primary_result, secondary_result)
-        if diff:
-            divergence = TaskDivergence(
-                timestamp=datetime.now(),
-                operation="get_task_counts",
-                task_id=None,
-                primary_result=primary_result,
-                secondary_result=secondary_result,
-                difference_summary=diff,
-            )
-            self._log_divergence(divergence)
-            logger.warning(f"Backend divergence detected in get_task_counts: {diff}")
-
+        self._shadow(
+            "get_task_counts",
+            self.secondary.get_task_counts,
+            primary_result,
+            self._compare_task_counts,
+        )
         return primary_result
 
     def add_task_note(self, task_id: str, note: str) -> Task:
@@ -566,26 +658,14 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If task not found in primary backend
         """
         primary_result = self.primary.add_task_note(task_id, note)
-
-        try:
-            secondary_result = self.secondary.add_task_note(task_id, note)
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="add_task_note",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(f"Backend divergence detected in add_task_note({task_id}): {diff}")
-        except Exception as e:
-            logger.warning(f"Secondary backend add_task_note failed: {e}")
-
+        self._shadow(
+            "add_task_note",
+            lambda: self.secondary.add_task_note(task_id, note),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            mutation=True,
+        )
         return primary_result
 
     def import_tasks(self, tasks: list[Task]) -> list[Task]:
@@ -603,18 +683,20 @@ class BothBackend(TaskBackendDefaults):
         """
         primary_result = self.primary.import_tasks(tasks)
 
-        try:
-            secondary_result = self.secondary.import_tasks(tasks)
-
+        def compare(primary: list[Task], secondary: list[Task]) -> str | None:
             # Compare counts only (IDs may differ)
-            if len(primary_result) != len(secondary_result):
-                logger.warning(
-                    f"Backend divergence in import_tasks: count mismatch "
-                    f"({len(primary_result)} != {len(secondary_result)})"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend import_tasks failed: {e}")
+            if len(primary) != len(secondary):
+                return f"count mismatch ({len(primary)} != {len(secondary)})"
+            return None
 
+        self._shadow(
+            "import_tasks",
+            lambda: self.secondary.import_tasks(tasks),
+            primary_result,
+            compare,
+            mutation=True,
+            record=False,
+        )
         return primary_result
 
     def get_agent_instructions(self, task_id: str) -> str:
@@ -646,18 +728,15 @@ class BothBackend(TaskBackendDefaults):
             True if binding created in primary backend, False if already exists or unsupported
         """
         primary_result = self.primary.bind_branch(epic_id, branch_name, base_branch)
-
-        try:
-            secondary_result = self.secondary.bind_branch(epic_id, branch_name, base_branch)
-
-            if primary_result != secondary_result:
-                logger.warning(
-                    f"Backend divergence in bind_branch({epic_id}): "
-                    f"{primary_result} != {secondary_result}"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend bind_branch failed: {e}")
-
+        self._shadow(
+            "bind_branch",
+            lambda: self.secondary.bind_branch(epic_id, branch_name, base_branch),
+            primary_result,
+            _compare_values,
+            task_id=epic_id,
+            mutation=True,
+            record=False,
+        )
         return primary_result
 
     def try_close_epic(self, epic_id: str) -> tuple[bool, str]:
@@ -673,18 +752,15 @@ class BothBackend(TaskBackendDefaults):
             Tuple of (closed: bool, message: str) from primary backend
         """
         primary_result = self.primary.try_close_epic(epic_id)
-
-        try:
-            secondary_result = self.secondary.try_close_epic(epic_id)
-
-            if primary_result != secondary_result:
-                logger.warning(
-                    f"Backend divergence in try_close_epic({epic_id}): "
-                    f"{primary_result} != {secondary_result}"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend try_close_epic failed: {e}")
-
+        self._shadow(
+            "try_close_epic",
+            lambda: self.secondary.try_close_epic(epic_id),
+            primary_result,
+            _compare_values,
+            task_id=epic_id,
+            mutation=True,
+            record=False,
+        )
         return primary_result
 
     def compare_all_tasks(self) -> list[TaskDivergence]:
@@ -777,6 +853,7 @@ class BothBackend(TaskBackendDefaults):
         Returns:
             Number of divergences logged since the log was last cleared
         """
+        self.drain()
         if not self.divergence_log.exists():
             return 0
 
@@ -804,29 +881,15 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If either task not found or dependency would create a cycle
         """
         primary_result = self.primary.add_dependency(task_id, depends_on_id)
-
-        try:
-            secondary_result = self.secondary.add_dependency(task_id, depends_on_id)
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="add_dependency",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(
-                    f"Backend divergence detected in add_dependency"
-                    f"({task_id}, {depends_on_id}): {diff}"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend add_dependency failed: {e}")
-
+        self._shadow(
+            "add_dependency",
+            lambda: self.secondary.add_dependency(task_id, depends_on_id),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            where=f"add_dependency({task_id}, {depends_on_id})",
+            mutation=True,
+        )
         return primary_result
 
     def remove_dependency(self, task_id: str, depends_on_id: str) -> Task:
@@ -846,29 +909,15 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If task not found or dependency doesn't exist
         """
         primary_result = self.primary.remove_dependency(task_id, depends_on_id)
-
-        try:
-            secondary_result = self.secondary.remove_dependency(task_id, depends_on_id)
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="remove_dependency",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(
-                    f"Backend divergence detected in remove_dependency"
-                    f"({task_id}, {depends_on_id}): {diff}"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend remove_dependency failed: {e}")
-
+        self._shadow(
+            "remove_dependency",
+            lambda: self.secondary.remove_dependency(task_id, depends_on_id),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            where=f"remove_dependency({task_id}, {depends_on_id})",
+            mutation=True,
+        )
         return primary_result
 
     def list_blocked_tasks(
@@ -893,22 +942,12 @@ class BothBackend(TaskBackendDefaults):
             List of blocked tasks from primary backend
         """
         primary_result = self.primary.list_blocked_tasks(parent=parent, label=label)
-        secondary_result = self.secondary.list_blocked_tasks(parent=parent, label=label)
-
-        # Compare results
-        diff = self._compare_task_lists(primary_result, secondary_result)
-        if diff:
-            divergence = TaskDivergence(
-                timestamp=datetime.now(),
-                operation="list_blocked_tasks",
-                task_id=None,
-                primary_result=primary_result,
-                secondary_result=secondary_result,
-                difference_summary=diff,
-            )
-            self._log_divergence(divergence)
-            logger.warning(f"Backend divergence detected in list_blocked_tasks: {diff}")
-
+        self._shadow(
+            "list_blocked_tasks",
+            lambda: self.secondary.list_blocked_tasks(parent=parent, label=label),
+            primary_result,
+            self._compare_task_lists,
+        )
         return primary_result
 
     def reopen_task(self, task_id: str, reason: str | None = None) -> Task:
@@ -928,26 +967,14 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If task not found or not closed
         """
         primary_result = self.primary.reopen_task(task_id, reason=reason)
-
-        try:
-            secondary_result = self.secondary.reopen_task(task_id, reason=reason)
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="reopen_task",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(f"Backend divergence detected in reopen_task({task_id}): {diff}")
-        except Exception as e:
-            logger.warning(f"Secondary backend reopen_task failed: {e}")
-
+        self._shadow(
+            "reopen_task",
+            lambda: self.secondary.reopen_task(task_id, reason=reason),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            mutation=True,
+        )
         return primary_result
 
     def delete_task(self, task_id: str) -> bool:
@@ -968,18 +995,15 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If task has dependents (other tasks depend on it)
         """
         primary_result = self.primary.delete_task(task_id)
-
-        try:
-            secondary_result = self.secondary.delete_task(task_id)
-
-            if primary_result != secondary_result:
-                logger.warning(
-                    f"Backend divergence in delete_task({task_id}): "
-                    f"{primary_result} != {secondary_result}"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend delete_task failed: {e}")
-
+        self._shadow(
+            "delete_task",
+            lambda: self.secondary.delete_task(task_id),
+            primary_result,
+            _compare_values,
+            task_id=task_id,
+            mutation=True,
+            record=False,
+        )
         return primary_result
 
     def add_label(self, task_id: str, label: str) -> Task:
@@ -999,28 +1023,15 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If task not found
         """
         primary_result = self.primary.add_label(task_id, label)
-
-        try:
-            secondary_result = self.secondary.add_label(task_id, label)
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="add_label",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(
-                    f"Backend divergence detected in add_label({task_id}, {label}): {diff}"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend add_label failed: {e}")
-
+        self._shadow(
+            "add_label",
+            lambda: self.secondary.add_label(task_id, label),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            where=f"add_label({task_id}, {label})",
+            mutation=True,
+        )
         return primary_result
 
     def remove_label(self, task_id: str, label: str) -> Task:
@@ -1040,26 +1051,13 @@ class BothBackend(TaskBackendDefaults):
             ValueError: If task not found or label doesn't exist
         """
         primary_result = self.primary.remove_label(task_id, label)
-
-        try:
-            secondary_result = self.secondary.remove_label(task_id, label)
-
-            # Compare results
-            diff = self._compare_tasks(primary_result, secondary_result)
-            if diff:
-                divergence = TaskDivergence(
-                    timestamp=datetime.now(),
-                    operation="remove_label",
-                    task_id=task_id,
-                    primary_result=primary_result,
-                    secondary_result=secondary_result,
-                    difference_summary=diff,
-                )
-                self._log_divergence(divergence)
-                logger.warning(
-                    f"Backend divergence detected in remove_label({task_id}, {label}): {diff}"
-                )
-        except Exception as e:
-            logger.warning(f"Secondary backend remove_label failed: {e}")
-
+        self._shadow(
+            "remove_label",
+            lambda: self.secondary.remove_label(task_id, label),
+            primary_result,
+            self._compare_tasks,
+            task_id=task_id,
+            where=f"remove_label({task_id}, {label})",
+            mutation=True,
+        )
         return primary_result
@@ -19,6 +19,8 @@ try:
 except ImportError:
     yaml = None
 
+from cub.core.profiling import profiled
+
 from .backend import TaskBackendDefaults, register_backend
 from .models import NON_EXECUTABLE_TYPES, Task, TaskCounts, TaskPriority, TaskStatus
 
@@ -75,6 +77,7 @@ class JsonlBackend(TaskBackendDefaults):
         self._cache: list[dict[str, Any]] | None = None
         self._cache_mtime: float | None = None
 
+    @profiled("tasks.load", "tasks")
     def _load_tasks(self) -> list[dict[str, Any]]:
         """
         Load and parse tasks.jsonl file with caching.
@@ -328,6 +331,7 @@ class JsonlBackend(TaskBackendDefaults):
         self._cache = []
         self._cache_mtime = os.path.getmtime(self.tasks_file)
 
+    @profiled("tasks.save", "tasks")
     def _save_tasks(self, tasks: list[dict[str, Any]]) -> None:
         """
         Save tasks.jsonl file atomically with validation.
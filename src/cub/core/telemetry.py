@@ -0,0 +1,468 @@
+"""
+Resource telemetry for task runs.
+
+Samplers record CPU, memory and I/O in the background while a task runs
+and reduce them to what's worth keeping in the ledger: peak RSS,
+CPU-seconds, bytes read and written, and a compact time series. With that
+recorded per attempt, sandbox ``--memory``/``--cpus`` limits and
+``--parallel`` worker counts can be sized from real use.
+
+Two samplers are provided:
+
+- ProcTreeSampler reads ``/proc`` for a process and all its descendants.
+  It covers the run loop's harness subprocesses and parallel worktree
+  workers. Where ``/proc`` isn't available it records nothing.
+- DockerStatsSampler keeps one streaming ``docker stats`` process open
+  for a sandbox container, rather than forking ``docker stats
+  --no-stream`` for every reading.
+
+Example:
+    >>> sampler = ProcTreeSampler(os.getpid())
+    >>> sampler.start()
+    >>> run_task()
+    >>> telemetry = sampler.stop()
+    >>> telemetry.peak_rss_mb if telemetry else None
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Literal, NamedTuple
+
+from cub.core.ledger.models import ResourceTelemetry
+
+logger = logging.getLogger(__name__)
+
+# Default seconds between samples
+DEFAULT_INTERVAL = 1.0
+
+# Samples kept per series before halving its resolution
+DEFAULT_MAX_POINTS = 120
+
+
+class ResourceSample(NamedTuple):
+    """One reading. CPU and I/O are cumulative since sampling started."""
+
+    elapsed: float
+    cpu_seconds: float
+    rss_bytes: int
+    read_bytes: int
+    write_bytes: int
+
+
+class ResourceSeries:
+    """
+    Bounded time series of resource samples.
+
+    Every sample counts towards the peak and the totals, but only every
+    ``stride``-th one is stored. When the stored points exceed
+    ``max_points``, every other point is dropped and the stride doubles,
+    so a long run keeps an even, bounded-size series.
+    """
+
+    def __init__(self, max_points: int = DEFAULT_MAX_POINTS) -> None:
+        """Create an empty series."""
+        self.max_points = max_points
+        self.points: list[ResourceSample] = []
+        self.latest: ResourceSample | None = None
+        self.peak_rss_bytes = 0
+        self._stride = 1
+        self._seen = 0
+
+    def add(self, sample: ResourceSample) -> None:
+        """Record a sample."""
+        self.latest = sample
+        self.peak_rss_bytes = max(self.peak_rss_bytes, sample.rss_bytes)
+        if self._seen % self._stride == 0:
+            self.points.append(sample)
+            if len(self.points) > self.max_points:
+                self.points = self.points[::2]
+                self._stride *= 2
+        self._seen += 1
+
+    def telemetry(self, source: Literal["proc", "docker"]) -> ResourceTelemetry | None:
+        """
+        Summarise the series for the ledger.
+
+        Returns:
+            ResourceTelemetry, or None if nothing was sampled
+        """
+        last = self.latest
+        if last is None:
+            return None
+        points = self.points if self.points[-1] is last else [*self.points, last]
+        return ResourceTelemetry(
+            source=source,
+            duration_seconds=round(last.elapsed, 3),
+            peak_rss_bytes=self.peak_rss_bytes,
+            cpu_seconds=round(last.cpu_seconds, 3),
+            read_bytes=last.read_bytes,
+            write_bytes=last.write_bytes,
+            samples=[(round(p.elapsed, 1), round(p.cpu_seconds, 2), p.rss_bytes) for p in points],
+        )
+
+
+class _Sampler(abc.ABC):
+    """Base for background samplers: start, sample periodically, stop."""
+
+    source: Literal["proc", "docker"]
+
+    def __init__(
+        self,
+        *,
+        interval: float = DEFAULT_INTERVAL,
+        max_points: int = DEFAULT_MAX_POINTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.interval = interval
+        self.series = ResourceSeries(max_points)
+        self._clock = clock
+        self._started_at = 0.0
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def latest(self) -> ResourceSample | None:
+        """The most recent sample, if any."""
+        with self._lock:
+            return self.series.latest
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        if self._thread is not None:
+            return
+        self._started_at = self._clock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"cub-telemetry-{self.source}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> ResourceTelemetry | None:
+        """
+        Stop sampling.
+
+        Returns:
+            Summary of what was sampled, or None if nothing was
+        """
+        self._stopping.set()
+        self._halt()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        with self._lock:
+            return self.series.telemetry(self.source)
+
+    def _record(self, sample: ResourceSample) -> None:
+        with self._lock:
+            self.series.add(sample)
+
+    def _elapsed(self) -> float:
+        return self._clock() - self._started_at
+
+    @abc.abstractmethod
+    def _run(self) -> None:
+        """Sample every ``interval`` seconds until the stop event is set."""
+
+    def _halt(self) -> None:
+        """Interrupt the sampling thread (beyond setting the stop event)."""
+
+
+class ProcTreeSampler(_Sampler):
+    """
+    Samples a process and its descendants from /proc.
+
+    CPU time and I/O are counted for every process in the tree, including
+    children that have exited (the kernel adds them to their parent's
+    totals when they're reaped). Readings are relative to the first
+    sample, so a long-lived process, such as the run loop itself, only
+    reports what was used while it was being sampled.
+    """
+
+    source: Literal["proc", "docker"] = "proc"
+
+    def __init__(
+        self,
+        pid: int,
+        *,
+        proc_root: Path = Path("/proc"),
+        interval: float = DEFAULT_INTERVAL,
+        max_points: int = DEFAULT_MAX_POINTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create a sampler for a process tree.
+
+        Args:
+            pid: Root process of the tree
+            proc_root: procfs mount (for tests)
+            interval: Seconds between samples
+            max_points: Samples kept before halving resolution
+            clock: Time source (for tests)
+        """
+        super().__init__(interval=interval, max_points=max_points, clock=clock)
+        self.pid = pid
+        self.proc_root = proc_root
+        self._ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self._baseline: tuple[float, int, int] | None = None
+        self._high = (0.0, 0, 0)
+
+    def sample(self) -> ResourceSample | None:
+        """
+        Take one reading of the tree and record it.
+
+        Returns:
+            The sample, or None if the root process is gone or /proc is
+            unavailable
+        """
+        totals = self._read_tree()
+        if totals is None:
+            return None
+        cpu, rss, read, write = totals
+        if self._baseline is None:
+            self._baseline = (cpu, read, write)
+        base_cpu, base_read, base_write = self._baseline
+        # A child that exits between readings drops out of the tree until
+        # it's reaped; never let the cumulative counters go backwards
+        high_cpu, high_read, high_write = self._high
+        self._high = (
+            max(high_cpu, cpu - base_cpu),
+            max(high_read, read - base_read),
+            max(high_write, write - base_write),
+        )
+        sample = ResourceSample(self._elapsed(), self._high[0], rss, *self._high[1:])
+        self._record(sample)
+        return sample
+
+    def _run(self) -> None:
+        while True:
+            self.sample()
+            if self._stopping.wait(self.interval):
+                break
+        # Take a final reading so short runs still get one
+        self.sample()
+
+    def _read_tree(self) -> tuple[float, int, int, int] | None:
+        """Sum CPU seconds, RSS bytes and I/O bytes over the tree."""
+        stats: dict[int, list[str]] = {}
+        try:
+            entries = [e for e in os.listdir(self.proc_root) if e.isdigit()]
+        except OSError:
+            return None
+        children: dict[int, list[int]] = {}
+        for entry in entries:
+            fields = self._read_stat(int(entry))
+            if fields is None:
+                continue
+            pid = int(entry)
+            stats[pid] = fields
+            children.setdefault(int(fields[1]), []).append(pid)
+        if self.pid not in stats:
+            return None
+
+        cpu_ticks = rss_pages = read = write = 0
+        pending = [self.pid]
+        while pending:
+            pid = pending.pop()
+            fields = stats.get(pid)
+            if fields is None:
+                continue
+            # utime, stime, cutime, cstime
+            cpu_ticks += sum(int(f) for f in fields[11:15])
+            rss_pages += int(fields[21])
+            pid_read, pid_write = self._read_io(pid)
+            read += pid_read
+            write += pid_write
+            pending.extend(children.get(pid, []))
+        return cpu_ticks / self._ticks, rss_pages * self._page_size, read, write
+
+    def _read_stat(self, pid: int) -> list[str] | None:
+        """Read /proc/<pid>/stat fields after the command name."""
+        try:
+            text = (self.proc_root / str(pid) / "stat").read_text()
+        except OSError:
+            return None
+        # The command name is parenthesised and may itself contain spaces
+        # or parentheses, so split after the last ')'
+        fields = text[text.rfind(")") + 2 :].split()
+        return fields if len(fields) > 21 else None
+
+    def _read_io(self, pid: int) -> tuple[int, int]:
+        """Read storage bytes from /proc/<pid>/io (0 if not permitted)."""
+        try:
+            text = (self.proc_root / str(pid) / "io").read_text()
+        except OSError:
+            return 0, 0
+        values = dict(line.split(":", 1) for line in text.splitlines() if ":" in line)
+        try:
+            return int(values.get("read_bytes", 0)), int(values.get("write_bytes", 0))
+        except ValueError:
+            return 0, 0
+
+
+_SIZE_RE = re.compile(r"^\s*([\d.]+)\s*([a-zA-Z]*)\s*$")
+
+_SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a size as printed by docker stats (e.g. '1.5GiB', '12.3MB').
+
+    Returns:
+        Size in bytes, or 0 if it can't be parsed
+    """
+    match = _SIZE_RE.match(text)
+    if not match:
+        return 0
+    unit = _SIZE_UNITS.get(match.group(2).lower())
+    if unit is None:
+        return 0
+    try:
+        return int(float(match.group(1)) * unit)
+    except ValueError:
+        return 0
+
+
+def _split_pair(text: str) -> tuple[str, str]:
+    """Split a docker stats 'used / limit' column."""
+    left, _, right = text.partition(" / ")
+    return left.strip(), right.strip()
+
+
+class DockerStatsSampler(_Sampler):
+    """
+    Samples a container from one streaming ``docker stats`` process.
+
+    docker stats reports CPU as a percentage of one core over its last
+    interval, so CPU-seconds are integrated from successive readings.
+    Memory and block I/O are taken as reported.
+    """
+
+    source: Literal["proc", "docker"] = "docker"
+
+    def __init__(
+        self,
+        container: str,
+        *,
+        max_points: int = DEFAULT_MAX_POINTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create a sampler for a container.
+
+        Args:
+            container: Container name or ID
+            max_points: Samples kept before halving resolution
+            clock: Time source (for tests)
+        """
+        super().__init__(max_points=max_points, clock=clock)
+        self.container = container
+        self.latest_stats: dict[str, Any] | None = None
+        self._process: subprocess.Popen[str] | None = None
+        self._cpu_seconds = 0.0
+        self._last_at: float | None = None
+
+    def feed(self, line: str) -> ResourceSample | None:
+        """
+        Record one line of ``docker stats --format '{{json .}}'`` output.
+
+        Lines may carry terminal control sequences around the JSON; those
+        are ignored.
+
+        Returns:
+            The sample, or None if the line held no stats
+        """
+        start, end = line.find("{"), line.rfind("}")
+        if start < 0 or end < start:
+            return None
+        try:
+            stats = json.loads(line[start : end + 1])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(stats, dict):
+            return None
+
+        now = self._elapsed()
+        try:
+            cpu_percent = float(str(stats.get("CPUPerc", "")).rstrip("%") or 0)
+        except ValueError:
+            cpu_percent = 0.0
+        if self._last_at is not None:
+            self._cpu_seconds += cpu_percent / 100 * max(0.0, now - self._last_at)
+        self._last_at = now
+
+        mem_used, _ = _split_pair(str(stats.get("MemUsage", "")))
+        read, write = _split_pair(str(stats.get("BlockIO", "")))
+        sample = ResourceSample(
+            now, self._cpu_seconds, parse_size(mem_used), parse_size(read), parse_size(write)
+        )
+        with self._lock:
+            self.latest_stats = stats
+        self._record(sample)
+        return sample
+
+    def _run(self) -> None:
+        try:
+            self._process = subprocess.Popen(
+                ["docker", "stats", "--format", "{{json .}}", self.container],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            logger.debug("Failed to start docker stats", exc_info=True)
+            return
+        if self._stopping.is_set():
+            self._process.terminate()
+        assert self._process.stdout is not None
+        for line in self._process.stdout:
+            self.feed(line)
+        self._process.wait()
+
+    def _halt(self) -> None:
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for display (e.g. '1.5 GiB')."""
+    if size < 1024:
+        return f"{size} B"
+    value = float(size)
+    for unit in ("KiB", "MiB"):
+        value /= 1024
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+    return f"{value / 1024:.1f} GiB"
+
+
+def format_telemetry(telemetry: ResourceTelemetry) -> str:
+    """One-line summary of sampled resource use."""
+    return (
+        f"peak {format_bytes(telemetry.peak_rss_bytes)} RSS, "
+        f"{telemetry.cpu_seconds:.1f} CPU-s ({telemetry.average_cpus:.2f} cores avg), "
+        f"{format_bytes(telemetry.read_bytes)} read, "
+        f"{format_bytes(telemetry.write_bytes)} written"
+    )
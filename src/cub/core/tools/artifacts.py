@@ -0,0 +1,472 @@
+"""
+Index and retention for tool execution artifacts.
+
+Every tool execution writes a JSON artifact to the artifact directory
+(.cub/toolsmith/runs by default). ArtifactIndex keeps an append-only
+manifest of them, index.jsonl, next to the artifacts. Listing reads the
+manifest instead of globbing the directory and parsing filenames, and the
+manifest carries what `cub tools artifacts` shows, so no artifact has to
+be opened to list it.
+
+An ArtifactRetention policy bounds the directory by age, by artifacts per
+tool and by total size. Eviction runs at most once per EVICTION_INTERVAL,
+in a background thread started after an artifact is written. Each
+eviction also reconciles the manifest with the directory: entries whose
+files are gone are dropped, and artifacts the manifest doesn't know about
+(written by older versions, or racing a manifest rewrite) are indexed.
+
+Storage location:
+- Project: .cub/toolsmith/runs/index.jsonl
+
+Example:
+    index = ArtifactIndex(Path(".cub/toolsmith/runs"))
+    for record in index.query(tool_id="brave-search"):
+        print(record.name, record.success)
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field, ValidationError
+
+from cub.core.filelock import file_lock
+from cub.core.tools.models import ToolResult
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "index.jsonl"
+
+# Run eviction at most this often (seconds)
+EVICTION_INTERVAL = 3600.0
+
+# Artifact filename timestamp: YYYYMMDDTHHMMSSZ
+_TIMESTAMP_LEN = 16
+
+
+def parse_artifact_name(name: str) -> tuple[str, str, str] | None:
+    """
+    Split an artifact filename into its parts.
+
+    Args:
+        name: Filename in the form {timestamp}-{tool_id}-{action}.json
+
+    Returns:
+        (timestamp, tool_id, action), or None if the name doesn't match
+    """
+    if not name.endswith(".json"):
+        return None
+    stem = name[: -len(".json")]
+    if len(stem) < _TIMESTAMP_LEN + 2:  # timestamp, one dash, one char
+        return None
+
+    # Split by last dash to separate tool_id from action
+    # This handles tool IDs with dashes (e.g., "brave-search")
+    remainder = stem[_TIMESTAMP_LEN + 1 :]
+    last_dash = remainder.rfind("-")
+    if last_dash == -1:
+        return None
+    return stem[:_TIMESTAMP_LEN], remainder[:last_dash], remainder[last_dash + 1 :]
+
+
+class ArtifactRetention(BaseModel):
+    """
+    Limits on how many execution artifacts are kept.
+
+    Each limit can be set to None to disable it.
+
+    Attributes:
+        max_age_days: Evict artifacts written more than this many days ago
+        max_per_tool: Keep at most this many artifacts per tool (newest win)
+        max_total_bytes: Evict oldest artifacts while the total exceeds this
+    """
+
+    max_age_days: int | None = Field(
+        default=30,
+        gt=0,
+        description="Evict artifacts older than this many days",
+    )
+    max_per_tool: int | None = Field(
+        default=500,
+        gt=0,
+        description="Keep at most this many artifacts per tool",
+    )
+    max_total_bytes: int | None = Field(
+        default=256 * 1024 * 1024,
+        gt=0,
+        description="Evict oldest artifacts while the total size exceeds this",
+    )
+
+
+class ArtifactRecord(BaseModel):
+    """
+    Manifest entry for one execution artifact.
+
+    Attributes:
+        name: Artifact filename within the artifact directory
+        tool_id: Tool that was executed
+        action: Action that was invoked
+        started_at: When execution started
+        success: Whether execution succeeded
+        size_bytes: Size of the artifact file
+        written_at: When the artifact was written (what max_age_days measures)
+    """
+
+    name: str
+    tool_id: str
+    action: str
+    started_at: datetime
+    success: bool
+    size_bytes: int = Field(default=0, ge=0)
+    written_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @classmethod
+    def from_result(cls, name: str, result: ToolResult, size_bytes: int) -> "ArtifactRecord":
+        """Build the entry for an artifact written from a ToolResult."""
+        return cls(
+            name=name,
+            tool_id=result.tool_id,
+            action=result.action,
+            started_at=result.started_at,
+            success=result.success,
+            size_bytes=size_bytes,
+        )
+
+
+class ArtifactIndex:
+    """
+    Append-only manifest of the artifacts in an artifact directory.
+
+    Reads tail the manifest incrementally, so repeated listings from one
+    index cost only the entries appended since the last one.
+
+    Attributes:
+        artifact_dir: Directory holding the artifacts
+        index_file: Path to the manifest
+        retention: Limits enforced by evict()
+    """
+
+    def __init__(self, artifact_dir: Path, retention: ArtifactRetention | None = None) -> None:
+        """
+        Initialize the index for an artifact directory.
+
+        Args:
+            artifact_dir: Directory holding the artifacts
+            retention: Retention limits (defaults to ArtifactRetention())
+        """
+        self.artifact_dir = Path(artifact_dir)
+        self.index_file = self.artifact_dir / INDEX_NAME
+        self.lock_file = self.artifact_dir / "index.lock"
+        self.marker_file = self.artifact_dir / "index.evicted"
+        self.retention = retention or ArtifactRetention()
+
+        self._records: dict[str, ArtifactRecord] = {}
+        self._inode: int | None = None
+        self._position = 0
+        self._mutex = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _refresh(self) -> dict[str, ArtifactRecord]:
+        """Bring the in-memory records up to date with the manifest."""
+        with self._mutex:
+            try:
+                st = self.index_file.stat()
+            except FileNotFoundError:
+                self._records, self._inode, self._position = {}, None, 0
+                return self._records
+            if st.st_ino != self._inode or st.st_size < self._position:
+                # Rewritten since we last read it
+                self._records, self._position = {}, 0
+            self._inode = st.st_ino
+            if st.st_size > self._position:
+                with open(self.index_file, "rb") as f:
+                    f.seek(self._position)
+                    data = f.read()
+                end = data.rfind(b"\n") + 1
+                for line in data[:end].splitlines():
+                    self._apply(line)
+                self._position += end
+            return self._records
+
+    def _apply(self, line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            entry = json.loads(line)
+            op = entry.pop("op")
+            if op == "add":
+                record = ArtifactRecord.model_validate(entry)
+                # Re-adding a name moves it to the newest position
+                self._records.pop(record.name, None)
+                self._records[record.name] = record
+            elif op == "remove":
+                for name in entry["names"]:
+                    self._records.pop(name, None)
+        except (ValueError, KeyError, TypeError, ValidationError):
+            logger.debug(f"Skipping bad artifact index line in {self.index_file}")
+
+    def records(self) -> list[ArtifactRecord]:
+        """
+        All indexed artifacts, oldest first.
+
+        Builds the manifest from the directory the first time it's read
+        for a directory that predates it.
+        """
+        if not self.index_file.exists() and self.artifact_dir.is_dir():
+            self.reindex()
+        return list(self._refresh().values())
+
+    def query(self, tool_id: str | None = None, action: str | None = None) -> list[ArtifactRecord]:
+        """
+        List indexed artifacts, most recent first.
+
+        Args:
+            tool_id: Optional filter by tool ID
+            action: Optional filter by action
+
+        Returns:
+            Matching artifact records, sorted by the timestamp in their
+            filenames (most recent first)
+        """
+        matches = [
+            record
+            for record in reversed(self.records())
+            if (not tool_id or record.tool_id == tool_id)
+            and (not action or record.action == action)
+        ]
+        # Stable, so artifacts from the same second stay newest first
+        matches.sort(key=lambda record: record.name[:_TIMESTAMP_LEN], reverse=True)
+        return matches
+
+    def total_bytes(self) -> int:
+        """Total size of the indexed artifacts."""
+        return sum(record.size_bytes for record in self.records())
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        # One write per entry, so concurrent appends don't interleave
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def add(self, record: ArtifactRecord) -> None:
+        """
+        Index a newly written artifact.
+
+        Starts a background eviction if one is due.
+
+        Args:
+            record: Manifest entry for the artifact
+        """
+        if not self.index_file.exists() and self.artifact_dir.is_dir():
+            # Index what's already there before the manifest starts
+            self.reindex(exclude={record.name})
+        self._append({"op": "add", **record.model_dump(mode="json")})
+        self.evict_in_background()
+
+    def reindex(self, exclude: set[str] | None = None) -> int:
+        """
+        Rewrite the manifest from the artifact directory.
+
+        Entries already in the manifest are kept as they are; artifacts it
+        doesn't know about are read to build theirs.
+
+        Args:
+            exclude: Filenames to leave out
+
+        Returns:
+            Number of artifacts in the rewritten manifest
+        """
+        known = dict(self._refresh())
+        records: list[ArtifactRecord] = []
+        with os.scandir(self.artifact_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_file())
+        for name in names:
+            if exclude and name in exclude:
+                continue
+            record = known.get(name) or _read_record(self.artifact_dir / name)
+            if record is not None:
+                records.append(record)
+
+        lines = [json.dumps({"op": "add", **r.model_dump(mode="json")}) for r in records]
+        _write_atomic(self.index_file, "".join(line + "\n" for line in lines))
+        return len(records)
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def select_evictions(self, now: datetime | None = None) -> list[ArtifactRecord]:
+        """
+        Pick the artifacts the retention policy would evict.
+
+        Args:
+            now: Current time (defaults to now, UTC)
+
+        Returns:
+            Records to evict, oldest first
+        """
+        now = now or datetime.now(timezone.utc)
+        policy = self.retention
+        oldest_first = sorted(self.records(), key=lambda r: r.name[:_TIMESTAMP_LEN])
+        evict: set[str] = set()
+
+        if policy.max_age_days is not None:
+            cutoff = now - timedelta(days=policy.max_age_days)
+            evict.update(r.name for r in oldest_first if r.written_at < cutoff)
+
+        if policy.max_per_tool is not None:
+            kept_per_tool: dict[str, int] = {}
+            for record in reversed(oldest_first):
+                if record.name in evict:
+                    continue
+                kept = kept_per_tool.get(record.tool_id, 0)
+                if kept >= policy.max_per_tool:
+                    evict.add(record.name)
+                else:
+                    kept_per_tool[record.tool_id] = kept + 1
+
+        if policy.max_total_bytes is not None:
+            total = sum(r.size_bytes for r in oldest_first if r.name not in evict)
+            for record in oldest_first:
+                if total <= policy.max_total_bytes:
+                    break
+                if record.name not in evict:
+                    evict.add(record.name)
+                    total -= record.size_bytes
+
+        return [r for r in oldest_first if r.name in evict]
+
+    def evict(self, now: datetime | None = None) -> list[ArtifactRecord] | None:
+        """
+        Delete artifacts beyond the retention limits and tidy the manifest.
+
+        Args:
+            now: Current time (defaults to now, UTC)
+
+        Returns:
+            Evicted records, or None if another process was already evicting
+        """
+        if not self.artifact_dir.is_dir():
+            return None
+        with file_lock(self.lock_file) as locked:
+            if not locked:
+                return None
+            _touch(self.marker_file)
+            evicted = self.select_evictions(now)
+            for record in evicted:
+                (self.artifact_dir / record.name).unlink(missing_ok=True)
+            if evicted:
+                self._append({"op": "remove", "names": [r.name for r in evicted]})
+            # Rewriting the manifest also picks up anything it missed
+            self.reindex()
+            if evicted:
+                logger.debug(f"Evicted {len(evicted)} artifact(s) from {self.artifact_dir}")
+            return evicted
+
+    def eviction_due(self) -> bool:
+        """Whether EVICTION_INTERVAL has passed since the last eviction."""
+        try:
+            last = self.marker_file.stat().st_mtime
+        except FileNotFoundError:
+            return True
+        return time.time() - last >= EVICTION_INTERVAL
+
+    def evict_in_background(self) -> bool:
+        """
+        Start an eviction in a daemon thread, if one is due.
+
+        The eviction is safe to interrupt (e.g. by the process exiting):
+        the next one finishes the job.
+
+        Returns:
+            True if an eviction was started
+        """
+        if not self.eviction_due():
+            return False
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        # Claim the interval now, so other writers don't start one too
+        _touch(self.marker_file)
+        self._thread = threading.Thread(
+            target=self._evict_quietly, name="cub-artifact-eviction", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for a background eviction to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _evict_quietly(self) -> None:
+        try:
+            self.evict()
+        except OSError as e:
+            logger.warning(f"Artifact eviction failed in {self.artifact_dir}: {e}")
+
+
+def _read_record(path: Path) -> ArtifactRecord | None:
+    """Build a manifest entry by reading an artifact file."""
+    parts = parse_artifact_name(path.name)
+    if parts is None:
+        return None
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    written_at = datetime.fromtimestamp(st.st_mtime, timezone.utc)
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            result = ToolResult.model_validate(json.load(f))
+        record = ArtifactRecord.from_result(path.name, result, st.st_size)
+        record.written_at = written_at
+        return record
+    except (OSError, ValueError, ValidationError):
+        pass
+
+    # Unreadable: index it from its name so retention still applies
+    timestamp, tool_id, action = parts
+    try:
+        started_at = datetime.strptime(timestamp, "%Y%m%dT%H%M%SZ")
+    except ValueError:
+        return None
+    return ArtifactRecord(
+        name=path.name,
+        tool_id=tool_id,
+        action=action,
+        started_at=started_at.replace(tzinfo=timezone.utc),
+        success=False,
+        size_bytes=st.st_size,
+        written_at=written_at,
+    )
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,212 @@
+"""
+Result cache for idempotent tool executions.
+
+Agents repeat read-only tool calls constantly: the same search, the same
+`gh` query a few minutes apart. Tools that opt in with a ResultCacheConfig
+have successful results of their cacheable actions kept here and reused
+for identical calls until the configured TTL runs out.
+
+Entries are keyed by tool ID, action, normalised params and the tool's
+version hash, so changing a tool's configuration never serves results
+produced by the old one. Each tool's entries live in their own directory,
+which is how invalidation drops everything cached for a tool.
+
+Storage location:
+- Project: .cub/tools/cache/{tool_id}/{key}.json
+
+Example:
+    cache = ResultCache.project()
+    key = cache.key("brave-search", "search", {"query": "python"}, version_hash)
+
+    result = cache.get("brave-search", key)
+    if result is None:
+        result = await adapter.execute(...)
+        cache.put("brave-search", key, result, ttl_seconds=300)
+"""
+
+import hashlib
+import json
+import logging
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from cub.core.tools.models import ToolResult
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_params(params: dict[str, Any]) -> str:
+    """
+    Serialise params to a canonical JSON string.
+
+    Key order doesn't matter, and adapter config objects passed in params
+    (e.g. ``_http_config``) are serialised by value.
+
+    Args:
+        params: Parameters for the action
+
+    Returns:
+        Canonical JSON representation of params
+    """
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, BaseModel):
+            return obj.model_dump(mode="json")
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj, key=str)
+        return str(obj)
+
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=default)
+
+
+class ResultCache:
+    """
+    Storage layer for cached tool results.
+
+    Attributes:
+        cache_dir: Directory holding one subdirectory of entries per tool
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """
+        Initialize the cache with a storage directory.
+
+        Args:
+            cache_dir: Path to the cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(tool_id: str, action: str, params: dict[str, Any], version_hash: str | None) -> str:
+        """
+        Compute the cache key for a tool call.
+
+        Args:
+            tool_id: Tool identifier
+            action: Action invoked
+            params: Parameters for the action
+            version_hash: The tool's version hash (see ToolConfig.version_hash)
+
+        Returns:
+            SHA256 hex digest identifying the call
+        """
+        material = "\0".join([tool_id, action, normalize_params(params), version_hash or ""])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _tool_dir(self, tool_id: str) -> Path:
+        # Tool IDs are registry keys; keep them from escaping cache_dir
+        return self.cache_dir / tool_id.replace("/", "_").replace("\\", "_")
+
+    def get(self, tool_id: str, key: str) -> ToolResult | None:
+        """
+        Look up an unexpired cached result.
+
+        Expired or unreadable entries are removed.
+
+        Args:
+            tool_id: Tool identifier
+            key: Cache key from key()
+
+        Returns:
+            The cached ToolResult, or None on a miss
+        """
+        entry_path = self._tool_dir(tool_id) / f"{key}.json"
+        try:
+            with open(entry_path, encoding="utf-8") as f:
+                entry = json.load(f)
+            expires_at = datetime.fromisoformat(entry["expires_at"])
+            result = ToolResult.model_validate(entry["result"])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, ValidationError) as e:
+            logger.debug(f"Dropping unreadable cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        if datetime.now(timezone.utc) >= expires_at:
+            entry_path.unlink(missing_ok=True)
+            return None
+        return result
+
+    def put(self, tool_id: str, key: str, result: ToolResult, ttl_seconds: int) -> Path:
+        """
+        Cache a result.
+
+        Args:
+            tool_id: Tool identifier
+            key: Cache key from key()
+            result: Result to cache
+            ttl_seconds: How long the entry stays valid
+
+        Returns:
+            Path to the cache entry
+
+        Raises:
+            OSError: If the entry cannot be written
+        """
+        tool_dir = self._tool_dir(tool_id)
+        tool_dir.mkdir(parents=True, exist_ok=True)
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        entry = {
+            "expires_at": expires_at.isoformat(),
+            "result": result.model_dump(mode="json"),
+        }
+
+        # Atomic write: write to temp file in same directory, then rename
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=tool_dir,
+            delete=False,
+            suffix=".tmp",
+        ) as tmp:
+            json.dump(entry, tmp)
+            tmp_path = Path(tmp.name)
+
+        entry_path = tool_dir / f"{key}.json"
+        tmp_path.replace(entry_path)
+        return entry_path
+
+    def invalidate(self, tool_id: str) -> int:
+        """
+        Drop every cached result for a tool.
+
+        Args:
+            tool_id: Tool identifier
+
+        Returns:
+            Number of entries removed
+        """
+        tool_dir = self._tool_dir(tool_id)
+        if not tool_dir.is_dir():
+            return 0
+        count = sum(1 for _ in tool_dir.glob("*.json"))
+        shutil.rmtree(tool_dir, ignore_errors=True)
+        return count
+
+    def clear_all(self) -> None:
+        """Drop every cached result."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    @classmethod
+    def project(cls, project_dir: Path | None = None) -> "ResultCache":
+        """
+        Create a cache for the project.
+
+        The project-level cache is stored at:
+        - .cub/tools/cache/ (relative to project root)
+
+        Args:
+            project_dir: Project directory (defaults to current directory)
+
+        Returns:
+            ResultCache for the project
+        """
+        if project_dir is None:
+            project_dir = Path.cwd()
+        return cls(project_dir / ".cub" / "tools" / "cache")
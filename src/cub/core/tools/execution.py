@@ -54,14 +54,16 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel, Field
 
 from cub.core.tools.adapter import get_adapter
+from cub.core.tools.artifacts import ArtifactIndex, ArtifactRecord, ArtifactRetention
 from cub.core.tools.exceptions import (
     ToolApprovalRequiredError,
     ToolNotAdoptedError,
 )
-from cub.core.tools.models import ToolMetrics, ToolResult
+from cub.core.tools.models import Registry, ResultCacheConfig, ToolMetrics, ToolResult
 
 if TYPE_CHECKING:
     from cub.core.tools.approvals import ApprovalService
+    from cub.core.tools.cache import ResultCache
     from cub.core.tools.metrics import MetricsStore
     from cub.core.tools.registry import RegistryService
 
@@ -95,7 +97,8 @@ class ExecutionService:
     - Adapter selection (HTTP, CLI, MCP stdio)
     - Readiness checks (auth credentials, command availability)
     - Timeout enforcement
-    - Artifact persistence (atomic writes to disk)
+    - Artifact persistence (atomic writes to disk), indexing and retention
+    - Result caching for tools that opt in (see ResultCacheConfig)
 
     The service uses the adapter registry to select the appropriate execution
     backend based on the adapter_type parameter.
@@ -103,9 +106,12 @@ class ExecutionService:
     Attributes:
         artifact_dir: Directory where execution artifacts are saved
             (default: .cub/toolsmith/runs)
+        artifact_index: ArtifactIndex listing the saved artifacts and evicting
+            old ones in the background
         registry_service: Optional RegistryService for enforcing adopt-before-execute
         metrics_store: Optional MetricsStore for recording execution metrics
         approval_service: Optional ApprovalService for enforcing freedom-level-based approvals
+        result_cache: Optional ResultCache for reusing results of repeated read-only calls
 
     Example:
         >>> from cub.core.tools.registry import RegistryService
@@ -143,6 +149,8 @@ class ExecutionService:
         registry_service: RegistryService | None = None,
         metrics_store: MetricsStore | None = None,
         approval_service: ApprovalService | None = None,
+        result_cache: ResultCache | None = None,
+        artifact_retention: ArtifactRetention | None = None,
     ):
         """
         Initialize the execution service.
@@ -156,12 +164,21 @@ class ExecutionService:
                 If None, metrics recording is disabled.
             approval_service: ApprovalService for checking approval requirements.
                 If None, approval checks are disabled (tools execute without prompting).
+            result_cache: ResultCache for tools whose registry config has a
+                result_cache policy. Needs registry_service to find the policy.
+                If None, results are never cached.
+            artifact_retention: Limits on kept artifacts.
+                If None, defaults to ArtifactRetention().
         """
         self.artifact_dir = artifact_dir or Path(".cub/toolsmith/runs")
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        self.artifact_index = ArtifactIndex(self.artifact_dir, artifact_retention)
         self.registry_service = registry_service
         self.metrics_store = metrics_store
         self.approval_service = approval_service
+        self.result_cache = result_cache
+        # Registry read for result cache policies, loaded on first use
+        self._registry: Registry | None = None
 
     async def execute(
         self,
@@ -181,6 +198,12 @@ class ExecutionService:
         If a registry_service is configured, verifies that the tool has been
         adopted before allowing execution.
 
+        If a result_cache is configured and the tool's registry config has a
+        result_cache policy, a cacheable action called again with the same
+        params is answered from the cache: the earlier ToolResult is returned
+        with ``cached=True``, the adapter isn't called and no new artifact is
+        written.
+
         Args:
             tool_id: Tool identifier (e.g., "brave-search", "gh")
             action: Action to invoke (e.g., "search", "pr create")
@@ -231,6 +254,23 @@ class ExecutionService:
                     f"Either approve this execution or increase the freedom level.",
                 )
 
+        # Serve repeated read-only calls from the result cache
+        result_cache = self.result_cache
+        cache_policy = self._get_cache_policy(tool_id)
+        cache_key: str | None = None
+        if (
+            result_cache is not None
+            and cache_policy is not None
+            and cache_policy[0].is_cacheable(action)
+        ):
+            cache_key = result_cache.key(tool_id, action, params, cache_policy[1])
+            cached = result_cache.get(tool_id, cache_key)
+            if self.metrics_store is not None:
+                self.metrics_store.record_cache_lookup(tool_id, hit=cached is not None)
+            if cached is not None:
+                logger.debug(f"Result cache hit for {tool_id} {action}")
+                return cached.model_copy(update={"cached": True})
+
         # Get the appropriate adapter
         adapter = get_adapter(adapter_type)
 
@@ -252,8 +292,53 @@ class ExecutionService:
         if self.metrics_store is not None:
             self.metrics_store.record_execution(result)
 
+        # Update the result cache
+        if result_cache is not None and cache_policy is not None:
+            self._update_cache(result_cache, tool_id, action, cache_policy[0], cache_key, result)
+
         return result
 
+    def _get_cache_policy(self, tool_id: str) -> tuple[ResultCacheConfig, str] | None:
+        """
+        Look up a tool's result caching policy and version hash.
+
+        The registry is read once per service, so tools adopted or changed
+        after the first execution keep their earlier policy until a new
+        ExecutionService is created.
+
+        Returns:
+            (policy, version hash), or None if results of this tool aren't cached
+        """
+        if self.result_cache is None or self.registry_service is None:
+            return None
+        if self._registry is None:
+            self._registry = self.registry_service.load()
+        tool_config = self._registry.get(tool_id)
+        if tool_config is None or tool_config.result_cache is None:
+            return None
+        version_hash = tool_config.version_hash or self.registry_service.version_hash(tool_config)
+        return tool_config.result_cache, version_hash
+
+    def _update_cache(
+        self,
+        result_cache: ResultCache,
+        tool_id: str,
+        action: str,
+        policy: ResultCacheConfig,
+        cache_key: str | None,
+        result: ToolResult,
+    ) -> None:
+        """Cache a fresh result, or invalidate the tool's cache after a write."""
+        try:
+            if action in policy.invalidate_on:
+                removed = result_cache.invalidate(tool_id)
+                logger.debug(f"{tool_id} {action} invalidated {removed} cached result(s)")
+            elif cache_key is not None and result.success:
+                result_cache.put(tool_id, cache_key, result, policy.ttl_seconds)
+        except OSError as e:
+            # A cache that can't be written only costs a future re-run
+            logger.warning(f"Failed to update result cache for {tool_id}: {e}")
+
     async def check_readiness(
         self,
         tool_id: str,
@@ -349,6 +434,9 @@ class ExecutionService:
         Note:
             Artifact filename format: {timestamp}-{tool_id}-{action}.json
             Example: 20260124T120000Z-brave-search-search.json
+
+            The artifact is added to the artifact index, which may start a
+            background eviction of old artifacts.
         """
         # Generate artifact filename
         timestamp = result.started_at.strftime("%Y%m%dT%H%M%SZ")
@@ -389,6 +477,9 @@ class ExecutionService:
             raise
 
         logger.debug(f"Saved execution artifact to {artifact_path}")
+        self.artifact_index.add(
+            ArtifactRecord.from_result(filename, result, artifact_path.stat().st_size)
+        )
         return artifact_path
 
     def read_artifact(self, artifact_path: Path) -> ToolResult | None:
@@ -433,6 +524,9 @@ class ExecutionService:
             tool_id: Optional filter by tool ID
             action: Optional filter by action
 
+        Reads the artifact index rather than the directory (see
+        ArtifactIndex), so listing doesn't slow down as artifacts accumulate.
+
         Returns:
             List of artifact paths matching the filters, sorted by modification time
             (most recent first)
@@ -450,48 +544,8 @@ class ExecutionService:
         if not self.artifact_dir.exists():
             return []
 
-        artifacts = []
-        for artifact_path in self.artifact_dir.glob("*.json"):
-            # Skip temp files
-            if artifact_path.suffix == ".tmp":
-                continue
-
-            # Parse filename: {timestamp}-{tool_id}-{action}.json
-            # Timestamp format: YYYYMMDDTHHMMSSZ (16 chars)
-            # Extract parts after timestamp
-            name = artifact_path.stem
-            if len(name) < 18:  # Minimum: timestamp(16) + 1 dash + 1 char
-                continue
-
-            # Everything after the timestamp (17th char onwards) is tool_id-action
-            remainder = name[17:]  # Skip "YYYYMMDDTHHMMSSZ-"
-
-            # Split by last dash to separate tool_id from action
-            # This handles tool IDs with dashes (e.g., "brave-search")
-            last_dash = remainder.rfind("-")
-            if last_dash == -1:
-                continue
-
-            artifact_tool_id = remainder[:last_dash]
-            artifact_action = remainder[last_dash + 1:]
-
-            # Apply filters
-            if tool_id and artifact_tool_id != tool_id:
-                continue
-            if action and artifact_action != action:
-                continue
-
-            artifacts.append(artifact_path)
-
-        # Sort by embedded timestamp in filename (most recent first)
-        # Filename format: {timestamp}-{tool_id}-{action}.json
-        # where timestamp is YYYYMMDDTHHMMSSZ
-        def extract_timestamp(artifact_path: Path) -> str:
-            """Extract timestamp from artifact filename."""
-            return artifact_path.stem[:16]  # YYYYMMDDTHHMMSSZ
-
-        artifacts.sort(key=extract_timestamp, reverse=True)
-        return artifacts
+        records = self.artifact_index.query(tool_id=tool_id, action=action)
+        return [self.artifact_dir / record.name for record in records]
 
     def get_metrics(self, tool_id: str) -> ToolMetrics | None:
         """
@@ -514,23 +568,41 @@ class ExecutionService:
             return None
         return self.metrics_store.get(tool_id)
 
-    def get_degraded_tools(self, threshold: float = 80.0) -> list[ToolMetrics]:
+    def get_degraded_tools(
+        self, threshold: float = 80.0, p95_ms: float | None = None
+    ) -> list[ToolMetrics]:
         """
-        Get tools with success rates below a threshold.
+        Get tools that are failing or slow.
+
+        Success rates are taken over each tool's recent executions, so a
+        tool that has started failing shows up even if its lifetime rate
+        is still high. Latency comes from the rolled-up histogram.
 
         Args:
             threshold: Success rate threshold percentage (default: 80.0)
+            p95_ms: Also report tools whose p95 latency exceeds this many
+                milliseconds (default: latency is not checked)
 
         Returns:
-            List of ToolMetrics for tools with success rates below the threshold.
+            List of ToolMetrics for tools with success rates below the threshold
+            or p95 latency above p95_ms.
             Returns empty list if metrics_store is not configured.
 
         Example:
-            >>> # Get tools with success rate below 80%
-            >>> degraded = service.get_degraded_tools(threshold=80.0)
+            >>> # Get tools with success rate below 80% or p95 above 5s
+            >>> degraded = service.get_degraded_tools(threshold=80.0, p95_ms=5000)
             >>> for metrics in degraded:
-            ...     print(f"{metrics.tool_id}: {metrics.success_rate():.1f}%")
+            ...     print(f"{metrics.tool_id}: {metrics.window_success_rate():.1f}%")
         """
         if self.metrics_store is None:
             return []
-        return self.metrics_store.filter(lambda m: m.success_rate() < threshold)
+
+        def is_degraded(metrics: ToolMetrics) -> bool:
+            if metrics.window_success_rate() < threshold:
+                return True
+            if p95_ms is None:
+                return False
+            p95 = metrics.percentile(95)
+            return p95 is not None and p95 > p95_ms
+
+        return self.metrics_store.filter(is_degraded)
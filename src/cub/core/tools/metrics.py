@@ -1,14 +1,28 @@
 """
 Metrics storage layer for reading/writing tool execution metrics.
 
-Manages tool metrics at project-level (.cub/tools/metrics.json). Provides
-load, save, and query operations with atomic writes for safety.
-
-Tool metrics track execution statistics (success rates, timing, errors)
-to enable the learning loop to evaluate tool reliability and performance.
+Manages tool metrics at project-level (.cub/tools/). Provides load, save,
+and query operations.
+
+Tool metrics track execution statistics (success rates, latency
+percentiles, errors) to enable the learning loop to evaluate tool
+reliability and performance.
+
+Recording an execution appends one line to an execution log instead of
+rewriting the whole metrics file, so concurrent tool runs neither race on
+a read-modify-write nor pay for re-serialising every tool's metrics. Once
+enough executions have piled up, the recorder rolls them up into
+metrics.json: per-tool counters, a mergeable latency histogram, error
+counts and a window of recent executions. The roll-up records how far
+into the log it has read, so readers combine the roll-up with the rest
+of the log and no execution is counted twice. Only one process rolls up
+at a time (guarded by a lock file); others leave it for the next record.
+Appends hold the same lock shared, so none can land in a log that a
+roll-up is moving aside and about to delete.
 
 Storage location:
-- Project: .cub/tools/metrics.json
+- Project: .cub/tools/metrics.json (roll-up)
+- Project: .cub/tools/metrics.jsonl (execution log)
 
 Example:
     # Project-level metrics store
@@ -28,23 +42,43 @@ Example:
 """
 
 import json
+import logging
+import os
 import tempfile
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+from cub.core.filelock import file_lock
+from cub.core.tools.models import ExecutionSample, ToolMetrics, ToolResult
+
+logger = logging.getLogger(__name__)
+
+# Roll up once this many bytes of the log are not yet in metrics.json
+DEFAULT_ROLLUP_BYTES = 64 * 1024
 
-from cub.core.tools.models import ToolMetrics, ToolResult
+# Start a fresh log once a roll-up has absorbed this much of it
+DEFAULT_ROTATE_BYTES = 4 * 1024 * 1024
+
+# Key in metrics.json holding the roll-up's position in the log
+ROLLUP_KEY = "_rollup"
+
+# How long an append waits for a roll-up to release the lock
+APPEND_LOCK_WAIT_SECONDS = 5.0
 
 
 class MetricsStore:
     """
     Storage layer for tool execution metrics.
 
-    Manages reading/writing tool metrics from disk with atomic writes
-    to prevent corruption during saves. Metrics are stored per-tool in
-    a single JSON file at the project level.
+    Executions are appended to an execution log and periodically rolled
+    up into a per-tool metrics file (see module docstring). Reads tail
+    the log incrementally, so repeated reads from one store cost only the
+    executions recorded since the last read.
 
     Attributes:
-        metrics_file: Path to the metrics JSON file
+        metrics_file: Path to the metrics JSON file (the roll-up)
+        log_file: Path to the execution log, next to metrics_file
 
     Example:
         # Project-level store
@@ -57,22 +91,121 @@ class MetricsStore:
         # Query metrics
         metrics = store.get("brave-search")
         print(f"Success rate: {metrics.success_rate():.1f}%")
+        print(f"p95: {metrics.percentile(95):.0f}ms")
     """
 
-    def __init__(self, metrics_file: Path) -> None:
+    def __init__(
+        self,
+        metrics_file: Path,
+        *,
+        rollup_bytes: int = DEFAULT_ROLLUP_BYTES,
+        rotate_bytes: int = DEFAULT_ROTATE_BYTES,
+    ) -> None:
         """
         Initialize store with a metrics file path.
 
         Args:
             metrics_file: Path to metrics.json file
+            rollup_bytes: Roll the log up once this much of it is pending
+            rotate_bytes: Start a fresh log once this much is rolled up
         """
         self.metrics_file = Path(metrics_file)
+        self.log_file = self.metrics_file.with_suffix(".jsonl")
+        self.lock_file = self.metrics_file.with_name(self.metrics_file.name + ".lock")
+        self.rollup_bytes = rollup_bytes
+        self.rotate_bytes = rotate_bytes
+
+        # Metrics as of _log_position, and the roll-up they started from
+        self._metrics: dict[str, ToolMetrics] | None = None
+        self._snapshot_signature: tuple[int, int, int] | None = None
+        self._rollup_offset = 0
+        self._log_inode: int | None = None
+        self._log_position = 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read_snapshot(self) -> tuple[dict[str, ToolMetrics], int, int | None]:
+        """Read metrics.json: metrics, log offset and log inode."""
+        if not self.metrics_file.exists():
+            return {}, 0, None
+
+        with open(self.metrics_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"Metrics file {self.metrics_file} is not a JSON object")
+
+        position = data.pop(ROLLUP_KEY, None) or {}
+        # Convert each tool's metrics dict to ToolMetrics object
+        metrics = {
+            tool_id: ToolMetrics.model_validate(metrics_data)
+            for tool_id, metrics_data in data.items()
+        }
+        return metrics, int(position.get("log_offset", 0)), position.get("log_inode")
+
+    def _refresh(self) -> dict[str, ToolMetrics]:
+        """Bring the in-memory metrics up to date with the files."""
+        signature = _signature(self.metrics_file)
+        if self._metrics is None or signature != self._snapshot_signature:
+            metrics, offset, inode = self._read_snapshot()
+            self._metrics = metrics
+            self._snapshot_signature = signature
+            self._rollup_offset = offset
+            self._log_inode = inode
+            self._log_position = offset
+
+        try:
+            st = self.log_file.stat()
+        except FileNotFoundError:
+            return self._metrics
+        if self._log_inode is not None and st.st_ino != self._log_inode:
+            # The log was replaced since the roll-up read it
+            self._rollup_offset = self._log_position = 0
+        self._log_inode = st.st_ino
+        if st.st_size < self._log_position:
+            # Truncated behind our back; start over from the roll-up
+            self._metrics = None
+            return self._refresh()
+        if st.st_size > self._log_position:
+            self._log_position = self._apply_log(self.log_file, self._log_position, self._metrics)
+        return self._metrics
+
+    def _apply_log(self, path: Path, position: int, metrics: dict[str, ToolMetrics]) -> int:
+        """
+        Apply complete log lines from ``position`` onwards.
+
+        Returns:
+            Position after the last complete line
+        """
+        with open(path, "rb") as f:
+            f.seek(position)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                tool_id = record.pop("tool_id")
+                cache = record.pop("cache", None)
+                sample = None if cache else ExecutionSample.model_validate(record)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                logger.debug("Skipping bad metrics log line in %s", path)
+                continue
+            if tool_id not in metrics:
+                metrics[tool_id] = ToolMetrics(tool_id=tool_id)
+            if sample is None:
+                metrics[tool_id].record_cache_lookup(cache == "hit")
+            else:
+                metrics[tool_id].record(sample)
+        return position + end
 
     def load(self) -> dict[str, ToolMetrics]:
         """
-        Load all tool metrics from disk.
+        Load all tool metrics: the roll-up plus executions logged since.
 
-        Returns an empty dict if the file doesn't exist yet.
+        Returns an empty dict if nothing has been recorded yet.
 
         Returns:
             Dictionary mapping tool IDs to ToolMetrics objects
@@ -81,43 +214,28 @@ class MetricsStore:
             ValueError: If metrics file is malformed
             json.JSONDecodeError: If metrics file contains invalid JSON
         """
-        if not self.metrics_file.exists():
-            # Return empty metrics dict
-            return {}
-
-        with open(self.metrics_file, encoding="utf-8") as f:
-            data = json.load(f)
-            # Convert each tool's metrics dict to ToolMetrics object
-            return {
-                tool_id: ToolMetrics.model_validate(metrics_data)
-                for tool_id, metrics_data in data.items()
-            }
-
-    def save(self, metrics: dict[str, ToolMetrics]) -> Path:
-        """
-        Write metrics to disk with atomic write.
-
-        Creates parent directories if they don't exist.
-        Uses atomic write (write to temp file, then rename) to prevent corruption.
-
-        Args:
-            metrics: Dictionary mapping tool IDs to ToolMetrics objects
+        metrics = self._refresh()
+        return {tool_id: m.model_copy(deep=True) for tool_id, m in metrics.items()}
 
-        Returns:
-            Path to the saved metrics file
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
 
-        Raises:
-            OSError: If file cannot be written
-        """
+    def _write_snapshot(
+        self, metrics: dict[str, ToolMetrics], log_offset: int, log_inode: int | None
+    ) -> None:
+        """Atomically write metrics.json."""
         # Ensure parent directory exists
         self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Serialize metrics to JSON with nice formatting
         # Use mode='json' to convert datetime objects to ISO strings
-        metrics_dict = {
+        metrics_dict: dict[str, Any] = {
             tool_id: tool_metrics.model_dump(mode="json")
             for tool_id, tool_metrics in metrics.items()
         }
+        if log_offset or log_inode is not None:
+            metrics_dict[ROLLUP_KEY] = {"log_offset": log_offset, "log_inode": log_inode}
         json_str = json.dumps(metrics_dict, indent=2)
 
         # Atomic write: write to temp file in same directory, then rename
@@ -136,8 +254,126 @@ class MetricsStore:
         # Atomic rename (replaces existing file)
         tmp_path.replace(self.metrics_file)
 
+    def save(self, metrics: dict[str, ToolMetrics]) -> Path:
+        """
+        Replace all metrics with the given ones.
+
+        Executions logged before the call are discarded along with the old
+        roll-up. Creates parent directories if they don't exist and writes
+        atomically (temp file, then rename) to prevent corruption.
+
+        Args:
+            metrics: Dictionary mapping tool IDs to ToolMetrics objects
+
+        Returns:
+            Path to the saved metrics file
+
+        Raises:
+            OSError: If file cannot be written
+        """
+        # Proceeds without the lock if a roll-up holds it for too long
+        with file_lock(self.lock_file, timeout=2.0):
+            try:
+                st = self.log_file.stat()
+                log_offset, log_inode = st.st_size, st.st_ino
+            except FileNotFoundError:
+                log_offset, log_inode = 0, None
+            self._write_snapshot(metrics, log_offset, log_inode)
+        self._metrics = None
         return self.metrics_file
 
+    def record_execution(self, result: ToolResult) -> ToolMetrics:
+        """
+        Record a tool execution and update metrics.
+
+        Appends the execution to the log, and rolls the log up into
+        metrics.json once enough executions are pending.
+
+        Args:
+            result: ToolResult from tool execution
+
+        Returns:
+            Updated ToolMetrics for the tool
+
+        Raises:
+            OSError: If the execution cannot be logged
+        """
+        sample = ExecutionSample(
+            success=result.success,
+            duration_ms=result.duration_ms,
+            error_type=result.error_type,
+            started_at=result.started_at,
+        )
+        return self._append({"tool_id": result.tool_id, **sample.model_dump(mode="json")})
+
+    def record_cache_lookup(self, tool_id: str, hit: bool) -> ToolMetrics:
+        """
+        Record a result cache lookup for a tool.
+
+        Args:
+            tool_id: The tool identifier
+            hit: Whether the lookup found a cached result
+
+        Returns:
+            Updated ToolMetrics for the tool
+
+        Raises:
+            OSError: If the lookup cannot be logged
+        """
+        return self._append({"tool_id": tool_id, "cache": "hit" if hit else "miss"})
+
+    def _append(self, record: dict[str, Any]) -> ToolMetrics:
+        """Append a record to the log, rolling up if enough is pending."""
+        tool_id = record["tool_id"]
+
+        # One write per record, so concurrent appends don't interleave.
+        # Appends only exclude roll-ups, not each other; if a roll-up holds
+        # the lock for too long the record is written anyway.
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.lock_file, timeout=APPEND_LOCK_WAIT_SECONDS, shared=True):
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        metrics = self._refresh()
+        tool_metrics = metrics.get(tool_id) or ToolMetrics(tool_id=tool_id)
+        tool_metrics = tool_metrics.model_copy(deep=True)
+
+        if self._log_position - self._rollup_offset >= self.rollup_bytes:
+            try:
+                self.rollup()
+            except OSError:
+                logger.debug("Metrics roll-up failed", exc_info=True)
+
+        return tool_metrics
+
+    def rollup(self) -> bool:
+        """
+        Fold logged executions into metrics.json.
+
+        Skips the roll-up if another process holds the lock, including
+        one in the middle of an append. Once the rolled-up part of the log
+        exceeds rotate_bytes, the log is moved aside, folded in up to its
+        end and deleted, and a fresh log is started.
+
+        Returns:
+            True if the roll-up ran, False if another process had the lock
+        """
+        with file_lock(self.lock_file) as locked:
+            if not locked:
+                return False
+            self._metrics = None
+            metrics = self._refresh()
+            if self._log_position < self.rotate_bytes:
+                self._write_snapshot(metrics, self._log_position, self._log_inode)
+            else:
+                rotated = self.log_file.with_name(self.log_file.name + ".rollup")
+                os.replace(self.log_file, rotated)
+                self._apply_log(rotated, self._log_position, metrics)
+                self._write_snapshot(metrics, 0, None)
+                rotated.unlink()
+            self._metrics = None
+            return True
+
     def get(self, tool_id: str) -> ToolMetrics | None:
         """
         Get metrics for a specific tool.
@@ -166,38 +402,6 @@ class MetricsStore:
             metrics[tool_id] = ToolMetrics(tool_id=tool_id)
         return metrics[tool_id]
 
-    def record_execution(self, result: ToolResult) -> ToolMetrics:
-        """
-        Record a tool execution and update metrics.
-
-        Loads current metrics, updates them with the execution result,
-        and saves back to disk atomically.
-
-        Args:
-            result: ToolResult from tool execution
-
-        Returns:
-            Updated ToolMetrics for the tool
-
-        Raises:
-            OSError: If metrics cannot be saved
-        """
-        # Load current metrics
-        metrics = self.load()
-
-        # Get or create metrics for this tool
-        if result.tool_id not in metrics:
-            metrics[result.tool_id] = ToolMetrics(tool_id=result.tool_id)
-
-        # Update metrics with this execution
-        tool_metrics = metrics[result.tool_id]
-        tool_metrics.record_execution(result)
-
-        # Save updated metrics
-        self.save(metrics)
-
-        return tool_metrics
-
     def list_all(self) -> list[ToolMetrics]:
         """
         Get metrics for all tools.
@@ -254,7 +458,7 @@ class MetricsStore:
         """
         Clear all metrics from the store.
 
-        Saves an empty metrics file to disk.
+        Saves an empty metrics file to disk, discarding logged executions.
         """
         self.save({})
 
@@ -276,3 +480,12 @@ class MetricsStore:
             project_dir = Path.cwd()
         metrics_file = project_dir / ".cub" / "tools" / "metrics.json"
         return cls(metrics_file)
+
+
+def _signature(path: Path) -> tuple[int, int, int] | None:
+    """Identity of a file's current contents, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
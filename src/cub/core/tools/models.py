@@ -11,8 +11,10 @@ Key Models:
     - ToolConfig: Configuration for an approved tool
     - Registry: Tool registry with approved tools and version tracking
     - ToolMetrics: Execution statistics for tool performance tracking
+    - LatencyHistogram: Mergeable latency distribution behind ToolMetrics percentiles
     - HTTPConfig, CLIConfig, MCPConfig: Adapter-specific configurations
     - AuthConfig: Authentication requirements
+    - ResultCacheConfig: Opt-in caching of a tool's results
     - FreedomLevel: Autonomy level for tool execution (low, medium, high)
     - ToolApprovals: Tool approval configuration based on freedom level
 
@@ -60,9 +62,10 @@ Example:
     >>> found = registry.find_by_capability("web_search")
 """
 
+import math
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -111,6 +114,7 @@ class ToolResult(BaseModel):
         adapter_type: Type of adapter that executed the tool
         artifact_path: Optional path to saved execution artifacts
         metadata: Additional execution metadata (headers, status codes, etc.)
+        cached: Whether this result was served from the result cache
     """
 
     tool_id: str = Field(..., description="Unique identifier of the executed tool")
@@ -155,6 +159,10 @@ class ToolResult(BaseModel):
         default=None,
         description="Additional execution metadata (headers, status codes, etc.)",
     )
+    cached: bool = Field(
+        default=False,
+        description="Whether this result was served from the result cache",
+    )
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -366,6 +374,47 @@ class AuthConfig(BaseModel):
     )
 
 
+class ResultCacheConfig(BaseModel):
+    """
+    Opt-in result caching for a tool's read-only actions.
+
+    When a tool has a result_cache config, successful results of the
+    actions listed in ``actions`` are reused for identical calls (same
+    action, params and tool version) until they expire. Only listed actions
+    are cached, so a mutating call is never answered from the cache. Running
+    one of the invalidate_on actions drops everything cached for the tool.
+
+    Attributes:
+        ttl_seconds: How long a cached result stays valid
+        actions: Read-only actions whose results may be cached (empty means
+            nothing is cached)
+        invalidate_on: Actions that change what the tool returns (e.g.
+            "pr create"), clearing its cached results when run
+    """
+
+    ttl_seconds: int = Field(
+        default=300,
+        gt=0,
+        description="How long a cached result stays valid (seconds)",
+    )
+    actions: list[str] = Field(
+        default_factory=list,
+        description="Read-only actions whose results may be cached (empty means none)",
+    )
+    invalidate_on: list[str] = Field(
+        default_factory=list,
+        description="Actions that clear the tool's cached results",
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+
+    def is_cacheable(self, action: str) -> bool:
+        """Whether results of an action may be served from the cache."""
+        return action in self.actions and action not in self.invalidate_on
+
+
 class ToolConfig(BaseModel):
     """
     Configuration for an approved tool.
@@ -386,6 +435,7 @@ class ToolConfig(BaseModel):
         adopted_at: Timestamp when tool was adopted into registry
         adopted_from: Source where tool was adopted from (e.g., "mcp-official")
         version_hash: Optional hash for detecting version changes requiring re-approval
+        result_cache: Optional result caching policy (results are not cached without it)
     """
 
     id: str = Field(
@@ -442,6 +492,12 @@ class ToolConfig(BaseModel):
         description="Optional hash for detecting version changes",
     )
 
+    # Execution policy
+    result_cache: ResultCacheConfig | None = Field(
+        default=None,
+        description="Result caching policy (disabled if not set)",
+    )
+
     model_config = ConfigDict(
         populate_by_name=True,
     )
@@ -541,6 +597,96 @@ class ToolConfig(BaseModel):
                 return self.mcp_config
 
 
+class LatencyHistogram(BaseModel):
+    """
+    Log-bucketed latency distribution.
+
+    Durations fall into buckets whose bounds grow by a factor of
+    2**(1/8), so percentiles are accurate to within about 5% whatever the
+    scale, and the histogram stays a few dozen counters even after
+    millions of executions. Histograms merge by adding counts, which is
+    what lets the metrics store roll up execution logs incrementally.
+
+    Attributes:
+        counts: Execution count per bucket index (0 holds 0ms durations)
+    """
+
+    # Buckets per doubling of duration
+    SUBBUCKETS: ClassVar[int] = 8
+
+    counts: dict[int, int] = Field(
+        default_factory=dict,
+        description="Execution count per bucket index",
+    )
+
+    @classmethod
+    def bucket(cls, duration_ms: int) -> int:
+        """Bucket index for a duration."""
+        if duration_ms <= 0:
+            return 0
+        return int(math.floor(math.log2(duration_ms) * cls.SUBBUCKETS)) + 1
+
+    @classmethod
+    def bucket_value(cls, index: int) -> float:
+        """Representative duration (geometric midpoint) of a bucket."""
+        if index <= 0:
+            return 0.0
+        return float(2 ** ((index - 0.5) / cls.SUBBUCKETS))
+
+    @property
+    def total(self) -> int:
+        """Number of recorded durations."""
+        return sum(self.counts.values())
+
+    def add(self, duration_ms: int, count: int = 1) -> None:
+        """Record a duration."""
+        index = self.bucket(duration_ms)
+        self.counts[index] = self.counts.get(index, 0) + count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Estimate a percentile.
+
+        Args:
+            q: Percentile, 0-100 (e.g. 95 for p95)
+
+        Returns:
+            Duration in milliseconds, or None if nothing was recorded
+        """
+        total = self.total
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(q / 100 * total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.counts))
+
+
+class ExecutionSample(BaseModel):
+    """
+    One execution in a tool's recent-execution window.
+
+    Attributes:
+        success: Whether the execution succeeded
+        duration_ms: Execution time in milliseconds
+        error_type: Error classification, if it failed
+        started_at: When the execution started
+    """
+
+    success: bool
+    duration_ms: int = Field(default=0, ge=0)
+    error_type: str | None = None
+    started_at: datetime | None = None
+
+
 class ToolMetrics(BaseModel):
     """
     Execution statistics for a tool.
@@ -561,8 +707,15 @@ class ToolMetrics(BaseModel):
         error_types: Mapping of error types to their occurrence counts
         last_used_at: Timestamp of most recent invocation
         first_used_at: Timestamp of first invocation
+        latency: Histogram of all execution durations, for percentiles
+        recent: The last RECENT_WINDOW executions, oldest first
+        cache_hits: Calls answered from the result cache (not counted as invocations)
+        cache_misses: Cacheable calls that had to run the tool
     """
 
+    # Executions kept in the recent window
+    RECENT_WINDOW: ClassVar[int] = 50
+
     tool_id: str = Field(
         ...,
         min_length=1,
@@ -613,6 +766,24 @@ class ToolMetrics(BaseModel):
         default=None,
         description="Timestamp of first invocation",
     )
+    latency: LatencyHistogram = Field(
+        default_factory=LatencyHistogram,
+        description="Histogram of execution durations",
+    )
+    recent: list[ExecutionSample] = Field(
+        default_factory=list,
+        description="Most recent executions, oldest first",
+    )
+    cache_hits: int = Field(
+        default=0,
+        ge=0,
+        description="Calls answered from the result cache",
+    )
+    cache_misses: int = Field(
+        default=0,
+        ge=0,
+        description="Cacheable calls that had to run the tool",
+    )
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -675,43 +846,119 @@ class ToolMetrics(BaseModel):
             return 0.0
         return (self.failures / self.invocations) * 100
 
-    def record_execution(self, result: ToolResult) -> None:
+    def percentile(self, q: float) -> float | None:
         """
-        Update metrics based on a tool execution result.
+        Estimate a latency percentile over all recorded executions.
 
         Args:
-            result: The ToolResult from tool execution
+            q: Percentile, 0-100 (e.g. 95 for p95)
+
+        Returns:
+            Duration in milliseconds, or None if no durations were recorded
+        """
+        return self.latency.percentile(q)
+
+    def window_success_rate(self) -> float:
+        """
+        Success rate over the recent-execution window, as a percentage.
+
+        Falls back to the all-time success rate when the window is empty
+        (e.g. metrics recorded before the window existed).
+        """
+        if not self.recent:
+            return self.success_rate()
+        return sum(1 for sample in self.recent if sample.success) / len(self.recent) * 100
+
+    def window_percentile(self, q: float) -> float | None:
+        """Estimate a latency percentile over the recent-execution window."""
+        histogram = LatencyHistogram()
+        for sample in self.recent:
+            histogram.add(sample.duration_ms)
+        return histogram.percentile(q)
+
+    def record(self, sample: ExecutionSample) -> None:
+        """
+        Update metrics with one execution.
+
+        Args:
+            sample: The execution's outcome and timing
         """
         # Increment invocation count
         self.invocations += 1
 
         # Update success/failure counts
-        if result.success:
+        if sample.success:
             self.successes += 1
         else:
             self.failures += 1
             # Track error type if present
-            if result.error_type:
-                self.error_types[result.error_type] = (
-                    self.error_types.get(result.error_type, 0) + 1
+            if sample.error_type:
+                self.error_types[sample.error_type] = (
+                    self.error_types.get(sample.error_type, 0) + 1
                 )
 
         # Update timing statistics
-        self.total_duration_ms += result.duration_ms
+        self.total_duration_ms += sample.duration_ms
 
-        if self.min_duration_ms is None or result.duration_ms < self.min_duration_ms:
-            self.min_duration_ms = result.duration_ms
+        if self.min_duration_ms is None or sample.duration_ms < self.min_duration_ms:
+            self.min_duration_ms = sample.duration_ms
 
-        if self.max_duration_ms is None or result.duration_ms > self.max_duration_ms:
-            self.max_duration_ms = result.duration_ms
+        if self.max_duration_ms is None or sample.duration_ms > self.max_duration_ms:
+            self.max_duration_ms = sample.duration_ms
 
         self.avg_duration_ms = self.total_duration_ms / self.invocations
+        self.latency.add(sample.duration_ms)
+
+        # Slide the recent window
+        self.recent.append(sample)
+        if len(self.recent) > self.RECENT_WINDOW:
+            del self.recent[: len(self.recent) - self.RECENT_WINDOW]
 
         # Update timestamps
-        if self.first_used_at is None:
-            self.first_used_at = result.started_at
+        if sample.started_at is not None:
+            if self.first_used_at is None:
+                self.first_used_at = sample.started_at
+            self.last_used_at = sample.started_at
+
+    def cache_hit_rate(self) -> float:
+        """
+        Share of cacheable calls answered from the cache, as a percentage.
+
+        Returns:
+            Hit rate (0.0-100.0), or 0.0 if no cacheable calls were made
+        """
+        lookups = self.cache_hits + self.cache_misses
+        if lookups == 0:
+            return 0.0
+        return self.cache_hits / lookups * 100
+
+    def record_cache_lookup(self, hit: bool) -> None:
+        """
+        Count a result cache lookup.
 
-        self.last_used_at = result.started_at
+        Args:
+            hit: Whether the lookup found a cached result
+        """
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def record_execution(self, result: ToolResult) -> None:
+        """
+        Update metrics based on a tool execution result.
+
+        Args:
+            result: The ToolResult from tool execution
+        """
+        self.record(
+            ExecutionSample(
+                success=result.success,
+                duration_ms=result.duration_ms,
+                error_type=result.error_type,
+                started_at=result.started_at,
+            )
+        )
 
 
 class Registry(BaseModel):
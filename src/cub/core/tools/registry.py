@@ -324,7 +324,7 @@ class RegistryService:
         """
         # Generate version_hash if not present
         if tool_config.version_hash is None:
-            tool_config.version_hash = self._generate_version_hash(tool_config)
+            tool_config.version_hash = self.version_hash(tool_config)
 
         # Update adopted_at to current time
         tool_config.adopted_at = datetime.now(timezone.utc)
@@ -402,7 +402,7 @@ class RegistryService:
 
         Example:
             >>> service = RegistryService()
-            >>> current_hash = service._generate_version_hash(updated_config)
+            >>> current_hash = service.version_hash(updated_config)
             >>> if service.needs_reapproval("brave-search", current_hash):
             ...     print("Tool has changed, please re-approve")
         """
@@ -420,6 +420,53 @@ class RegistryService:
         # Compare hashes
         return tool.version_hash != current_hash
 
+    def version_hash(self, tool_config: ToolConfig) -> str:
+        """
+        Generate a version hash for a tool configuration.
+
+        Creates a deterministic hash based on tool metadata (name, source,
+        adapter configuration) to detect when a tool has changed and may need
+        re-approval.
+
+        The hash includes:
+        - Tool name
+        - Source (adopted_from)
+        - Adapter type
+        - Serialized adapter configuration (HTTP/CLI/MCP config)
+
+        Args:
+            tool_config: ToolConfig to generate hash for
+
+        Returns:
+            SHA256 hash (hex string) of the tool metadata
+
+        Note:
+            The hash is automatically generated during adoption if not
+            already present.
+        """
+        # Collect hashable components
+        components = [
+            tool_config.name,
+            tool_config.adopted_from,
+            tool_config.adapter_type.value,
+        ]
+
+        # Include adapter configuration (serialized to ensure consistency)
+        try:
+            adapter_config = tool_config.get_adapter_config()
+            # Use model_dump and json.dumps with sort_keys for deterministic serialization
+            config_dict = adapter_config.model_dump(mode="json")
+            config_json = json.dumps(config_dict, sort_keys=True)
+            components.append(config_json)
+        except ValueError:
+            # If adapter config is missing, just use the adapter type
+            # This shouldn't happen in normal usage but provides a fallback
+            pass
+
+        # Generate SHA256 hash of concatenated components
+        hash_input = "|".join(components)
+        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+
     def remove(self, tool_id: str) -> bool:
         """
         Remove a tool from the project registry.
@@ -601,50 +648,3 @@ class RegistryService:
         else:
             # Some words match - fuzzy match
             return (0.3 + (overlap_ratio * 0.2), "fuzzy")
-
-    def _generate_version_hash(self, tool_config: ToolConfig) -> str:
-        """
-        Generate a version hash for a tool configuration.
-
-        Creates a deterministic hash based on tool metadata (name, source,
-        adapter configuration) to detect when a tool has changed and may need
-        re-approval.
-
-        The hash includes:
-        - Tool name
-        - Source (adopted_from)
-        - Adapter type
-        - Serialized adapter configuration (HTTP/CLI/MCP config)
-
-        Args:
-            tool_config: ToolConfig to generate hash for
-
-        Returns:
-            SHA256 hash (hex string) of the tool metadata
-
-        Note:
-            This is an internal method. The hash is automatically generated
-            during adoption if not already present.
-        """
-        # Collect hashable components
-        components = [
-            tool_config.name,
-            tool_config.adopted_from,
-            tool_config.adapter_type.value,
-        ]
-
-        # Include adapter configuration (serialized to ensure consistency)
-        try:
-            adapter_config = tool_config.get_adapter_config()
-            # Use model_dump and json.dumps with sort_keys for deterministic serialization
-            config_dict = adapter_config.model_dump(mode="json")
-            config_json = json.dumps(config_dict, sort_keys=True)
-            components.append(config_json)
-        except ValueError:
-            # If adapter config is missing, just use the adapter type
-            # This shouldn't happen in normal usage but provides a fallback
-            pass
-
-        # Generate SHA256 hash of concatenated components
-        hash_input = "|".join(components)
-        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
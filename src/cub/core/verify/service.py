@@ -17,6 +17,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 
+from cub.core.ledger.writer import LedgerWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -385,6 +387,38 @@ class VerifyService:
                         )
                     )
 
+            self._check_epic_aggregates(result, fix=fix)
+
+    def _check_epic_aggregates(self, result: VerifyResult, *, fix: bool) -> None:
+        """
+        Check stored epic aggregates against a full recompute.
+
+        Epic aggregates are maintained incrementally as tasks close, so
+        task entries changed outside cub (e.g. merged from another branch)
+        can leave them stale. With fix, stale epics are recomputed.
+        """
+        writer = LedgerWriter(self.ledger_dir)
+        try:
+            mismatched = writer.verify_epic_aggregates(fix=fix)
+        except Exception as e:
+            # Unreadable task entries are reported by the checks above
+            logger.debug(f"Skipping epic aggregate check: {e}")
+            return
+
+        for epic_id in mismatched:
+            result.issues.append(
+                Issue(
+                    severity=IssueSeverity.WARNING,
+                    category="ledger",
+                    message=f"Epic '{epic_id}' aggregates are out of date",
+                    location=str(writer.by_epic_dir / epic_id / "entry.json"),
+                    fix_suggestion="Run 'cub verify --fix' to recompute from task entries",
+                    auto_fixable=True,
+                )
+            )
+            if fix:
+                result.auto_fixed += 1
+
     def _check_id_integrity(self, result: VerifyResult, *, fix: bool) -> None:
         """
         Check ID integrity.
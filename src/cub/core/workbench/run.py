@@ -19,6 +19,7 @@ from typing import Any
 
 import frontmatter
 
+from cub.core.tools.cache import ResultCache
 from cub.core.tools.exceptions import ExecutionError, ToolNotAdoptedError
 from cub.core.tools.execution import ExecutionService
 from cub.core.tools.registry import RegistryService
@@ -62,7 +63,10 @@ async def _run_next_move_async(*, session_path: Path) -> RunNextResult:
 
     # Initialize registry and execution services
     registry_service = RegistryService()
-    execution_service = ExecutionService(registry_service=registry_service)
+    execution_service = ExecutionService(
+        registry_service=registry_service,
+        result_cache=ResultCache.project(),
+    )
 
     if not tool_id or not isinstance(tool_id, str):
         # Fallback: if the session didn't have a tool selected yet, try to use an
@@ -154,8 +158,9 @@ async def _run_next_move_async(*, session_path: Path) -> RunNextResult:
             results.append({"query": q, "ok": False, "error": str(e)})
             break
 
-        # Small delay to reduce risk of rate limiting.
-        time.sleep(0.8)
+        # Small delay to reduce risk of rate limiting (cache hits made no request).
+        if not r.cached:
+            time.sleep(0.8)
 
     # Update session links
     links = meta.get("links")
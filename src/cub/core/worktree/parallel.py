@@ -18,6 +18,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 from cub.core.invoke import cub_python_command
+from cub.core.ledger.models import ResourceTelemetry
+from cub.core.telemetry import ProcTreeSampler
 from cub.core.worktree.manager import Worktree, WorktreeError, WorktreeManager
 
 if TYPE_CHECKING:
@@ -85,6 +87,7 @@ class WorkerResult:
         error: Error message if failed
         tokens_used: Token count if available
         cost_usd: Cost in USD if available
+        resources: CPU, memory and I/O used by the worker's process tree
     """
 
     task_id: str
@@ -96,6 +99,7 @@ class WorkerResult:
     error: str | None = None
     tokens_used: int = 0
     cost_usd: float = 0.0
+    resources: ResourceTelemetry | None = None
 
 
 @dataclass
@@ -119,6 +123,16 @@ class ParallelRunResult:
     total_tokens: int = 0
     total_cost: float = 0.0
 
+    @property
+    def peak_worker_rss_bytes(self) -> int:
+        """Highest resident memory used by any one worker."""
+        return max((w.resources.peak_rss_bytes for w in self.workers if w.resources), default=0)
+
+    @property
+    def total_cpu_seconds(self) -> float:
+        """CPU time used across all workers."""
+        return sum(w.resources.cpu_seconds for w in self.workers if w.resources)
+
 
 class _NoOpCallback:
     """Default no-op callback implementation."""
@@ -347,13 +361,22 @@ class ParallelRunner:
             if self.debug:
                 self._callback.on_debug(f"{task.id}: {' '.join(cmd)}")
 
-            # Execute cub run in worktree
-            result = subprocess.run(
+            # Execute cub run in worktree, sampling the worker's process tree
+            resources = None
+            with subprocess.Popen(
                 cmd,
                 cwd=worktree_path,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-            )
+            ) as process:
+                sampler = ProcTreeSampler(process.pid)
+                sampler.start()
+                try:
+                    stdout, stderr = process.communicate()
+                finally:
+                    resources = sampler.stop()
+            result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
 
             duration = time.time() - start_time
 
@@ -383,6 +406,7 @@ class ParallelRunner:
                 error=result.stderr if result.returncode != 0 else None,
                 tokens_used=tokens_used,
                 cost_usd=cost_usd,
+                resources=resources,
             )
 
         except WorktreeError as e:
@@ -8,6 +8,7 @@ import json
 from collections.abc import Callable
 from pathlib import Path
 
+from cub.core.status.journal import StatusJournalReader
 from cub.core.status.models import RunStatus
 
 
@@ -19,6 +20,10 @@ class StatusWatcher:
     when changes are detected. Handles file existence, invalid JSON,
     and partial writes gracefully.
 
+    When the run also keeps a status.jsonl journal next to status.json,
+    the watcher tails the journal instead, parsing only the records
+    appended since the previous poll.
+
     Example:
         >>> def on_change(status: RunStatus) -> None:
         ...     print(f"Phase: {status.phase}")
@@ -51,6 +56,8 @@ class StatusWatcher:
         self._last_mtime: float | None = None
         self._last_status: RunStatus | None = None
 
+        self._journal = StatusJournalReader(self.status_path.with_suffix(".jsonl"))
+
     def poll(self) -> RunStatus | None:
         """
         Poll status.json for updates.
@@ -62,6 +69,9 @@ class StatusWatcher:
         Returns:
             RunStatus if file exists and is valid, None otherwise
         """
+        if self._journal.exists():
+            return self._poll_journal()
+
         if not self.status_path.exists():
             # File doesn't exist yet - reset tracking state
             if self._last_mtime is not None:
@@ -97,6 +107,23 @@ class StatusWatcher:
             # File system error (deleted, permission denied, etc.)
             return None
 
+    def _poll_journal(self) -> RunStatus | None:
+        """
+        Poll status.jsonl for new records.
+
+        Returns:
+            RunStatus rebuilt from the journal, or None if it isn't valid yet
+        """
+        status = self._journal.read()
+        if status is None or status is self._last_status:
+            return status
+
+        if self._last_status != status:
+            self._last_status = status
+            if self.on_change:
+                self.on_change(status)
+        return status
+
     def _read_status(self) -> RunStatus | None:
         """
         Read and parse status.json.
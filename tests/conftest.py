@@ -66,6 +66,13 @@ def project_dir(tmp_path):
     return project
 
 
+@pytest.fixture(autouse=True)
+def _isolated_document_cache(tmp_path_factory, monkeypatch):
+    """Keep the shared document cache out of the real ~/.cache."""
+    cache_home = tmp_path_factory.mktemp("xdg-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+
+
 @pytest.fixture
 def user_config_dir(tmp_path):
     """Provide a temporary XDG_CONFIG_HOME/cub directory."""
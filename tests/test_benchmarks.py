@@ -0,0 +1,101 @@
+"""
+Tests for the benchmark fixture generator and result comparison.
+"""
+
+import json
+from pathlib import Path
+
+from benchmarks import run
+from benchmarks.cases import CASES
+from benchmarks.fixtures import Scale, ensure_fixture, generate, task_id
+from cub.core.ledger.reader import LedgerReader
+from cub.core.tasks.graph import DependencyGraph
+from cub.core.tasks.jsonl import JsonlBackend
+
+TINY = Scale(tasks=30, chain_length=10, ledger_entries=20, specs=5, plans=3, source_files=4)
+
+
+def results(**medians: float) -> dict[str, object]:
+    return {"results": {name: {"median_s": value} for name, value in medians.items()}}
+
+
+class TestFixtures:
+    def test_generation_is_deterministic(self, tmp_path: Path) -> None:
+        a = generate(tmp_path / "a", TINY, seed=3)
+        b = generate(tmp_path / "b", TINY, seed=3)
+        c = generate(tmp_path / "c", TINY, seed=4)
+
+        for relative in [".cub/tasks.jsonl", ".cub/ledger/index.jsonl", "src/benchpkg000/mod03.py"]:
+            assert (a.root / relative).read_bytes() == (b.root / relative).read_bytes()
+        assert a.tasks_file.read_bytes() != c.tasks_file.read_bytes()
+
+    def test_fixture_is_readable_by_cub(self, tmp_path: Path) -> None:
+        fixture = generate(tmp_path / "project", TINY)
+
+        tasks = JsonlBackend(fixture.root).list_tasks()
+        assert len(tasks) == 30 + 3  # tasks plus one epic per chain
+        graph = DependencyGraph(tasks)
+        assert not graph.has_cycle()
+        assert graph.stats["max_chain_depth"] >= TINY.chain_length - 1
+
+        assert len(LedgerReader(fixture.ledger_dir).list_tasks()) == 20
+        assert len(list(fixture.specs_dir.rglob("*.md"))) == 5
+        assert len(list(fixture.plans_dir.glob("*/plan.jsonl"))) == 3
+
+    def test_matching_fixture_is_reused(self, tmp_path: Path) -> None:
+        fixture = ensure_fixture(tmp_path / "project", TINY)
+        marker = fixture.root / "marker"
+        marker.touch()
+
+        ensure_fixture(tmp_path / "project", TINY)
+        assert marker.exists()
+
+        ensure_fixture(tmp_path / "project", TINY, seed=1)
+        assert not marker.exists()
+
+
+class TestRun:
+    def test_cases_run_against_fixture(self, tmp_path: Path) -> None:
+        fixture = generate(tmp_path / "project", TINY)
+        cases = [case for case in CASES if case.name.startswith(("tasks.", "graph.", "ledger."))]
+
+        document = run.run_benchmarks(
+            fixture, cases, scale_name="tiny", repeat=2, warmup=0, verbose=False
+        )
+        assert set(document["results"]) == {case.name for case in cases}
+        assert all(len(r["runs"]) == 2 for r in document["results"].values())
+        # The write case rewrites existing entries, leaving the ledger as generated
+        assert len(LedgerReader(fixture.ledger_dir).list_tasks()) == 20
+        assert JsonlBackend(fixture.root).get_task(task_id(0)) is not None
+
+    def test_select_cases_by_prefix(self) -> None:
+        names = [case.name for case in run.select_cases(["ledger", "tasks.load"])]
+        assert "tasks.load" in names
+        assert "tasks.ready" not in names
+        assert all(n.startswith("ledger.") for n in names if n != "tasks.load")
+
+    def test_compare_flags_regressions_beyond_threshold(self) -> None:
+        baseline = results(fast=0.100, slow=0.100, tiny=0.001)
+        current = results(fast=0.110, slow=0.150, tiny=0.003, new=1.0)
+
+        comparisons = {c.name: c for c in run.compare(baseline, current, threshold=0.2)}
+        assert set(comparisons) == {"fast", "slow", "tiny"}
+        assert comparisons["slow"].regressed
+        assert not comparisons["fast"].regressed
+        # Tripled, but within the noise floor
+        assert not comparisons["tiny"].regressed
+
+    def test_main_exit_code_reflects_regressions(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(results(**{"graph.build": 1e-9})))
+        output = tmp_path / "results.json"
+        args = ["--scale", "small", "--fixture-dir", str(tmp_path / "fx"), "--repeat", "1"]
+        args += ["--only", "graph.build"]
+
+        assert run.main([*args, "--output", str(output)]) == 0
+        assert json.loads(output.read_text())["scale"] == "small"
+        # Far slower than the baseline, but inside the default noise floor
+        assert run.main([*args, "--compare", str(baseline)]) == 0
+        assert run.main([*args, "--compare", str(baseline), "--min-delta", "0"]) == 1
+        assert run.main([*args, "--compare", str(tmp_path / "missing.json")]) == 2
+        assert run.main(["--only", "nothing"]) == 2
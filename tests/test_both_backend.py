@@ -189,6 +189,30 @@ class TestGetBackendBothMode:
         assert backend.primary.backend_name == "beads"
         assert backend.secondary.backend_name == "jsonl"
 
+    def test_get_backend_passes_shadow_settings(self, tmp_path: Path, monkeypatch):
+        """Test that backend.shadow and compare_sample_rate reach BothBackend."""
+        from cub.core.config import clear_cache
+
+        class MockBackend:
+            def __init__(self, project_dir=None):
+                self.project_dir = project_dir
+
+        monkeypatch.setattr("cub.core.tasks.beads.BeadsBackend", MockBackend)
+        monkeypatch.setattr("cub.core.tasks.jsonl.JsonlBackend", MockBackend)
+        config_data = {"backend": {"mode": "both", "shadow": True, "compare_sample_rate": 0.25}}
+        (tmp_path / ".cub.json").write_text(json.dumps(config_data))
+        clear_cache()
+
+        try:
+            backend = get_backend(name="both", project_dir=tmp_path)
+        finally:
+            clear_cache()
+
+        assert isinstance(backend, BothBackend)
+        assert backend.shadow is True
+        assert backend.sample_rate == 0.25
+        backend.close()
+
     def test_get_backend_raises_error_if_both_initialization_fails(
         self, tmp_path: Path, monkeypatch
     ):
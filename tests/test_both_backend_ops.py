@@ -1,5 +1,6 @@
 """Tests for BothBackend operation delegation and comparison methods."""
 
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -514,6 +515,127 @@ class TestDivergenceLogging:
         assert log_path.exists()
 
 
+class TestShadowMode:
+    """Tests for background, sampled comparison."""
+
+    def test_secondary_runs_off_the_caller_thread(self, tmp_path: Path, task1: Task) -> None:
+        release = threading.Event()
+
+        class SlowBackend(MockBackend):
+            def list_tasks(
+                self,
+                status: TaskStatus | None = None,
+                parent: str | None = None,
+                label: str | None = None,
+            ) -> list[Task]:
+                release.wait(5)
+                return []
+
+        b = BothBackend(
+            MockBackend("primary", [task1]),
+            SlowBackend("secondary"),
+            divergence_log=tmp_path / "d.log",
+            shadow=True,
+        )
+
+        assert b.list_tasks() == [task1]
+        assert not (tmp_path / "d.log").exists()
+
+        release.set()
+        assert b.drain(timeout=5)
+        assert b.get_divergence_count() == 1
+        b.close()
+
+    def test_drain_times_out_while_work_is_queued(self, tmp_path: Path, task1: Task) -> None:
+        release = threading.Event()
+
+        class BlockedBackend(MockBackend):
+            def get_task(self, task_id: str) -> Task | None:
+                release.wait(5)
+                return task1
+
+        b = BothBackend(
+            MockBackend("primary", [task1]),
+            BlockedBackend("secondary"),
+            divergence_log=tmp_path / "d.log",
+            shadow=True,
+        )
+
+        b.get_task("test-001")
+        assert b.drain(timeout=0.05) is False
+
+        release.set()
+        assert b.drain(timeout=5) is True
+        b.close()
+
+    def test_secondary_operations_keep_their_order(
+        self, tmp_path: Path, task1: Task, task2: Task
+    ) -> None:
+        secondary = MockBackend("secondary", [task1, task2])
+        b = BothBackend(
+            MockBackend("primary", [task1, task2]),
+            secondary,
+            divergence_log=tmp_path / "d.log",
+            shadow=True,
+        )
+
+        b.update_task("test-001")
+        b.get_task("test-001")
+        b.close_task("test-002")
+        b.close()
+
+        assert [c[0] for c in secondary.calls] == ["update_task", "get_task", "close_task"]
+
+    def test_secondary_read_failure_is_logged(self, tmp_path: Path, task1: Task) -> None:
+        class FailingBackend(MockBackend):
+            def get_task(self, task_id: str) -> Task | None:
+                raise RuntimeError("boom")
+
+        b = BothBackend(
+            MockBackend("primary", [task1]),
+            FailingBackend("secondary"),
+            divergence_log=tmp_path / "d.log",
+            shadow=True,
+        )
+
+        assert b.get_task("test-001") == task1
+        b.close()
+
+    def test_unsampled_reads_skip_secondary(self, tmp_path: Path, task1: Task) -> None:
+        secondary = MockBackend("secondary")
+        b = BothBackend(
+            MockBackend("primary", [task1]),
+            secondary,
+            divergence_log=tmp_path / "d.log",
+            sample_rate=0.5,
+            rng=lambda: 0.9,
+        )
+
+        b.list_tasks()
+        b.update_task("test-001")
+
+        # The write still reaches the secondary, but isn't compared
+        assert [c[0] for c in secondary.calls] == ["update_task"]
+        assert b.get_divergence_count() == 0
+
+    def test_sampled_reads_compare(self, tmp_path: Path, task1: Task) -> None:
+        b = BothBackend(
+            MockBackend("primary", [task1]),
+            MockBackend("secondary"),
+            divergence_log=tmp_path / "d.log",
+            sample_rate=0.5,
+            rng=lambda: 0.1,
+        )
+
+        b.list_tasks()
+
+        assert b.get_divergence_count() == 1
+
+    def test_invalid_sample_rate(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="sample_rate"):
+            BothBackend(MockBackend(), MockBackend(), tmp_path / "d.log", sample_rate=1.5)
+
+
 class TestTaskDivergence:
     """Tests for TaskDivergence dataclass."""
 
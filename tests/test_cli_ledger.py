@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
 from cub.cli.ledger import (
@@ -16,6 +17,7 @@ from cub.cli.ledger import (
     _get_ledger_reader,
     app,
 )
+from cub.core.ledger.artifact_store import ArtifactStore
 from cub.core.ledger.models import (
     Attempt,
     LedgerEntry,
@@ -191,6 +193,81 @@ class TestLedgerStatsCommand:
             assert "Tasks: 0" in result.output
 
 
+class TestLedgerCacheCommand:
+    """Tests for ledger cache command."""
+
+    def _create_entries(self, ledger_dir: Path) -> None:
+        writer = LedgerWriter(ledger_dir)
+        for task_id, run_id, read, prefix in [
+            ("cub-c1", "run-a", 0, "aaaa"),
+            ("cub-c2", "run-a", 3000, "aaaa"),
+            ("cub-c3", "run-b", 900, "bbbb"),
+        ]:
+            writer.create_entry(
+                LedgerEntry(
+                    id=task_id,
+                    title=task_id,
+                    attempts=[
+                        Attempt(
+                            attempt_number=1,
+                            run_id=run_id,
+                            started_at=datetime(
+                                2026, 1, 1 if run_id == "run-a" else 2, tzinfo=timezone.utc
+                            ),
+                            tokens=TokenUsage(
+                                input_tokens=100,
+                                cache_read_tokens=read,
+                                cache_creation_tokens=0 if read else 900,
+                            ),
+                            prompt_prefix_hash=prefix,
+                        )
+                    ],
+                )
+            )
+
+    def test_cache_no_ledger(self, tmp_path: Path) -> None:
+        """Test cache command when no ledger exists."""
+        with patch("cub.cli.ledger.get_project_root") as mock_get_root:
+            mock_get_root.return_value = tmp_path
+            result = runner.invoke(app, ["cache"])
+            assert result.exit_code == 0
+            assert "No ledger found" in result.output
+
+    def test_cache_hit_ratio_per_run(self, tmp_path: Path) -> None:
+        """Attempts are grouped by run with their cache hit ratio."""
+        ledger_dir = tmp_path / ".cub" / "ledger"
+        ledger_dir.mkdir(parents=True)
+        self._create_entries(ledger_dir)
+
+        with patch("cub.cli.ledger.get_project_root") as mock_get_root:
+            mock_get_root.return_value = tmp_path
+            result = runner.invoke(app, ["cache", "--json"])
+
+        assert result.exit_code == 0
+        runs = json.loads(result.output)
+        assert [r["run_id"] for r in runs] == ["run-a", "run-b"]
+        run_a = runs[0]
+        assert run_a["attempts"] == 2
+        assert run_a["prompt_tokens"] == 4100
+        assert run_a["cache_hit_ratio"] == pytest.approx(3000 / 4100)
+        assert run_a["prompt_prefixes"] == ["aaaa"]
+        assert runs[1]["cache_hit_ratio"] == 0.9
+
+    def test_cache_table(self, tmp_path: Path) -> None:
+        """Test the table output."""
+        ledger_dir = tmp_path / ".cub" / "ledger"
+        ledger_dir.mkdir(parents=True)
+        self._create_entries(ledger_dir)
+
+        with patch("cub.cli.ledger.get_project_root") as mock_get_root:
+            mock_get_root.return_value = tmp_path
+            result = runner.invoke(app, ["cache"])
+
+        assert result.exit_code == 0
+        assert "run-a" in result.output
+        assert "73.2%" in result.output
+
+
 class TestLedgerSearchCommand:
     """Tests for ledger search command."""
 
@@ -358,6 +435,45 @@ class TestLedgerShowWithNewFields:
             assert result.exit_code == 1
             assert "Attempt 99 not found" in result.output
 
+    def test_show_artifact_reads_through_store(self, tmp_path: Path) -> None:
+        """Test --artifact prints stored and plain artifacts alike."""
+        ledger_dir = tmp_path / ".cub" / "ledger"
+        ledger_dir.mkdir(parents=True)
+        stored = LedgerWriter(ledger_dir, ArtifactStore(ledger_dir))
+        stored.create_entry(self._create_sample_entry(ledger_dir))
+        stored.write_prompt_file("cub-test.1", 1, "# System Prompt\n\nBe brief.")
+        LedgerWriter(ledger_dir).write_harness_log("cub-test.1", 2, "plain log\n")
+
+        with patch("cub.cli.ledger.get_project_root") as mock_get_root:
+            mock_get_root.return_value = tmp_path
+            result = runner.invoke(app, ["show", "cub-test.1", "-a", "1", "-A", "prompt"])
+            assert result.exit_code == 0
+            assert "Be brief." in result.output
+
+            # Defaults to the latest attempt
+            result = runner.invoke(app, ["show", "cub-test.1", "--artifact", "harness"])
+            assert result.exit_code == 0
+            assert result.output == "plain log\n"
+
+            result = runner.invoke(app, ["show", "cub-test.1", "--attempt", "1"])
+            assert "prompt: 001-prompt.md" in result.output
+
+    def test_show_missing_artifact(self, tmp_path: Path) -> None:
+        """Test --artifact fails for an attempt without that artifact."""
+        ledger_dir = tmp_path / ".cub" / "ledger"
+        ledger_dir.mkdir(parents=True)
+        LedgerWriter(ledger_dir).create_entry(self._create_sample_entry(ledger_dir))
+
+        with patch("cub.cli.ledger.get_project_root") as mock_get_root:
+            mock_get_root.return_value = tmp_path
+            result = runner.invoke(app, ["show", "cub-test.1", "-A", "patch"])
+            assert result.exit_code == 1
+            assert "No patch artifact" in result.output
+
+            result = runner.invoke(app, ["show", "cub-test.1", "-A", "bogus"])
+            assert result.exit_code == 1
+            assert "Unknown artifact" in result.output
+
     def test_show_json_output(self, tmp_path: Path) -> None:
         """Test show command with JSON output."""
         ledger_dir = tmp_path / ".cub" / "ledger"
@@ -744,3 +860,31 @@ class TestLedgerGCCommand:
             result = runner.invoke(app, ["gc", "--keep-latest", "5"])
             assert result.exit_code == 0
             assert "Garbage Collection" in result.output
+
+
+class TestLedgerCompactCommand:
+    """Tests for the compact command."""
+
+    def test_compact_moves_plain_artifacts(self, tmp_path: Path) -> None:
+        ledger_dir = tmp_path / ".cub" / "ledger"
+        ledger_dir.mkdir(parents=True)
+        writer = LedgerWriter(ledger_dir)
+        writer.write_harness_log("cub-1", 1, "log line\n" * 200)
+        writer.write_harness_log("cub-2", 1, "log line\n" * 200)
+
+        with patch("cub.cli.ledger.get_project_root") as mock_get_root:
+            mock_get_root.return_value = tmp_path
+            result = runner.invoke(app, ["compact", "--dry-run"])
+            assert result.exit_code == 0
+            assert "Would compact 2 file(s)" in result.output
+            assert (ledger_dir / "by-task" / "cub-1" / "001-harness.jsonl").exists()
+
+            result = runner.invoke(app, ["compact"])
+            assert result.exit_code == 0
+            assert "Compacted 2 file(s)" in result.output
+
+            result = runner.invoke(app, ["compact"])
+            assert "No plain artifact files" in result.output
+
+        assert not (ledger_dir / "by-task" / "cub-1" / "001-harness.jsonl").exists()
+        assert len(list((ledger_dir / "objects").rglob("*.gz"))) == 1
@@ -10,6 +10,7 @@ from datetime import datetime
 from unittest.mock import Mock
 
 from cub.core.status.models import EventLevel, RunPhase, RunStatus
+from cub.core.status.writer import StatusWriter
 from cub.dashboard.status import StatusWatcher
 
 
@@ -339,3 +340,25 @@ class TestStatusWatcher:
         result2 = watcher.poll()
         assert result2 is not None
         assert callback.call_count == 1
+
+    def test_poll_tails_journal(self, temp_dir):
+        """Test poll() follows status.jsonl when the run keeps one."""
+        writer = StatusWriter(temp_dir, "test-run-001", snapshot_rate=0.001)
+        callback = Mock()
+        watcher = StatusWatcher(writer.status_path, on_change=callback)
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.RUNNING)
+        writer.write(status)
+
+        assert watcher.poll() is not None
+        assert watcher.poll() is not None
+        assert callback.call_count == 1
+
+        # Snapshot rewrite is deferred, but the journal already has it
+        status.add_event("Starting task", EventLevel.INFO, task_id="cub-001")
+        writer.write(status)
+        result = watcher.poll()
+
+        assert result is not None
+        assert [e.message for e in result.events] == ["Starting task"]
+        assert callback.call_count == 2
+        writer.flush()
@@ -6,7 +6,14 @@ from pathlib import Path
 
 import pytest
 
-from cub.audit import detect_unused, find_python_definitions, find_python_references
+from cub.audit import (
+    analyze_python_file,
+    dead_code,
+    detect_unused,
+    find_python_definitions,
+    find_python_references,
+)
+from cub.audit.dead_code import get_module_exports
 
 
 @pytest.fixture
@@ -412,3 +419,80 @@ def test_empty_project(tmp_path: Path) -> None:
     assert report.total_definitions == 0
     assert len(report.findings) == 0
     assert report.has_findings is False
+
+
+def test_analyze_python_file_single_pass(tmp_path: Path) -> None:
+    """Test that one analysis yields definitions, references and exports."""
+    test_file = tmp_path / "mod.py"
+    test_file.write_text(
+        """\
+import os
+
+__all__ = ["exported"]
+
+def exported():
+    return os.getcwd()
+
+def helper():
+    pass
+
+def nested():
+    __all__ = ["not_module_level"]
+"""
+    )
+
+    analysis = analyze_python_file(test_file)
+
+    assert {d.name for d in analysis.definitions} >= {"os", "exported", "helper", "nested"}
+    assert "os" in analysis.references
+    assert analysis.exports == {"exported"}
+    assert get_module_exports(test_file) == {"exported"}
+
+
+def test_cache_reuses_unchanged_files(sample_project: Path, tmp_path: Path, mocker) -> None:
+    """Test that a warm cache only re-analyses changed files."""
+    cache_dir = tmp_path / "cache"
+    cold = detect_unused(sample_project, cache_dir=cache_dir)
+    assert (cache_dir / "python.json").exists()
+
+    spy = mocker.spy(dead_code, "analyze_python_source")
+    warm = detect_unused(sample_project, cache_dir=cache_dir)
+    assert spy.call_count == 0
+    assert warm == cold
+
+    (sample_project / "module_b.py").write_text("def brand_new():\n    pass\n")
+    changed = detect_unused(sample_project, cache_dir=cache_dir)
+    assert spy.call_count == 1
+    assert "brand_new" in {f.name for f in changed.findings}
+
+
+def test_cache_remembers_syntax_errors(tmp_path: Path) -> None:
+    """Test that unparseable files are cached and still skipped."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "broken.py").write_text("def broken(:\n")
+    (project / "ok.py").write_text("def unused():\n    pass\n")
+
+    for _ in range(2):
+        report = detect_unused(project, cache_dir=tmp_path / "cache")
+        assert report.files_scanned == 1
+        assert [f.name for f in report.findings] == ["unused"]
+
+
+def test_parallel_matches_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that process-pool analysis produces the same report as serial."""
+    project = tmp_path / "project"
+    project.mkdir()
+    for i in range(10):
+        (project / f"mod_{i}.py").write_text(
+            f"from mod_{(i + 1) % 10} import func_{(i + 1) % 10}\n\n"
+            f"def func_{i}():\n    return func_{(i + 1) % 10}()\n\n"
+            f"def dead_{i}():\n    pass\n"
+        )
+
+    serial = detect_unused(project, max_workers=1)
+    monkeypatch.setattr(dead_code, "PARALLEL_THRESHOLD", 2)
+    parallel = detect_unused(project, max_workers=2)
+
+    assert parallel == serial
+    assert {f.name for f in parallel.findings} == {f"dead_{i}" for i in range(10)}
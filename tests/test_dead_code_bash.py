@@ -11,6 +11,7 @@ from cub.audit import (
     find_bash_calls,
     find_bash_functions,
     run_shellcheck,
+    run_shellcheck_batch,
 )
 
 
@@ -610,3 +611,35 @@ fi
     # Regex should handle indentation
     assert "nested_function" in names
     assert "indented_function" in names
+
+
+def test_run_shellcheck_batch_not_installed(tmp_path: Path, mocker) -> None:
+    """Test that batched shellcheck is skipped without spawning when missing."""
+    test_file = tmp_path / "test.sh"
+    test_file.write_text("#!/usr/bin/env bash\necho hi\n")
+    mocker.patch("cub.audit.dead_code.shutil.which", return_value=None)
+    run = mocker.patch("cub.audit.dead_code.subprocess.run")
+
+    assert run_shellcheck_batch([test_file]) == {}
+    run.assert_not_called()
+
+
+def test_run_shellcheck_batch_single_invocation(tmp_path: Path, mocker) -> None:
+    """Test that many files are checked by one shellcheck process."""
+    files = [tmp_path / f"script_{i}.sh" for i in range(3)]
+    for f in files:
+        f.write_text("#!/usr/bin/env bash\n")
+    mocker.patch("cub.audit.dead_code.shutil.which", return_value="/usr/bin/shellcheck")
+    run = mocker.patch(
+        "cub.audit.dead_code.subprocess.run",
+        return_value=mocker.Mock(
+            returncode=1,
+            stdout=f'[{{"file": "{files[1]}", "line": 3, "code": 2317}}]',
+        ),
+    )
+
+    warnings = run_shellcheck_batch(files)
+
+    run.assert_called_once()
+    assert run.call_args.args[0][2:] == [str(f) for f in files]
+    assert warnings == {str(files[1]): [{"file": str(files[1]), "line": 3, "code": 2317}]}
@@ -2,10 +2,13 @@
 Tests for documentation validation.
 """
 
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from unittest.mock import Mock, patch
 
-import requests
+import pytest
 
 from cub.audit.docs import (
     CodeBlock,
@@ -16,9 +19,76 @@ from cub.audit.docs import (
     validate_code,
     validate_docs,
 )
+from cub.audit.links import ExternalLinkChecker, LinkCheckResult, LinkResultCache
 from cub.audit.models import CodeBlockFinding, DocsReport, LinkFinding
 
 
+class _LinkServer:
+    """Local HTTP stand-in recording every request it serves."""
+
+    def __init__(self) -> None:
+        self.hits: list[tuple[str, str]] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: object) -> None:
+                pass
+
+            def _respond(self, method: str) -> None:
+                with server._lock:
+                    server.hits.append((method, self.path))
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                try:
+                    if self.path.startswith("/slow"):
+                        time.sleep(0.5)
+                    elif self.path.startswith("/busy"):
+                        time.sleep(0.05)
+                    if self.path == "/reset-head" and method == "HEAD":
+                        self.wfile.write(b"not http\r\n")
+                        self.close_connection = True
+                        return
+                    if self.path == "/no-head" and method == "HEAD":
+                        status = 405
+                    elif self.path == "/missing":
+                        status = 404
+                    else:
+                        status = 200
+                    self.send_response(status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def do_HEAD(self) -> None:  # noqa: N802
+                self._respond("HEAD")
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._respond("GET")
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def url(self, path: str) -> str:
+        return self.base + path
+
+
+@pytest.fixture
+def link_server() -> Iterator[_LinkServer]:
+    """Run a local HTTP server for link checking tests."""
+    server = _LinkServer()
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
 class TestExtractLinks:
     """Tests for extract_links function."""
 
@@ -184,43 +254,31 @@ plain text
 class TestCheckLinks:
     """Tests for check_links function."""
 
-    def test_check_valid_http_link(self, tmp_path: Path) -> None:
+    def test_check_valid_http_link(self, tmp_path: Path, link_server: _LinkServer) -> None:
         """Test checking a valid HTTP link."""
-        links = [Link(url="https://python.org", line_number=1, file_path="test.md")]
-
-        with patch("requests.Session.head") as mock_head:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_head.return_value = mock_response
+        links = [Link(url=link_server.url("/ok"), line_number=1, file_path="test.md")]
 
-            findings = check_links(links, tmp_path)
+        findings = check_links(links, tmp_path)
 
         assert len(findings) == 0
+        assert link_server.hits == [("HEAD", "/ok")]
 
-    def test_check_broken_http_link(self, tmp_path: Path) -> None:
+    def test_check_broken_http_link(self, tmp_path: Path, link_server: _LinkServer) -> None:
         """Test checking a broken HTTP link (404)."""
-        links = [Link(url="https://example.com/404", line_number=5, file_path="test.md")]
-
-        with patch("requests.Session.head") as mock_head:
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_head.return_value = mock_response
+        links = [Link(url=link_server.url("/missing"), line_number=5, file_path="test.md")]
 
-            findings = check_links(links, tmp_path)
+        findings = check_links(links, tmp_path)
 
         assert len(findings) == 1
         assert findings[0].issue == "broken_link"
         assert findings[0].status_code == 404
         assert findings[0].line_number == 5
 
-    def test_check_timeout_link(self, tmp_path: Path) -> None:
+    def test_check_timeout_link(self, tmp_path: Path, link_server: _LinkServer) -> None:
         """Test checking a link that times out."""
-        links = [Link(url="https://slow.example.com", line_number=3, file_path="test.md")]
-
-        with patch("requests.Session.head") as mock_head:
-            mock_head.side_effect = requests.Timeout()
+        links = [Link(url=link_server.url("/slow"), line_number=3, file_path="test.md")]
 
-            findings = check_links(links, tmp_path)
+        findings = check_links(links, tmp_path, timeout=0.1)
 
         assert len(findings) == 1
         assert findings[0].issue == "timeout"
@@ -274,20 +332,90 @@ class TestCheckLinks:
         # Anchor should be stripped, file should be found
         assert len(findings) == 0
 
-    def test_fallback_to_get_on_head_failure(self, tmp_path: Path) -> None:
+    def test_fallback_to_get_on_head_failure(
+        self, tmp_path: Path, link_server: _LinkServer
+    ) -> None:
         """Test that GET is tried if HEAD fails."""
-        links = [Link(url="https://example.com", line_number=1, file_path="test.md")]
+        links = [Link(url=link_server.url("/reset-head"), line_number=1, file_path="test.md")]
 
-        with patch("requests.Session.head") as mock_head, patch("requests.Session.get") as mock_get:
-            # HEAD fails, GET succeeds
-            mock_head.side_effect = requests.RequestException()
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_get.return_value = mock_response
+        findings = check_links(links, tmp_path)
 
-            findings = check_links(links, tmp_path)
+        assert len(findings) == 0
+        assert ("GET", "/reset-head") in link_server.hits
+
+    def test_fallback_to_get_when_head_not_allowed(
+        self, tmp_path: Path, link_server: _LinkServer
+    ) -> None:
+        """Test that a 405 on HEAD is retried with GET."""
+        links = [Link(url=link_server.url("/no-head"), line_number=1, file_path="test.md")]
+
+        findings = check_links(links, tmp_path)
 
         assert len(findings) == 0
+        assert link_server.hits == [("HEAD", "/no-head"), ("GET", "/no-head")]
+
+    def test_duplicate_urls_checked_once(self, tmp_path: Path, link_server: _LinkServer) -> None:
+        """Test that identical URLs across files are requested once."""
+        url = link_server.url("/missing")
+        links = [
+            Link(url=url, line_number=1, file_path="a.md"),
+            Link(url=url, line_number=7, file_path="b.md"),
+        ]
+
+        findings = check_links(links, tmp_path)
+
+        assert [(f.file_path, f.line_number) for f in findings] == [("a.md", 1), ("b.md", 7)]
+        assert link_server.hits == [("HEAD", "/missing")]
+
+    def test_findings_keep_link_order(self, tmp_path: Path, link_server: _LinkServer) -> None:
+        """Test that findings are reported in link order regardless of completion order."""
+        links = [
+            Link(url=link_server.url("/missing"), line_number=1, file_path="test.md"),
+            Link(url="not-a-url", line_number=2, file_path="test.md"),
+            Link(url=link_server.url("/busy/missing"), line_number=3, file_path="test.md"),
+        ]
+
+        findings = check_links(links, tmp_path)
+
+        assert [f.line_number for f in findings] == [1, 2]
+
+
+class TestExternalLinkChecker:
+    """Tests for the concurrent external link checker."""
+
+    def test_per_host_concurrency_is_bounded(self, link_server: _LinkServer) -> None:
+        """Test that no more than max_per_host requests hit one host at once."""
+        urls = [link_server.url(f"/busy/{i}") for i in range(8)]
+
+        results = ExternalLinkChecker(max_per_host=2).check(urls)
+
+        assert all(r.issue is None for r in results.values())
+        assert 1 < link_server.peak <= 2
+
+    def test_results_are_cached_with_ttl(self, tmp_path: Path, link_server: _LinkServer) -> None:
+        """Test that cached results skip the network until they expire."""
+        cache_file = tmp_path / "links.json"
+        urls = [link_server.url("/ok"), link_server.url("/missing")]
+
+        ExternalLinkChecker(cache=LinkResultCache(cache_file)).check(urls)
+        assert len(link_server.hits) == 2
+
+        results = ExternalLinkChecker(cache=LinkResultCache(cache_file)).check(urls)
+        assert len(link_server.hits) == 2
+        assert results[urls[1]] == LinkCheckResult(urls[1], "broken_link", 404)
+
+        ExternalLinkChecker(cache=LinkResultCache(cache_file, ttl=-1)).check(urls)
+        assert len(link_server.hits) == 4
+
+    def test_timeouts_are_not_cached(self, tmp_path: Path, link_server: _LinkServer) -> None:
+        """Test that transient failures are re-checked next time."""
+        cache = LinkResultCache(tmp_path / "links.json")
+        url = link_server.url("/slow")
+
+        result = ExternalLinkChecker(timeout=0.1, cache=cache).check([url])[url]
+
+        assert result.issue == "timeout"
+        assert cache.get(url) is None
 
 
 class TestValidateCode:
@@ -380,15 +508,15 @@ class TestValidateCode:
 class TestValidateDocs:
     """Tests for validate_docs function."""
 
-    def test_validate_docs_full_workflow(self, tmp_path: Path) -> None:
+    def test_validate_docs_full_workflow(self, tmp_path: Path, link_server: _LinkServer) -> None:
         """Test full documentation validation workflow."""
         # Create test markdown files
         doc1 = tmp_path / "README.md"
         doc1.write_text(
-            """
+            f"""
 # Test Doc
 
-[Valid link](https://python.org)
+[Valid link]({link_server.url("/ok")})
 [Missing file](./missing.md)
 
 ```python
@@ -403,12 +531,7 @@ def invalid(
 """
         )
 
-        with patch("requests.Session.head") as mock_head:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_head.return_value = mock_response
-
-            report = validate_docs([doc1], tmp_path, check_external_links=True)
+        report = validate_docs([doc1], tmp_path, check_external_links=True)
 
         assert report.files_scanned == 1
         assert report.links_checked == 2
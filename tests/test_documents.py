@@ -0,0 +1,202 @@
+"""
+Tests for the shared parsed-document cache.
+"""
+
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from cub.core import documents
+from cub.core.documents import (
+    DocumentCache,
+    Section,
+    get_document_cache,
+    parse_sections,
+)
+
+SPEC = """---
+status: researching
+created: 2026-01-15
+---
+# My Spec
+
+Intro.
+
+## Goals
+
+```python
+# not a heading
+```
+
+### Details
+"""
+
+
+@pytest.fixture
+def spec_file(tmp_path: Path) -> Path:
+    path = tmp_path / "specs" / "my-spec.md"
+    path.parent.mkdir()
+    path.write_text(SPEC)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> DocumentCache:
+    return DocumentCache(tmp_path / "cache")
+
+
+def count_parses(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every call to parse_document."""
+    calls: list[Path] = []
+    real = documents.parse_document
+
+    def wrapper(path, raw, st):  # type: ignore[no-untyped-def]
+        calls.append(path)
+        return real(path, raw, st)
+
+    monkeypatch.setattr(documents, "parse_document", wrapper)
+    return calls
+
+
+class TestParseSections:
+    def test_finds_headings_outside_code(self) -> None:
+        sections = parse_sections("# Title\n\n```\n# code\n```\n## Sub ##\n")
+        assert sections == [Section(1, "Title", 0), Section(2, "Sub", 5)]
+
+
+class TestLoad:
+    def test_parses_frontmatter_and_headings(self, cache: DocumentCache, spec_file: Path) -> None:
+        doc = cache.load(spec_file)
+        assert doc.metadata == {"status": "researching", "created": date(2026, 1, 15)}
+        assert doc.title == "My Spec"
+        assert [s.title for s in doc.sections] == ["My Spec", "Goals", "Details"]
+        assert doc.error is None
+        assert doc.text == SPEC
+
+    def test_unchanged_file_is_not_reparsed(
+        self, cache: DocumentCache, spec_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = count_parses(monkeypatch)
+        first = cache.load(spec_file)
+        second = cache.load(spec_file)
+        assert second is first
+        assert len(calls) == 1
+
+    def test_touch_without_change_reuses_parse(
+        self, cache: DocumentCache, spec_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = count_parses(monkeypatch)
+        cache.load(spec_file)
+        st = spec_file.stat()
+        os.utime(spec_file, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        doc = cache.load(spec_file)
+        assert len(calls) == 1
+        assert doc.mtime_ns == spec_file.stat().st_mtime_ns
+
+    def test_changed_file_is_reparsed(self, cache: DocumentCache, spec_file: Path) -> None:
+        cache.load(spec_file)
+        spec_file.write_text(SPEC.replace("researching", "planned"))
+        assert cache.load(spec_file).metadata["status"] == "planned"
+
+    def test_index_persists_across_instances(
+        self,
+        tmp_path: Path,
+        spec_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        DocumentCache(tmp_path / "cache").load(spec_file)
+
+        calls = count_parses(monkeypatch)
+        doc = DocumentCache(tmp_path / "cache").load(spec_file)
+        assert calls == []
+        assert doc.metadata["created"] == date(2026, 1, 15)
+        assert doc.sections[1] == Section(2, "Goals", 4)
+        assert doc.text == SPEC
+        assert doc.content.startswith("# My Spec")
+
+    def test_index_holds_no_bodies(
+        self, cache: DocumentCache, spec_file: Path, tmp_path: Path
+    ) -> None:
+        cache.load(spec_file)
+
+        (index_file,) = (tmp_path / "cache").iterdir()
+        assert "Intro." not in index_file.read_text()
+
+    def test_body_is_read_on_first_access(self, tmp_path: Path, spec_file: Path) -> None:
+        DocumentCache(tmp_path / "cache").load(spec_file)
+
+        doc = DocumentCache(tmp_path / "cache").load(spec_file)
+        assert doc._text is None
+        assert doc.text == SPEC
+
+    def test_changed_or_deleted_file_raises_on_text(self, tmp_path: Path, spec_file: Path) -> None:
+        DocumentCache(tmp_path / "cache").load(spec_file)
+
+        doc = DocumentCache(tmp_path / "cache").load(spec_file)
+        spec_file.write_text("# Changed\n")
+        with pytest.raises(OSError, match="changed since it was loaded"):
+            doc.text
+
+        spec_file.write_text(SPEC)
+        DocumentCache(tmp_path / "cache").load(spec_file)
+        doc = DocumentCache(tmp_path / "cache").load(spec_file)
+        spec_file.unlink()
+        with pytest.raises(FileNotFoundError):
+            doc.content
+
+    def test_invalid_frontmatter_is_reported(self, cache: DocumentCache, tmp_path: Path) -> None:
+        path = tmp_path / "bad.md"
+        path.write_text("---\nstatus: [unclosed\n---\n# Bad\n")
+        doc = cache.load(path)
+        assert doc.error is not None
+        assert doc.metadata == {}
+        assert doc.content == doc.text
+
+    def test_missing_file_raises(self, cache: DocumentCache, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            cache.load(tmp_path / "missing.md")
+
+    def test_memory_only_cache(self, spec_file: Path) -> None:
+        cache = DocumentCache(None)
+        assert cache.load(spec_file) is cache.load(spec_file)
+
+
+class TestBatch:
+    def test_batch_defers_index_write(
+        self, cache: DocumentCache, spec_file: Path, tmp_path: Path
+    ) -> None:
+        with cache.batch():
+            cache.load(spec_file)
+            assert not (tmp_path / "cache").exists()
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    def test_flush_drops_deleted_files(
+        self, tmp_path: Path, spec_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        other = spec_file.parent / "other.md"
+        other.write_text("# Other\n")
+        cache = DocumentCache(tmp_path / "cache")
+        with cache.batch():
+            cache.load(spec_file)
+            cache.load(other)
+
+        other.unlink()
+        spec_file.write_text(SPEC + "\nMore.\n")
+        with cache.batch():
+            cache.load(spec_file)
+
+        calls = count_parses(monkeypatch)
+        other.write_text("# Other\n")
+        DocumentCache(tmp_path / "cache").load(other)
+        assert calls == [other.absolute()]
+
+
+class TestSharedCache:
+    def test_uses_xdg_cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        cache = get_document_cache()
+        assert cache.cache_dir == tmp_path / "xdg" / "cub" / "documents"
+        assert get_document_cache() is cache
@@ -6,10 +6,13 @@ Tests ensure epic aggregation works correctly across multiple tasks, including:
 - Escalation rate calculation
 - Epic stage computation based on child task stages
 - Handling multiple tasks within the same epic
+- Incremental updates through the epic membership index
 """
 
+import json
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -23,8 +26,9 @@ from cub.core.ledger import (
     TokenUsage,
     WorkflowState,
 )
-from cub.core.ledger.models import EpicEntry
+from cub.core.ledger.models import EpicEntry, compute_aggregates
 from cub.core.tasks.models import Task, TaskPriority, TaskStatus, TaskType
+from cub.core.verify.service import VerifyService
 
 
 @pytest.fixture
@@ -716,3 +720,148 @@ class TestMultipleTasksInEpic:
 
         result = writer.add_task_to_epic(epic_id, task_id)
         assert result is False
+
+
+def _task(task_id: str, epic_id: str, cost: float, *, success: bool = True) -> LedgerEntry:
+    now = datetime.now(timezone.utc)
+    return LedgerEntry(
+        id=task_id,
+        title=task_id,
+        lineage=Lineage(epic_id=epic_id),
+        workflow=WorkflowState(stage="dev_complete"),
+        outcome=Outcome(success=success, total_cost_usd=cost),
+        tokens=TokenUsage(input_tokens=100, output_tokens=50),
+        started_at=now,
+        completed_at=now,
+    )
+
+
+class TestIncrementalAggregation:
+    """Tests for epic aggregates maintained through the membership index."""
+
+    @pytest.fixture
+    def indexed_epic(self, writer: LedgerWriter) -> str:
+        epic_id = "cub-inc"
+        for i in range(1, 4):
+            writer.create_entry(_task(f"{epic_id}.{i}", epic_id, 0.10 * i))
+        writer.create_entry(_task("cub-other.1", "cub-other", 5.0))
+        writer.create_epic_entry(EpicEntry(id=epic_id, title="Incremental", lineage=Lineage()))
+        writer.update_epic_aggregates(epic_id)  # first update scans and builds the index
+        return epic_id
+
+    def test_update_reads_only_changed_entry(
+        self, writer: LedgerWriter, indexed_epic: str, mocker: Any
+    ) -> None:
+        writer.update_entry(_task(f"{indexed_epic}.2", indexed_epic, 1.0, success=False))
+
+        glob = mocker.spy(Path, "glob")
+        validate = mocker.spy(LedgerEntry, "model_validate")
+        epic = writer.update_epic_aggregates(indexed_epic)
+
+        assert glob.call_count == 0
+        assert validate.call_count == 0
+        assert epic is not None
+        assert epic.aggregates.total_cost_usd == pytest.approx(1.4)
+        assert epic.aggregates.max_cost_usd == pytest.approx(1.0)
+        assert epic.aggregates.tasks_failed == 1
+
+    def test_incremental_matches_full_recompute(
+        self, writer: LedgerWriter, indexed_epic: str
+    ) -> None:
+        writer.create_entry(_task(f"{indexed_epic}.4", indexed_epic, 0.05))
+        writer.update_workflow_stage(f"{indexed_epic}.1", "validated")
+
+        incremental = writer.update_epic_aggregates(indexed_epic)
+        full = writer.update_epic_aggregates(indexed_epic, full=True)
+
+        assert incremental is not None and full is not None
+        assert incremental.aggregates == full.aggregates
+        assert incremental.task_ids == full.task_ids
+        assert incremental.workflow.stage == full.workflow.stage
+
+    def test_task_moved_to_another_epic_is_dropped(
+        self, writer: LedgerWriter, indexed_epic: str
+    ) -> None:
+        writer.update_entry(_task(f"{indexed_epic}.3", "cub-other", 0.30))
+
+        epic = writer.update_epic_aggregates(indexed_epic)
+
+        assert epic is not None
+        assert epic.task_ids == [f"{indexed_epic}.1", f"{indexed_epic}.2"]
+        assert epic.aggregates.total_cost_usd == pytest.approx(0.3)
+
+    def test_external_edit_is_picked_up_by_signature(
+        self, writer: LedgerWriter, indexed_epic: str, ledger_dir: Path
+    ) -> None:
+        task_file = ledger_dir / "by-task" / f"{indexed_epic}.1.json"
+        entry = _task(f"{indexed_epic}.1", indexed_epic, 2.5)
+        task_file.write_text(json.dumps(entry.model_dump(mode="json"), indent=4))
+
+        epic = writer.update_epic_aggregates(indexed_epic)
+
+        assert epic is not None
+        assert epic.aggregates.total_cost_usd == pytest.approx(3.0)
+
+    def test_corrupt_index_falls_back_to_full_scan(
+        self, writer: LedgerWriter, indexed_epic: str, ledger_dir: Path
+    ) -> None:
+        (ledger_dir / "epic-index" / f"{indexed_epic}.json").write_text("{not json")
+
+        epic = writer.update_epic_aggregates(indexed_epic)
+
+        assert epic is not None
+        assert len(epic.task_ids) == 3
+        assert epic.aggregates.total_cost_usd == pytest.approx(0.6)
+
+
+class TestVerifyEpicAggregates:
+    """Tests for checking stored aggregates against a full recompute."""
+
+    def test_consistent_ledger_passes(self, writer: LedgerWriter) -> None:
+        writer.create_entry(_task("cub-v.1", "cub-v", 0.1))
+        writer.create_epic_entry(EpicEntry(id="cub-v", title="V", lineage=Lineage()))
+        writer.update_epic_aggregates("cub-v")
+
+        assert writer.verify_epic_aggregates() == []
+
+    def test_detects_and_fixes_drift(self, writer: LedgerWriter, ledger_dir: Path) -> None:
+        writer.create_entry(_task("cub-v.1", "cub-v", 0.1))
+        writer.create_epic_entry(EpicEntry(id="cub-v", title="V", lineage=Lineage()))
+        writer.update_epic_aggregates("cub-v")
+
+        # A task entry arriving outside the writer (e.g. from a git merge)
+        extra = _task("cub-v.2", "cub-v", 0.2)
+        (ledger_dir / "by-task" / "cub-v.2.json").write_text(
+            json.dumps(extra.model_dump(mode="json"))
+        )
+
+        assert writer.verify_epic_aggregates() == ["cub-v"]
+        assert writer.verify_epic_aggregates(fix=True) == ["cub-v"]
+        assert writer.verify_epic_aggregates() == []
+
+        epic = writer.get_epic_entry("cub-v")
+        assert epic is not None
+        assert epic.aggregates.total_tasks == 2
+
+    def test_verify_service_reports_stale_epic(
+        self, writer: LedgerWriter, ledger_dir: Path
+    ) -> None:
+        writer.create_entry(_task("cub-v.1", "cub-v", 0.1))
+        writer.create_epic_entry(EpicEntry(id="cub-v", title="V", lineage=Lineage()))
+
+        project_dir = ledger_dir.parent.parent
+        result = VerifyService(project_dir).verify(fix=True)
+
+        stale = [i for i in result.issues if "aggregates are out of date" in i.message]
+        assert len(stale) == 1
+        assert stale[0].auto_fixable
+        assert writer.verify_epic_aggregates() == []
+
+
+def test_aggregates_sum_cache_read_tokens() -> None:
+    """Prompt cache reads are totalled so retained-session savings show per epic."""
+    entries = [_task(f"cub-c.{i}", "cub-c", 0.1) for i in range(2)]
+    entries[0].tokens = TokenUsage(input_tokens=100, cache_read_tokens=4000)
+    entries[1].tokens = TokenUsage(input_tokens=100, cache_read_tokens=6000)
+
+    assert compute_aggregates(entries).total_cache_read_tokens == 10000
@@ -0,0 +1,71 @@
+"""
+Tests for the advisory file lock shared by cub's stores.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from cub.core.filelock import file_lock
+
+
+class TestFileLock:
+    """Tests for file_lock."""
+
+    def test_excludes_other_holders(self, tmp_path: Path) -> None:
+        lock = tmp_path / "nested" / "store.lock"
+        with file_lock(lock) as locked:
+            assert locked
+            with file_lock(lock) as again:
+                assert not again
+        with file_lock(lock) as locked:
+            assert locked
+        # The lock file stays so waiters never lock a different inode
+        assert lock.exists()
+
+    def test_waits_for_release(self, tmp_path: Path) -> None:
+        lock = tmp_path / "store.lock"
+        held = threading.Event()
+
+        def hold() -> None:
+            with file_lock(lock):
+                held.set()
+                time.sleep(0.1)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        held.wait()
+        with file_lock(lock, timeout=5.0) as locked:
+            assert locked
+        thread.join()
+
+    def test_shared_holders_exclude_only_exclusive(self, tmp_path: Path) -> None:
+        lock = tmp_path / "store.lock"
+        with file_lock(lock, shared=True) as first:
+            with file_lock(lock, shared=True) as second:
+                assert first and second
+                with file_lock(lock) as exclusive:
+                    assert not exclusive
+
+    def test_released_when_holder_dies(self, tmp_path: Path) -> None:
+        lock = tmp_path / "store.lock"
+        script = (
+            "import os, sys\n"
+            "from pathlib import Path\n"
+            "from cub.core.filelock import file_lock\n"
+            "with file_lock(Path(sys.argv[1])):\n"
+            "    os._exit(1)\n"
+        )
+        subprocess.run([sys.executable, "-c", script, str(lock)], check=False)
+
+        assert lock.exists()
+        with file_lock(lock) as locked:
+            assert locked
+
+    def test_unopenable_lock_is_not_taken(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        with file_lock(blocker / "store.lock") as locked:
+            assert not locked
@@ -5,6 +5,7 @@ Tests both unit tests (with mocks) and integration tests (with real SDK).
 Integration tests require ANTHROPIC_API_KEY and are skipped without it.
 """
 
+import asyncio
 import os
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -18,6 +19,7 @@ from cub.core.harness import (
 from cub.core.harness.models import (
     HarnessFeature,
     TaskInput,
+    TokenUsage,
 )
 
 # Skip all tests if claude-agent-sdk is not installed
@@ -606,6 +608,159 @@ class TestStreamTask:
             assert os.environ.get("CUB_RUN_ACTIVE") == original_cub_run_active
 
 
+class _FakeSDKClient:
+    """Stand-in for ClaudeSDKClient that reports session-cumulative cost."""
+
+    instances: list["_FakeSDKClient"] = []
+
+    def __init__(self, options: Any = None) -> None:
+        self.options = options
+        self.prompts: list[str] = []
+        self.connected = False
+        self.disconnected = False
+        self.total_cost = 0.0
+        self.fail_on: str | None = None
+        _FakeSDKClient.instances.append(self)
+
+    async def connect(self) -> None:
+        self.connected = True
+
+    async def query(self, prompt: str) -> None:
+        if prompt == self.fail_on:
+            from claude_agent_sdk import ProcessError
+
+            raise ProcessError("boom", exit_code=2)
+        self.prompts.append(prompt)
+
+    async def receive_response(self) -> Any:
+        from claude_agent_sdk import AssistantMessage, ResultMessage
+        from claude_agent_sdk.types import TextBlock
+
+        prompt = self.prompts[-1]
+        if prompt != "/clear":
+            self.total_cost += 0.25
+            yield AssistantMessage(content=[TextBlock(text=f"did {prompt}")], model="sonnet")
+        cache_read = 900 if len(self.prompts) > 1 else 0
+        yield ResultMessage(
+            subtype="success",
+            duration_ms=10,
+            duration_api_ms=8,
+            is_error=False,
+            num_turns=1,
+            session_id="retained",
+            total_cost_usd=self.total_cost,
+            usage={
+                "input_tokens": 100,
+                "output_tokens": 20,
+                "cache_read_input_tokens": cache_read,
+            },
+        )
+
+    async def interrupt(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+class TestRetainedSession:
+    """Tests for keeping one SDK client alive across tasks."""
+
+    @pytest.fixture(autouse=True)
+    def fake_client(self) -> Any:
+        _FakeSDKClient.instances = []
+        with patch("claude_agent_sdk.ClaudeSDKClient", _FakeSDKClient):
+            yield
+
+    @pytest.fixture
+    def harness(self) -> Any:
+        harness = ClaudeSDKBackend()
+        with patch.object(harness, "is_available", return_value=True):
+            yield harness
+        harness.close_session()
+
+    def _run(self, harness: ClaudeSDKBackend, prompt: str, **kwargs: Any) -> Any:
+        # Each task gets its own event loop, as in the run loop
+        return asyncio.run(harness.run_task(TaskInput(prompt=prompt, **kwargs)))
+
+    def test_tasks_in_scope_share_one_client(self, harness: ClaudeSDKBackend) -> None:
+        harness.open_session("epic-1")
+        first = self._run(harness, "task 1", system_prompt="sys")
+        harness.open_session("epic-1")
+        second = self._run(harness, "task 2", system_prompt="sys")
+
+        assert len(_FakeSDKClient.instances) == 1
+        client = _FakeSDKClient.instances[0]
+        assert client.prompts == ["task 1", "/clear", "task 2"]
+        assert first.output == "did task 1"
+        assert second.output == "did task 2"
+        # Cost is per task, not the process total; cache reads are reported
+        assert first.usage.cost_usd == pytest.approx(0.25)
+        assert second.usage.cost_usd == pytest.approx(0.25)
+        assert second.usage.cache_read_tokens == 900
+
+    def test_new_scope_or_options_start_new_session(self, harness: ClaudeSDKBackend) -> None:
+        harness.open_session("epic-1")
+        self._run(harness, "a", model="sonnet")
+        self._run(harness, "b", model="opus")
+        harness.open_session("epic-2")
+        self._run(harness, "c", model="opus")
+
+        assert len(_FakeSDKClient.instances) == 3
+        assert all(c.disconnected for c in _FakeSDKClient.instances[:2])
+
+    def test_failure_closes_session_and_next_task_reconnects(
+        self, harness: ClaudeSDKBackend
+    ) -> None:
+        harness.open_session("epic-1")
+        self._run(harness, "ok")
+        _FakeSDKClient.instances[0].fail_on = "/clear"
+
+        failed = self._run(harness, "breaks")
+        recovered = self._run(harness, "again")
+
+        assert failed.exit_code == 2
+        assert recovered.success
+        assert len(_FakeSDKClient.instances) == 2
+        assert _FakeSDKClient.instances[0].disconnected
+
+    def test_streaming_uses_session(self, harness: ClaudeSDKBackend) -> None:
+        harness.open_session("epic-1")
+
+        async def stream(prompt: str) -> list[Any]:
+            return [c async for c in harness.stream_task(TaskInput(prompt=prompt))]
+
+        asyncio.run(stream("one"))
+        chunks = asyncio.run(stream("two"))
+
+        assert chunks[0] == "did two"
+        assert isinstance(chunks[-1], TokenUsage)
+        assert chunks[-1].cost_usd == pytest.approx(0.25)
+        assert len(_FakeSDKClient.instances) == 1
+
+    def test_close_session_disconnects(self, harness: ClaudeSDKBackend) -> None:
+        harness.open_session("epic-1")
+        self._run(harness, "task")
+        harness.close_session()
+
+        assert _FakeSDKClient.instances[0].disconnected
+        self._run(harness, "one-shot")  # falls back to query()
+        assert len(_FakeSDKClient.instances) == 1
+
+    def test_without_session_uses_query(self, harness: ClaudeSDKBackend) -> None:
+        async def mock_query(*args: Any, **kwargs: Any) -> Any:
+            from claude_agent_sdk import AssistantMessage
+            from claude_agent_sdk.types import TextBlock
+
+            yield AssistantMessage(content=[TextBlock(text="one-shot")], model="sonnet")
+
+        with patch("claude_agent_sdk.query", mock_query):
+            result = self._run(harness, "task")
+
+        assert result.output == "one-shot"
+        assert _FakeSDKClient.instances == []
+
+
 # Integration tests - require ANTHROPIC_API_KEY
 @pytest.mark.skipif(
     not os.environ.get("ANTHROPIC_API_KEY"),
@@ -0,0 +1,210 @@
+"""Tests for columnar ledger analytics."""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cub.core.ledger.analytics import (
+    LedgerAnalytics,
+    LedgerColumns,
+    column_stats,
+    outlier_rows,
+)
+
+
+def _entry(task_id: str, **overrides: Any) -> dict[str, Any]:
+    entry: dict[str, Any] = {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "task": {"title": f"Snapshot {task_id}"},
+        "completed_at": "2026-01-10T12:00:00Z",
+        "cost_usd": 0.5,
+        "duration_seconds": 120,
+        "outcome": {
+            "success": True,
+            "total_cost_usd": 0.5,
+            "total_attempts": 1,
+            "escalated": False,
+        },
+        "commits": [{"hash": "abc1234", "message": "work"}],
+        "attempts": [],
+        "lessons_learned": [],
+        "decisions": [],
+    }
+    entry.update(overrides)
+    return entry
+
+
+def _write(ledger_dir: Path, entry: dict[str, Any]) -> Path:
+    by_task = ledger_dir / "by-task"
+    by_task.mkdir(parents=True, exist_ok=True)
+    path = by_task / f"{entry['id']}.json"
+    path.write_text(json.dumps(entry))
+    return path
+
+
+@pytest.fixture
+def ledger_dir(tmp_path: Path) -> Path:
+    return tmp_path / ".cub" / "ledger"
+
+
+class TestLedgerColumns:
+    """Tests for building and slicing columns."""
+
+    def test_append_entry(self) -> None:
+        columns = LedgerColumns()
+        columns.append_entry(
+            "t1.json",
+            (10, 20),
+            _entry(
+                "t1",
+                attempts=[
+                    {"success": False, "error_category": "timeout"},
+                    {"success": False},
+                    {"success": True},
+                ],
+                lessons_learned=["Run tests first"],
+                decisions=["Use sqlite"],
+                outcome={"success": False, "escalated": True, "total_attempts": 3},
+            ),
+        )
+
+        assert len(columns) == 1
+        assert columns.ids == ["t1"]
+        assert columns.titles == ["Snapshot t1"]
+        assert list(columns.escalated) == [1]
+        assert list(columns.outcome_attempts) == [3]
+        assert list(columns.commit_count) == [1]
+        assert columns.failures.values == ["timeout", "unknown"]
+        assert columns.lessons.values == ["Run tests first"]
+        assert columns.decisions.values == ["Use sqlite"]
+
+    def test_take_reorders_list_columns(self) -> None:
+        columns = LedgerColumns()
+        columns.append_entry("a.json", (1, 1), _entry("a", lessons_learned=["from a"]))
+        columns.append_entry("b.json", (1, 1), _entry("b", lessons_learned=["from b", "b2"]))
+
+        taken = columns.take([1, 0])
+
+        assert taken.ids == ["b", "a"]
+        assert list(taken.lessons.rows) == [0, 0, 1]
+        assert taken.lessons.values == ["from b", "b2", "from a"]
+
+    def test_since_keeps_undated_rows(self) -> None:
+        columns = LedgerColumns()
+        columns.append_entry("old.json", (1, 1), _entry("old", completed_at="2025-01-01T00:00:00Z"))
+        columns.append_entry("new.json", (1, 1), _entry("new", completed_at="2026-02-01T00:00:00"))
+        columns.append_entry("none.json", (1, 1), _entry("none", completed_at=None))
+
+        rows = columns.since(datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+        assert [columns.ids[i] for i in rows] == ["new", "none"]
+
+    def test_time_range_days(self) -> None:
+        columns = LedgerColumns()
+        assert columns.time_range_days() == 0
+        columns.append_entry("a.json", (1, 1), _entry("a", completed_at="2026-01-01T08:00:00Z"))
+        columns.append_entry("b.json", (1, 1), _entry("b", completed_at="2026-01-04T09:00:00Z"))
+
+        assert columns.time_range_days() == 4
+
+    def test_round_trip(self) -> None:
+        columns = LedgerColumns()
+        columns.append_entry("a.json", (5, 6), _entry("a", decisions=["x"]))
+
+        restored = LedgerColumns.from_dict(json.loads(json.dumps(columns.to_dict())))
+
+        assert restored == columns
+
+    def test_from_dict_rejects_misaligned(self) -> None:
+        columns = LedgerColumns()
+        columns.append_entry("a.json", (5, 6), _entry("a"))
+        data = columns.to_dict()
+        data["cost_usd"] = []
+
+        with pytest.raises(ValueError, match="misaligned"):
+            LedgerColumns.from_dict(data)
+
+
+class TestStatistics:
+    """Tests for column statistics helpers."""
+
+    def test_column_stats(self) -> None:
+        assert column_stats([1.0]) is None
+        assert column_stats([1.0, 3.0]) == pytest.approx((2.0, 2**0.5))
+
+    def test_outlier_rows(self) -> None:
+        values = [1.0, 1.0, 1.0, 1.0, 10.0, 99.0]
+
+        result = outlier_rows(values, [0, 1, 2, 3, 4], 1.5)
+
+        assert result is not None
+        outliers, mean, threshold = result
+        assert outliers == [4]
+        assert mean == pytest.approx(2.8)
+        assert threshold > mean
+
+    def test_outlier_rows_without_spread(self) -> None:
+        assert outlier_rows([2.0, 2.0, 2.0], [0, 1, 2], 2.0) is None
+
+
+class TestLedgerAnalytics:
+    """Tests for cached, incremental loading."""
+
+    def test_load_orders_by_file_and_skips_bad_json(self, ledger_dir: Path) -> None:
+        _write(ledger_dir, _entry("b"))
+        _write(ledger_dir, _entry("a"))
+        (ledger_dir / "by-task" / "broken.json").write_text("{not json")
+
+        columns = LedgerAnalytics(ledger_dir).load()
+
+        assert columns.ids == ["a", "b"]
+        assert (ledger_dir.parent / "cache" / "ledger" / "columns.json").exists()
+
+    def test_incremental_refresh(self, ledger_dir: Path) -> None:
+        path_a = _write(ledger_dir, _entry("a", cost_usd=1.0))
+        path_b = _write(ledger_dir, _entry("b"))
+        analytics = LedgerAnalytics(ledger_dir)
+        analytics.load()
+
+        path_a.write_text(json.dumps(_entry("a", cost_usd=2.5)))
+        stat = path_a.stat()
+        os.utime(path_a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        path_b.unlink()
+        _write(ledger_dir, _entry("c"))
+
+        columns = analytics.load()
+
+        assert columns.ids == ["a", "c"]
+        assert list(columns.cost_usd) == [2.5, 0.5]
+
+    def test_unchanged_files_come_from_cache(
+        self, ledger_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _write(ledger_dir, _entry("a"))
+        analytics = LedgerAnalytics(ledger_dir)
+        first = analytics.load()
+
+        def fail(name: str) -> None:
+            raise AssertionError(f"re-parsed {name}")
+
+        monkeypatch.setattr(analytics, "_read_entry", fail)
+
+        assert analytics.load() == first
+
+    def test_corrupt_cache_is_rebuilt(self, ledger_dir: Path) -> None:
+        _write(ledger_dir, _entry("a"))
+        analytics = LedgerAnalytics(ledger_dir)
+        analytics.cache_file.parent.mkdir(parents=True)
+        analytics.cache_file.write_text('{"version": 1, "columns": {"ids": ["x"]}}')
+
+        columns = analytics.load()
+
+        assert columns.ids == ["a"]
+
+    def test_missing_ledger(self, ledger_dir: Path) -> None:
+        assert len(LedgerAnalytics(ledger_dir).load()) == 0
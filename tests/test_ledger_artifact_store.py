@@ -0,0 +1,191 @@
+"""Tests for the content-addressed ledger artifact store."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cub.core.ledger.artifact_store import ArtifactStore, ref_path, split_prompt
+from cub.core.ledger.artifacts import ArtifactManager
+from cub.core.ledger.writer import LedgerWriter
+from cub.core.status.writer import StatusWriter
+
+SYSTEM_PROMPT = "You are a careful engineer.\n" * 50
+
+
+@pytest.fixture
+def ledger_dir(tmp_path: Path) -> Path:
+    path = tmp_path / ".cub" / "ledger"
+    path.mkdir(parents=True)
+    return path
+
+
+def objects(ledger_dir: Path) -> list[Path]:
+    return sorted((ledger_dir / "objects").rglob("*.gz"))
+
+
+def blobs(store: ArtifactStore) -> list[bytes]:
+    """Contents of every stored object."""
+    return [
+        store.get(p.parent.name + p.name.removesuffix(".gz")) for p in objects(store.ledger_dir)
+    ]
+
+
+class TestSplitPrompt:
+    def test_parts_concatenate_to_original(self) -> None:
+        text = (
+            f"---\nattempt: 1\n---\n\n# System Prompt\n\n{SYSTEM_PROMPT}\n\n# Task Prompt\n\nDo it"
+        )
+        parts = split_prompt(text)
+        assert "".join(parts) == text
+        assert f"{SYSTEM_PROMPT}\n\n" in parts
+
+    def test_text_without_sections(self) -> None:
+        assert split_prompt("just text") == ["just text"]
+
+
+class TestArtifactStore:
+    def test_put_dedupes_identical_content(self, ledger_dir: Path) -> None:
+        store = ArtifactStore(ledger_dir)
+        assert store.put(b"same") == store.put(b"same")
+        assert len(objects(ledger_dir)) == 1
+        assert store.get(store.put(b"same")) == b"same"
+
+    def test_write_and_read_round_trip(self, ledger_dir: Path) -> None:
+        store = ArtifactStore(ledger_dir)
+        path = ledger_dir / "by-task" / "cub-1" / "001-harness.jsonl"
+        path.parent.mkdir(parents=True)
+        path.write_text("old plain log")
+
+        manifest = store.write(path, "héllo\n" * 1000)
+
+        assert manifest == ref_path(path)
+        assert not path.exists()
+        assert store.exists(path)
+        assert store.read(path) == "héllo\n" * 1000
+        assert store.read(manifest) == "héllo\n" * 1000
+        assert store.size(path) == len(("héllo\n" * 1000).encode())
+        assert objects(ledger_dir)[0].stat().st_size < 200
+
+    def test_plain_file_wins_over_manifest(self, ledger_dir: Path) -> None:
+        store = ArtifactStore(ledger_dir)
+        path = ledger_dir / "a.log"
+        store.write(path, "stored")
+        path.write_text("rewritten")
+        assert store.read(path) == "rewritten"
+        assert store.size(path) == len("rewritten")
+
+    def test_missing_artifact_raises(self, ledger_dir: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            ArtifactStore(ledger_dir).read(ledger_dir / "missing.md")
+
+    def test_corrupt_object_is_detected(self, ledger_dir: Path) -> None:
+        store = ArtifactStore(ledger_dir)
+        path = ledger_dir / "a.log"
+        store.write(path, "content")
+        objects(ledger_dir)[0].write_bytes(b"not gzip")
+        with pytest.raises(ValueError, match="Corrupt"):
+            store.read(path)
+
+    def test_unknown_manifest_version(self, ledger_dir: Path) -> None:
+        path = ledger_dir / "a.log"
+        ref_path(path).write_text(json.dumps({"version": 99, "parts": []}))
+        with pytest.raises(ValueError, match="Unsupported"):
+            ArtifactStore(ledger_dir).read(path)
+
+
+class TestStoredWriters:
+    def test_system_prompt_stored_once(self, tmp_path: Path, ledger_dir: Path) -> None:
+        store = ArtifactStore(ledger_dir)
+        ledger_writer = LedgerWriter(ledger_dir, store)
+        status_writer = StatusWriter(tmp_path, "run-1", artifact_store=store)
+
+        for attempt in (1, 2, 3):
+            task_prompt = f"Attempt {attempt}"
+            status_writer.write_prompt("cub-1", SYSTEM_PROMPT, task_prompt)
+            ledger_writer.write_prompt_file(
+                "cub-1",
+                attempt,
+                f"# System Prompt\n\n{SYSTEM_PROMPT}\n\n# Task Prompt\n\n{task_prompt}",
+            )
+
+        system_copies = [blob for blob in blobs(store) if SYSTEM_PROMPT.encode() in blob]
+        assert len(system_copies) == 1
+
+        manager = ArtifactManager(ledger_dir)
+        prompt = manager.read_artifact("cub-1", 2, "prompt")
+        assert prompt is not None
+        assert prompt.startswith("---\nattempt: 2\n")
+        assert prompt.endswith("# Task Prompt\n\nAttempt 2")
+        rendered = store.read(status_writer.get_prompt_path("cub-1"))
+        assert rendered.startswith("# Rendered Prompt\n\n## System Prompt\n\n")
+
+    def test_harness_log_shared_between_run_and_task(
+        self, tmp_path: Path, ledger_dir: Path
+    ) -> None:
+        store = ArtifactStore(ledger_dir)
+        status_writer = StatusWriter(tmp_path, "run-1", artifact_store=store)
+        log_path = status_writer.get_harness_log_path("cub-1")
+        log_path.write_text("harness output\n" * 100)
+
+        LedgerWriter(ledger_dir, store).write_harness_log("cub-1", 1, log_path.read_text())
+        status_writer.store_harness_log("cub-1")
+
+        assert not log_path.exists()
+        assert store.read(log_path) == "harness output\n" * 100
+        assert len(objects(ledger_dir)) == 1
+
+    def test_store_harness_log_without_store_is_noop(self, tmp_path: Path) -> None:
+        status_writer = StatusWriter(tmp_path, "run-1")
+        log_path = status_writer.get_harness_log_path("cub-1")
+        log_path.write_text("output")
+        status_writer.store_harness_log("cub-1")
+        assert log_path.read_text() == "output"
+
+
+class TestArtifactManagerReadThrough:
+    def test_stored_artifacts_are_listed_and_numbered(self, ledger_dir: Path) -> None:
+        writer = LedgerWriter(ledger_dir, ArtifactStore(ledger_dir))
+        writer.write_prompt_file("cub-1", 1, "prompt")
+        writer.write_harness_log("cub-1", 1, "log")
+
+        manager = ArtifactManager(ledger_dir)
+        artifacts = manager.get_task_artifacts("cub-1", 1)
+        assert artifacts == {
+            "prompt": ledger_dir / "by-task" / "cub-1" / "001-prompt.md",
+            "harness": ledger_dir / "by-task" / "cub-1" / "001-harness.jsonl",
+        }
+        assert manager.get_next_attempt_number("cub-1") == 2
+        assert manager.list_attempts("cub-1") == [1]
+        assert manager.read_artifact("cub-1", 1, "harness") == "log"
+        assert manager.read_artifact("cub-1", 1, "patch") is None
+
+
+class TestCompact:
+    def test_compact_migrates_task_and_run_artifacts(
+        self, tmp_path: Path, ledger_dir: Path
+    ) -> None:
+        writer = LedgerWriter(ledger_dir)
+        status_writer = StatusWriter(tmp_path, "run-1")
+        for attempt in (1, 2):
+            writer.write_prompt_file(
+                "cub-1", attempt, f"# System Prompt\n\n{SYSTEM_PROMPT}\n\n# Task Prompt\n\nGo"
+            )
+        status_writer.write_prompt("cub-1", SYSTEM_PROMPT, "Go")
+        status_writer.get_harness_log_path("cub-1").write_text("log")
+        (ledger_dir / "by-task" / "cub-1" / "notes.txt").write_text("not an artifact")
+        before = {
+            p: p.read_text() for p in ledger_dir.rglob("*") if p.is_file() and p.name != "notes.txt"
+        }
+
+        store = ArtifactStore(ledger_dir)
+        assert store.compact(dry_run=True).files == 4
+        result = store.compact()
+
+        assert result.files == 4
+        assert result.bytes_after < result.bytes_before
+        assert (ledger_dir / "by-task" / "cub-1" / "notes.txt").exists()
+        for path, content in before.items():
+            assert not path.exists()
+            assert store.read(path) == content
+        assert store.compact().files == 0
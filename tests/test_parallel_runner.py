@@ -18,6 +18,14 @@ from cub.core.worktree.parallel import (
 )
 
 
+def _worker_process(returncode, stderr=""):
+    """Provide a mock worker subprocess that has already exited."""
+    process = MagicMock(returncode=returncode, pid=-1)
+    process.__enter__.return_value = process
+    process.communicate.return_value = ("", stderr)
+    return process
+
+
 @pytest.fixture
 def mock_worktree_manager():
     """Provide a mock WorktreeManager."""
@@ -356,13 +364,13 @@ class TestParallelRunnerRun:
         assert result.tasks_failed == 0
         assert len(result.workers) == 0
 
-    @patch("cub.core.worktree.parallel.subprocess.run")
+    @patch("cub.core.worktree.parallel.subprocess.Popen")
     def test_run_single_task_success(
         self, mock_subprocess, mock_worktree_manager, sample_tasks, tmp_path
     ):
         """Test running a single task successfully."""
         # Mock subprocess to return success
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
+        mock_subprocess.return_value = _worker_process(0)
 
         runner = ParallelRunner(tmp_path)
 
@@ -373,13 +381,13 @@ class TestParallelRunnerRun:
         assert len(result.workers) == 1
         assert result.workers[0].success is True
 
-    @patch("cub.core.worktree.parallel.subprocess.run")
+    @patch("cub.core.worktree.parallel.subprocess.Popen")
     def test_run_single_task_failure(
         self, mock_subprocess, mock_worktree_manager, sample_tasks, tmp_path
     ):
         """Test running a single task that fails."""
         # Mock subprocess to return failure
-        mock_subprocess.return_value = MagicMock(returncode=1, stderr="Task failed")
+        mock_subprocess.return_value = _worker_process(1, "Task failed")
 
         runner = ParallelRunner(tmp_path)
 
@@ -391,13 +399,13 @@ class TestParallelRunnerRun:
         assert result.workers[0].success is False
         assert result.workers[0].error is not None
 
-    @patch("cub.core.worktree.parallel.subprocess.run")
+    @patch("cub.core.worktree.parallel.subprocess.Popen")
     def test_run_multiple_tasks(
         self, mock_subprocess, mock_worktree_manager, sample_tasks, tmp_path
     ):
         """Test running multiple tasks."""
         # Mock subprocess to return success for all
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
+        mock_subprocess.return_value = _worker_process(0)
 
         runner = ParallelRunner(tmp_path)
 
@@ -407,7 +415,7 @@ class TestParallelRunnerRun:
         assert result.tasks_failed == 0
         assert len(result.workers) == 3
 
-    @patch("cub.core.worktree.parallel.subprocess.run")
+    @patch("cub.core.worktree.parallel.subprocess.Popen")
     def test_run_mixed_results(
         self, mock_subprocess, mock_worktree_manager, sample_tasks, tmp_path
     ):
@@ -418,8 +426,8 @@ class TestParallelRunnerRun:
         def mock_run(*args, **kwargs):
             call_count[0] += 1
             if call_count[0] % 2 == 0:
-                return MagicMock(returncode=1, stderr="Failed")
-            return MagicMock(returncode=0, stderr="")
+                return _worker_process(1, "Failed")
+            return _worker_process(0)
 
         mock_subprocess.side_effect = mock_run
 
@@ -450,12 +458,12 @@ class TestGetIndependentTasks:
 class TestCleanup:
     """Test worktree cleanup."""
 
-    @patch("cub.core.worktree.parallel.subprocess.run")
+    @patch("cub.core.worktree.parallel.subprocess.Popen")
     def test_cleanup_worktrees(
         self, mock_subprocess, mock_worktree_manager, sample_tasks, tmp_path
     ):
         """Test that worktrees are cleaned up after run."""
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
+        mock_subprocess.return_value = _worker_process(0)
 
         runner = ParallelRunner(tmp_path)
 
@@ -0,0 +1,394 @@
+"""
+Tests for batched PR check polling.
+
+Runs the poller against a local stub of the GitHub GraphQL endpoint that
+serves canned check runs per PR and honours If-None-Match.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from cub.core.github.client import GitHubClient
+from cub.core.github.models import RepoInfo
+from cub.core.services.pr_checks import (
+    CheckDurationModel,
+    CheckPoller,
+    HTTPGraphQLTransport,
+    build_checks_query,
+    parse_pr_checks,
+)
+from cub.core.services.pr_monitor import CheckPollError, CheckState, PRMonitorService
+
+REPO = RepoInfo(owner="octo", repo="app")
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def _run(
+    name: str,
+    status: str = "IN_PROGRESS",
+    conclusion: str | None = None,
+    *,
+    started: datetime | None = None,
+    completed: datetime | None = None,
+) -> dict[str, Any]:
+    return {
+        "__typename": "CheckRun",
+        "name": name,
+        "status": status,
+        "conclusion": conclusion,
+        "startedAt": _iso(started) if started else None,
+        "completedAt": _iso(completed) if completed else None,
+        "detailsUrl": f"https://ci.example/{name}",
+    }
+
+
+class _GraphQLStub:
+    """In-process stand-in for api.github.com/graphql."""
+
+    def __init__(self) -> None:
+        self.checks: dict[int, list[dict[str, Any]]] = {}
+        self.requests: list[list[int]] = []
+        self.not_modified = 0
+        self.fail = False
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                query = json.loads(self.rfile.read(length))["query"]
+                numbers = [int(n) for n in re.findall(r"pr(\d+): pullRequest", query)]
+                stub.requests.append(numbers)
+                if stub.fail:
+                    self.send_response(502)
+                    self.end_headers()
+                    return
+                repository = {
+                    f"pr{n}": {
+                        "number": n,
+                        "commits": {
+                            "nodes": [
+                                {
+                                    "commit": {
+                                        "oid": "abc123",
+                                        "statusCheckRollup": {
+                                            "contexts": {"nodes": stub.checks.get(n, [])}
+                                        },
+                                    }
+                                }
+                            ]
+                        },
+                    }
+                    for n in numbers
+                }
+                body = json.dumps({"data": {"repository": repository}}).encode()
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    stub.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+
+@pytest.fixture
+def stub() -> Iterator[_GraphQLStub]:
+    server = _GraphQLStub()
+    thread = threading.Thread(target=server.server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def poller(stub: _GraphQLStub) -> Iterator[CheckPoller]:
+    transport = HTTPGraphQLTransport("test-token", api_url=stub.url)
+    poller = CheckPoller(
+        REPO,
+        transport=transport,
+        min_interval=5,
+        base_interval=30,
+        max_interval=300,
+        clock=_Clock(),
+    )
+    yield poller
+    poller.stop()
+    transport.close()
+
+
+class TestQueryAndParsing:
+    """Tests for the batched query and its result parsing."""
+
+    def test_query_aliases_each_pr_once(self) -> None:
+        query = build_checks_query(REPO, [42, 7, 42])
+        assert re.findall(r"pr(\d+): pullRequest", query) == ["7", "42"]
+        assert 'repository(owner: "octo", name: "app")' in query
+
+    def test_parses_check_runs_and_status_contexts(self) -> None:
+        pr_data = {
+            "commits": {
+                "nodes": [
+                    {
+                        "commit": {
+                            "statusCheckRollup": {
+                                "contexts": {
+                                    "nodes": [
+                                        _run("test", "COMPLETED", "FAILURE", started=NOW),
+                                        _run("lint", "QUEUED"),
+                                        {
+                                            "__typename": "StatusContext",
+                                            "context": "ci/legacy",
+                                            "state": "SUCCESS",
+                                            "createdAt": _iso(NOW),
+                                            "targetUrl": None,
+                                        },
+                                    ]
+                                }
+                            }
+                        }
+                    }
+                ]
+            }
+        }
+        summary = parse_pr_checks(pr_data)
+        states = {c.name: c.state for c in summary.checks}
+        assert states == {
+            "test": CheckState.FAILURE,
+            "lint": CheckState.PENDING,
+            "ci/legacy": CheckState.SUCCESS,
+        }
+
+    def test_missing_pr_has_no_checks(self) -> None:
+        assert parse_pr_checks(None).checks == []
+
+
+class TestBatchedPolling:
+    """Tests for polling many PRs through one request."""
+
+    def test_one_request_for_many_prs(self, stub: _GraphQLStub, poller: CheckPoller) -> None:
+        for n in range(1, 11):
+            stub.checks[n] = [_run("test", "COMPLETED", "SUCCESS" if n % 2 else "FAILURE")]
+            poller.watch(n)
+
+        summaries = poller.poll_once(now=NOW)
+
+        assert stub.requests == [list(range(1, 11))]
+        assert summaries[1].all_passed
+        assert summaries[2].has_failures
+
+    def test_subscribers_notified_only_on_change(
+        self, stub: _GraphQLStub, poller: CheckPoller
+    ) -> None:
+        stub.checks[1] = [_run("test", started=NOW)]
+        stub.checks[2] = [_run("test", started=NOW)]
+        seen: dict[int, list[CheckState]] = {1: [], 2: []}
+        poller.subscribe(1, lambda s: seen[1].append(s.checks[0].state))
+        poller.subscribe(2, lambda s: seen[2].append(s.checks[0].state))
+
+        poller.poll_once(force=True, now=NOW)
+        stub.checks[1] = [_run("test", "COMPLETED", "SUCCESS", started=NOW, completed=NOW)]
+        poller.poll_once(force=True, now=NOW)
+
+        assert seen[1] == [CheckState.RUNNING, CheckState.SUCCESS]
+        assert seen[2] == [CheckState.RUNNING]
+
+    def test_unchanged_response_uses_conditional_request(
+        self, stub: _GraphQLStub, poller: CheckPoller
+    ) -> None:
+        stub.checks[5] = [_run("test")]
+        calls: list[Any] = []
+        poller.subscribe(5, calls.append)
+
+        poller.poll_once(force=True, now=NOW)
+        summaries = poller.poll_once(force=True, now=NOW)
+
+        assert stub.not_modified == 1
+        assert len(calls) == 1
+        assert summaries[5].checks[0].name == "test"
+
+    def test_unsubscribe_stops_polling(self, stub: _GraphQLStub, poller: CheckPoller) -> None:
+        unsubscribe = poller.subscribe(3, lambda s: None)
+        poller.poll_once(now=NOW)
+        unsubscribe()
+        assert poller.poll_once(force=True, now=NOW) == {}
+        assert len(stub.requests) == 1
+
+    def test_failed_request_raises_and_backs_off(
+        self, stub: _GraphQLStub, poller: CheckPoller
+    ) -> None:
+        stub.fail = True
+        poller.watch(9)
+        with pytest.raises(CheckPollError):
+            poller.poll_once(now=NOW)
+        assert poller.next_poll_in(9) == pytest.approx(45)
+
+
+class TestAdaptiveSchedule:
+    """Tests for scheduling polls from expected check durations."""
+
+    def test_next_poll_follows_learned_duration(
+        self, stub: _GraphQLStub, poller: CheckPoller
+    ) -> None:
+        # PR 1 teaches that "test" takes 100s
+        stub.checks[1] = [
+            _run(
+                "test",
+                "COMPLETED",
+                "SUCCESS",
+                started=NOW - timedelta(seconds=100),
+                completed=NOW,
+            )
+        ]
+        # PR 2's "test" started 40s ago, so should finish in about 60s
+        stub.checks[2] = [_run("test", started=NOW - timedelta(seconds=40))]
+        poller.watch(1)
+        poller.poll_once(now=NOW)
+        poller.watch(2)
+        poller.poll_once(now=NOW)
+
+        assert poller.durations.expected("test") == pytest.approx(100)
+        assert poller.next_poll_in(2) == pytest.approx(60)
+        assert poller.next_poll_in(1) == pytest.approx(300)  # settled
+
+    def test_unchanged_pending_backs_off(self, stub: _GraphQLStub, poller: CheckPoller) -> None:
+        stub.checks[4] = [_run("build", started=NOW)]
+        poller.watch(4)
+
+        intervals = []
+        for _ in range(4):
+            poller.poll_once(force=True, now=NOW)
+            intervals.append(poller.next_poll_in(4))
+
+        assert intervals == pytest.approx([30, 45, 67.5, 101.25])
+
+    def test_only_due_prs_are_polled(self, stub: _GraphQLStub, poller: CheckPoller) -> None:
+        stub.checks[1] = [_run("test", "COMPLETED", "SUCCESS")]
+        stub.checks[2] = [_run("test")]
+        poller.watch(1)
+        poller.watch(2)
+        poller.poll_once(now=NOW)
+
+        clock = poller._clock
+        assert isinstance(clock, _Clock)
+        clock.now += 31
+        poller.poll_once(now=NOW)
+
+        assert stub.requests == [[1, 2], [2]]
+
+    def test_duration_model_smooths_observations(self) -> None:
+        model = CheckDurationModel(smoothing=0.5)
+        for seconds in (100, 200):
+            start = NOW + timedelta(hours=seconds)
+            summary = parse_pr_checks(
+                {
+                    "commits": {
+                        "nodes": [
+                            {
+                                "commit": {
+                                    "statusCheckRollup": {
+                                        "contexts": {
+                                            "nodes": [
+                                                _run(
+                                                    "e2e",
+                                                    "COMPLETED",
+                                                    "SUCCESS",
+                                                    started=start,
+                                                    completed=start + timedelta(seconds=seconds),
+                                                )
+                                            ]
+                                        }
+                                    }
+                                }
+                            }
+                        ]
+                    }
+                }
+            )
+            model.observe(summary)
+            model.observe(summary)  # repeated polls of the same run count once
+        assert model.expected("e2e") == pytest.approx(150)
+
+
+class TestPollerConsumers:
+    """Tests for the monitor and client using the shared poller."""
+
+    def test_monitors_share_one_request(self, stub: _GraphQLStub, poller: CheckPoller) -> None:
+        stub.checks[1] = [_run("test", "COMPLETED", "SUCCESS")]
+        stub.checks[2] = [_run("test", "COMPLETED", "FAILURE")]
+        poller.watch(1)
+        poller.watch(2)
+
+        first = PRMonitorService(poller=poller).check_once(1)
+        second = PRMonitorService(poller=poller).check_once(2)
+
+        assert first.all_passed
+        assert second.has_failures
+        assert len(stub.requests) == 1
+
+    def test_wait_for_checks_uses_poller(self, stub: _GraphQLStub) -> None:
+        stub.checks[8] = [_run("test", "COMPLETED", "SUCCESS")]
+        transport = HTTPGraphQLTransport("test-token", api_url=stub.url)
+        poller = CheckPoller(REPO, transport=transport)
+        try:
+            assert GitHubClient(REPO).wait_for_checks(8, timeout=5, poller=poller)
+        finally:
+            poller.stop()
+            transport.close()
+
+    def test_wait_returns_empty_summary_when_pr_has_no_checks(self, stub: _GraphQLStub) -> None:
+        transport = HTTPGraphQLTransport("test-token", api_url=stub.url)
+        poller = CheckPoller(REPO, transport=transport)
+        try:
+            started = time.monotonic()
+            summary = poller.wait_until_complete(9, timeout=30, no_checks_grace=0.1)
+            assert summary is not None
+            assert summary.checks == []
+            assert time.monotonic() - started < 10
+        finally:
+            poller.stop()
+            transport.close()
+
+    def test_wait_for_checks_times_out_while_pending(self, stub: _GraphQLStub) -> None:
+        stub.checks[8] = [_run("test")]
+        transport = HTTPGraphQLTransport("test-token", api_url=stub.url)
+        poller = CheckPoller(REPO, transport=transport)
+        try:
+            assert not GitHubClient(REPO).wait_for_checks(8, timeout=0, poller=poller)
+        finally:
+            poller.stop()
+            transport.close()
@@ -0,0 +1,261 @@
+"""
+Tests for span profiling of cub runs.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cub.core import profiling
+from cub.core.profiling import (
+    Profiler,
+    Span,
+    activate,
+    chrome_trace,
+    deactivate,
+    format_summary,
+    load_spans,
+    load_summary,
+    profiled,
+    span,
+    summarize,
+)
+from cub.core.run.loop import RunLoop
+from cub.core.run.models import RunConfig
+
+
+class FakeClock:
+    """Clock advanced by hand, in seconds."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def no_active_profiler() -> Iterator[None]:
+    yield
+    deactivate()
+
+
+def make_span(name: str, start: int, duration: int, depth: int = 0, category: str = "cub") -> Span:
+    return Span(
+        name=name,
+        category=category,
+        start_us=start,
+        duration_us=duration,
+        thread_id=1,
+        depth=depth,
+        main=True,
+    )
+
+
+class TestProfiler:
+    def test_nested_spans_record_depth_and_duration(self, tmp_path: Path) -> None:
+        clock = FakeClock()
+        profiler = Profiler(tmp_path, clock=clock)
+
+        with profiler.span("outer", "run", task_id="cub-1"):
+            clock.now += 1
+            with profiler.span("inner", "ledger"):
+                clock.now += 2
+
+        profiler.flush()
+        spans = {s.name: s for s in load_spans(profiler.spans_path)}
+        assert spans["outer"].duration_us == 3_000_000
+        assert spans["outer"].depth == 0
+        assert spans["outer"].args == {"task_id": "cub-1"}
+        assert spans["inner"].start_us == 1_000_000
+        assert spans["inner"].depth == 1
+
+    def test_span_recorded_when_body_raises(self, tmp_path: Path) -> None:
+        profiler = Profiler(tmp_path)
+
+        with pytest.raises(ValueError), profiler.span("failing"):
+            raise ValueError("boom")
+
+        profiler.flush()
+        assert [s.name for s in load_spans(profiler.spans_path)] == ["failing"]
+
+    def test_flush_appends(self, tmp_path: Path) -> None:
+        profiler = Profiler(tmp_path)
+        with profiler.span("first"):
+            pass
+        profiler.flush()
+        with profiler.span("second"):
+            pass
+        profiler.flush()
+        profiler.flush()
+
+        assert [s.name for s in load_spans(profiler.spans_path)] == ["first", "second"]
+
+    def test_close_writes_chrome_trace(self, tmp_path: Path) -> None:
+        clock = FakeClock()
+        profiler = Profiler(tmp_path / "run", clock=clock)
+        with profiler.span("harness.invoke", "harness", model="sonnet"):
+            clock.now += 4
+
+        summary = profiler.close()
+
+        trace = json.loads(profiler.trace_path.read_text())
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert events == [
+            {
+                "name": "harness.invoke",
+                "cat": "harness",
+                "ph": "X",
+                "ts": 0,
+                "dur": 4_000_000,
+                "pid": 1,
+                "tid": events[0]["tid"],
+                "args": {"model": "sonnet"},
+            }
+        ]
+        assert summary.harness_seconds == 4.0
+
+    def test_load_spans_skips_partial_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "profile.jsonl"
+        path.write_text(json.dumps(make_span("ok", 0, 1).to_dict()) + '\n{"name": "cut')
+
+        assert [s.name for s in load_spans(path)] == ["ok"]
+        assert load_spans(tmp_path / "missing.jsonl") == []
+
+
+class TestModuleLevelSpans:
+    def test_inactive_spans_do_nothing(self) -> None:
+        @profiled("work")
+        def work() -> int:
+            return 42
+
+        with span("noop"):
+            assert work() == 42
+        assert profiling.active_profiler() is None
+
+    def test_active_profiler_receives_spans(self, tmp_path: Path) -> None:
+        profiler = Profiler(tmp_path)
+
+        @profiled("work", "tasks")
+        def work() -> int:
+            return 42
+
+        activate(profiler)
+        with span("outer"):
+            assert work() == 42
+        deactivate(profiler)
+        with span("after"):
+            pass
+
+        profiler.flush()
+        spans = load_spans(profiler.spans_path)
+        assert [(s.name, s.category, s.depth) for s in spans] == [
+            ("work", "tasks", 1),
+            ("outer", "cub", 0),
+        ]
+
+    def test_deactivate_ignores_other_profiler(self, tmp_path: Path) -> None:
+        profiler = Profiler(tmp_path)
+        activate(profiler)
+        deactivate(Profiler(tmp_path / "other"))
+        assert profiling.active_profiler() is profiler
+
+
+class TestSummarize:
+    def test_self_time_excludes_children(self) -> None:
+        spans = [
+            make_span("harness.invoke", 100, 700, depth=1, category="harness"),
+            make_span("ledger.write", 850, 100, depth=1),
+            make_span("run.task", 0, 1000),
+            make_span("run.select_task", 1000, 50),
+        ]
+
+        summary = summarize(spans)
+        totals = {t.name: t for t in summary.spans}
+        assert totals["run.task"].total_seconds == pytest.approx(0.001)
+        assert totals["run.task"].self_seconds == pytest.approx(0.0002)
+        assert summary.wall_seconds == pytest.approx(0.00105)
+        assert summary.harness_seconds == pytest.approx(0.0007)
+        assert summary.overhead_percentage == pytest.approx(35 / 105 * 100)
+        assert summary.spans[0].name == "harness.invoke"
+
+    def test_repeated_spans_aggregate(self) -> None:
+        summary = summarize([make_span("tasks.load", 0, 10), make_span("tasks.load", 20, 30)])
+
+        (total,) = summary.spans
+        assert total.count == 2
+        assert total.max_seconds == pytest.approx(0.00003)
+
+    def test_chrome_trace_has_process_metadata(self) -> None:
+        trace = chrome_trace([make_span("a", 0, 1)], process_name="cub run-1")
+
+        meta = trace["traceEvents"][0]
+        assert meta["ph"] == "M"
+        assert meta["args"] == {"name": "cub run-1"}
+
+    def test_load_summary_of_unprofiled_run(self, tmp_path: Path) -> None:
+        assert load_summary(tmp_path) is None
+
+    def test_format_summary(self) -> None:
+        spans = [make_span("run.task", 0, 2_000_000), make_span("h", 0, 1_500_000, 1, "harness")]
+        assert format_summary(summarize(spans)) == (
+            "2.0s profiled: harness 1.5s, cub overhead 0.50s (25.0%)"
+        )
+
+
+class TestRunLoopProfiling:
+    @patch("cub.core.run.loop.generate_system_prompt", return_value="system prompt")
+    @patch("cub.core.run.loop.generate_task_prompt", return_value="task prompt")
+    def test_profiled_run_writes_spans_and_trace(
+        self,
+        mock_task_prompt: MagicMock,
+        mock_sys_prompt: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        task = MagicMock()
+        task.id = "test-001"
+        task.title = "Test task"
+        task.parent = None
+        task.model_label = None
+        task_backend = MagicMock()
+        task_backend.get_ready_tasks.return_value = [task]
+        task_backend.get_task.return_value = task
+        harness_result = MagicMock(success=True, duration_seconds=1.0, exit_code=0, error=None)
+        harness_result.usage.total_tokens = 10
+        harness_result.usage.cost_usd = 0.0
+
+        config = RunConfig(
+            once=True,
+            harness_name="test-harness",
+            max_iterations=1,
+            circuit_breaker_enabled=False,
+            ledger_enabled=False,
+            hooks_enabled=False,
+            sync_enabled=False,
+            project_dir=str(tmp_path),
+            profile=True,
+        )
+        loop = RunLoop(config=config, task_backend=task_backend, harness_backend=MagicMock())
+
+        with patch.object(loop, "_invoke_harness", return_value=harness_result):
+            list(loop.execute())
+
+        run_dir = tmp_path / ".cub" / "ledger" / "by-run" / loop.run_id
+        names = {s.name for s in load_spans(run_dir / "profile.jsonl")}
+        assert {"run.select_task", "run.task", "harness.invoke", "tasks.close"} <= names
+        assert (run_dir / "trace.json").exists()
+        assert loop.profile_summary is not None
+        assert profiling.active_profiler() is None
+
+    def test_unprofiled_run_has_no_profiler(self, tmp_path: Path) -> None:
+        loop = RunLoop(
+            config=RunConfig(project_dir=str(tmp_path)),
+            task_backend=MagicMock(),
+            harness_backend=MagicMock(),
+        )
+        assert loop.profiler is None
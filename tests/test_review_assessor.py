@@ -0,0 +1,282 @@
+"""
+Tests for concurrent and cached assessment in the review system.
+
+Covers the assessment cache, batched git lookups, bounded concurrency
+for deep analysis, and epic/plan aggregation built on assess_tasks.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cub.core.ledger.models import CommitRef, LedgerEntry, Lineage, Outcome, TaskSnapshot
+from cub.core.ledger.reader import LedgerReader
+from cub.core.ledger.writer import LedgerWriter
+from cub.core.review.assessor import EpicAssessor, PlanAssessor, TaskAssessor
+from cub.core.review.cache import AssessmentCache
+from cub.core.review.models import AssessmentGrade, IssueType, ReviewIssue
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a git repo with two commits touching different files."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    _git(tmp_path, "add", "a.py")
+    _git(tmp_path, "commit", "-q", "-m", "add a")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    _git(tmp_path, "add", "b.py")
+    _git(tmp_path, "commit", "-q", "-m", "add b")
+    return tmp_path
+
+
+@pytest.fixture
+def ledger_dir(project: Path) -> Path:
+    ledger = project / ".cub" / "ledger"
+    ledger.mkdir(parents=True)
+    return ledger
+
+
+def _commit_hashes(repo: Path) -> list[str]:
+    return _git(repo, "log", "--format=%H", "--reverse").splitlines()
+
+
+def _write_entry(
+    writer: LedgerWriter,
+    task_id: str,
+    epic_id: str,
+    commits: list[str] | None = None,
+    *,
+    plan_file: str | None = None,
+) -> LedgerEntry:
+    entry = LedgerEntry(
+        id=task_id,
+        title=f"Task {task_id}",
+        epic_id=epic_id,
+        lineage=Lineage(epic_id=epic_id, plan_file=plan_file),
+        outcome=Outcome(
+            success=True,
+            commits=[CommitRef(hash=h) for h in (commits or [])],
+        ),
+        completed_at=datetime.now(timezone.utc),
+    )
+    writer.create_entry(entry)
+    return entry
+
+
+class TestAssessmentCache:
+    """Tests for the on-disk assessment cache."""
+
+    def test_key_depends_on_inputs(self) -> None:
+        base = AssessmentCache.make_key("abc", ["c1"], deep=False)
+        assert base == AssessmentCache.make_key("abc", ["c1"], deep=False)
+        assert base != AssessmentCache.make_key("abd", ["c1"], deep=False)
+        assert base != AssessmentCache.make_key("abc", ["c2"], deep=False)
+        assert base != AssessmentCache.make_key("abc", ["c1"], deep=True)
+        assert base != AssessmentCache.make_key("abc", ["c1"], deep=False, worktree=["file:x"])
+
+    def test_roundtrip_and_clear(self, tmp_path: Path, ledger_dir: Path) -> None:
+        writer = LedgerWriter(ledger_dir)
+        _write_entry(writer, "t-1", "e")
+        assessment = TaskAssessor(LedgerReader(ledger_dir), tmp_path).assess_task("t-1")
+
+        cache = AssessmentCache(tmp_path / "cache")
+        assert cache.get("k") is None
+        cache.set("k", assessment)
+        assert cache.get("k") == assessment
+        assert cache.clear() == 1
+        assert cache.get("k") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = AssessmentCache(tmp_path)
+        (tmp_path / "bad.json").write_text("{not json")
+        assert cache.get("bad") is None
+
+
+class TestBatchedGitLookup:
+    """Tests for looking up files from many commits at once."""
+
+    def test_single_git_call_for_all_commits(
+        self, project: Path, ledger_dir: Path, mocker: Any
+    ) -> None:
+        first, second = _commit_hashes(project)
+        writer = LedgerWriter(ledger_dir)
+        _write_entry(writer, "t-1", "e", [first])
+        _write_entry(writer, "t-2", "e", [second[:10]])
+
+        spy = mocker.spy(subprocess, "run")
+        assessor = TaskAssessor(LedgerReader(ledger_dir), project)
+        assessor.assess_tasks(["t-1", "t-2"])
+
+        git_show_calls = [c for c in spy.call_args_list if c.args[0][:2] == ["git", "show"]]
+        assert len(git_show_calls) == 1
+
+        files = assessor._get_commit_files([first, second[:10]])
+        assert files == {first: ["a.py"], second[:10]: ["b.py"]}
+
+    def test_falls_back_per_commit_on_unknown_hash(self, project: Path, ledger_dir: Path) -> None:
+        first, _ = _commit_hashes(project)
+        assessor = TaskAssessor(LedgerReader(ledger_dir), project)
+        files = assessor._get_commit_files([first, "deadbeefdeadbeef"])
+        assert files == {first: ["a.py"]}
+
+
+class TestCachedAssessment:
+    """Tests for reusing assessments across reviews."""
+
+    def test_unchanged_epic_is_served_from_cache(
+        self, project: Path, ledger_dir: Path, mocker: Any
+    ) -> None:
+        writer = LedgerWriter(ledger_dir)
+        for i in range(3):
+            _write_entry(writer, f"t-{i}", "epic-1")
+
+        cache = AssessmentCache.for_project(project)
+        first = EpicAssessor(LedgerReader(ledger_dir), project_root=project, cache=cache)
+        before = first.assess_epic("epic-1")
+
+        second = EpicAssessor(LedgerReader(ledger_dir), project_root=project, cache=cache)
+        spy = mocker.spy(second.task_assessor, "_assess_entry")
+        after = second.assess_epic("epic-1")
+
+        assert spy.call_count == 0
+        assert after == before
+        assert after.title == "Epic epic-1"
+
+    def test_changed_entry_is_reassessed(
+        self, project: Path, ledger_dir: Path, mocker: Any
+    ) -> None:
+        writer = LedgerWriter(ledger_dir)
+        _write_entry(writer, "t-1", "epic-1")
+        _write_entry(writer, "t-2", "epic-1")
+
+        cache = AssessmentCache.for_project(project)
+        EpicAssessor(LedgerReader(ledger_dir), project_root=project, cache=cache).assess_epic(
+            "epic-1"
+        )
+
+        entry = writer.get_entry("t-2")
+        assert entry is not None
+        entry.outcome = Outcome(success=False)
+        writer.update_entry(entry)
+
+        assessor = EpicAssessor(LedgerReader(ledger_dir), project_root=project, cache=cache)
+        spy = mocker.spy(assessor.task_assessor, "_assess_entry")
+        result = assessor.assess_epic("epic-1")
+
+        assert spy.call_count == 1
+        assert result.tasks_failed == 1
+
+    def test_deleted_file_is_reassessed(self, project: Path, ledger_dir: Path) -> None:
+        writer = LedgerWriter(ledger_dir)
+        entry = _write_entry(writer, "t-1", "epic-1")
+        entry.task = TaskSnapshot(title="Task t-1", description="Files: lib/a.py")
+        writer.update_entry(entry)
+        (project / "lib").mkdir()
+        (project / "lib" / "a.py").write_text("a = 1\n")
+
+        cache = AssessmentCache.for_project(project)
+        before = TaskAssessor(LedgerReader(ledger_dir), project, cache=cache).assess_task("t-1")
+        assert before.missing_files == []
+
+        (project / "lib" / "a.py").unlink()
+        after = TaskAssessor(LedgerReader(ledger_dir), project, cache=cache).assess_task("t-1")
+
+        assert after.missing_files == ["lib/a.py"]
+        assert any(i.type == IssueType.MISSING_FILE for i in after.issues)
+
+    def test_missing_task_is_not_cached(self, project: Path, ledger_dir: Path) -> None:
+        cache = AssessmentCache.for_project(project)
+        assessor = TaskAssessor(LedgerReader(ledger_dir), project, cache=cache)
+        result = assessor.assess_task("nope")
+        assert result.grade == AssessmentGrade.UNKNOWN
+        assert not cache.cache_dir.exists()
+
+
+class TestConcurrentDeepAnalysis:
+    """Tests for the bounded deep analysis pool."""
+
+    def test_deep_analysis_runs_concurrently_within_bound(
+        self, project: Path, ledger_dir: Path, mocker: Any
+    ) -> None:
+        writer = LedgerWriter(ledger_dir)
+        for i in range(6):
+            _write_entry(writer, f"t-{i}", "epic-1")
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_deep(
+            self: TaskAssessor, entry: LedgerEntry, files: list[str]
+        ) -> tuple[str | None, list[ReviewIssue]]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return f"analysis of {entry.id}", []
+
+        mocker.patch.object(TaskAssessor, "_run_deep_analysis", fake_deep)
+        assessor = EpicAssessor(LedgerReader(ledger_dir), project_root=project, max_workers=3)
+        result = assessor.assess_epic("epic-1", deep=True)
+
+        assert 1 < peak <= 3
+        assert [t.task_id for t in result.task_assessments] == [f"t-{i}" for i in range(6)]
+        assert all(t.deep_analysis == f"analysis of {t.task_id}" for t in result.task_assessments)
+
+    def test_failed_deep_analysis_is_not_cached(
+        self, project: Path, ledger_dir: Path, mocker: Any
+    ) -> None:
+        writer = LedgerWriter(ledger_dir)
+        _write_entry(writer, "t-1", "epic-1")
+
+        unavailable = ReviewIssue(
+            type=IssueType.DEEP_ANALYSIS_FINDING,
+            severity="info",
+            description="Deep analysis unavailable - no harness configured",
+            recommendation="Install a harness",
+        )
+        mocker.patch.object(TaskAssessor, "_run_deep_analysis", return_value=(None, [unavailable]))
+
+        cache = AssessmentCache.for_project(project)
+        TaskAssessor(LedgerReader(ledger_dir), project, cache=cache).assess_task("t-1", deep=True)
+
+        assert not list(cache.cache_dir.glob("*.json"))
+
+
+class TestPlanAssessment:
+    """Tests for plan assessment over the shared task batch."""
+
+    def test_plan_aggregates_epics_from_lineage(self, project: Path, ledger_dir: Path) -> None:
+        plans_root = project / "plans"
+        (plans_root / "my-plan").mkdir(parents=True)
+        writer = LedgerWriter(ledger_dir)
+        _write_entry(writer, "a-1", "epic-a", plan_file="plans/my-plan/plan.md")
+        _write_entry(writer, "b-1", "epic-b", plan_file="plans/my-plan/plan.md")
+        _write_entry(writer, "c-1", "epic-c", plan_file="plans/other/plan.md")
+
+        result = PlanAssessor(
+            LedgerReader(ledger_dir), plans_root, project_root=project
+        ).assess_plan("my-plan")
+
+        assert [e.epic_id for e in result.epic_assessments] == ["epic-a", "epic-b"]
+        assert result.tasks_total == 2
@@ -8,6 +8,7 @@ generator interface and all loop behaviors.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -1623,6 +1624,71 @@ class TestRunLoopMaxTaskIterations:
 # ===========================================================================
 
 
+class _SessionHarness:
+    """Harness stub implementing SessionRetainingBackend."""
+
+    def __init__(self) -> None:
+        self.capabilities = MagicMock(streaming=False)
+        self.opened: list[str] = []
+        self.closed = 0
+
+    def open_session(self, scope: str) -> None:
+        self.opened.append(scope)
+
+    def close_session(self) -> None:
+        self.closed += 1
+
+
+class TestRunLoopSessionRetention:
+    """Tests for retaining a harness session across an epic's tasks."""
+
+    @patch("cub.core.run.loop.generate_system_prompt", return_value="system prompt")
+    @patch("cub.core.run.loop.generate_task_prompt", return_value="task prompt")
+    def test_session_opened_per_epic_and_closed_at_end(
+        self,
+        mock_task_prompt: MagicMock,
+        mock_sys_prompt: MagicMock,
+        mock_task_backend: MagicMock,
+        base_config: RunConfig,
+    ) -> None:
+        task = _make_task()
+        task.parent = "epic-1"
+        mock_task_backend.get_ready_tasks.return_value = [task]
+        harness = _SessionHarness()
+        loop = RunLoop(
+            config=replace(base_config, retain_session=True),
+            task_backend=mock_task_backend,
+            harness_backend=harness,  # type: ignore[arg-type]
+        )
+
+        with patch.object(loop, "_invoke_harness", return_value=_make_harness_result()):
+            list(loop.execute())
+
+        assert harness.opened == ["epic-1"]
+        assert harness.closed == 1
+
+    @patch("cub.core.run.loop.generate_system_prompt", return_value="system prompt")
+    @patch("cub.core.run.loop.generate_task_prompt", return_value="task prompt")
+    def test_session_not_retained_by_default(
+        self,
+        mock_task_prompt: MagicMock,
+        mock_sys_prompt: MagicMock,
+        mock_task_backend: MagicMock,
+        base_config: RunConfig,
+    ) -> None:
+        harness = _SessionHarness()
+        loop = RunLoop(
+            config=base_config,
+            task_backend=mock_task_backend,
+            harness_backend=harness,  # type: ignore[arg-type]
+        )
+
+        with patch.object(loop, "_invoke_harness", return_value=_make_harness_result()):
+            list(loop.execute())
+
+        assert harness.opened == []
+
+
 class TestRunLoopImports:
     """Tests that RunLoop and models can be imported from the package."""
 
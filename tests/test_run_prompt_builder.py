@@ -14,13 +14,20 @@ import pytest
 
 from cub.core.run.prompt_builder import (
     PromptConfig,
+    PromptLayout,
+    PromptSection,
+    PromptStability,
     TaskPrompt,
+    build_system_prompt,
+    build_task_prompt,
     generate_direct_task_prompt,
     generate_epic_context,
     generate_retry_context,
     generate_system_prompt,
     generate_task_prompt,
+    hash_prompt_prefix,
     load_plan_context,
+    normalize_prompt_text,
 )
 from cub.core.tasks.models import Task, TaskPriority, TaskStatus, TaskType
 
@@ -641,6 +648,89 @@ class TestGenerateTaskPrompt:
         assert "## Retry Context" not in result
 
 
+# ===========================================================================
+# Prefix stability
+# ===========================================================================
+
+
+class TestPromptLayout:
+    """Tests for stable prompt layout and prefix hashing."""
+
+    def test_sections_ordered_by_stability(self) -> None:
+        layout = PromptLayout.compose(
+            [
+                PromptSection("task", "Task", PromptStability.TASK),
+                PromptSection("epic", "Epic", PromptStability.EPIC),
+                PromptSection("runloop", "Runloop", PromptStability.PROJECT),
+                PromptSection("empty", "  \n", PromptStability.PLAN),
+            ]
+        )
+        assert [s.name for s in layout.sections] == ["runloop", "epic", "task"]
+        assert layout.text == "Runloop\n\nEpic\n\nTask"
+        assert layout.prefix == "Runloop\n\nEpic"
+
+    def test_normalization_makes_equivalent_text_identical(self) -> None:
+        assert normalize_prompt_text("\n# A  \r\nbody\t\r\n\n") == "# A\nbody"
+
+    def test_prefix_hash_ignores_task_sections(self) -> None:
+        def layout(task_text: str) -> PromptLayout:
+            return PromptLayout.compose(
+                [
+                    PromptSection("runloop", "Runloop\r\n", PromptStability.PROJECT),
+                    PromptSection("task", task_text, PromptStability.TASK),
+                ]
+            )
+
+        assert layout("one").prefix_hash == layout("two").prefix_hash
+        assert layout("one").prefix_hash == hash_prompt_prefix("Runloop")
+        assert hash_prompt_prefix("ab", "c") != hash_prompt_prefix("a", "bc")
+
+    def test_system_prompt_is_all_prefix(self, tmp_path: Path) -> None:
+        cub_dir = tmp_path / ".cub"
+        cub_dir.mkdir()
+        (cub_dir / "runloop.md").write_text("# Core Runloop   \r\n\r\nBase.\r\n")
+        plan_dir = tmp_path / "plans" / "feat"
+        plan_dir.mkdir(parents=True)
+        (plan_dir / "prompt-context.md").write_text("# Plan Context\n")
+
+        layout = build_system_prompt(tmp_path, plan_slug="feat")
+        assert layout.text == "# Core Runloop\n\nBase.\n\n# Plan Context"
+        assert layout.prefix == layout.text
+        assert generate_system_prompt(tmp_path, plan_slug="feat") == layout.text
+
+    def test_task_prompt_puts_epic_summary_first(self) -> None:
+        epic = _make_task(task_id="epic-1", title="The Epic", task_type=TaskType.EPIC)
+        siblings = [
+            _make_task(task_id="t-1", title="First", parent="epic-1", status=TaskStatus.CLOSED),
+            _make_task(task_id="t-2", title="Second", parent="epic-1"),
+        ]
+        backend = _make_task_backend(epic=epic, sibling_tasks=siblings)
+
+        layout = build_task_prompt(_make_task(task_id="t-2", parent="epic-1"), backend)
+        names = [s.name for s in layout.sections]
+        assert names == [
+            "epic",
+            "epic-progress",
+            "current-task",
+            "task-management",
+            "when-complete",
+        ]
+        assert layout.prefix.startswith("## Epic Context")
+        assert "t-2" not in layout.prefix
+
+    def test_sibling_tasks_share_prefix(self) -> None:
+        epic = _make_task(task_id="epic-1", title="The Epic", task_type=TaskType.EPIC)
+        backend = _make_task_backend(epic=epic)
+
+        first = build_task_prompt(_make_task(task_id="t-1", parent="epic-1"), backend)
+        second = build_task_prompt(_make_task(task_id="t-2", parent="epic-1"), backend)
+        assert first.prefix_hash == second.prefix_hash
+        assert first.text != second.text
+        assert generate_task_prompt(_make_task(task_id="t-1", parent="epic-1"), backend) == (
+            first.text
+        )
+
+
 # ===========================================================================
 # Import compatibility (from cub.core.run)
 # ===========================================================================
@@ -3,6 +3,7 @@
 import json
 import subprocess
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,6 +17,7 @@ from cub.core.sandbox import (
     list_providers,
 )
 from cub.core.sandbox.docker import DockerProvider
+from cub.core.sandbox.seed import TreeDelta
 
 
 class TestDockerProviderProperties:
@@ -118,7 +120,7 @@ class TestDockerProviderAvailability:
 class TestDockerProviderStart:
     """Test sandbox start functionality."""
 
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_start_creates_volume_and_container(
         self,
         mock_run: MagicMock,
@@ -145,7 +147,7 @@ class TestDockerProviderStart:
         # Verify container run
         assert any("run" in str(call) and "--detach" in str(call) for call in calls)
 
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_start_with_custom_config(
         self,
         mock_run: MagicMock,
@@ -179,8 +181,8 @@ class TestDockerProviderStart:
         assert "none" in last_run
         assert "FOO=bar" in last_run
 
-    @patch.object(DockerProvider, "_run_docker")
-    @patch.object(DockerProvider, "_cleanup_resources")
+    @patch.object(DockerProvider, "run_docker")
+    @patch.object(DockerProvider, "cleanup_resources")
     def test_start_cleans_up_on_failure(
         self,
         mock_cleanup: MagicMock,
@@ -204,11 +206,290 @@ class TestDockerProviderStart:
         mock_cleanup.assert_called_once()
 
 
+class _FakeDocker:
+    """Stand-in for run_docker that tracks volumes and labels."""
+
+    def __init__(self, fail_overlay: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.inputs: list[str | None] = []
+        self.volumes: dict[str, dict[str, str]] = {}
+        self.fail_overlay = fail_overlay
+        self.outputs: dict[str, str] = {}
+
+    def __call__(self, args: list[str], check: bool = True, input: str | None = None) -> MagicMock:
+        self.calls.append(args)
+        self.inputs.append(input)
+        stdout = ""
+        if args[:2] == ["volume", "create"]:
+            if self.fail_overlay and "type=overlay" in args:
+                raise subprocess.CalledProcessError(1, args, "", "overlay unsupported")
+            labels = dict(args[i + 1].split("=", 1) for i, a in enumerate(args) if a == "--label")
+            self.volumes[args[-1]] = labels
+        elif args[:2] == ["volume", "rm"]:
+            self.volumes.pop(args[-1], None)
+        elif args[:2] == ["volume", "ls"]:
+            flt = args[args.index("--filter") + 1]
+            if flt.startswith("label="):
+                key, value = flt.removeprefix("label=").split("=", 1)
+                names = [n for n, labels in self.volumes.items() if labels.get(key) == value]
+            else:
+                name = flt.removeprefix("name=^").removesuffix("$")
+                names = [name] if name in self.volumes else []
+            stdout = "\n".join(names)
+        elif args[:2] == ["volume", "inspect"]:
+            stdout = f"/var/lib/docker/volumes/{args[-1]}/_data\n"
+        else:
+            for marker, output in self.outputs.items():
+                if any(marker in arg for arg in args):
+                    stdout = output
+        return MagicMock(returncode=0, stdout=stdout, stderr="")
+
+    def find(self, *words: str) -> list[list[str]]:
+        return [c for c in self.calls if all(w in c for w in words)]
+
+
+def _git_project(path: Path) -> Path:
+    """Create a project with one commit."""
+    path.mkdir()
+    (path / "main.py").write_text("print('hi')\n")
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    subprocess.run(["git", "-C", str(path), "add", "."], check=True)
+    subprocess.run(
+        ["git", "-C", str(path), "-c", "user.name=t", "-c", "user.email=t@t"]
+        + ["commit", "-qm", "init"],
+        check=True,
+    )
+    return path
+
+
+class TestDockerProviderCopyOnWriteSeeding:
+    """Test seeding sandboxes from a per-commit base volume."""
+
+    @patch.object(DockerProvider, "_seed_delta")
+    def test_first_start_builds_base_and_overlay(
+        self, mock_seed: MagicMock, tmp_path: Path
+    ) -> None:
+        project = _git_project(tmp_path / "proj")
+        docker = _FakeDocker()
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            sandbox_id = DockerProvider().start(project, SandboxConfig())
+
+        bases = [n for n in docker.volumes if n.startswith("cub-base-")]
+        assert len(bases) == 1
+        # Base is filled by a full copy once
+        assert len(docker.find("cp -a /source/. /dest/")) == 1
+        assert docker.find(f"{bases[0]}:/dest")
+
+        overlay = docker.find("volume", "create", "type=overlay")
+        assert len(overlay) == 1
+        opts = " ".join(overlay[0])
+        assert f"lowerdir=/var/lib/docker/volumes/{bases[0]}/_data" in opts
+        assert f"upperdir=/var/lib/docker/volumes/{sandbox_id}_upper/_data/data" in opts
+        assert overlay[0][-1] == f"{sandbox_id}_work"
+        assert docker.find("--detach", f"{sandbox_id}_work:/project")
+
+        # Nothing changed since the base snapshot
+        volume, _, delta = mock_seed.call_args.args
+        assert volume == f"{sandbox_id}_work"
+        assert not delta
+
+    @patch.object(DockerProvider, "_seed_delta")
+    def test_second_start_reuses_base_and_seeds_only_changes(
+        self, mock_seed: MagicMock, tmp_path: Path
+    ) -> None:
+        project = _git_project(tmp_path / "proj")
+        docker = _FakeDocker()
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            provider = DockerProvider()
+            provider.start(project, SandboxConfig())
+            (project / "main.py").write_text("print('changed')\n")
+            (project / "new.py").write_text("x = 1\n")
+            with patch("cub.core.sandbox.docker.time.time", return_value=1):
+                provider.start(project, SandboxConfig())
+
+        assert len(docker.find("cp -a /source/. /dest/")) == 1
+        assert len(docker.find("volume", "create", "type=overlay")) == 2
+        _, _, delta = mock_seed.call_args.args
+        assert delta.changed == ["main.py", "new.py"]
+        assert delta.deleted == []
+
+    @patch.object(DockerProvider, "_seed_delta")
+    def test_falls_back_to_copy_when_overlay_unavailable(
+        self, mock_seed: MagicMock, tmp_path: Path
+    ) -> None:
+        project = _git_project(tmp_path / "proj")
+        docker = _FakeDocker(fail_overlay=True)
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            sandbox_id = DockerProvider().start(project, SandboxConfig())
+
+        assert f"{sandbox_id}_upper" not in docker.volumes
+        assert f"{sandbox_id}_work" in docker.volumes
+        assert docker.find(f"{sandbox_id}_work:/dest", "cp -a /source/. /dest/")
+
+    def test_copy_seed_option_skips_overlay(self, tmp_path: Path) -> None:
+        project = _git_project(tmp_path / "proj")
+        docker = _FakeDocker()
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            DockerProvider().start(project, SandboxConfig(provider_opts={"seed": "copy"}))
+
+        assert not any(n.startswith("cub-base-") for n in docker.volumes)
+
+    def test_seed_delta_streams_changed_files(self, tmp_path: Path) -> None:
+        project = tmp_path / "proj"
+        (project / "src").mkdir(parents=True)
+        (project / "src" / "app.py").write_text("new\n")
+        dest = tmp_path / "volume"
+        dest.mkdir()
+        (dest / "old.txt").write_text("stale")
+        real_popen = subprocess.Popen
+        commands: list[list[str]] = []
+
+        def local_popen(cmd: list[str], **kwargs: Any) -> subprocess.Popen[bytes]:
+            # Run the container's script against a local directory instead
+            commands.append(cmd)
+            script_at = cmd.index("-c") + 1
+            script = cmd[script_at].replace("/project", str(dest))
+            return real_popen(["sh", "-c", script, *cmd[script_at + 1 :]], **kwargs)
+
+        delta = TreeDelta(changed=["src/app.py", "vanished.py"], deleted=["old.txt"])
+        with patch("cub.core.sandbox.docker.subprocess.Popen", side_effect=local_popen):
+            DockerProvider()._seed_delta("cub-sandbox-1_work", project, delta)
+
+        assert (dest / "src" / "app.py").read_text() == "new\n"
+        assert not (dest / "old.txt").exists()
+        assert not (dest / ".cub-sandbox-deleted").exists()
+        assert "cub-sandbox-1_work:/project" in commands[0]
+        # Deleted paths travel in the tar stream, not on the command line
+        assert "old.txt" not in commands[0]
+
+    def test_seed_delta_removes_many_deleted_paths(self, tmp_path: Path) -> None:
+        project = tmp_path / "proj"
+        project.mkdir()
+        dest = tmp_path / "volume"
+        deleted = [f"node_modules/pkg{i:05d}/index with space.js" for i in range(20000)]
+        for path in deleted[:3]:
+            (dest / path).parent.mkdir(parents=True)
+            (dest / path).write_text("x")
+        real_popen = subprocess.Popen
+
+        def local_popen(cmd: list[str], **kwargs: Any) -> subprocess.Popen[bytes]:
+            script = cmd[cmd.index("-c") + 1].replace("/project", str(dest))
+            return real_popen(["sh", "-c", script], **kwargs)
+
+        with patch("cub.core.sandbox.docker.subprocess.Popen", side_effect=local_popen):
+            DockerProvider()._seed_delta("v", project, TreeDelta(changed=[], deleted=deleted))
+
+        assert not any((dest / path).exists() for path in deleted[:3])
+
+    @patch.object(DockerProvider, "_seed_delta", side_effect=OSError(7, "Argument list too long"))
+    def test_falls_back_to_copy_when_seeding_cannot_run(
+        self, mock_seed: MagicMock, tmp_path: Path
+    ) -> None:
+        project = _git_project(tmp_path / "proj")
+        docker = _FakeDocker()
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            sandbox_id = DockerProvider().start(project, SandboxConfig())
+
+        assert f"{sandbox_id}_upper" not in docker.volumes
+        assert docker.find(f"{sandbox_id}_work:/dest", "cp -a /source/. /dest/")
+
+    def test_old_bases_pruned_unless_in_use(self, tmp_path: Path) -> None:
+        docker = _FakeDocker()
+        docker.volumes = {
+            "cub-base-k-old": {"cub.sandbox.base-of": "k"},
+            "cub-base-k-busy": {"cub.sandbox.base-of": "k"},
+            "cub-sandbox-1_work": {"cub.sandbox.lower": "cub-base-k-busy"},
+            "cub-base-k-new": {"cub.sandbox.base-of": "k"},
+        }
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            DockerProvider().prune_bases(tmp_path, "k", keep="cub-base-k-new")
+
+        assert "cub-base-k-old" not in docker.volumes
+        assert "cub-base-k-busy" in docker.volumes
+        assert "cub-base-k-new" in docker.volumes
+
+    @patch.object(DockerProvider, "_container_exists", return_value=True)
+    @patch.object(DockerProvider, "status")
+    def test_diff_limited_to_upper_layer(
+        self, mock_status: MagicMock, mock_exists: MagicMock
+    ) -> None:
+        mock_status.return_value = MagicMock(state=SandboxState.RUNNING)
+        docker = _FakeDocker()
+        docker.volumes["cub-sandbox-1_upper"] = {}
+        docker.outputs = {"find": "./src/app.py\0./.git/index\0./notes.txt\0"}
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            DockerProvider().diff("cub-sandbox-1")
+
+        (exec_call,) = docker.find("exec", "-i")
+        assert exec_call[-1] == "xargs -0 -r git diff HEAD --"
+        assert docker.inputs[docker.calls.index(exec_call)] == "src/app.py\0notes.txt\0"
+
+    @patch.object(DockerProvider, "_container_exists", return_value=True)
+    def test_diff_empty_upper_layer(self, mock_exists: MagicMock) -> None:
+        docker = _FakeDocker()
+        docker.volumes["cub-sandbox-1_upper"] = {}
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            assert DockerProvider().diff("cub-sandbox-1") == ""
+
+        assert not docker.find("git")
+
+    @patch.object(DockerProvider, "_container_exists", return_value=True)
+    def test_export_copies_from_upper_in_one_container(
+        self, mock_exists: MagicMock, tmp_path: Path
+    ) -> None:
+        docker = _FakeDocker()
+        docker.volumes["cub-sandbox-1_upper"] = {}
+        docker.outputs = {
+            "find": "./src/app.py\0./build.log\0",
+            "--name-only": "src/app.py\0",
+        }
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            DockerProvider().export("cub-sandbox-1", tmp_path / "out")
+
+        copies = docker.find("cub-sandbox-1_upper:/upper:ro", "sh")
+        assert len(copies) == 1
+        assert docker.inputs[docker.calls.index(copies[0])] == "src/app.py\0"
+        assert not docker.find("cub-sandbox-1_work:/project:ro")
+
+    @patch.object(DockerProvider, "_container_exists", return_value=True)
+    def test_export_passes_upper_paths_on_stdin(
+        self, mock_exists: MagicMock, tmp_path: Path
+    ) -> None:
+        # A build inside the sandbox wrote more files than fit in argv,
+        # some with names that only survive NUL separation
+        written = [f"node_modules/pkg{i}/index.js" for i in range(20000)]
+        written += [" leading.txt", "trailing.txt ", "new\nline.txt"]
+        docker = _FakeDocker()
+        docker.volumes["cub-sandbox-1_upper"] = {}
+        docker.outputs = {
+            "find": "".join(f"./{path}\0" for path in written),
+            "--name-only": " leading.txt\0new\nline.txt\0",
+        }
+
+        with patch.object(DockerProvider, "run_docker", side_effect=docker):
+            DockerProvider().export("cub-sandbox-1", tmp_path / "out")
+
+        (names,) = docker.find("alpine/git")
+        assert docker.inputs[docker.calls.index(names)] == "".join(f"{p}\0" for p in written)
+        (copy,) = docker.find("cub-sandbox-1_upper:/upper:ro", "sh")
+        assert docker.inputs[docker.calls.index(copy)] == " leading.txt\0new\nline.txt\0"
+        assert all(len(call) < 20 for call in docker.calls)
+
+
 class TestDockerProviderStop:
     """Test sandbox stop functionality."""
 
     @patch.object(DockerProvider, "_container_exists")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_stop_running_container(
         self,
         mock_run: MagicMock,
@@ -240,7 +521,7 @@ class TestDockerProviderStatus:
     """Test sandbox status functionality."""
 
     @patch.object(DockerProvider, "_container_exists")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     @patch.object(DockerProvider, "_get_resource_usage")
     def test_status_running_container(
         self,
@@ -271,7 +552,7 @@ class TestDockerProviderStatus:
         assert status.started_at is not None
 
     @patch.object(DockerProvider, "_container_exists")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_status_stopped_container(
         self,
         mock_run: MagicMock,
@@ -298,7 +579,7 @@ class TestDockerProviderStatus:
         assert status.stopped_at is not None
 
     @patch.object(DockerProvider, "_container_exists")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_status_oom_killed(
         self,
         mock_run: MagicMock,
@@ -340,7 +621,7 @@ class TestDockerProviderLogs:
     """Test sandbox logs functionality."""
 
     @patch.object(DockerProvider, "_container_exists")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_logs_returns_output(
         self,
         mock_run: MagicMock,
@@ -377,7 +658,7 @@ class TestDockerProviderDiff:
 
     @patch.object(DockerProvider, "_container_exists")
     @patch.object(DockerProvider, "status")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_diff_running_container(
         self,
         mock_run: MagicMock,
@@ -400,7 +681,7 @@ class TestDockerProviderDiff:
 
     @patch.object(DockerProvider, "_container_exists")
     @patch.object(DockerProvider, "status")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_diff_stopped_container(
         self,
         mock_run: MagicMock,
@@ -428,7 +709,7 @@ class TestDockerProviderExport:
     """Test sandbox export functionality."""
 
     @patch.object(DockerProvider, "_container_exists")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_export_changed_files(
         self,
         mock_run: MagicMock,
@@ -437,8 +718,10 @@ class TestDockerProviderExport:
     ) -> None:
         """Test exporting changed files only."""
         mock_exists.return_value = True
-        # First call: get changed files, second: copy file
+        # First call: check for an upper layer (none: full-copy sandbox),
+        # then get changed files, then copy each file
         mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=""),
             MagicMock(returncode=0, stdout="src/main.py\nREADME.md\n"),
             MagicMock(returncode=0),  # copy src/main.py
             MagicMock(returncode=0),  # copy README.md
@@ -452,7 +735,7 @@ class TestDockerProviderExport:
         assert dest.exists()
 
     @patch.object(DockerProvider, "_container_exists")
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_export_all_files(
         self,
         mock_run: MagicMock,
@@ -490,7 +773,7 @@ class TestDockerProviderCleanup:
 
     @patch.object(DockerProvider, "_container_exists")
     @patch.object(DockerProvider, "_volume_exists")
-    @patch.object(DockerProvider, "_cleanup_resources")
+    @patch.object(DockerProvider, "cleanup_resources")
     def test_cleanup_removes_resources(
         self,
         mock_cleanup: MagicMock,
@@ -529,7 +812,7 @@ class TestDockerProviderCleanup:
 class TestDockerProviderVersion:
     """Test version retrieval."""
 
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_get_version(self, mock_run: MagicMock) -> None:
         """Test getting Docker version."""
         mock_run.return_value = MagicMock(
@@ -542,7 +825,7 @@ class TestDockerProviderVersion:
 
         assert version == "24.0.7"
 
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_get_version_failure(self, mock_run: MagicMock) -> None:
         """Test get_version returns unknown on failure."""
         mock_run.side_effect = subprocess.CalledProcessError(1, "docker")
@@ -575,7 +858,7 @@ class TestDockerProviderHelpers:
         ts = provider._parse_docker_timestamp("")
         assert ts is None
 
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_container_exists(self, mock_run: MagicMock) -> None:
         """Test container existence check."""
         mock_run.return_value = MagicMock(
@@ -586,7 +869,7 @@ class TestDockerProviderHelpers:
         provider = DockerProvider()
         assert provider._container_exists("cub-sandbox-123") is True
 
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_container_not_exists(self, mock_run: MagicMock) -> None:
         """Test container non-existence check."""
         mock_run.return_value = MagicMock(
@@ -597,7 +880,7 @@ class TestDockerProviderHelpers:
         provider = DockerProvider()
         assert provider._container_exists("nonexistent") is False
 
-    @patch.object(DockerProvider, "_run_docker")
+    @patch.object(DockerProvider, "run_docker")
     def test_get_resource_usage(self, mock_run: MagicMock) -> None:
         """Test getting resource usage."""
         mock_run.return_value = MagicMock(
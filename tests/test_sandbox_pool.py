@@ -0,0 +1,353 @@
+"""Tests for the warm Docker sandbox container pool."""
+
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cub.core.sandbox import SandboxConfig, SandboxState
+from cub.core.sandbox.docker import LOWER_LABEL, DockerProvider
+from cub.core.sandbox.pool import (
+    CLAIM_MARKER,
+    COMMIT_LABEL,
+    IDLE_COMMAND,
+    IDLE_MARKER,
+    POOL_LABEL,
+    RESET_SCRIPT,
+    SandboxPool,
+    pool_id,
+)
+
+
+class _FakeDocker:
+    """Stand-in for run_docker that tracks containers and volumes."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.volumes: dict[str, dict[str, str]] = {}
+        self.containers: dict[str, dict[str, str]] = {}
+        self.stopped: set[str] = set()
+
+    def __call__(self, args: list[str], check: bool = True) -> MagicMock:
+        self.calls.append(args)
+        labels = dict(args[i + 1].split("=", 1) for i, a in enumerate(args) if a == "--label")
+        returncode = 0
+        stdout = ""
+        if args[:2] == ["volume", "create"]:
+            self.volumes[args[-1]] = labels
+        elif args[:2] == ["volume", "rm"]:
+            self.volumes.pop(args[-1], None)
+        elif args[:2] == ["volume", "ls"]:
+            flt = args[args.index("--filter") + 1]
+            if flt.startswith("label="):
+                key, value = flt.removeprefix("label=").split("=", 1)
+                names = [n for n, vol in self.volumes.items() if vol.get(key) == value]
+            else:
+                name = flt.removeprefix("name=^").removesuffix("$")
+                names = [name] if name in self.volumes else []
+            stdout = "\n".join(names)
+        elif args[0] == "run" and "--detach" in args:
+            self.containers[args[args.index("--name") + 1]] = labels
+        elif args[0] == "rename":
+            old, new = args[1], args[2]
+            if old in self.containers and new not in self.containers:
+                self.containers[new] = self.containers.pop(old)
+            else:
+                returncode = 1
+        elif args[0] == "exec":
+            if args[3] not in self.containers or args[3] in self.stopped:
+                returncode = 1
+        elif args[:2] == ["rm", "-f"]:
+            self.containers.pop(args[2], None)
+        elif args[0] == "ps":
+            stdout = "\n".join(
+                f"{name}\t{labels[POOL_LABEL]}\t{labels[COMMIT_LABEL]}\t"
+                + ("exited" if name in self.stopped else "running")
+                for name, labels in self.containers.items()
+            )
+        if check and returncode:
+            raise subprocess.CalledProcessError(returncode, args, "", "failed")
+        return MagicMock(returncode=returncode, stdout=stdout, stderr="")
+
+    def find(self, *words: str) -> list[list[str]]:
+        return [c for c in self.calls if all(w in c for w in words)]
+
+    def idle(self) -> list[str]:
+        return [n for n in self.containers if IDLE_MARKER in n]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _commit(path: Path, message: str = "init") -> None:
+    subprocess.run(["git", "-C", str(path), "add", "-A"], check=True)
+    subprocess.run(
+        ["git", "-C", str(path), "-c", "user.name=t", "-c", "user.email=t@t"]
+        + ["commit", "-qm", message],
+        check=True,
+    )
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    path = tmp_path / "proj"
+    path.mkdir()
+    (path / "main.py").write_text("print('hi')\n")
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    _commit(path)
+    return path
+
+
+@pytest.fixture
+def docker() -> Iterator[_FakeDocker]:
+    fake = _FakeDocker()
+    with patch.object(DockerProvider, "run_docker", side_effect=fake):
+        yield fake
+
+
+@pytest.fixture
+def seed() -> Iterator[MagicMock]:
+    with patch.object(DockerProvider, "stream_delta") as mock:
+        yield mock
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def pool(clock: _Clock) -> SandboxPool:
+    return SandboxPool(DockerProvider(), max_size=2, idle_ttl=60, clock=clock)
+
+
+class TestAcquire:
+    """Tests for handing out pooled containers."""
+
+    def test_first_acquire_starts_container_with_limits(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        config = SandboxConfig(memory="2g", cpus=1.0, network=False)
+
+        sandbox_id = pool.acquire(project, config)
+
+        assert sandbox_id is not None
+        (run,) = docker.find("run", "--detach")
+        assert run[run.index("--name") + 1] == sandbox_id
+        assert run[-len(IDLE_COMMAND) :] == IDLE_COMMAND
+        assert run[run.index("--memory") + 1] == "2g"
+        assert "--cpus=1.0" in run
+        assert run[run.index("--network") + 1] == "none"
+        base = next(n for n in docker.volumes if n.startswith("cub-base-"))
+        assert f"{base}:/base:ro" in run
+        assert CLAIM_MARKER in sandbox_id
+        assert f"{pool_id(sandbox_id)}_work:/project" in run
+        assert docker.volumes[f"{pool_id(sandbox_id)}_work"][LOWER_LABEL] == base
+        # Work volume filled from the base before use
+        assert docker.find("exec", sandbox_id, RESET_SCRIPT)
+        # Nothing changed since the base was taken
+        seed.assert_not_called()
+
+    def test_released_container_is_reused(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        config = SandboxConfig()
+        first = pool.acquire(project, config)
+        assert first is not None
+        assert pool.release(first)
+        assert docker.idle() == [f"{pool_id(first)}{IDLE_MARKER}1000"]
+
+        second = pool.acquire(project, config)
+
+        assert second is not None
+        assert pool_id(second) == pool_id(first)
+        assert len(docker.find("run", "--detach")) == 1
+        assert docker.idle() == []
+
+    def test_changed_files_seeded_by_exec(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        pool.acquire(project, SandboxConfig())
+        (project / "main.py").write_text("print('changed')\n")
+
+        sandbox_id = pool.acquire(project, SandboxConfig())
+
+        prefix, _, delta = seed.call_args.args
+        assert prefix == ["docker", "exec", "-i", "-u", "0", sandbox_id]
+        assert delta.changed == ["main.py"]
+
+    def test_different_config_gets_its_own_container(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        first = pool.acquire(project, SandboxConfig())
+        assert first is not None
+        pool.release(first)
+
+        second = pool.acquire(project, SandboxConfig(memory="8g"))
+
+        assert second is not None
+        assert pool_id(second) != pool_id(first)
+        assert len(docker.find("run", "--detach")) == 2
+
+    def test_lost_claim_race_starts_another(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        first = pool.acquire(project, SandboxConfig())
+        assert first is not None
+        pool.release(first)
+        original = docker.__call__
+
+        def racing(args: list[str], check: bool = True) -> MagicMock:
+            if args[0] == "rename" and IDLE_MARKER in args[1]:
+                # Another process claims it between listing and renaming
+                claimed = f"{pool_id(first)}{CLAIM_MARKER}1-1000"
+                docker.containers[claimed] = docker.containers.pop(args[1])
+            return original(args, check)
+
+        with patch.object(DockerProvider, "run_docker", side_effect=racing):
+            second = pool.acquire(project, SandboxConfig())
+
+        assert second is not None
+        assert pool_id(second) != pool_id(first)
+
+    def test_project_without_commit_not_pooled(
+        self, tmp_path: Path, docker: _FakeDocker, pool: SandboxPool
+    ) -> None:
+        assert pool.acquire(tmp_path, SandboxConfig()) is None
+        assert docker.calls == []
+
+    def test_full_pool_of_busy_containers(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        assert pool.acquire(project, SandboxConfig()) is not None
+        assert pool.acquire(project, SandboxConfig()) is not None
+
+        assert pool.acquire(project, SandboxConfig()) is None
+        assert len(docker.find("run", "--detach")) == 2
+
+    def test_full_pool_evicts_longest_idle(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool, clock: _Clock
+    ) -> None:
+        old = pool.acquire(project, SandboxConfig(memory="1g"))
+        newer = pool.acquire(project, SandboxConfig(memory="2g"))
+        assert old is not None and newer is not None
+        pool.release(old)
+        clock.now += 10
+        pool.release(newer)
+
+        sandbox_id = pool.acquire(project, SandboxConfig(memory="3g"))
+
+        assert sandbox_id is not None
+        assert set(docker.containers) == {sandbox_id, f"{pool_id(newer)}{IDLE_MARKER}1010"}
+        assert f"{pool_id(old)}_work" not in docker.volumes
+
+
+class TestReleaseAndPrune:
+    """Tests for returning containers and enforcing the idle TTL."""
+
+    def test_stopped_container_is_removed(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        sandbox_id = pool.acquire(project, SandboxConfig())
+        assert sandbox_id is not None
+        docker.stopped.add(sandbox_id)
+
+        assert not pool.release(sandbox_id)
+        assert docker.containers == {}
+        assert f"{pool_id(sandbox_id)}_work" not in docker.volumes
+
+    def test_idle_ttl(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool, clock: _Clock
+    ) -> None:
+        sandbox_id = pool.acquire(project, SandboxConfig())
+        assert sandbox_id is not None
+        pool.release(sandbox_id)
+
+        clock.now += 60
+        assert pool.prune() == 0
+        clock.now += 1
+        assert pool.prune() == 1
+        assert docker.containers == {}
+
+    def test_containers_in_use_not_pruned(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool, clock: _Clock
+    ) -> None:
+        sandbox_id = pool.acquire(project, SandboxConfig())
+        clock.now += 3600
+
+        assert pool.prune() == 0
+        assert sandbox_id in docker.containers
+
+    def test_abandoned_claims_are_pruned(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool, clock: _Clock
+    ) -> None:
+        # Two runs that never released their containers: one whose process
+        # died, and one claimed by a live process longer ago than the TTL
+        crashed = pool.acquire(project, SandboxConfig())
+        stuck = pool.acquire(project, SandboxConfig())
+        assert crashed is not None and stuck is not None
+        exited = subprocess.Popen(["true"])
+        exited.wait()
+        dead_name = f"{pool_id(crashed)}{CLAIM_MARKER}{exited.pid}-1000"
+        docker.containers[dead_name] = docker.containers.pop(crashed)
+
+        # The pool is full, but the dead process's container makes room
+        sandbox_id = pool.acquire(project, SandboxConfig())
+        assert sandbox_id is not None
+        assert set(docker.containers) == {stuck, sandbox_id}
+        assert f"{pool_id(crashed)}_work" not in docker.volumes
+
+        clock.now += pool.claim_ttl + 1
+        assert pool.prune() == 2
+        assert docker.containers == {}
+
+    def test_new_commit_retires_idle_containers(
+        self, project: Path, docker: _FakeDocker, seed: MagicMock, pool: SandboxPool
+    ) -> None:
+        first = pool.acquire(project, SandboxConfig())
+        assert first is not None
+        pool.release(first)
+        (project / "main.py").write_text("print('v2')\n")
+        _commit(project, "v2")
+
+        second = pool.acquire(project, SandboxConfig())
+
+        assert second is not None
+        assert pool_id(second) != pool_id(first)
+        assert set(docker.containers) == {second}
+        # The old commit's base went with its last container
+        assert len([n for n in docker.volumes if n.startswith("cub-base-")]) == 1
+
+
+class TestRun:
+    """Tests for running cub in a pooled container."""
+
+    def test_run_streams_output_and_exit_code(self, pool: SandboxPool) -> None:
+        process = MagicMock()
+        process.stdout = iter(["line 1\n", "line 2\n"])
+        process.wait.return_value = 3
+        lines: list[str] = []
+
+        with patch("cub.core.sandbox.pool.subprocess.Popen", return_value=process) as popen:
+            status = pool.run(
+                "cub-pool-abc-1", SandboxConfig(cub_args=["--once"]), callback=lines.append
+            )
+
+        assert popen.call_args.args[0] == [
+            "docker",
+            "exec",
+            "cub-pool-abc-1",
+            "cub",
+            "run",
+            "--once",
+        ]
+        assert lines == ["line 1\n", "line 2\n"]
+        assert status.state == SandboxState.STOPPED
+        assert status.exit_code == 3
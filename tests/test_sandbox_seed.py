@@ -0,0 +1,133 @@
+"""Tests for copy-on-write sandbox seeding helpers."""
+
+import os
+import subprocess
+from pathlib import Path
+
+from cub.core.sandbox.seed import (
+    TreeDelta,
+    diff_trees,
+    head_commit,
+    load_manifest,
+    manifest_path,
+    project_key,
+    save_manifest,
+    snapshot_tree,
+)
+
+
+class TestSnapshotAndDiff:
+    """Tests for manifests and tree deltas."""
+
+    def test_snapshot_records_files_with_posix_paths(self, tmp_path: Path) -> None:
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+        (tmp_path / "README.md").write_text("hi")
+
+        manifest = snapshot_tree(tmp_path)
+
+        assert set(manifest) == {"README.md", "src/pkg/mod.py"}
+        assert manifest["README.md"][0] == 2
+
+    def test_manifest_directory_skipped(self, tmp_path: Path) -> None:
+        save_manifest(manifest_path(tmp_path, "base"), {})
+        (tmp_path / ".cub" / "config.json").write_text("{}")
+
+        assert set(snapshot_tree(tmp_path)) == {".cub/config.json"}
+
+    def test_directory_symlink_recorded_not_followed(self, tmp_path: Path) -> None:
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "f.txt").write_text("data")
+        os.symlink(tmp_path / "real", tmp_path / "link")
+
+        manifest = snapshot_tree(tmp_path)
+
+        assert "link" in manifest
+        assert "link/f.txt" not in manifest
+
+    def test_unchanged_tree_has_empty_delta(self, tmp_path: Path) -> None:
+        (tmp_path / "a.txt").write_text("a")
+        base = snapshot_tree(tmp_path)
+
+        delta = diff_trees(base, snapshot_tree(tmp_path))
+
+        assert delta == TreeDelta([], [])
+        assert not delta
+
+    def test_delta_lists_changed_new_and_deleted(self, tmp_path: Path) -> None:
+        (tmp_path / "keep.txt").write_text("keep")
+        (tmp_path / "edit.txt").write_text("old")
+        (tmp_path / "gone.txt").write_text("bye")
+        base = snapshot_tree(tmp_path)
+
+        (tmp_path / "edit.txt").write_text("new content")
+        (tmp_path / "gone.txt").unlink()
+        (tmp_path / "new.txt").write_text("hello")
+
+        delta = diff_trees(base, snapshot_tree(tmp_path))
+
+        assert delta.changed == ["edit.txt", "new.txt"]
+        assert delta.deleted == ["gone.txt"]
+
+    def test_touch_without_content_change_counts_as_changed(self, tmp_path: Path) -> None:
+        (tmp_path / "f.txt").write_text("same")
+        base = snapshot_tree(tmp_path)
+        st = (tmp_path / "f.txt").stat()
+        os.utime(tmp_path / "f.txt", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert diff_trees(base, snapshot_tree(tmp_path)).changed == ["f.txt"]
+
+
+class TestManifestStorage:
+    """Tests for manifest persistence."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = manifest_path(tmp_path, "cub-base-abc-123")
+        save_manifest(path, {"a.txt": (1, 2), "b/c.txt": (3, 4)})
+
+        assert path.parent == tmp_path / ".cub" / "cache" / "sandbox"
+        assert load_manifest(path) == {"a.txt": (1, 2), "b/c.txt": (3, 4)}
+
+    def test_missing_or_corrupt_manifest(self, tmp_path: Path) -> None:
+        path = tmp_path / "m.json"
+        assert load_manifest(path) is None
+        path.write_text("not json")
+        assert load_manifest(path) is None
+        path.write_text('{"a": [1]}')
+        assert load_manifest(path) is None
+
+
+class TestProjectIdentity:
+    """Tests for project key and commit lookup."""
+
+    def test_project_key_is_stable(self, tmp_path: Path) -> None:
+        assert project_key(tmp_path) == project_key(tmp_path / ".")
+        assert len(project_key(tmp_path)) == 12
+
+    def test_head_commit_outside_git(self, tmp_path: Path) -> None:
+        assert head_commit(tmp_path) is None
+
+    def test_head_commit_in_repo(self, tmp_path: Path) -> None:
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "f.txt").write_text("x")
+        subprocess.run(["git", "-C", str(tmp_path), "add", "f.txt"], check=True)
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                str(tmp_path),
+                "-c",
+                "user.name=t",
+                "-c",
+                "user.email=t@t",
+                "commit",
+                "-qm",
+                "init",
+            ],
+            check=True,
+        )
+
+        commit = head_commit(tmp_path)
+
+        assert commit is not None
+        assert len(commit) == 40
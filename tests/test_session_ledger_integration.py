@@ -10,6 +10,7 @@ from cub.core.ledger.models import LedgerEntry
 from cub.core.ledger.session_integration import (
     SessionLedgerIntegration,
     SessionState,
+    checkpoint_path,
 )
 from cub.core.ledger.writer import LedgerWriter
 from cub.core.tasks.models import Task, TaskPriority, TaskStatus, TaskType
@@ -742,6 +743,139 @@ class TestGetSessionState:
         assert state is None
 
 
+class TestReduceForensics:
+    """Tests for the checkpointed reduce_forensics method."""
+
+    SESSION_EVENTS = [
+        {
+            "event_type": "session_start",
+            "timestamp": "2026-01-28T10:00:00+00:00",
+            "session_id": "claude-123",
+        },
+        {
+            "event_type": "task_claim",
+            "timestamp": "2026-01-28T10:05:00+00:00",
+            "task_id": "cub-abc.1",
+        },
+        {
+            "event_type": "file_write",
+            "timestamp": "2026-01-28T10:10:00+00:00",
+            "file_path": "plans/x/plan.md",
+            "file_category": "plan",
+        },
+    ]
+
+    def append(self, forensics_path: Path, *events: dict) -> None:
+        with forensics_path.open("a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+
+    def test_matches_full_read(
+        self,
+        integration: SessionLedgerIntegration,
+        forensics_dir: Path,
+    ) -> None:
+        """Incremental reduction gives the same state as a full read."""
+        forensics_path = forensics_dir / "test.jsonl"
+        for event in self.SESSION_EVENTS:
+            self.append(forensics_path, event)
+            integration.reduce_forensics(forensics_path)
+
+        reduced = integration.reduce_forensics(forensics_path)
+        assert reduced.to_dict() == integration.read_forensics(forensics_path).to_dict()
+        assert reduced.started_at == datetime(2026, 1, 28, 10, 0, tzinfo=timezone.utc)
+        assert reduced.plan_files == ["plans/x/plan.md"]
+
+    def test_only_new_events_processed(
+        self,
+        integration: SessionLedgerIntegration,
+        forensics_dir: Path,
+    ) -> None:
+        """Events already covered by the checkpoint are not processed again."""
+        forensics_path = forensics_dir / "test.jsonl"
+        write_forensics(forensics_path, self.SESSION_EVENTS)
+        integration.reduce_forensics(forensics_path)
+        assert checkpoint_path(forensics_path).exists()
+
+        self.append(
+            forensics_path,
+            {"event_type": "session_end", "timestamp": "2026-01-28T11:00:00+00:00"},
+        )
+        processed: list[str] = []
+        original = integration._process_event
+
+        def record(state: SessionState, event: dict) -> None:
+            processed.append(event["event_type"])
+            original(state, event)
+
+        integration._process_event = record  # type: ignore[method-assign]
+        state = integration.reduce_forensics(forensics_path)
+
+        assert processed == ["session_end"]
+        assert state.task_id == "cub-abc.1"
+        assert state.duration_seconds == 3600
+
+    def test_partial_last_line_not_checkpointed(
+        self,
+        integration: SessionLedgerIntegration,
+        forensics_dir: Path,
+    ) -> None:
+        """A line still being written is read again once it is complete."""
+        forensics_path = forensics_dir / "test.jsonl"
+        write_forensics(forensics_path, self.SESSION_EVENTS[:1])
+        line = json.dumps(self.SESSION_EVENTS[1])
+        with forensics_path.open("a", encoding="utf-8") as f:
+            f.write(line[:10])
+
+        assert integration.reduce_forensics(forensics_path).task_id is None
+
+        with forensics_path.open("a", encoding="utf-8") as f:
+            f.write(line[10:] + "\n")
+        assert integration.reduce_forensics(forensics_path).task_id == "cub-abc.1"
+
+    def test_rewritten_log_invalidates_checkpoint(
+        self,
+        integration: SessionLedgerIntegration,
+        forensics_dir: Path,
+    ) -> None:
+        """A checkpoint for a different log is ignored."""
+        forensics_path = forensics_dir / "test.jsonl"
+        write_forensics(forensics_path, self.SESSION_EVENTS)
+        integration.reduce_forensics(forensics_path)
+
+        other_session = [dict(event, session_id="claude-456") for event in self.SESSION_EVENTS]
+        write_forensics(forensics_path, other_session)
+        assert integration.reduce_forensics(forensics_path).session_id == "claude-456"
+
+        write_forensics(forensics_path, self.SESSION_EVENTS[:1])
+        assert integration.reduce_forensics(forensics_path).task_id is None
+
+    def test_corrupt_checkpoint_falls_back_to_full_read(
+        self,
+        integration: SessionLedgerIntegration,
+        forensics_dir: Path,
+    ) -> None:
+        """An unreadable checkpoint is rebuilt from the log."""
+        forensics_path = forensics_dir / "test.jsonl"
+        write_forensics(forensics_path, self.SESSION_EVENTS)
+        checkpoint_path(forensics_path).write_text("{not json")
+
+        state = integration.reduce_forensics(forensics_path)
+        assert state.task_id == "cub-abc.1"
+        assert json.loads(checkpoint_path(forensics_path).read_text())["offset"] == (
+            forensics_path.stat().st_size
+        )
+
+    def test_nonexistent_file(
+        self,
+        integration: SessionLedgerIntegration,
+        forensics_dir: Path,
+    ) -> None:
+        """Missing forensics raise FileNotFoundError, like read_forensics."""
+        with pytest.raises(FileNotFoundError):
+            integration.reduce_forensics(forensics_dir / "nonexistent.jsonl")
+
+
 class TestFullWorkflow:
     """Test complete session workflows."""
 
@@ -1,5 +1,8 @@
 """Tests for run session manager."""
 
+import os
+import subprocess
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from collections.abc import Iterator
@@ -7,6 +10,7 @@ from unittest.mock import patch
 
 import pytest
 
+from cub.core.filelock import file_lock
 from cub.core.session.manager import RunSessionError, RunSessionManager
 from cub.core.session.models import RunSession, SessionBudget, SessionStatus
 
@@ -354,3 +358,200 @@ def test_multiple_sessions_in_sequence(manager: RunSessionManager) -> None:
     completed = manager._read_session_file(session1.run_id)
     assert completed.status == SessionStatus.COMPLETED
     assert completed.tasks_completed == 5
+
+
+def _write_session(manager: RunSessionManager, session: RunSession) -> None:
+    """Write a session file directly, bypassing the index."""
+    manager.sessions_dir.mkdir(parents=True, exist_ok=True)
+    path = manager.sessions_dir / f"{session.run_id}.json"
+    path.write_text(session.model_dump_json())
+
+
+def test_session_index_tracks_lifecycle(manager: RunSessionManager) -> None:
+    """Test the index follows start, update and end."""
+    session = manager.start_session("claude")
+
+    (entry,) = manager.list_sessions()
+    assert entry.run_id == session.run_id
+    assert entry.status == SessionStatus.RUNNING
+    assert entry.pid == os.getpid()
+
+    manager.end_session(session.run_id)
+    (ended,) = manager.list_sessions()
+    assert ended.status == SessionStatus.COMPLETED
+    assert ended.ended_at is not None
+    assert manager.list_sessions(SessionStatus.RUNNING) == []
+
+
+def test_session_index_rebuilt_from_files(manager: RunSessionManager, tmp_path: Path) -> None:
+    """Test sessions written before the index existed are picked up."""
+    legacy = RunSession(run_id="cub-20250101-000000", project_dir=tmp_path, harness="claude")
+    _write_session(manager, legacy)
+
+    (entry,) = manager.list_sessions()
+
+    assert entry.run_id == legacy.run_id
+    assert entry.pid is None
+    assert manager.index.path.exists()
+
+
+def test_session_index_concurrent_upserts_keep_every_entry(
+    manager: RunSessionManager, tmp_path: Path
+) -> None:
+    """Test updates from several processes (here, threads) aren't lost."""
+    from cub.core.session.index import SessionIndex
+
+    def write_sessions(worker: int) -> None:
+        index = SessionIndex(manager.sessions_dir)
+        for i in range(10):
+            session = RunSession(
+                run_id=f"cub-20260127-{worker}000{i:02d}", project_dir=tmp_path, harness="claude"
+            )
+            _write_session(manager, session)
+            index.upsert(session)
+
+    threads = [threading.Thread(target=write_sessions, args=(w,)) for w in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    entries = manager.index.load()
+    assert entries is not None
+    assert len(entries) == 60
+
+
+def test_session_index_dropped_when_lock_unavailable(
+    manager: RunSessionManager, tmp_path: Path
+) -> None:
+    """Test an update that can't lock the index leaves it to be rebuilt."""
+    first = manager.start_session("claude")
+    second = RunSession(run_id="cub-20260127-999999", project_dir=tmp_path, harness="claude")
+    _write_session(manager, second)
+
+    with file_lock(manager.index.lock_path) as locked:
+        assert locked
+        with patch("cub.core.session.index.LOCK_WAIT_SECONDS", 0.05):
+            manager.index.upsert(second)
+
+    assert not manager.index.path.exists()
+    assert {e.run_id for e in manager.list_sessions()} == {first.run_id, second.run_id}
+    assert manager.index.path.exists()
+
+
+def test_detect_orphans_dead_pid(manager: RunSessionManager) -> None:
+    """Test an active session whose process exited is orphaned."""
+    session = manager.start_session("claude")
+
+    with patch("cub.core.session.manager.alive_pids", return_value=set()):
+        orphans = manager.detect_orphans()
+
+    assert [o.run_id for o in orphans] == [session.run_id]
+    assert "no longer running" in (orphans[0].orphaned_reason or "")
+    assert manager.get_active_session() is None
+
+
+def test_detect_orphans_reused_pid(manager: RunSessionManager, tmp_path: Path) -> None:
+    """Test a session whose pid now belongs to a newer process is orphaned."""
+    other = RunSession(
+        run_id="cub-20260127-999999",
+        project_dir=tmp_path,
+        harness="claude",
+        pid=os.getpid() + 1,
+        pid_start_time=100,
+    )
+    _write_session(manager, other)
+    manager.index.upsert(other)
+    current = manager.start_session("claude")
+
+    with (
+        patch("cub.core.session.manager.alive_pids", return_value={os.getpid(), os.getpid() + 1}),
+        patch(
+            "cub.core.session.manager.process_start_time",
+            side_effect=lambda pid: current.pid_start_time if pid == os.getpid() else 200,
+        ),
+    ):
+        orphans = manager.detect_orphans()
+
+    assert [o.run_id for o in orphans] == [other.run_id]
+    assert "pid reused" in (orphans[0].orphaned_reason or "")
+
+
+@pytest.mark.skipif(not Path("/proc/self/stat").exists(), reason="needs /proc")
+def test_process_start_time() -> None:
+    """Test start times are read from /proc and differ between processes."""
+    from cub.core.session.index import process_start_time
+
+    child = subprocess.Popen(["sleep", "5"])
+    try:
+        assert process_start_time(os.getpid()) is not None
+        assert process_start_time(os.getpid()) == process_start_time(os.getpid())
+        assert process_start_time(child.pid) not in (None, process_start_time(os.getpid()))
+    finally:
+        child.kill()
+        child.wait()
+    assert process_start_time(child.pid) is None
+
+
+def test_detect_orphans_keeps_other_live_process(
+    manager: RunSessionManager, tmp_path: Path
+) -> None:
+    """Test a running session owned by another live process is left alone."""
+    other = RunSession(
+        run_id="cub-20260127-999999",
+        project_dir=tmp_path,
+        harness="claude",
+        pid=os.getpid() + 1,
+    )
+    _write_session(manager, other)
+    manager.index.upsert(other)
+    manager.start_session("claude")
+
+    with patch("cub.core.session.manager.alive_pids", return_value={os.getpid(), os.getpid() + 1}):
+        orphans = manager.detect_orphans()
+
+    assert orphans == []
+
+
+def test_detect_orphans_drops_missing_files(manager: RunSessionManager) -> None:
+    """Test index entries without a session file are forgotten."""
+    session = manager.start_session("claude")
+    manager.start_session("claude")
+    (manager.sessions_dir / f"{session.run_id}.json").unlink()
+
+    assert manager.detect_orphans() == []
+    assert session.run_id not in {e.run_id for e in manager.list_sessions()}
+
+
+def test_archive_sessions(manager: RunSessionManager, tmp_path: Path) -> None:
+    """Test old finished sessions move into the compressed archive."""
+    old = RunSession(
+        run_id="cub-20250101-000000",
+        started_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        project_dir=tmp_path,
+        harness="claude",
+    )
+    old.mark_completed()
+    old.ended_at = datetime(2025, 1, 1, 1, tzinfo=timezone.utc)
+    _write_session(manager, old)
+    running = manager.start_session("claude")
+
+    assert manager.archive_sessions(max_age_days=30) == 1
+
+    assert not (manager.sessions_dir / f"{old.run_id}.json").exists()
+    assert [e.run_id for e in manager.list_sessions()] == [running.run_id]
+    archived = manager.iter_archived_sessions()
+    assert [s.run_id for s in archived] == [old.run_id]
+    assert archived[0].tasks_completed == old.tasks_completed
+
+    # Nothing left to archive; appending again keeps earlier entries
+    assert manager.archive_sessions(max_age_days=30) == 0
+    assert len(manager.iter_archived_sessions()) == 1
+
+
+def test_alive_pids() -> None:
+    """Test batched liveness check."""
+    from cub.core.session.index import alive_pids
+
+    assert alive_pids([]) == set()
+    assert alive_pids([os.getpid(), 2**22 + 12345]) == {os.getpid()}
@@ -9,6 +9,7 @@ from datetime import datetime
 
 import pytest
 
+from cub.core.status.journal import StatusJournalReader
 from cub.core.status.models import BudgetStatus, RunArtifact, RunPhase, RunStatus
 from cub.core.status.writer import StatusWriter, get_latest_status, list_runs
 
@@ -434,6 +435,226 @@ Task Line 3"""
         assert "System 1" not in content2
 
 
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _journal_records(writer: StatusWriter) -> list[dict]:
+    return [json.loads(line) for line in writer.journal_path.read_text().splitlines()]
+
+
+def _snapshot_phase(writer: StatusWriter) -> str:
+    return json.loads(writer.status_path.read_text())["phase"]
+
+
+class TestStatusJournal:
+    """Tests for the status.jsonl journal and coalesced snapshots."""
+
+    def test_journal_records_changes_only(self, temp_dir):
+        """Test later journal records hold only changed fields and new events."""
+        writer = StatusWriter(temp_dir, "test-run-001", clock=_Clock())
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.INITIALIZING)
+        writer.write(status)
+
+        status.phase = RunPhase.RUNNING
+        status.add_event("Starting task: one", task_id="cub-001")
+        writer.write(status)
+
+        first, second = _journal_records(writer)
+        assert first["op"] == "snapshot"
+        assert first["status"]["phase"] == "initializing"
+        assert second["op"] == "update"
+        assert second["fields"]["phase"] == "running"
+        assert "run_id" not in second["fields"]
+        assert "task_entries" not in second["fields"]
+        assert [e["message"] for e in second["events"]] == ["Starting task: one"]
+
+    def test_replaced_events_sent_in_full(self, temp_dir):
+        """Test a rewritten event list is journaled as a whole."""
+        writer = StatusWriter(temp_dir, "test-run-001", clock=_Clock())
+        status = RunStatus(run_id="test-run-001")
+        status.add_event("one")
+        status.add_event("two")
+        writer.write(status)
+
+        status.events = status.events[1:]
+        writer.write(status)
+
+        update = _journal_records(writer)[-1]
+        assert "events" not in update
+        assert [e["message"] for e in update["fields"]["events"]] == ["two"]
+
+    def test_snapshots_are_coalesced(self, temp_dir):
+        """Test status.json is rewritten at most once per interval."""
+        clock = _Clock()
+        writer = StatusWriter(temp_dir, "test-run-001", snapshot_rate=1.0, clock=clock)
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.INITIALIZING)
+        writer.write(status)
+
+        clock.now = 0.5
+        status.phase = RunPhase.RUNNING
+        writer.write(status)
+
+        assert _snapshot_phase(writer) == "initializing"
+        assert len(_journal_records(writer)) == 2
+
+        writer.flush()
+        assert _snapshot_phase(writer) == "running"
+
+        clock.now = 1.6
+        status.iteration.current = 2
+        writer.write(status)
+        assert json.loads(writer.status_path.read_text())["iteration"]["current"] == 2
+
+    def test_finished_status_written_immediately(self, temp_dir):
+        """Test writes that finish the run bypass coalescing."""
+        clock = _Clock()
+        writer = StatusWriter(temp_dir, "test-run-001", snapshot_rate=1.0, clock=clock)
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.RUNNING)
+        writer.write(status)
+
+        status.mark_completed()
+        writer.write(status)
+
+        assert _snapshot_phase(writer) == "completed"
+
+    def test_deferred_snapshot_flushed_by_timer(self, temp_dir):
+        """Test a held-back snapshot is written once the interval passes."""
+        import time
+
+        writer = StatusWriter(temp_dir, "test-run-001", snapshot_rate=20.0)
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.INITIALIZING)
+        writer.write(status)
+        status.phase = RunPhase.RUNNING
+        writer.write(status)
+
+        deadline = time.monotonic() + 2.0
+        while _snapshot_phase(writer) != "running" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _snapshot_phase(writer) == "running"
+
+    def test_journal_restarted_past_limit(self, temp_dir):
+        """Test a large journal is replaced by one snapshot record."""
+        clock = _Clock()
+        writer = StatusWriter(temp_dir, "test-run-001", journal_limit=2048, clock=clock)
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.RUNNING)
+        reader = StatusJournalReader(writer.journal_path)
+        for i in range(20):
+            clock.now += 1.0
+            status.add_event(f"Event {i} " + "x" * 100)
+            writer.write(status)
+            assert reader.read() == status
+
+        records = _journal_records(writer)
+        assert records[0]["op"] == "snapshot"
+        assert len(records) < 20
+        assert StatusJournalReader(writer.journal_path).read() == status
+
+    def test_read_flushes_deferred_snapshot(self, temp_dir):
+        """Test read() sees the latest write."""
+        writer = StatusWriter(temp_dir, "test-run-001", snapshot_rate=1.0, clock=_Clock())
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.INITIALIZING)
+        writer.write(status)
+        status.phase = RunPhase.RUNNING
+        writer.write(status)
+
+        loaded = writer.read()
+
+        assert loaded is not None
+        assert loaded.phase == RunPhase.RUNNING
+
+
+class TestStatusJournalReader:
+    """Tests for tailing status.jsonl."""
+
+    def test_replays_journal(self, temp_dir):
+        """Test replaying the journal rebuilds the written status."""
+        writer = StatusWriter(temp_dir, "test-run-001", clock=_Clock())
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.RUNNING)
+        writer.write(status)
+        status.add_event("Task completed", task_id="cub-001")
+        status.budget.tasks_completed = 1
+        writer.write(status)
+
+        rebuilt = StatusJournalReader(writer.journal_path).read()
+
+        assert rebuilt == status
+
+    def test_reads_incrementally(self, temp_dir):
+        """Test later reads only consume new records."""
+        writer = StatusWriter(temp_dir, "test-run-001", clock=_Clock())
+        status = RunStatus(run_id="test-run-001", phase=RunPhase.RUNNING)
+        writer.write(status)
+        reader = StatusJournalReader(writer.journal_path)
+        first = reader.read()
+        offset = reader.offset
+
+        assert reader.read() is first
+
+        status.current_task_id = "cub-002"
+        writer.write(status)
+        second = reader.read()
+
+        assert reader.offset > offset
+        assert second is not None
+        assert second.current_task_id == "cub-002"
+
+    def test_partial_record_left_for_next_read(self, temp_dir):
+        """Test a half-written trailing line is not consumed."""
+        writer = StatusWriter(temp_dir, "test-run-001", clock=_Clock())
+        writer.write(RunStatus(run_id="test-run-001", phase=RunPhase.RUNNING))
+        line = json.dumps({"op": "update", "fields": {"phase": "completed"}})
+        with writer.journal_path.open("a") as f:
+            f.write(line[:10])
+        reader = StatusJournalReader(writer.journal_path)
+
+        assert reader.read().phase == RunPhase.RUNNING
+
+        with writer.journal_path.open("a") as f:
+            f.write(line[10:] + "\n")
+        assert reader.read().phase == RunPhase.COMPLETED
+
+    def test_truncated_journal_is_replayed(self, temp_dir):
+        """Test a journal that shrinks is read again from the start."""
+        path = temp_dir / "status.jsonl"
+        status = RunStatus(run_id="run-a", phase=RunPhase.RUNNING)
+        record = {"op": "snapshot", "status": status.model_dump(mode="json")}
+        path.write_text(json.dumps(record) + "\n" + json.dumps(record) + "\n")
+        reader = StatusJournalReader(path)
+        reader.read()
+
+        record["status"]["run_id"] = "run-b"
+        path.write_text(json.dumps(record) + "\n")
+
+        assert reader.read().run_id == "run-b"
+
+    def test_replaced_journal_is_replayed(self, temp_dir):
+        """Test a journal replaced by a longer one is read from the start."""
+        path = temp_dir / "status.jsonl"
+        status = RunStatus(run_id="run-a", phase=RunPhase.RUNNING)
+        record = {"op": "snapshot", "status": status.model_dump(mode="json")}
+        path.write_text(json.dumps(record) + "\n")
+        reader = StatusJournalReader(path)
+        reader.read()
+
+        record["status"]["run_id"] = "run-b"
+        record["status"]["current_task_id"] = "cub-001" * 10
+        replacement = temp_dir / "status.jsonl.tmp"
+        replacement.write_text(json.dumps(record) + "\n")
+        replacement.replace(path)
+
+        assert reader.read().run_id == "run-b"
+
+    def test_missing_journal(self, temp_dir):
+        """Test reading a journal that doesn't exist."""
+        assert StatusJournalReader(temp_dir / "status.jsonl").read() is None
+
+
 class TestGetLatestStatus:
     """Tests for get_latest_status function."""
 
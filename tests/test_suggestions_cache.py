@@ -0,0 +1,116 @@
+"""Tests for the suggestion source result cache."""
+
+import subprocess
+from pathlib import Path
+
+from cub.core.suggestions.cache import SuggestionCache, file_signature, git_signature
+from cub.core.suggestions.models import Suggestion, SuggestionCategory
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _suggestion(title: str) -> Suggestion:
+    return Suggestion(
+        category=SuggestionCategory.GIT,
+        title=title,
+        rationale="Because",
+        priority_score=0.7,
+        context={"branch": "feature", "recent_commits": 4},
+    )
+
+
+class TestSuggestionCache:
+    """Tests for storing and reusing source results."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = SuggestionCache(tmp_path)
+        stored = [_suggestion("Push 2 local commit(s)"), _suggestion("Commit changes")]
+
+        cache.set("GitSource", "key", stored)
+
+        assert cache.get("GitSource", "key") == stored
+        assert cache.get("LedgerSource", "key") is None
+
+    def test_key_mismatch_is_a_miss(self, tmp_path: Path) -> None:
+        cache = SuggestionCache(tmp_path)
+        cache.set("GitSource", "old", [_suggestion("Stale")])
+
+        assert cache.get("GitSource", "new") is None
+
+    def test_entries_expire(self, tmp_path: Path) -> None:
+        clock = _Clock()
+        cache = SuggestionCache(tmp_path, ttl=30, clock=clock)
+        cache.set("GitSource", "key", [])
+
+        clock.now += 30
+        assert cache.get("GitSource", "key") == []
+        clock.now += 1
+        assert cache.get("GitSource", "key") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = SuggestionCache(tmp_path)
+        (tmp_path / "GitSource.json").write_text("{not json")
+        assert cache.get("GitSource", "key") is None
+
+        (tmp_path / "GitSource.json").write_text(
+            '{"key": "key", "stored_at": 1e12, "suggestions": [{"title": ""}]}'
+        )
+        assert cache.get("GitSource", "key") is None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        cache = SuggestionCache.for_project(tmp_path)
+        cache.set("GitSource", "key", [])
+        cache.set("TaskSource", "key", [])
+
+        assert cache.cache_dir == tmp_path / ".cub" / "cache" / "suggestions"
+        assert cache.clear() == 2
+        assert cache.get("GitSource", "key") is None
+
+    def test_make_key_depends_on_parts(self) -> None:
+        assert SuggestionCache.make_key("a", "b") == SuggestionCache.make_key("a", "b")
+        assert SuggestionCache.make_key("a", "b") != SuggestionCache.make_key("ab")
+
+
+class TestSignatures:
+    """Tests for state fingerprints used as cache keys."""
+
+    def test_file_signature_tracks_writes_and_creation(self, tmp_path: Path) -> None:
+        path = tmp_path / "index.jsonl"
+        missing = file_signature([path])
+
+        path.write_text("{}\n")
+        created = file_signature([path])
+        path.write_text("{}\n{}\n")
+
+        assert len({missing, created, file_signature([path])}) == 3
+
+    def test_git_signature_outside_repo(self, tmp_path: Path) -> None:
+        assert git_signature(tmp_path) is None
+
+    def test_git_signature_changes_with_head_and_index(self, tmp_path: Path) -> None:
+        def git(*args: str) -> None:
+            subprocess.run(
+                ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+                check=True,
+                capture_output=True,
+            )
+
+        git("init", "-q")
+        (tmp_path / "a.txt").write_text("a")
+        git("add", "a.txt")
+        git("commit", "-qm", "one")
+        first = git_signature(tmp_path)
+
+        (tmp_path / "b.txt").write_text("b")
+        git("add", "b.txt")
+        staged = git_signature(tmp_path)
+        git("commit", "-qm", "two")
+
+        assert first is not None
+        assert len({first, staged, git_signature(tmp_path)}) == 3
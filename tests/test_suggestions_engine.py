@@ -6,12 +6,15 @@ sources and provides the public API.
 """
 
 import shutil
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from cub.core.suggestions.cache import SuggestionCache
 from cub.core.suggestions.engine import SuggestionEngine, WelcomeMessage
 from cub.core.suggestions.models import Suggestion, SuggestionCategory
 from cub.core.suggestions.ranking import (
@@ -547,6 +550,131 @@ class TestSuggestionEngine:
         assert result.ready_tasks == 0
 
 
+class _KeyedSource:
+    """Source with a controllable cache key that counts its calls."""
+
+    def __init__(self, title: str, key: str | None = "k1") -> None:
+        self.title = title
+        self.key = key
+        self.calls = 0
+
+    def cache_key(self) -> str | None:
+        return self.key
+
+    def get_suggestions(self) -> list[Suggestion]:
+        self.calls += 1
+        return [
+            Suggestion(
+                category=SuggestionCategory.TASK,
+                title=f"{self.title} {self.calls}",
+                rationale="Test",
+                priority_score=0.5,
+            )
+        ]
+
+
+class TestConcurrentSources:
+    """Test concurrent source collection and result memoisation."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        with (
+            patch("cub.core.suggestions.engine.TaskSource"),
+            patch("cub.core.suggestions.engine.GitSource"),
+            patch("cub.core.suggestions.engine.LedgerSource"),
+            patch("cub.core.suggestions.engine.MilestoneSource"),
+        ):
+            yield SuggestionEngine(project_dir=tmp_path, source_timeout=0.2)
+
+    def test_sources_run_concurrently(self, engine):
+        """Sources waiting on each other only finish if run at the same time."""
+        barrier = threading.Barrier(2, timeout=1)
+        sources = [Mock(), Mock()]
+        for i, source in enumerate(sources):
+            source.get_suggestions.side_effect = lambda i=i: [
+                Suggestion(
+                    category=SuggestionCategory.TASK,
+                    title=f"Source {i} after {barrier.wait()}",
+                    rationale="Test",
+                    priority_score=0.5,
+                )
+            ]
+        engine.sources = sources
+
+        result = engine.get_suggestions()
+
+        assert len(result) == 2
+
+    def test_slow_source_left_out(self, engine):
+        """A source that exceeds the timeout doesn't hold up the others."""
+        release = threading.Event()
+
+        def slow_suggestions():
+            release.wait(5)
+            return []
+
+        slow = Mock()
+        slow.get_suggestions.side_effect = slow_suggestions
+        fast = _KeyedSource("Fast", key=None)
+        engine.sources = [slow, fast]
+
+        started = time.monotonic()
+        result = engine.get_suggestions()
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert [s.title for s in result] == ["Fast 1"]
+        assert elapsed < 2
+
+    def test_results_memoised_by_key(self, engine):
+        """Unchanged sources are served from the cache."""
+        source = _KeyedSource("Keyed")
+        engine.sources = [source]
+
+        first = engine.get_suggestions()
+        second = engine.get_suggestions()
+        source.key = "k2"
+        third = engine.get_suggestions()
+
+        assert [s.title for s in first] == ["Keyed 1"]
+        assert [s.title for s in second] == ["Keyed 1"]
+        assert [s.title for s in third] == ["Keyed 2"]
+        assert source.calls == 2
+
+    def test_sources_without_key_not_cached(self, engine):
+        """Sources that can't fingerprint their state are always queried."""
+        source = _KeyedSource("Unkeyed", key=None)
+        engine.sources = [source]
+
+        engine.get_suggestions()
+        engine.get_suggestions()
+
+        assert source.calls == 2
+        assert not engine.cache.cache_dir.exists()
+
+    def test_expired_results_recomputed(self, tmp_path):
+        """Results are only reused within the cache TTL."""
+        now = [1000.0]
+        cache = SuggestionCache(tmp_path / "cache", ttl=60, clock=lambda: now[0])
+        with (
+            patch("cub.core.suggestions.engine.TaskSource"),
+            patch("cub.core.suggestions.engine.GitSource"),
+            patch("cub.core.suggestions.engine.LedgerSource"),
+            patch("cub.core.suggestions.engine.MilestoneSource"),
+        ):
+            engine = SuggestionEngine(project_dir=tmp_path, cache=cache)
+        source = _KeyedSource("Keyed")
+        engine.sources = [source]
+
+        engine.get_suggestions()
+        now[0] += 60
+        engine.get_suggestions()
+        now[0] += 1
+        engine.get_suggestions()
+
+        assert source.calls == 2
+
+
 class TestWelcomeMessage:
     """Test WelcomeMessage dataclass."""
 
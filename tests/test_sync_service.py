@@ -16,11 +16,13 @@ import json
 import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from cub.core.sync import SyncConflict, SyncResult, SyncService, SyncState, SyncStatus
 from cub.core.sync.service import GitError
+from cub.core.sync.task_index import TaskIndex
 
 
 @pytest.fixture
@@ -782,13 +784,13 @@ class TestPull:
         sync = SyncService(project_dir=local_repo)
         sync.initialize()
 
-        # Create local task with older timestamp
-        old_time = (datetime.now() - timedelta(hours=1)).isoformat()
-        local_task = {"id": "task-001", "title": "Local version", "updated_at": old_time}
+        # Create base task and push it
+        base_time = (datetime.now() - timedelta(hours=2)).isoformat()
+        base_task = {"id": "task-001", "title": "Base version", "updated_at": base_time}
         tasks_path = local_repo / ".cub" / "tasks.jsonl"
         tasks_path.parent.mkdir(parents=True, exist_ok=True)
-        tasks_path.write_text(json.dumps(local_task) + "\n")
-        sync.commit("Local task")
+        tasks_path.write_text(json.dumps(base_task) + "\n")
+        sync.commit("Base task")
 
         # Push to remote
         subprocess.run(
@@ -798,6 +800,12 @@ class TestPull:
             check=True,
         )
 
+        # Edit locally with an older timestamp than the remote edit below
+        old_time = (datetime.now() - timedelta(hours=1)).isoformat()
+        local_task = {"id": "task-001", "title": "Local version", "updated_at": old_time}
+        tasks_path.write_text(json.dumps(local_task) + "\n")
+        sync.commit("Local task")
+
         # Create "remote" changes with newer timestamp
         second_clone = local_repo.parent / "second_clone"
         subprocess.run(
@@ -889,17 +897,13 @@ class TestPull:
         tasks_path.write_text(json.dumps(new_task) + "\n")
         sync.commit("Updated local task")
 
-        # Pull should keep local (newer) version
+        # Pull should keep local version: remote hasn't changed since the base
         result = sync.pull()
 
         assert result.success is True
         # tasks_updated should be 0 since local is kept
         assert result.tasks_updated == 0
-        assert len(result.conflicts) == 1
-
-        conflict = result.conflicts[0]
-        assert conflict.task_id == "task-001"
-        assert conflict.winner == "local"
+        assert len(result.conflicts) == 0
 
         # Verify local version was kept
         local_content = tasks_path.read_text()
@@ -913,11 +917,11 @@ class TestPull:
         sync = SyncService(project_dir=local_repo)
         sync.initialize()
 
-        # Create local task without timestamp
+        # Create base task without timestamp and push it
         tasks_path = local_repo / ".cub" / "tasks.jsonl"
         tasks_path.parent.mkdir(parents=True, exist_ok=True)
-        tasks_path.write_text('{"id": "task-001", "title": "Local version"}\n')
-        sync.commit("Local task")
+        tasks_path.write_text('{"id": "task-001", "title": "Base version"}\n')
+        sync.commit("Base task")
 
         subprocess.run(
             ["git", "push", "origin", "cub-sync"],
@@ -926,6 +930,10 @@ class TestPull:
             check=True,
         )
 
+        # Edit locally, still without timestamp
+        tasks_path.write_text('{"id": "task-001", "title": "Local version"}\n')
+        sync.commit("Local task")
+
         # Create different remote version without timestamp
         second_clone = local_repo.parent / "second_clone"
         subprocess.run(
@@ -1125,6 +1133,220 @@ class TestPull:
         assert result.completed_at is not None
 
 
+    def _push_from_clone(self, local_repo: Path, remote_repo: Path, content: str) -> None:
+        """Commit new tasks content to the remote sync branch from a second clone."""
+        clone = local_repo.parent / "second_clone"
+        if not clone.exists():
+            subprocess.run(
+                ["git", "clone", "-q", "-b", "cub-sync", str(remote_repo), str(clone)],
+                capture_output=True,
+                check=True,
+            )
+            for key, value in (("user.email", "test@example.com"), ("user.name", "Test")):
+                subprocess.run(["git", "config", key, value], cwd=clone, check=True)
+        else:
+            subprocess.run(["git", "pull", "-q"], cwd=clone, capture_output=True, check=True)
+        (clone / ".cub" / "tasks.jsonl").write_text(content)
+        subprocess.run(["git", "commit", "-qam", "Remote edit"], cwd=clone, check=True)
+        subprocess.run(
+            ["git", "push", "-q", "origin", "cub-sync"], cwd=clone, capture_output=True, check=True
+        )
+
+    def test_pull_merges_independent_field_edits(
+        self, git_repo_with_remote: tuple[Path, Path]
+    ) -> None:
+        """pull combines edits to different fields of the same task without conflict."""
+        local_repo, remote_repo = git_repo_with_remote
+        sync = SyncService(project_dir=local_repo)
+        sync.initialize()
+
+        tasks_path = local_repo / ".cub" / "tasks.jsonl"
+        tasks_path.parent.mkdir(parents=True, exist_ok=True)
+        base = {"id": "task-001", "title": "Task", "status": "open", "priority": 2}
+        tasks_path.write_text(json.dumps(base) + "\n")
+        sync.commit("Base")
+        assert sync.push()
+
+        self._push_from_clone(
+            local_repo, remote_repo, json.dumps({**base, "priority": 0}) + "\n"
+        )
+        tasks_path.write_text(json.dumps({**base, "status": "closed"}) + "\n")
+        sync.commit("Close locally")
+
+        result = sync.pull()
+
+        assert result.success is True
+        assert result.conflicts == []
+        assert result.tasks_updated == 1
+        merged = json.loads(tasks_path.read_text())
+        assert merged["status"] == "closed"
+        assert merged["priority"] == 0
+
+    def test_pull_preserves_unchanged_lines_and_records_merge(
+        self, git_repo_with_remote: tuple[Path, Path]
+    ) -> None:
+        """pull leaves untouched task lines byte-for-byte and commits a merge."""
+        local_repo, remote_repo = git_repo_with_remote
+        sync = SyncService(project_dir=local_repo)
+        sync.initialize()
+
+        tasks_path = local_repo / ".cub" / "tasks.jsonl"
+        tasks_path.parent.mkdir(parents=True, exist_ok=True)
+        untouched = '{"title":"Compact","id":"task-001"}'
+        tasks_path.write_text(untouched + "\n" + '{"id": "task-002", "title": "Old"}\n')
+        sync.commit("Base")
+        assert sync.push()
+
+        self._push_from_clone(
+            local_repo,
+            remote_repo,
+            untouched + "\n" + '{"id": "task-002", "title": "New"}\n',
+        )
+
+        result = sync.pull()
+
+        assert result.tasks_updated == 1
+        assert tasks_path.read_text().splitlines() == [
+            untouched,
+            '{"id": "task-002", "title": "New"}',
+        ]
+        parents = subprocess.run(
+            ["git", "rev-list", "--parents", "-n", "1", "cub-sync"],
+            cwd=local_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()[1:]
+        assert len(parents) == 2
+        assert sync.push()
+
+    def test_pull_applies_remote_deletion(
+        self, git_repo_with_remote: tuple[Path, Path]
+    ) -> None:
+        """pull removes a task deleted on remote when it is unchanged locally."""
+        local_repo, remote_repo = git_repo_with_remote
+        sync = SyncService(project_dir=local_repo)
+        sync.initialize()
+
+        tasks_path = local_repo / ".cub" / "tasks.jsonl"
+        tasks_path.parent.mkdir(parents=True, exist_ok=True)
+        keep = '{"id": "task-001", "title": "Keep"}'
+        tasks_path.write_text(keep + "\n" + '{"id": "task-002", "title": "Drop"}\n')
+        sync.commit("Base")
+        assert sync.push()
+
+        self._push_from_clone(local_repo, remote_repo, keep + "\n")
+
+        result = sync.pull()
+
+        assert result.tasks_updated == 1
+        assert tasks_path.read_text() == keep + "\n"
+
+    def test_pull_skips_when_remote_unchanged_since_base(
+        self, git_repo_with_remote: tuple[Path, Path], mocker: Any
+    ) -> None:
+        """pull doesn't read or parse tasks when remote matches the merge base."""
+        local_repo, _ = git_repo_with_remote
+        sync = SyncService(project_dir=local_repo)
+        sync.initialize()
+
+        tasks_path = local_repo / ".cub" / "tasks.jsonl"
+        tasks_path.parent.mkdir(parents=True, exist_ok=True)
+        tasks_path.write_text('{"id": "task-001", "title": "Task"}\n')
+        sync.commit("Base")
+        assert sync.push()
+
+        spy = mocker.spy(sync, "_get_file_from_ref")
+        result = sync.pull()
+
+        assert result.success is True
+        assert "up to date" in result.message.lower()
+        assert spy.call_count == 0
+
+
+class TestThreeWayMerge:
+    """Tests for _merge_tasks with a merge base."""
+
+    def test_only_remote_changed_takes_remote(self, git_repo_with_commit: Path) -> None:
+        sync = SyncService(project_dir=git_repo_with_commit)
+        base = {"task-001": {"id": "task-001", "title": "Base"}}
+        remote = {"task-001": {"id": "task-001", "title": "Remote"}}
+
+        merged, conflicts, updated = sync._merge_tasks(dict(base), remote, base)
+
+        assert merged["task-001"] is remote["task-001"]
+        assert conflicts == []
+        assert updated == 1
+
+    def test_only_local_changed_keeps_local(self, git_repo_with_commit: Path) -> None:
+        sync = SyncService(project_dir=git_repo_with_commit)
+        base = {"task-001": {"id": "task-001", "title": "Base"}}
+        local = {"task-001": {"id": "task-001", "title": "Local"}}
+
+        merged, conflicts, updated = sync._merge_tasks(local, dict(base), base)
+
+        assert merged["task-001"]["title"] == "Local"
+        assert conflicts == []
+        assert updated == 0
+
+    def test_same_field_conflict_uses_last_write(self, git_repo_with_commit: Path) -> None:
+        sync = SyncService(project_dir=git_repo_with_commit)
+        old = (datetime.now() - timedelta(hours=1)).isoformat()
+        new = datetime.now().isoformat()
+        base = {"task-001": {"id": "task-001", "title": "Base", "status": "open"}}
+        local = {
+            "task-001": {"id": "task-001", "title": "Local", "status": "open", "updated_at": new}
+        }
+        remote = {
+            "task-001": {"id": "task-001", "title": "Remote", "status": "done", "updated_at": old}
+        }
+
+        merged, conflicts, updated = sync._merge_tasks(local, remote, base)
+
+        assert [c.winner for c in conflicts] == ["local"]
+        assert merged["task-001"]["title"] == "Local"
+        assert merged["task-001"]["status"] == "done"
+        assert merged["task-001"]["updated_at"] == new
+        assert updated == 1
+
+    def test_local_only_new_task_is_kept(self, git_repo_with_commit: Path) -> None:
+        sync = SyncService(project_dir=git_repo_with_commit)
+        local = {"task-009": {"id": "task-009", "title": "New"}}
+
+        merged, conflicts, updated = sync._merge_tasks(local, {}, {})
+
+        assert "task-009" in merged
+        assert updated == 0
+
+
+class TestTaskIndex:
+    """Tests for per-task line hashing."""
+
+    def test_known_hashes_skip_parsing(self, mocker: Any) -> None:
+        content = '{"id": "a", "n": 1}\n{"id": "b", "n": 2}\n'
+        first = TaskIndex.from_content(content)
+        known = {h: t for t, h in first.hashes().items()}
+
+        spy = mocker.spy(json, "loads")
+        second = TaskIndex.from_content(content + '{"id": "c"}\n', known)
+
+        assert list(second) == ["a", "b", "c"]
+        assert spy.call_count == 1
+        assert second.task("a") == {"id": "a", "n": 1}
+
+    def test_commit_records_task_hashes(self, git_repo_with_commit: Path) -> None:
+        sync = SyncService(project_dir=git_repo_with_commit)
+        sync.initialize()
+        tasks_path = git_repo_with_commit / ".cub" / "tasks.jsonl"
+        tasks_path.parent.mkdir(parents=True, exist_ok=True)
+        tasks_path.write_text('{"id": "task-001"}\n')
+
+        commit_sha = sync.commit()
+
+        recorded_sha, hashes = sync._load_task_hashes()
+        assert recorded_sha == commit_sha
+        assert list(hashes) == ["task-001"]
+
 class TestSyncConflictModel:
     """Tests for the SyncConflict model."""
 
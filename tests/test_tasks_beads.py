@@ -6,6 +6,7 @@ JSON parsing, task transformation, and error handling.
 """
 
 import json
+import os
 import subprocess
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -1235,3 +1236,146 @@ class TestTryCloseEpic:
 
                 assert closed is True
                 assert "auto-closed" in message
+
+
+# ==============================================================================
+# Snapshot Read Tests
+# ==============================================================================
+
+
+def _write_snapshot(project_dir: Path, issues: list[dict]) -> None:
+    """Write an issues.jsonl export that is newer than the database."""
+    beads_dir = project_dir / ".beads"
+    db = beads_dir / "beads.db"
+    db.write_text("")
+    export = beads_dir / "issues.jsonl"
+    export.write_text("".join(json.dumps(issue) + "\n" for issue in issues))
+    db_mtime = db.stat().st_mtime_ns
+    os.utime(export, ns=(db_mtime, db_mtime + 1_000_000))
+
+
+SNAPSHOT_ISSUES = [
+    {"id": "epic-1", "title": "Epic", "status": "open", "issue_type": "epic", "priority": 1},
+    {
+        "id": "cub-001",
+        "title": "Closed dependency",
+        "status": "closed",
+        "priority": 2,
+        "dependencies": [
+            {"issue_id": "cub-001", "depends_on_id": "epic-1", "type": "parent-child"}
+        ],
+    },
+    {
+        "id": "cub-002",
+        "title": "Ready task",
+        "description": "Mentions Widgets",
+        "status": "open",
+        "priority": 3,
+        "labels": ["backend"],
+        "dependencies": [
+            {"issue_id": "cub-002", "depends_on_id": "epic-1", "type": "parent-child"},
+            {"issue_id": "cub-002", "depends_on_id": "cub-001", "type": "blocks"},
+        ],
+    },
+    {
+        "id": "cub-003",
+        "title": "Blocked task",
+        "status": "open",
+        "priority": 0,
+        "dependencies": [{"issue_id": "cub-003", "depends_on_id": "cub-002", "type": "blocks"}],
+    },
+    {"id": "cub-004", "title": "Deleted", "status": "tombstone"},
+]
+
+
+class TestSnapshotReads:
+    """Test reads served from the .beads/issues.jsonl snapshot."""
+
+    @pytest.fixture
+    def backend(self, project_dir):
+        _write_snapshot(project_dir, SNAPSHOT_ISSUES)
+        with patch("shutil.which", return_value="/usr/local/bin/bd"):
+            backend = BeadsBackend(project_dir=project_dir)
+        with patch("subprocess.run", side_effect=AssertionError("bd was called")):
+            yield backend
+
+    def test_list_tasks(self, backend):
+        tasks = backend.list_tasks()
+
+        assert [t.id for t in tasks] == ["epic-1", "cub-001", "cub-002", "cub-003"]
+        assert tasks[2].parent == "epic-1"
+        assert tasks[2].depends_on == ["cub-001"]
+
+    def test_list_tasks_filters(self, backend):
+        assert [t.id for t in backend.list_tasks(status=TaskStatus.CLOSED)] == ["cub-001"]
+        assert [t.id for t in backend.list_tasks(parent="epic-1")] == ["cub-001", "cub-002"]
+        assert [t.id for t in backend.list_tasks(label="backend")] == ["cub-002"]
+
+    def test_get_task(self, backend):
+        task = backend.get_task("cub-002")
+
+        assert task is not None
+        assert task.title == "Ready task"
+        assert backend.get_task("cub-004") is None
+        assert backend.get_task("missing") is None
+
+    def test_get_ready_tasks(self, backend):
+        assert [t.id for t in backend.get_ready_tasks()] == ["epic-1", "cub-002"]
+        assert [t.id for t in backend.get_ready_tasks(parent="epic-1")] == ["cub-002"]
+
+    def test_list_blocked_tasks(self, backend):
+        assert [t.id for t in backend.list_blocked_tasks()] == ["cub-003"]
+
+    def test_get_task_counts(self, backend):
+        counts = backend.get_task_counts()
+
+        assert counts.total == 4
+        assert counts.open == 3
+        assert counts.closed == 1
+        assert counts.blocked == 1
+
+    def test_search_tasks(self, backend):
+        assert [t.id for t in backend.search_tasks("widgets")] == ["cub-002"]
+
+    def test_reloads_when_export_changes(self, backend, project_dir):
+        backend.list_tasks()
+        _write_snapshot(project_dir, SNAPSHOT_ISSUES[:1])
+
+        assert [t.id for t in backend.list_tasks()] == ["epic-1"]
+
+    def test_stale_export_falls_back_to_bd(self, project_dir):
+        _write_snapshot(project_dir, SNAPSHOT_ISSUES)
+        db = project_dir / ".beads" / "beads.db"
+        export_mtime = (project_dir / ".beads" / "issues.jsonl").stat().st_mtime_ns
+        os.utime(db, ns=(export_mtime, export_mtime + 1_000_000))
+
+        mock_result = Mock(stdout=json.dumps([{"id": "bd-1", "title": "From bd"}]))
+        with patch("shutil.which", return_value="/usr/local/bin/bd"):
+            with patch("subprocess.run", return_value=mock_result) as mock_run:
+                backend = BeadsBackend(project_dir=project_dir)
+                tasks = backend.list_tasks()
+
+        assert [t.id for t in tasks] == ["bd-1"]
+        mock_run.assert_called_once()
+
+
+class TestListPaging:
+    """Test that bd list results beyond the first page are not truncated."""
+
+    def test_full_page_widens_limit(self, project_dir):
+        full_page = [{"id": f"cub-{i}", "title": "Task"} for i in range(1000)]
+        rest = full_page + [{"id": "cub-1000", "title": "Task"}]
+
+        mock_results = [
+            Mock(stdout=json.dumps(full_page), returncode=0),
+            Mock(stdout=json.dumps(rest), returncode=0),
+        ]
+
+        with patch("shutil.which", return_value="/usr/local/bin/bd"):
+            with patch("subprocess.run", side_effect=mock_results) as mock_run:
+                backend = BeadsBackend(project_dir=project_dir)
+                tasks = backend.list_tasks(status=TaskStatus.OPEN)
+
+        assert len(tasks) == 1001
+        second_args = mock_run.call_args_list[1][0][0]
+        assert second_args == ["bd", "list", "--json", "--limit", "4000", "--status", "open"]
@@ -0,0 +1,250 @@
+"""Tests for resource telemetry sampling."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cub.core.ledger.models import ResourceTelemetry
+from cub.core.sandbox.docker import DockerProvider
+from cub.core.telemetry import (
+    DockerStatsSampler,
+    ProcTreeSampler,
+    ResourceSample,
+    ResourceSeries,
+    format_bytes,
+    format_telemetry,
+    parse_size,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _write_proc(
+    root: Path,
+    pid: int,
+    ppid: int,
+    *,
+    ticks: tuple[int, int, int, int] = (0, 0, 0, 0),
+    rss_pages: int = 0,
+    io: tuple[int, int] | None = None,
+    comm: str = "python",
+) -> None:
+    """Write a minimal /proc/<pid> entry."""
+    proc = root / str(pid)
+    proc.mkdir(exist_ok=True)
+    utime, stime, cutime, cstime = ticks
+    fields = ["S", str(ppid)] + ["0"] * 9 + [str(utime), str(stime), str(cutime), str(cstime)]
+    fields += ["20", "0", "1", "0", "0", "0", str(rss_pages), "0"]
+    (proc / "stat").write_text(f"{pid} ({comm}) {' '.join(fields)}\n")
+    if io is not None:
+        (proc / "io").write_text(f"rchar: 1\nread_bytes: {io[0]}\nwrite_bytes: {io[1]}\n")
+
+
+def _proc_sampler(root: Path, pid: int, clock: _Clock) -> ProcTreeSampler:
+    sampler = ProcTreeSampler(pid, proc_root=root, clock=clock)
+    sampler._ticks = 100
+    sampler._page_size = 4096
+    return sampler
+
+
+class TestResourceSeries:
+    """Tests for the bounded sample series."""
+
+    def test_downsamples_but_keeps_peak_and_totals(self) -> None:
+        series = ResourceSeries(max_points=10)
+        for i in range(100):
+            rss = 5000 if i == 37 else 1000
+            series.add(ResourceSample(float(i), i / 10, rss, i, 2 * i))
+
+        telemetry = series.telemetry("proc")
+
+        assert telemetry is not None
+        assert len(series.points) <= 10
+        assert telemetry.peak_rss_bytes == 5000
+        assert telemetry.cpu_seconds == 9.9
+        assert telemetry.read_bytes == 99
+        assert telemetry.write_bytes == 198
+        # Evenly spaced, and always ending on the last reading
+        elapsed = [s[0] for s in telemetry.samples]
+        gaps = {b - a for a, b in zip(elapsed[:-2], elapsed[1:-1], strict=True)}
+        assert len(gaps) == 1
+        assert elapsed[-1] == 99.0
+
+    def test_empty_series(self) -> None:
+        assert ResourceSeries().telemetry("docker") is None
+
+
+class TestProcTreeSampler:
+    """Tests for /proc process tree sampling."""
+
+    def test_sums_descendants_only(self, tmp_path: Path) -> None:
+        _write_proc(tmp_path, 10, 1, ticks=(100, 50, 0, 0), rss_pages=10, io=(100, 200))
+        _write_proc(tmp_path, 11, 10, ticks=(10, 10, 0, 0), rss_pages=5, comm="my (odd) cmd")
+        _write_proc(tmp_path, 12, 11, rss_pages=1, io=(1, 2))
+        _write_proc(tmp_path, 20, 1, ticks=(999, 999, 0, 0), rss_pages=999, io=(999, 999))
+        clock = _Clock()
+        sampler = _proc_sampler(tmp_path, 10, clock)
+
+        first = sampler.sample()
+        _write_proc(tmp_path, 10, 1, ticks=(200, 50, 30, 20), rss_pages=10, io=(1100, 200))
+        clock.now = 2.0
+        second = sampler.sample()
+
+        assert first == ResourceSample(0.0, 0.0, 16 * 4096, 0, 0)
+        # Relative to the first reading, including reaped children
+        assert second is not None
+        assert second.cpu_seconds == pytest.approx(1.5)
+        assert second._replace(cpu_seconds=0.0) == ResourceSample(2.0, 0.0, 16 * 4096, 1000, 0)
+
+    def test_counters_never_go_backwards(self, tmp_path: Path) -> None:
+        _write_proc(tmp_path, 10, 1, rss_pages=1)
+        _write_proc(tmp_path, 11, 10, ticks=(0, 0, 0, 0), rss_pages=1)
+        sampler = _proc_sampler(tmp_path, 10, _Clock())
+        sampler.sample()
+        _write_proc(tmp_path, 11, 10, ticks=(300, 0, 0, 0), rss_pages=1)
+        sampler.sample()
+
+        # Child exits but hasn't been reaped into the parent's totals yet
+        (tmp_path / "11" / "stat").unlink()
+        sample = sampler.sample()
+
+        assert sample is not None
+        assert sample.cpu_seconds == 3.0
+        assert sample.rss_bytes == 4096
+
+    def test_missing_process(self, tmp_path: Path) -> None:
+        sampler = _proc_sampler(tmp_path, 10, _Clock())
+
+        assert sampler.sample() is None
+        sampler.start()
+        assert sampler.stop() is None
+
+    @pytest.mark.skipif(not Path("/proc/self/stat").exists(), reason="needs /proc")
+    def test_samples_real_process(self) -> None:
+        sampler = ProcTreeSampler(os.getpid(), interval=0.01)
+        sampler.start()
+        sum(i * i for i in range(200_000))
+
+        telemetry = sampler.stop()
+
+        assert telemetry is not None
+        assert telemetry.source == "proc"
+        assert telemetry.peak_rss_bytes > 0
+        assert telemetry.samples
+
+
+class TestSamplerBase:
+    """Tests for the sampler base class."""
+
+    def test_subclass_without_run_cannot_be_constructed(self) -> None:
+        from cub.core.telemetry import _Sampler
+
+        class Incomplete(_Sampler):
+            source = "proc"
+
+        with pytest.raises(TypeError, match="_run"):
+            Incomplete()  # type: ignore[abstract]
+
+
+class TestDockerStatsSampler:
+    """Tests for streamed docker stats parsing."""
+
+    @staticmethod
+    def _line(cpu: str, mem: str = "100MiB / 2GiB", block: str = "1MB / 2kB") -> str:
+        stats = {"CPUPerc": cpu, "MemUsage": mem, "BlockIO": block, "MemPerc": "5.00%"}
+        return json.dumps(stats)
+
+    def test_integrates_cpu_and_reads_memory(self) -> None:
+        clock = _Clock()
+        sampler = DockerStatsSampler("cub-sandbox-1", clock=clock)
+
+        sampler.feed(self._line("50.00%"))
+        clock.now = 2.0
+        sampler.feed(self._line("150.00%", mem="300MiB / 2GiB"))
+        clock.now = 3.0
+        # docker redraws its table with escape sequences before each line
+        last = sampler.feed("\x1b[2J\x1b[H" + self._line("100.00%", block="2MB / 4kB"))
+
+        assert last == ResourceSample(3.0, 4.0, 100 * 1024**2, 2_000_000, 4000)
+        telemetry = sampler.stop()
+        assert telemetry is not None
+        assert telemetry.source == "docker"
+        assert telemetry.peak_rss_bytes == 300 * 1024**2
+        assert sampler.latest_stats is not None
+        assert sampler.latest_stats["BlockIO"] == "2MB / 4kB"
+
+    def test_ignores_non_stats_lines(self) -> None:
+        sampler = DockerStatsSampler("cub-sandbox-1")
+
+        assert sampler.feed("\x1b[2J\x1b[H") is None
+        assert sampler.feed("{not json}") is None
+        assert sampler.latest is None
+
+    def test_provider_status_uses_streamed_stats(self) -> None:
+        provider = DockerProvider()
+        sampler = DockerStatsSampler("cub-sandbox-1")
+        sampler.feed(self._line("25.00%", mem="512MiB / 2GiB"))
+        provider._samplers["cub-sandbox-1"] = sampler
+        inspect = MagicMock(
+            returncode=0,
+            stdout=json.dumps({"Status": "running", "StartedAt": "2024-01-15T10:30:00Z"}),
+        )
+
+        with (
+            patch.object(DockerProvider, "_container_exists", return_value=True),
+            patch.object(DockerProvider, "run_docker", return_value=inspect) as run,
+        ):
+            status = provider.status("cub-sandbox-1")
+
+        assert all(call.args[0][0] != "stats" for call in run.call_args_list)
+        assert status.resources is not None
+        assert status.resources.cpu_percent == 25.0
+
+
+class TestFormatting:
+    """Tests for size parsing and display."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("0B", 0),
+            ("512B", 512),
+            ("1.5kB", 1500),
+            ("12.3MB", 12_300_000),
+            ("1.5GiB", int(1.5 * 1024**3)),
+            ("100MiB", 100 * 1024**2),
+            ("--", 0),
+            ("3 parsecs", 0),
+        ],
+    )
+    def test_parse_size(self, text: str, expected: int) -> None:
+        assert parse_size(text) == expected
+
+    def test_format_bytes(self) -> None:
+        assert format_bytes(512) == "512 B"
+        assert format_bytes(1536) == "1.5 KiB"
+        assert format_bytes(300 * 1024**2) == "300.0 MiB"
+        assert format_bytes(3 * 1024**3) == "3.0 GiB"
+
+    def test_format_telemetry(self) -> None:
+        telemetry = ResourceTelemetry(
+            source="proc",
+            duration_seconds=10.0,
+            peak_rss_bytes=1024**3,
+            cpu_seconds=15.0,
+            read_bytes=0,
+            write_bytes=2048,
+        )
+
+        assert format_telemetry(telemetry) == (
+            "peak 1.0 GiB RSS, 15.0 CPU-s (1.50 cores avg), 0 B read, 2.0 KiB written"
+        )
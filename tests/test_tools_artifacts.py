@@ -0,0 +1,187 @@
+"""
+Tests for the tool artifact index and retention policy.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from cub.core.filelock import file_lock
+from cub.core.tools import artifacts
+from cub.core.tools.artifacts import (
+    ArtifactIndex,
+    ArtifactRecord,
+    ArtifactRetention,
+    parse_artifact_name,
+)
+from cub.core.tools.execution import ExecutionService
+from cub.core.tools.models import AdapterType, ToolResult
+
+NO_LIMITS = ArtifactRetention(max_age_days=None, max_per_tool=None, max_total_bytes=None)
+
+
+def make_result(tool_id: str, action: str, minute: int) -> ToolResult:
+    return ToolResult(
+        tool_id=tool_id,
+        action=action,
+        success=True,
+        output={"minute": minute},
+        started_at=f"2024-01-24T12:{minute:02d}:00Z",
+        duration_ms=100,
+        adapter_type=AdapterType.HTTP,
+    )
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> ExecutionService:
+    return ExecutionService(artifact_dir=tmp_path / "runs", artifact_retention=NO_LIMITS)
+
+
+class TestParseArtifactName:
+    def test_tool_id_with_dashes(self) -> None:
+        assert parse_artifact_name("20240124T120000Z-brave-search-search.json") == (
+            "20240124T120000Z",
+            "brave-search",
+            "search",
+        )
+
+    def test_rejects_other_files(self) -> None:
+        assert parse_artifact_name("index.jsonl") is None
+        assert parse_artifact_name("x.json.tmp") is None
+        assert parse_artifact_name("short.json") is None
+
+
+class TestArtifactIndex:
+    def test_listing_reads_index_not_artifacts(self, service: ExecutionService) -> None:
+        for minute in range(3):
+            service._write_artifact(make_result("gh", "pr", minute))
+
+        # Listing doesn't need the artifact files themselves
+        for path in service.artifact_dir.glob("*.json"):
+            path.write_text("not json")
+
+        records = ArtifactIndex(service.artifact_dir).query(tool_id="gh")
+        assert [r.started_at.minute for r in records] == [2, 1, 0]
+        assert all(r.success for r in records)
+
+    def test_incremental_reads_see_new_artifacts(self, service: ExecutionService) -> None:
+        index = ArtifactIndex(service.artifact_dir)
+        service._write_artifact(make_result("gh", "pr", 0))
+        assert len(index.query()) == 1
+        service._write_artifact(make_result("gh", "pr", 1))
+        assert len(index.query()) == 2
+
+    def test_existing_directory_is_indexed(self, tmp_path: Path) -> None:
+        runs = tmp_path / "runs"
+        runs.mkdir()
+        result = make_result("brave-search", "search", 5)
+        (runs / "20240124T120500Z-brave-search-search.json").write_text(result.model_dump_json())
+        (runs / "20240124T120600Z-gh-pr.json").write_text("{ broken")
+
+        index = ArtifactIndex(runs)
+        records = index.query()
+        assert [r.tool_id for r in records] == ["gh", "brave-search"]
+        assert records[0].success is False
+        assert index.index_file.exists()
+
+    def test_partial_trailing_line_is_ignored(self, service: ExecutionService) -> None:
+        service._write_artifact(make_result("gh", "pr", 0))
+        with open(service.artifact_index.index_file, "a") as f:
+            f.write('{"op": "add", "name": "x')
+        assert len(ArtifactIndex(service.artifact_dir).query()) == 1
+
+
+class TestRetention:
+    def write(self, index: ArtifactIndex, tool_id: str, minute: int, size: int = 10) -> Path:
+        name = f"20240124T12{minute:02d}00Z-{tool_id}-run.json"
+        path = index.artifact_dir / name
+        path.write_text("x" * size)
+        index.add(ArtifactRecord.from_result(name, make_result(tool_id, "run", minute), size))
+        return path
+
+    @pytest.fixture(autouse=True)
+    def _no_background_eviction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ArtifactIndex, "evict_in_background", lambda self: False)
+
+    def test_max_per_tool_keeps_newest(self, tmp_path: Path) -> None:
+        index = ArtifactIndex(tmp_path, ArtifactRetention(max_per_tool=2))
+        paths = [self.write(index, "gh", minute) for minute in range(4)]
+        self.write(index, "brave", 9)
+
+        evicted = index.evict()
+        assert evicted is not None
+        assert [r.name for r in evicted] == [paths[0].name, paths[1].name]
+        assert not paths[0].exists()
+        assert [r.started_at.minute for r in index.query(tool_id="gh")] == [3, 2]
+        assert len(index.query(tool_id="brave")) == 1
+
+    def test_max_total_bytes_evicts_oldest(self, tmp_path: Path) -> None:
+        index = ArtifactIndex(tmp_path, ArtifactRetention(max_total_bytes=25))
+        for minute in range(4):
+            self.write(index, "gh", minute)
+
+        index.evict()
+        assert [r.started_at.minute for r in index.query()] == [3, 2]
+        assert index.total_bytes() == 20
+
+    def test_max_age_uses_write_time(self, tmp_path: Path) -> None:
+        index = ArtifactIndex(tmp_path, ArtifactRetention(max_age_days=7))
+        self.write(index, "gh", 0)
+        assert index.evict() == []
+
+        later = datetime.now(timezone.utc) + timedelta(days=8)
+        assert len(index.evict(now=later) or []) == 1
+        assert index.query() == []
+
+    def test_eviction_compacts_index_and_drops_missing(self, tmp_path: Path) -> None:
+        index = ArtifactIndex(tmp_path, ArtifactRetention(max_per_tool=1))
+        for minute in range(5):
+            self.write(index, "gh", minute)
+        orphan = self.write(index, "other", 7)
+        orphan.unlink()
+
+        index.evict()
+        lines = index.index_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["name"].endswith("-gh-run.json")
+
+    def test_eviction_skipped_while_locked(self, tmp_path: Path) -> None:
+        index = ArtifactIndex(tmp_path, ArtifactRetention(max_per_tool=1))
+        self.write(index, "gh", 0)
+        self.write(index, "gh", 1)
+        with file_lock(index.lock_file):
+            assert index.evict() is None
+        assert len(index.query()) == 2
+
+    def test_eviction_due_after_interval(self, tmp_path: Path) -> None:
+        index = ArtifactIndex(tmp_path)
+        assert index.eviction_due()
+        index.evict()
+        assert not index.eviction_due()
+
+        old = time.time() - artifacts.EVICTION_INTERVAL - 1
+        os.utime(index.marker_file, (old, old))
+        assert index.eviction_due()
+
+
+class TestBackgroundEviction:
+    def test_write_triggers_background_eviction(self, tmp_path: Path) -> None:
+        service = ExecutionService(
+            artifact_dir=tmp_path / "runs",
+            artifact_retention=ArtifactRetention(max_per_tool=1),
+        )
+        # The first write starts an eviction; later ones wait for the interval
+        service._write_artifact(make_result("gh", "pr", 0))
+        service.artifact_index.wait(timeout=5)
+        service._write_artifact(make_result("gh", "pr", 1))
+        service.artifact_index.wait(timeout=5)
+        assert len(service.list_artifacts()) == 2
+
+        os.utime(service.artifact_index.marker_file, (0, 0))
+        service._write_artifact(make_result("gh", "pr", 2))
+        service.artifact_index.wait(timeout=5)
+        assert [p.name for p in service.list_artifacts()] == ["20240124T120200Z-gh-pr.json"]
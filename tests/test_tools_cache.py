@@ -0,0 +1,225 @@
+"""
+Tests for the tool result cache and its use by ExecutionService.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from cub.core.tools.cache import ResultCache, normalize_params
+from cub.core.tools.execution import ExecutionService
+from cub.core.tools.metrics import MetricsStore
+from cub.core.tools.models import (
+    AdapterType,
+    CLIConfig,
+    HTTPConfig,
+    ResultCacheConfig,
+    ToolConfig,
+    ToolResult,
+)
+from cub.core.tools.registry import RegistryService, RegistryStore
+
+
+def make_result(action: str = "search", success: bool = True) -> ToolResult:
+    return ToolResult(
+        tool_id="gh",
+        action=action,
+        success=success,
+        output={"items": [1, 2]},
+        started_at=datetime.now(timezone.utc),
+        duration_ms=120,
+        adapter_type=AdapterType.CLI,
+    )
+
+
+class TestResultCache:
+    """Tests for ResultCache storage."""
+
+    def test_key_ignores_param_order_and_tracks_version(self) -> None:
+        key = ResultCache.key("gh", "issue list", {"a": 1, "b": 2}, "v1")
+        assert key == ResultCache.key("gh", "issue list", {"b": 2, "a": 1}, "v1")
+        assert key != ResultCache.key("gh", "issue list", {"a": 1, "b": 2}, "v2")
+        assert key != ResultCache.key("gh", "pr list", {"a": 1, "b": 2}, "v1")
+
+    def test_normalize_params_serialises_config_models(self) -> None:
+        config = HTTPConfig(base_url="https://api.example.com", endpoints={"search": "/s"})
+        assert "api.example.com" in normalize_params({"_http_config": config})
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("gh", "k", make_result(), ttl_seconds=60)
+
+        cached = cache.get("gh", "k")
+        assert cached is not None
+        assert cached.output == {"items": [1, 2]}
+        assert cache.get("gh", "other") is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        path = cache.put("gh", "k", make_result(), ttl_seconds=60)
+        entry = json.loads(path.read_text())
+        entry["expires_at"] = "2000-01-01T00:00:00+00:00"
+        path.write_text(json.dumps(entry))
+
+        assert cache.get("gh", "k") is None
+        assert not path.exists()
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        path = cache.put("gh", "k", make_result(), ttl_seconds=60)
+        path.write_text("{not json")
+        assert cache.get("gh", "k") is None
+
+    def test_invalidate_only_drops_one_tool(self, tmp_path: Path) -> None:
+        cache = ResultCache(tmp_path / "cache")
+        cache.put("gh", "a", make_result(), ttl_seconds=60)
+        cache.put("gh", "b", make_result(), ttl_seconds=60)
+        cache.put("brave", "a", make_result(), ttl_seconds=60)
+
+        assert cache.invalidate("gh") == 2
+        assert cache.get("gh", "a") is None
+        assert cache.get("brave", "a") is not None
+        assert cache.invalidate("gh") == 0
+
+
+class TestResultCacheConfig:
+    """Tests for the per-tool caching policy."""
+
+    def test_nothing_cacheable_by_default(self) -> None:
+        policy = ResultCacheConfig(ttl_seconds=60, invalidate_on=["pr create"])
+        assert not policy.is_cacheable("pr list")
+        assert not policy.is_cacheable("pr create")
+
+    def test_explicit_actions(self) -> None:
+        policy = ResultCacheConfig(actions=["search"])
+        assert policy.is_cacheable("search")
+        assert not policy.is_cacheable("post")
+
+    def test_invalidating_action_never_cacheable(self) -> None:
+        policy = ResultCacheConfig(actions=["pr list", "pr create"], invalidate_on=["pr create"])
+        assert policy.is_cacheable("pr list")
+        assert not policy.is_cacheable("pr create")
+
+
+class TestExecutionServiceCaching:
+    """Tests for cached execution through ExecutionService."""
+
+    def make_service(
+        self, tmp_path: Path, result_cache: ResultCacheConfig | None
+    ) -> ExecutionService:
+        registry_store = RegistryStore(tmp_path / "registry.json")
+        registry_service = RegistryService(user_store=registry_store, project_store=registry_store)
+        registry_service.adopt(
+            ToolConfig(
+                id="gh",
+                name="GitHub CLI",
+                adapter_type=AdapterType.CLI,
+                cli_config=CLIConfig(command="gh"),
+                adopted_at=datetime.now(timezone.utc),
+                adopted_from="test",
+                result_cache=result_cache,
+            )
+        )
+        return ExecutionService(
+            artifact_dir=tmp_path / "artifacts",
+            registry_service=registry_service,
+            metrics_store=MetricsStore(tmp_path / "metrics.json"),
+            result_cache=ResultCache(tmp_path / "cache"),
+        )
+
+    async def run(self, service: ExecutionService, adapter: Mock, action: str) -> ToolResult:
+        with patch("cub.core.tools.execution.get_adapter", return_value=adapter):
+            return await service.execute(
+                tool_id="gh", action=action, adapter_type="cli", params={"state": "open"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_is_served_from_cache(self, tmp_path: Path) -> None:
+        service = self.make_service(
+            tmp_path, ResultCacheConfig(ttl_seconds=60, actions=["issue list"])
+        )
+        adapter = Mock()
+        adapter.execute = AsyncMock(return_value=make_result("issue list"))
+
+        first = await self.run(service, adapter, "issue list")
+        second = await self.run(service, adapter, "issue list")
+
+        assert adapter.execute.await_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.output == first.output
+        assert second.artifact_path == first.artifact_path
+        assert len(list((tmp_path / "artifacts").glob("*.json"))) == 1
+
+        assert service.metrics_store is not None
+        metrics = service.metrics_store.get("gh")
+        assert metrics is not None
+        assert (metrics.cache_hits, metrics.cache_misses) == (1, 1)
+        assert metrics.invocations == 1
+        assert metrics.cache_hit_rate() == 50.0
+
+    @pytest.mark.asyncio
+    async def test_registry_loaded_once_per_service(self, tmp_path: Path) -> None:
+        service = self.make_service(tmp_path, ResultCacheConfig(actions=["issue list"]))
+        adapter = Mock()
+        adapter.execute = AsyncMock(return_value=make_result("issue list"))
+        assert service.registry_service is not None
+
+        with patch.object(
+            service.registry_service, "load", wraps=service.registry_service.load
+        ) as load:
+            await self.run(service, adapter, "issue list")
+            await self.run(service, adapter, "issue list")
+            await self.run(service, adapter, "issue create")
+
+        # One for the cache policies; is_approved still reads it per call
+        assert load.call_count == 1 + 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, tmp_path: Path) -> None:
+        service = self.make_service(tmp_path, ResultCacheConfig(actions=["issue list"]))
+        adapter = Mock()
+        adapter.execute = AsyncMock(return_value=make_result("issue list", success=False))
+
+        await self.run(service, adapter, "issue list")
+        await self.run(service, adapter, "issue list")
+        assert adapter.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidating_action_clears_cache(self, tmp_path: Path) -> None:
+        service = self.make_service(
+            tmp_path, ResultCacheConfig(actions=["issue list"], invalidate_on=["issue create"])
+        )
+        adapter = Mock()
+        adapter.execute = AsyncMock(return_value=make_result())
+
+        await self.run(service, adapter, "issue list")
+        await self.run(service, adapter, "issue create")
+        await self.run(service, adapter, "issue create")
+        await self.run(service, adapter, "issue list")
+        assert adapter.execute.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_unlisted_actions_are_not_cached(self, tmp_path: Path) -> None:
+        service = self.make_service(tmp_path, ResultCacheConfig(ttl_seconds=60))
+        adapter = Mock()
+        adapter.execute = AsyncMock(return_value=make_result("pr create"))
+
+        await self.run(service, adapter, "pr create")
+        second = await self.run(service, adapter, "pr create")
+        assert adapter.execute.await_count == 2
+        assert second.cached is False
+
+    @pytest.mark.asyncio
+    async def test_tools_without_policy_are_not_cached(self, tmp_path: Path) -> None:
+        service = self.make_service(tmp_path, None)
+        adapter = Mock()
+        adapter.execute = AsyncMock(return_value=make_result())
+
+        await self.run(service, adapter, "issue list")
+        await self.run(service, adapter, "issue list")
+        assert adapter.execute.await_count == 2
+        assert not (tmp_path / "cache").exists()
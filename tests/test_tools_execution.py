@@ -834,3 +834,41 @@ class TestExecutionServiceMetrics:
         # Should NOT be degraded at 50% threshold
         degraded_50 = service.get_degraded_tools(threshold=50.0)
         assert len(degraded_50) == 0
+
+    def test_get_degraded_tools_uses_recent_window_and_p95(self, tmp_path):
+        """Test get_degraded_tools flags recently failing and slow tools."""
+        from datetime import datetime, timezone
+
+        from cub.core.tools.metrics import MetricsStore
+
+        metrics_store = MetricsStore(tmp_path / "metrics.json")
+        service = ExecutionService(metrics_store=metrics_store)
+
+        def record(tool_id: str, success: bool, duration_ms: int) -> None:
+            metrics_store.record_execution(
+                ToolResult(
+                    tool_id=tool_id,
+                    action="run",
+                    success=success,
+                    output=None,
+                    started_at=datetime.now(timezone.utc),
+                    duration_ms=duration_ms,
+                    adapter_type=AdapterType.CLI,
+                )
+            )
+
+        # Lifetime success rate stays high, but the recent window is failing
+        for _ in range(200):
+            record("newly-broken", True, 10)
+        for _ in range(25):
+            record("newly-broken", False, 10)
+        # Always succeeds, but slowly
+        for _ in range(20):
+            record("slow-tool", True, 8000)
+        record("fast-tool", True, 10)
+
+        degraded = service.get_degraded_tools(threshold=80.0)
+        assert [m.tool_id for m in degraded] == ["newly-broken"]
+
+        degraded = service.get_degraded_tools(threshold=80.0, p95_ms=5000)
+        assert {m.tool_id for m in degraded} == {"newly-broken", "slow-tool"}
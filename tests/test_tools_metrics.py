@@ -4,7 +4,13 @@ from datetime import datetime, timezone
 
 import pytest
 
-from cub.core.tools.models import AdapterType, ToolMetrics, ToolResult
+from cub.core.tools.models import (
+    AdapterType,
+    ExecutionSample,
+    LatencyHistogram,
+    ToolMetrics,
+    ToolResult,
+)
 
 
 class TestToolMetrics:
@@ -480,6 +486,64 @@ class TestToolMetrics:
         assert isinstance(data["last_used_at"], str)
 
 
+class TestLatencyHistogram:
+    """Tests for the mergeable latency histogram."""
+
+    def test_percentiles_within_bucket_error(self) -> None:
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.add(ms)
+
+        assert histogram.total == 1000
+        for q, expected in ((50, 500), (95, 950), (99, 990)):
+            value = histogram.percentile(q)
+            assert value is not None
+            assert abs(value - expected) / expected < 0.1
+
+    def test_empty_histogram_has_no_percentile(self) -> None:
+        assert LatencyHistogram().percentile(50) is None
+
+    def test_zero_durations(self) -> None:
+        histogram = LatencyHistogram()
+        histogram.add(0, count=3)
+        assert histogram.percentile(99) == 0.0
+
+    def test_merge_matches_combined_recording(self) -> None:
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for ms in range(1, 100):
+            (left if ms % 2 else right).add(ms)
+            combined.add(ms)
+
+        left.merge(right)
+        assert left.counts == combined.counts
+
+    def test_json_round_trip(self) -> None:
+        histogram = LatencyHistogram()
+        histogram.add(42, count=5)
+        restored = LatencyHistogram.model_validate_json(histogram.model_dump_json())
+        assert restored.counts == histogram.counts
+
+
+class TestRecentWindow:
+    """Tests for the sliding window of recent executions."""
+
+    def test_window_keeps_latest_samples(self) -> None:
+        metrics = ToolMetrics(tool_id="test-tool")
+        now = datetime.now(timezone.utc)
+        for i in range(ToolMetrics.RECENT_WINDOW + 10):
+            metrics.record(ExecutionSample(success=i >= 10, duration_ms=i, started_at=now))
+
+        assert len(metrics.recent) == ToolMetrics.RECENT_WINDOW
+        assert metrics.recent[0].duration_ms == 10
+        assert metrics.window_success_rate() == 100.0
+        assert metrics.success_rate() < 100.0
+
+    def test_window_falls_back_to_lifetime_rate(self) -> None:
+        metrics = ToolMetrics(tool_id="test-tool", invocations=10, successes=6, failures=4)
+        assert metrics.window_success_rate() == 60.0
+        assert metrics.window_percentile(50) is None
+
+
 class TestDegradationDetection:
     """Tests for detecting tool performance degradation over time."""
 
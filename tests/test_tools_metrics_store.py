@@ -1,11 +1,14 @@
 """Tests for MetricsStore."""
 
 import json
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
+from cub.core.filelock import file_lock
 from cub.core.tools.metrics import MetricsStore
 from cub.core.tools.models import AdapterType, ToolMetrics, ToolResult
 
@@ -435,3 +438,114 @@ class TestMetricsStore:
         loaded = store.load()
         assert loaded["test-tool"].first_used_at is not None
         assert isinstance(loaded["test-tool"].first_used_at, datetime)
+
+
+def make_result(tool_id: str, success: bool = True, duration_ms: int = 100) -> ToolResult:
+    return ToolResult(
+        tool_id=tool_id,
+        action="run",
+        success=success,
+        output=None,
+        error_type=None if success else "timeout",
+        started_at=datetime.now(timezone.utc),
+        duration_ms=duration_ms,
+        adapter_type=AdapterType.CLI,
+    )
+
+
+class TestExecutionLog:
+    """Tests for the append-only execution log and its roll-up."""
+
+    def test_record_appends_to_log_without_rewriting_metrics(self, tmp_path: Path):
+        store = MetricsStore(tmp_path / "metrics.json")
+        for _ in range(3):
+            store.record_execution(make_result("tool-a"))
+
+        assert not store.metrics_file.exists()
+        assert len(store.log_file.read_text().splitlines()) == 3
+        assert MetricsStore(store.metrics_file).get("tool-a").invocations == 3
+
+    def test_rollup_folds_log_into_metrics(self, tmp_path: Path):
+        store = MetricsStore(tmp_path / "metrics.json", rollup_bytes=1)
+        store.record_execution(make_result("tool-a", duration_ms=250))
+        store.record_execution(make_result("tool-a", success=False))
+
+        data = json.loads(store.metrics_file.read_text())
+        assert data["tool-a"]["invocations"] == 2
+        assert data["tool-a"]["error_types"] == {"timeout": 1}
+        assert data["_rollup"]["log_offset"] == store.log_file.stat().st_size
+
+        # Nothing counted twice when roll-up and log are read together
+        loaded = MetricsStore(store.metrics_file).load()
+        assert set(loaded) == {"tool-a"}
+        assert loaded["tool-a"].invocations == 2
+        assert loaded["tool-a"].latency.total == 2
+
+    def test_rotation_starts_a_fresh_log(self, tmp_path: Path):
+        store = MetricsStore(tmp_path / "metrics.json", rollup_bytes=1, rotate_bytes=1)
+        for _ in range(5):
+            store.record_execution(make_result("tool-a"))
+
+        assert not store.log_file.exists()
+        assert MetricsStore(store.metrics_file).get("tool-a").invocations == 5
+
+    def test_rollup_skipped_while_locked(self, tmp_path: Path):
+        store = MetricsStore(tmp_path / "metrics.json", rollup_bytes=1)
+        # As an append elsewhere would hold it
+        with file_lock(store.lock_file, shared=True):
+            store.record_execution(make_result("tool-a"))
+            assert not store.metrics_file.exists()
+            assert store.rollup() is False
+        assert store.rollup() is True
+        assert MetricsStore(store.metrics_file).get("tool-a").invocations == 1
+
+    def test_append_during_rotation_is_kept(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        metrics_file = tmp_path / "metrics.json"
+        store = MetricsStore(metrics_file, rollup_bytes=1 << 30, rotate_bytes=1)
+        for _ in range(3):
+            store.record_execution(make_result("tool-a"))
+
+        other = MetricsStore(metrics_file, rollup_bytes=1 << 30)
+        appender = threading.Thread(target=other.record_execution, args=(make_result("tool-a"),))
+        apply_log = store._apply_log
+
+        def apply_after_append(path: Path, position: int, metrics: dict[str, ToolMetrics]) -> int:
+            if path.name.endswith(".rollup"):
+                # Between moving the log aside and reading it
+                appender.start()
+                time.sleep(0.2)
+                assert appender.is_alive()
+            return apply_log(path, position, metrics)
+
+        monkeypatch.setattr(store, "_apply_log", apply_after_append)
+        assert store.rollup() is True
+        appender.join()
+
+        assert MetricsStore(metrics_file).get("tool-a").invocations == 4
+
+    def test_partial_trailing_line_is_ignored(self, tmp_path: Path):
+        store = MetricsStore(tmp_path / "metrics.json")
+        store.record_execution(make_result("tool-a"))
+        with open(store.log_file, "a") as f:
+            f.write('{"tool_id": "tool-a", "succ')
+
+        assert store.get("tool-a").invocations == 1
+
+    def test_concurrent_stores_share_one_log(self, tmp_path: Path):
+        metrics_file = tmp_path / "metrics.json"
+        writers = [MetricsStore(metrics_file, rollup_bytes=512) for _ in range(3)]
+        for i in range(60):
+            writers[i % 3].record_execution(make_result(f"tool-{i % 2}"))
+
+        loaded = MetricsStore(metrics_file).load()
+        assert sum(m.invocations for m in loaded.values()) == 60
+        assert loaded["tool-0"].invocations == 30
+
+    def test_save_discards_logged_executions(self, tmp_path: Path):
+        store = MetricsStore(tmp_path / "metrics.json")
+        store.record_execution(make_result("tool-a"))
+        store.save({"tool-b": ToolMetrics(tool_id="tool-b")})
+
+        assert set(MetricsStore(store.metrics_file).load()) == {"tool-b"}
+        store.record_execution(make_result("tool-a"))
+        assert MetricsStore(store.metrics_file).get("tool-a").invocations == 1
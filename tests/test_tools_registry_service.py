@@ -8,7 +8,7 @@ Tests cover:
 - is_approved() checking tool presence
 - needs_reapproval() detecting version changes
 - remove() removing from project registry
-- _generate_version_hash() deterministic hash generation
+- version_hash() deterministic hash generation
 """
 
 from datetime import datetime, timezone
@@ -515,10 +515,10 @@ class TestRegistryServiceRemove:
 
 
 class TestRegistryServiceGenerateVersionHash:
-    """Tests for _generate_version_hash() method."""
+    """Tests for version_hash() method."""
 
-    def test_generate_version_hash_produces_sha256(self, tmp_path: Path) -> None:
-        """_generate_version_hash() returns SHA256 hex string."""
+    def test_version_hash_produces_sha256(self, tmp_path: Path) -> None:
+        """version_hash() returns SHA256 hex string."""
         service = RegistryService()
 
         tool = ToolConfig(
@@ -530,15 +530,15 @@ class TestRegistryServiceGenerateVersionHash:
             adopted_from="test",
         )
 
-        hash_value = service._generate_version_hash(tool)
+        hash_value = service.version_hash(tool)
 
         # SHA256 hex string is 64 characters
         assert len(hash_value) == 64
         # Should be hex (all chars in 0-9a-f)
         assert all(c in "0123456789abcdef" for c in hash_value)
 
-    def test_generate_version_hash_is_deterministic(self, tmp_path: Path) -> None:
-        """_generate_version_hash() produces same hash for same tool."""
+    def test_version_hash_is_deterministic(self, tmp_path: Path) -> None:
+        """version_hash() produces same hash for same tool."""
         service = RegistryService()
 
         tool1 = ToolConfig(
@@ -564,15 +564,15 @@ class TestRegistryServiceGenerateVersionHash:
             adopted_from="test",
         )
 
-        hash1 = service._generate_version_hash(tool1)
-        hash2 = service._generate_version_hash(tool2)
+        hash1 = service.version_hash(tool1)
+        hash2 = service.version_hash(tool2)
 
         assert hash1 == hash2
 
-    def test_generate_version_hash_differs_for_different_tools(
+    def test_version_hash_differs_for_different_tools(
         self, tmp_path: Path
     ) -> None:
-        """_generate_version_hash() produces different hashes for different tools."""
+        """version_hash() produces different hashes for different tools."""
         service = RegistryService()
 
         tool1 = ToolConfig(
@@ -592,13 +592,13 @@ class TestRegistryServiceGenerateVersionHash:
             adopted_from="test",
         )
 
-        hash1 = service._generate_version_hash(tool1)
-        hash2 = service._generate_version_hash(tool2)
+        hash1 = service.version_hash(tool1)
+        hash2 = service.version_hash(tool2)
 
         assert hash1 != hash2
 
-    def test_generate_version_hash_includes_adapter_config(self, tmp_path: Path) -> None:
-        """_generate_version_hash() changes when adapter config changes."""
+    def test_version_hash_includes_adapter_config(self, tmp_path: Path) -> None:
+        """version_hash() changes when adapter config changes."""
         service = RegistryService()
 
         tool1 = ToolConfig(
@@ -624,13 +624,13 @@ class TestRegistryServiceGenerateVersionHash:
             adopted_from="test",
         )
 
-        hash1 = service._generate_version_hash(tool1)
-        hash2 = service._generate_version_hash(tool2)
+        hash1 = service.version_hash(tool1)
+        hash2 = service.version_hash(tool2)
 
         assert hash1 != hash2
 
-    def test_generate_version_hash_for_cli_tool(self, tmp_path: Path) -> None:
-        """_generate_version_hash() works for CLI tools."""
+    def test_version_hash_for_cli_tool(self, tmp_path: Path) -> None:
+        """version_hash() works for CLI tools."""
         service = RegistryService()
 
         tool = ToolConfig(
@@ -646,7 +646,7 @@ class TestRegistryServiceGenerateVersionHash:
             adopted_from="custom",
         )
 
-        hash_value = service._generate_version_hash(tool)
+        hash_value = service.version_hash(tool)
 
         assert len(hash_value) == 64
         assert all(c in "0123456789abcdef" for c in hash_value)